@@ -0,0 +1,58 @@
+"""Construction and field assignment micro-benchmark.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/construct.py`.
+"""
+
+import timeit
+
+from kubic.api import apps, core
+
+
+def build_container():
+    return core.Container(
+        name="app",
+        image="registry.example.com/app:1.0",
+        args=["--verbose"],
+        image_pull_policy="IfNotPresent",
+        working_dir="/srv",
+        ports=[core.ContainerPort(container_port=8080, name="http")],
+    )
+
+
+def build_deployment():
+    d = apps.Deployment(name="myapp", namespace="default")
+    d.metadata.labels["app"] = "myapp"
+    d.spec.replicas = 2
+    d.spec.revision_history_limit = 2
+    d.spec.paused = False
+    d.spec.min_ready_seconds = 10
+    d.spec.selector.match_labels = {"app": "myapp"}
+    d.spec.template.metadata.labels["app"] = "myapp"
+    d.spec.template.spec.containers += build_container()
+    return d
+
+
+def assign_fields(d=apps.Deployment(name="myapp")):
+    spec = d.spec
+    spec.replicas = 1
+    spec.paused = True
+    spec.min_ready_seconds = 5
+    spec.progress_deadline_seconds = 60
+    spec.revision_history_limit = 3
+
+
+def bench(name: str, func, number: int):
+    # warm up class field tables
+    func()
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{name:<24} {best / number * 1e6:8.2f} µs/op")
+
+
+def main():
+    bench("core.Container", build_container, 10_000)
+    bench("apps.Deployment", build_deployment, 5_000)
+    bench("setattr x5", assign_fields, 50_000)
+
+
+if __name__ == "__main__":
+    main()
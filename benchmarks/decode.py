@@ -0,0 +1,163 @@
+"""Manifest decoding benchmark (plain dict -> typed objects).
+
+The reference decoder reproduces update() before per-field decoders: every key goes through the
+attribute protocol (getattr() to merge nested objects, setattr() for other values).
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/decode.py`.
+"""
+
+import copy
+import time
+
+import kubic.api
+import kubic.crds
+from kubic import KubernetesObject, _FieldKind, camel_to_snake
+from kubic.reader import create_api_resource, register_modules, resolve_api_resource
+
+CONTAINER = {
+    "name": "app",
+    "image": "registry.example.com/app:1.0",
+    "imagePullPolicy": "IfNotPresent",
+    "args": ["--listen", ":8080"],
+    "env": [{"name": "LOG_LEVEL", "value": "debug"}, {"name": "POD_NAME", "valueFrom": {"fieldRef": {"fieldPath": "metadata.name"}}}],
+    "ports": [{"containerPort": 8080, "name": "http", "protocol": "TCP"}],
+    "resources": {"limits": {"memory": "256Mi"}, "requests": {"cpu": "100m", "memory": "128Mi"}},
+    "livenessProbe": {"httpGet": {"path": "/healthz", "port": "http"}, "periodSeconds": 10},
+    "volumeMounts": [{"name": "config", "mountPath": "/etc/app", "readOnly": True}],
+    "securityContext": {"runAsNonRoot": True, "readOnlyRootFilesystem": True, "capabilities": {"drop": ["ALL"]}},
+}
+
+POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {"name": "app-0", "namespace": "default", "labels": {"app": "app"}, "annotations": {"checksum": "1234"}},
+    "spec": {
+        "containers": [CONTAINER, dict(CONTAINER, name="sidecar")],
+        "initContainers": [dict(CONTAINER, name="init")],
+        "volumes": [{"name": "config", "configMap": {"name": "app-config", "items": [{"key": "app.yaml", "path": "app.yaml"}]}}],
+        "tolerations": [{"key": "node-role", "operator": "Exists", "effect": "NoSchedule"}],
+        "affinity": {
+            "podAntiAffinity": {
+                "preferredDuringSchedulingIgnoredDuringExecution": [
+                    {
+                        "weight": 100,
+                        "podAffinityTerm": {"topologyKey": "kubernetes.io/hostname", "labelSelector": {"matchLabels": {"app": "app"}}},
+                    }
+                ]
+            }
+        },
+    },
+}
+
+CILIUM_POLICY = {
+    "apiVersion": "cilium.io/v2",
+    "kind": "CiliumNetworkPolicy",
+    "metadata": {"name": "allow-http", "namespace": "default"},
+    "spec": {
+        "endpointSelector": {"matchLabels": {"app": "app"}},
+        "ingress": [
+            {
+                "fromEndpoints": [{"matchLabels": {"app": "frontend"}}],
+                "toPorts": [{"ports": [{"port": "8080", "protocol": "TCP"}], "rules": {"http": [{"method": "GET", "path": "/"}]}}],
+            }
+        ],
+        "egress": [{"toEntities": ["kube-apiserver"]}, {"toFQDNs": [{"matchName": "example.com"}]}],
+    },
+}
+
+SERVICE_MONITOR = {
+    "apiVersion": "monitoring.coreos.com/v1",
+    "kind": "ServiceMonitor",
+    "metadata": {"name": "app", "namespace": "default", "labels": {"release": "prometheus"}},
+    "spec": {
+        "selector": {"matchLabels": {"app": "app"}},
+        "namespaceSelector": {"matchNames": ["default"]},
+        "endpoints": [
+            {"port": "http", "interval": "30s", "path": "/metrics", "relabelings": [{"sourceLabels": ["__meta_pod"], "targetLabel": "pod"}]}
+        ],
+    },
+}
+
+PROMETHEUS_RULE = {
+    "apiVersion": "monitoring.coreos.com/v1",
+    "kind": "PrometheusRule",
+    "metadata": {"name": "app", "namespace": "default"},
+    "spec": {
+        "groups": [
+            {
+                "name": "app",
+                "rules": [
+                    {
+                        "alert": f"Alert{i}",
+                        "expr": "up == 0",
+                        "for": "5m",
+                        "labels": {"severity": "critical"},
+                        "annotations": {"summary": "down"},
+                    }
+                    for i in range(10)
+                ],
+            }
+        ]
+    },
+}
+
+
+def reference_update(obj: KubernetesObject, values: dict) -> KubernetesObject:
+    fields = obj._fields_()
+    for key, value in values.items():
+        name = key if key in fields else (obj._revfield_names_.get(key) or camel_to_snake(key))
+        field = fields[name]
+        if field.kind is _FieldKind.OBJECT:
+            reference_update(getattr(obj, name), value)
+        elif field.kind is _FieldKind.RAW_DICT:
+            getattr(obj, name).update(value)
+        elif field.kind is _FieldKind.TYPED_LIST:
+            setattr(obj, name, [reference_update(field.type(), item) for item in value])
+        else:
+            setattr(obj, name, value)
+    return obj
+
+
+def reference_decode(document: dict, **kwargs) -> KubernetesObject:
+    rsrc = resolve_api_resource(document["apiVersion"], document["kind"])
+    # apiVersion and kind are set by the constructor (see KubernetesApiResource._update())
+    return reference_update(rsrc(""), {key: value for key, value in document.items() if key not in ("apiVersion", "kind", "status")})
+
+
+def bench(name: str, document: dict, number: int, decode=create_api_resource, **kwargs):
+    best = None
+    for _ in range(5):
+        # decoded objects may keep references to the source dicts, so decode fresh copies
+        documents = [copy.deepcopy(document) for _ in range(number)]
+        start = time.perf_counter()
+        for doc in documents:
+            rsrc = decode(doc, **kwargs)
+            # typical audit access
+            _ = rsrc.metadata.labels
+            _ = rsrc.spec
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<32} {best / number * 1e6:8.2f} µs/op")
+
+
+def main():
+    register_modules(kubic.api.__spec__)
+    register_modules(kubic.crds.__spec__)
+
+    for name, document in (
+        ("core.Pod", POD),
+        ("CiliumNetworkPolicy", CILIUM_POLICY),
+        ("ServiceMonitor", SERVICE_MONITOR),
+        ("PrometheusRule", PROMETHEUS_RULE),
+    ):
+        # warm up class field tables
+        create_api_resource(copy.deepcopy(document))
+        # both decoders must build the same object
+        assert reference_decode(copy.deepcopy(document)) == create_api_resource(copy.deepcopy(document)), name
+        bench(f"{name} (reference)", document, 2_000, decode=reference_decode)
+        bench(name, document, 2_000)
+        bench(f"{name} (lazy)", document, 2_000, lazy=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""YAML dump benchmark.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/dump.py`.
+"""
+
+import time
+
+import yaml
+
+from kubic.api import apps, core
+
+
+def build_deployment(idx: int) -> apps.Deployment:
+    d = apps.Deployment(name=f"app-{idx}", namespace="default")
+    d.metadata.labels["app"] = f"app-{idx}"
+    d.spec.replicas = 2
+    d.spec.selector.match_labels = {"app": f"app-{idx}"}
+    d.spec.template.metadata.labels["app"] = f"app-{idx}"
+    # implicitly created, but never set
+    _ = d.spec.template.metadata.annotations
+    _ = d.spec.template.spec.affinity.pod_anti_affinity.preferred_during_scheduling_ignored_during_execution
+    for name in ("app", "sidecar", "exporter"):
+        c = core.Container(name=name, image=f"registry.example.com/{name}:1.0")
+        c.ports = [{"containerPort": 8080, "name": "http"}]
+        c.resources.limits["memory"] = "128Mi"
+        c.liveness_probe.http_get.path = "/healthz"
+        c.liveness_probe.http_get.port = "http"
+        _ = c.security_context.capabilities.drop
+        _ = c.env
+        d.spec.template.spec.containers += c
+    d.spec.template.spec.volumes += {"name": "config", "configMap": {"name": f"app-{idx}"}}
+    return d
+
+
+def bench(name: str, objects: list, dumper):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        yaml.dump_all(objects, Dumper=dumper)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<24} {best / len(objects) * 1e6:8.2f} µs/object")
+
+
+def main():
+    objects = [build_deployment(idx) for idx in range(500)]
+    bench("SafeDumper", objects, yaml.SafeDumper)
+    bench("CSafeDumper", objects, yaml.CSafeDumper)
+
+
+if __name__ == "__main__":
+    main()
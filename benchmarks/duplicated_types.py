@@ -0,0 +1,74 @@
+"""Anonymous type deduplication benchmark: StructuralKeys compared to pairwise ObjectType equality.
+
+Builds `count` anonymous types sharing the same name, with `distinct` different structures (nested
+anonymous types included), then groups them like ApiGroup.rename_duplicated().
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/duplicated_types.py [count] [distinct]`.
+"""
+
+import random
+import sys
+import time
+
+from pykapi.k8s import QualifiedName
+from pykapi.types import AnonymousType, GenericType, ObjectType, Property, StructuralKeys
+
+
+def build_types(count: int, distinct: int) -> list[AnonymousType]:
+    rand = random.Random(42)
+    parent = ObjectType(QualifiedName("Root", "bench.example.com", "v1"))
+    types = []
+    for _ in range(count):
+        variant = rand.randrange(distinct)
+        ty = AnonymousType(QualifiedName("Item", parent.group, parent.version), parent, "items")
+        for idx in range(20):
+            ty.properties.append(Property(f"field{idx}", "str", False, None))
+        nested = AnonymousType(QualifiedName("Selector", parent.group, parent.version), ty, "selector")
+        nested.properties.append(Property("matchLabels", GenericType("dict", ("str", "str")), False, None))
+        # types only differ by their last (nested) property, the worst case for pairwise comparisons
+        nested.properties.append(Property(f"variant{variant}", "int", False, None))
+        ty.properties.append(Property("selectors", GenericType("list", (nested,)), False, None))
+        types.append(ty)
+    return types
+
+
+def pairwise(items: list[AnonymousType]) -> list[list[AnonymousType]]:
+    types = []
+    for duplicated in items:
+        for atypes in types:
+            if atypes[0] == duplicated:
+                atypes.append(duplicated)
+                break
+        else:
+            types.append([duplicated])
+    return types
+
+
+def structural(items: list[AnonymousType]) -> list[list[AnonymousType]]:
+    keys = StructuralKeys()
+    matching = {}
+    for duplicated in items:
+        matching.setdefault(keys.key(duplicated), []).append(duplicated)
+    return list(matching.values())
+
+
+def run(name: str, items: list[AnonymousType], func) -> list[list[AnonymousType]]:
+    start = time.perf_counter()
+    result = func(items)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {elapsed * 1e3:8.1f} ms  {len(result)} distinct types")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    items = build_types(count, distinct)
+
+    expected = run("pairwise", items, pairwise)
+    result = run("structural", items, structural)
+    assert [[id(ty) for ty in typs] for typs in expected] == [[id(ty) for ty in typs] for typs in result]
+
+
+if __name__ == "__main__":
+    main()
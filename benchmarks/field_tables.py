@@ -0,0 +1,50 @@
+"""Field table benchmark: first use of every generated class, from generated field types or from annotations.
+
+Each variant runs in a fresh interpreter, as evaluated annotations are cached by typing.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/field_tables.py`.
+"""
+
+import subprocess
+import sys
+
+SCRIPT = """
+import importlib, pkgutil, time
+import kubic, kubic.api, kubic.crds
+
+classes = []
+for spec in (kubic.api.__spec__, kubic.crds.__spec__):
+    for info in pkgutil.iter_modules(spec.submodule_search_locations, prefix=spec.name + "."):
+        module = importlib.import_module(info.name)
+        for cls in vars(module).values():
+            if isinstance(cls, type) and cls.__module__ == info.name and "_field_types_" in cls.__dict__:
+                classes.append(cls)
+
+start = time.perf_counter()
+if {static}:
+    for cls in classes:
+        cls._fields_()
+else:
+    for cls in classes:
+        for name, hint in kubic.get_type_hints(cls).items():
+            kubic._resolve_field(name, name, hint)
+print((time.perf_counter() - start) / len(classes), len(classes))
+"""
+
+
+def run(name: str, static: bool):
+    best = None
+    for _ in range(5):
+        out = subprocess.run([sys.executable, "-c", SCRIPT.format(static=static)], check=True, capture_output=True, text=True).stdout
+        elapsed, count = out.split()
+        best = float(elapsed) if best is None else min(best, float(elapsed))
+    print(f"{name:<28} {best * 1e6:8.2f} µs/class ({count} classes)")
+
+
+def main():
+    run("annotations", False)
+    run("generated field types", True)
+
+
+if __name__ == "__main__":
+    main()
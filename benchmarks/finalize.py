@@ -0,0 +1,51 @@
+"""Dependency ordering benchmark: ApiGroup.finalize() on a synthetic group.
+
+Each type references up to 4 types with a greater index (directly or as list items), like the nested
+properties of a large CRD. The digest of the resulting order is printed, to compare implementations.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/finalize.py [count]`.
+"""
+
+import hashlib
+import random
+import sys
+import time
+
+from pykapi.k8s import QualifiedName
+from pykapi.parser import ApiGroup
+from pykapi.types import GenericType, ObjectType, Property
+
+
+def build_group(count: int) -> ApiGroup:
+    rand = random.Random(42)
+    group = ApiGroup("bench.example.com", "v1", "bench")
+    types = [ObjectType(QualifiedName(f"Type{idx:05}", group.name, group.version)) for idx in range(count)]
+    # insertion order differs from the name order used to select roots
+    for idx in rand.sample(range(count), count):
+        group.add(types[idx])
+
+    for idx, ty in enumerate(types):
+        ty.properties.append(Property("name", "str", True, None))
+        targets = range(idx + 1, min(count, idx + 200))
+        for n, target in enumerate(rand.sample(targets, min(len(targets), rand.randint(0, 4)))):
+            prop_type = types[target] if n % 2 else GenericType("list", [types[target]])
+            ty.properties.append(Property(f"prop{n}", prop_type, False, None))
+    return group
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    # the recursive implementation needs one frame per dependency level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), count * 4))
+
+    group = build_group(count)
+    start = time.perf_counter()
+    group.finalize()
+    elapsed = time.perf_counter() - start
+
+    digest = hashlib.sha256("\n".join(ty.name for ty in group.types).encode()).hexdigest()
+    print(f"{count} types: {elapsed * 1e3:.1f} ms, order {digest[:16]}")
+
+
+if __name__ == "__main__":
+    main()
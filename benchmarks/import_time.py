@@ -0,0 +1,52 @@
+"""Import time benchmark: cost of importing each generated module in a fresh interpreter.
+
+Reports the time to import the module once `kubic` itself is imported, and the generated modules
+that were loaded as a side effect.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/import_time.py [module...]`.
+"""
+
+import importlib.util
+import pkgutil
+import subprocess
+import sys
+
+SCRIPT = """
+import sys, time
+import kubic
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in sys.modules if name.startswith(("kubic.api.", "kubic.crds.")) and name != "{module}")
+print(elapsed, " ".join(loaded))
+"""
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    best = None
+    loaded = []
+    for _ in range(5):
+        out = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module)], check=True, capture_output=True, text=True).stdout
+        elapsed, _, names = out.strip().partition(" ")
+        elapsed = float(elapsed)
+        if best is None or elapsed < best:
+            best, loaded = elapsed, names.split()
+    return best, loaded
+
+
+def main():
+    modules = sys.argv[1:]
+    if not modules:
+        for package in ("kubic.api", "kubic.crds"):
+            spec = importlib.util.find_spec(package)
+            submodules = pkgutil.iter_modules(spec.submodule_search_locations, prefix=package + ".")
+            modules.extend(m.name for m in submodules if not m.name.endswith("._index"))
+
+    for module in modules:
+        elapsed, loaded = measure(module)
+        others = ", ".join(name.rpartition(".")[2] for name in loaded) or "-"
+        print(f"{module:<36} {elapsed * 1e3:7.2f} ms   also loaded: {others}")
+
+
+if __name__ == "__main__":
+    main()
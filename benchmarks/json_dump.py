@@ -0,0 +1,38 @@
+"""JSON serialization benchmark: dumps_json() compared to json.dumps(to_dict()) and YAML dumping.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/json_dump.py`.
+"""
+
+import io
+import json
+import time
+
+import yaml
+
+import kubic
+from dump import build_deployment
+
+
+def bench(name: str, objects: list, func):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        func(objects)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<36} {best / len(objects) * 1e6:8.2f} µs/object")
+
+
+def main():
+    objects = [build_deployment(idx) for idx in range(500)]
+    bench("dumps_json()", objects, lambda objs: [kubic.dumps_json(obj) for obj in objs])
+    bench("dumps_json(sort_keys=True)", objects, lambda objs: [kubic.dumps_json(obj, sort_keys=True) for obj in objs])
+    bench("dumps_json(compact=False)", objects, lambda objs: [kubic.dumps_json(obj, compact=False) for obj in objs])
+    bench("dump_json() streaming", objects, lambda objs: kubic.dump_json(objs, io.StringIO()))
+    bench("json.dumps(to_dict())", objects, lambda objs: [json.dumps(obj.to_dict()) for obj in objs])
+    bench("yaml.dump_all (CSafeDumper)", objects, lambda objs: yaml.dump_all(objs, Dumper=yaml.CSafeDumper))
+    bench("yaml.dump_all (SafeDumper)", objects, lambda objs: yaml.dump_all(objs, Dumper=yaml.SafeDumper))
+
+
+if __name__ == "__main__":
+    main()
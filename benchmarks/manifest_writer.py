@@ -0,0 +1,55 @@
+"""Streaming manifest writer benchmark: ManifestWriter compared to collecting objects for yaml.dump_all().
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/manifest_writer.py [count]`.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+from dump import build_deployment
+from kubic.writer import ManifestWriter
+
+
+def generate(count: int):
+    for idx in range(count):
+        yield build_deployment(idx)
+
+
+def run(name: str, count: int, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(os.devnull, "w") as fp:
+        func(fp, count)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<28} {elapsed:8.2f} s   {elapsed / count * 1e6:8.2f} µs/object   peak {peak / 2**20:8.2f} MiB")
+
+
+def dump_all(fp, count: int):
+    yaml.dump_all(list(generate(count)), fp, Dumper=yaml.CSafeDumper, sort_keys=False)
+
+
+def writer_yaml(fp, count: int):
+    with ManifestWriter(fp) as writer:
+        writer.write_all(generate(count))
+
+
+def writer_json(fp, count: int):
+    with ManifestWriter(fp, "json") as writer:
+        writer.write_all(generate(count))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run("yaml.dump_all(list)", count, dump_all)
+    run("ManifestWriter (yaml)", count, writer_yaml)
+    run("ManifestWriter (json)", count, writer_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Manifest reader benchmark: iter_resources() compared to a yaml.load_all() loop.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/reader.py [count]`.
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+
+import yaml
+
+import kubic.api
+from dump import build_deployment
+from kubic.reader import create_api_resource, iter_resources, register_modules
+
+
+def load_all(data: bytes):
+    for doc in yaml.load_all(data, yaml.CSafeLoader):
+        if doc.get("kind") == "List":
+            for item in doc["items"]:
+                yield create_api_resource(item)
+        else:
+            yield create_api_resource(doc)
+
+
+def run(name: str, count: int, func):
+    start = time.perf_counter()
+    total = sum(1 for _ in func())
+    elapsed = time.perf_counter() - start
+    assert total == count
+
+    # tracemalloc slows down allocations, so memory is measured in a separate pass.
+    tracemalloc.start()
+    for _ in func():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<36} {elapsed / count * 1e6:8.2f} µs/object   peak {peak / 2**20:8.2f} MiB")
+
+
+def main():
+    register_modules(kubic.api.__spec__)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    objects = [build_deployment(idx) for idx in range(count)]
+    documents = yaml.dump_all(objects, Dumper=yaml.CSafeDumper).encode()
+    single = yaml.dump({"apiVersion": "v1", "kind": "List", "items": objects}, Dumper=yaml.CSafeDumper).encode()
+    del objects
+
+    run("load_all() loop (documents)", count, lambda: load_all(documents))
+    run("iter_resources() (documents)", count, lambda: iter_resources(io.BytesIO(documents)))
+    run("load_all() loop (List)", count, lambda: load_all(single))
+    run("iter_resources() (List)", count, lambda: iter_resources(io.BytesIO(single)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Resource registry benchmark: cold start of a process reading a small manifest.
+
+Each measure runs in a fresh interpreter. The eager variant imports every generated module,
+like register_modules() did before packages shipped a pykapi index.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/registry.py`.
+"""
+
+import subprocess
+import sys
+import time
+
+MANIFEST = """
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: app}
+---
+apiVersion: v1
+kind: Service
+metadata: {name: app}
+---
+apiVersion: monitoring.coreos.com/v1
+kind: ServiceMonitor
+metadata: {name: app}
+"""
+
+SETUP = """
+import io, importlib, pkgutil, sys
+import kubic.api, kubic.crds
+from kubic import reader
+"""
+
+LAZY = """
+reader.register_modules(kubic.api.__spec__)
+reader.register_modules(kubic.crds.__spec__)
+"""
+
+EAGER = """
+for spec in (kubic.api.__spec__, kubic.crds.__spec__):
+    for pkg in pkgutil.iter_modules(spec.submodule_search_locations, prefix=spec.name + "."):
+        if not pkg.name.endswith("._index"):
+            reader.register_module(importlib.import_module(pkg.name))
+"""
+
+READ = f"""
+rsrcs = list(reader.iter_resources(io.StringIO({MANIFEST!r})))
+assert [type(r).__name__ for r in rsrcs] == ["Deployment", "Service", "ServiceMonitor"]
+"""
+
+
+def run(name: str, code: str):
+    script = (
+        f"import time\nstart = time.perf_counter()\n{SETUP}\nbase = time.perf_counter()\n"
+        f"{code}\n{READ}\nprint(base - start, time.perf_counter() - base)"
+    )
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+        total = time.perf_counter() - start
+        base, register = (float(value) for value in out.split())
+        if best is None or total < best[0]:
+            best = (total, base, register)
+    total, base, register = best
+    print(f"{name:<10} process {total * 1e3:8.1f} ms   import kubic {base * 1e3:7.1f} ms   register + read {register * 1e3:7.1f} ms")
+
+
+def main():
+    run("eager", EAGER)
+    run("indexed", LAZY)
+
+
+if __name__ == "__main__":
+    main()
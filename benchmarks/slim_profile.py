@@ -0,0 +1,101 @@
+"""Generation profile benchmark: import time and memory of full vs slim CRD modules.
+
+Generates the CRDs found in `schemas/crds` with both profiles into a temporary package, then imports
+each module in a fresh interpreter and reports the import time, the RSS growth and the size of the
+compiled module (Linux only).
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/slim_profile.py [schema...]`.
+"""
+
+import compileall
+import importlib.util
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from pykapi.annotations import AnnotationProvider
+from pykapi.cli import print_groups, read_crds
+from pykapi.crd import import_crds
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# resident set size from /proc (Linux), ru_maxrss is a high-water mark that the interpreter startup already reached.
+SCRIPT = """
+import os, time
+import kubic
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+before = rss()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, rss() - before)
+"""
+
+
+def generate(schemas: list[pathlib.Path], root: pathlib.Path, profile: str) -> list[str]:
+    package = root / f"kbench_{profile}"
+    crds = package / "crds"
+    crds.mkdir(parents=True)
+    (package / "__init__.py").touch()
+    (crds / "__init__.py").touch()
+    # generated modules reference the api types as `..api`
+    os.symlink(ROOT / "src" / "kubic" / "api", package / "api")
+
+    items = []
+    read_crds(schemas, items)
+    annotations = AnnotationProvider(ROOT / "annotations")
+    groups = import_crds(items, annotations)
+    print_groups(groups, str(crds), api_module="..api", docstrings=True, annotations=annotations, profile=profile)
+    compileall.compile_dir(str(crds), quiet=2)
+    return sorted(group.module for group in groups)
+
+
+def measure(module: str, path: str) -> tuple[float, int] | None:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((path, os.environ.get("PYTHONPATH", ""))))
+    best = None
+    for _ in range(5):
+        proc = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module)], capture_output=True, text=True, env=env)
+        if proc.returncode:
+            return None
+        elapsed, rss = proc.stdout.split()
+        if best is None or float(elapsed) < best[0]:
+            best = float(elapsed), int(rss)
+    return best
+
+
+def pyc_size(module: str, path: str) -> int:
+    sys.path.insert(0, path)
+    try:
+        return os.path.getsize(importlib.util.cache_from_source(importlib.util.find_spec(module).origin))
+    finally:
+        sys.path.remove(path)
+
+
+def main():
+    schemas = [pathlib.Path(arg) for arg in sys.argv[1:]] or [ROOT / "schemas" / "crds"]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = pathlib.Path(tmp)
+        modules = {}
+        for profile in ("full", "slim"):
+            modules[profile] = generate(schemas, root, profile)
+
+        print(f"{'module':<20} {'full':>24} {'slim':>24}")
+        for name in modules["full"]:
+            row = [f"{name:<20}"]
+            for profile in ("full", "slim"):
+                module = f"kbench_{profile}.crds.{name}"
+                result = measure(module, tmp)
+                if result is None:
+                    row.append(f"{'import failed':>24}")
+                    continue
+                elapsed, rss = result
+                row.append(f"{elapsed * 1e3:6.2f} ms {rss / 2**20:5.2f} MiB {pyc_size(module, tmp) / 1024:4.0f} KiB")
+            print(" ".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Plain export benchmark: to_dict() compared to YAML dumping.
+
+Run from the repository root with `PYTHONPATH=src python benchmarks/to_dict.py`.
+"""
+
+import json
+import time
+
+import yaml
+
+from dump import build_deployment
+
+
+def bench(name: str, objects: list, func):
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for obj in objects:
+            func(obj)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<32} {best / len(objects) * 1e6:8.2f} µs/object")
+
+
+def main():
+    objects = [build_deployment(idx) for idx in range(500)]
+    bench("to_dict()", objects, lambda obj: obj.to_dict())
+    bench("json.dumps(to_dict())", objects, lambda obj: json.dumps(obj.to_dict()))
+    bench("yaml.dump (SafeDumper)", objects, lambda obj: yaml.dump(obj, Dumper=yaml.SafeDumper))
+    bench("yaml.dump (CSafeDumper)", objects, lambda obj: yaml.dump(obj, Dumper=yaml.CSafeDumper))
+
+
+if __name__ == "__main__":
+    main()
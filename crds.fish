@@ -1,9 +1,7 @@
 #!/usr/local/bin/fish
 
-for crd in schemas/crds/*;
-  echo "  Processing $crd"
-  python3 src/kubegen.py crd --api_module="..api" -o src/kubic/crds/ $crd
-end
+# targets are listed in crds.yaml, and generated in a single process
+python3 src/kubegen.py crd --manifest crds.yaml
 
 # for crd in (kubectl get crds -o name);
 #   set crd (string replace -r 'customresourcedefinition.apiextensions.k8s.io/' '' $crd)
@@ -1,9 +1,17 @@
+import contextlib
+import contextvars
+import enum
+import functools
+import importlib
+import json
+import sys
+import threading
 import types
 import typing as t
 from collections.abc import Iterable, Mapping
 from functools import cache
 
-__all__ = ["KubernetesObject", "KubernetesApiResource"]
+__all__ = ["KubernetesObject", "KubernetesApiResource", "read_only", "dumps_json", "dump_json", "get_type_hints"]
 
 import yaml
 
@@ -12,22 +20,44 @@ class _K8SResourceMeta(type):
     __slots__ = ()
 
     def __new__(mcs, clsname, superclasses, attributedict):
-        # merge fields from all parent classes
-        fields = attributedict.get("_field_names_") or {}
-        revfields = attributedict.get("_revfield_names_") or {}
-        for parent in superclasses:
-            if hasattr(parent, "_field_names_"):
-                fields.update(getattr(parent, "_field_names_"))
-            if hasattr(parent, "_revfield_names_"):
-                fields.update(getattr(parent, "_field_names_"))
-
-        attributedict["_hints"] = None
+        # merge fields from all parent classes (class fields take precedence over inherited ones)
+        fields = {}
+        revfields = {}
+        for parent in reversed(superclasses):
+            fields.update(getattr(parent, "_field_names_", {}))
+            revfields.update(getattr(parent, "_revfield_names_", {}))
+        fields.update(attributedict.get("_field_names_") or {})
+        revfields.update(attributedict.get("_revfield_names_") or {})
+
+        # _empty_() skips constructors that only forward their arguments (generated ones), but must run the others.
+        init = attributedict.get("__init__")
+        attributedict.setdefault(
+            "_plain_init", all(getattr(parent, "_plain_init", True) for parent in superclasses) and (init is None or _forwards_only(init))
+        )
+
+        # field tables are built on first use, as annotations may contain forward references.
+        attributedict["_fields"] = None
+        attributedict["_input_fields"] = None
         attributedict["_field_names_"] = fields
         attributedict["_revfield_names_"] = revfields
 
         return type.__new__(mcs, clsname, superclasses, attributedict)
 
 
+# True for constructors like the generated ones: `super().__init__(name, namespace, field=field, …)`, with None defaults.
+def _forwards_only(init) -> bool:
+    code = getattr(init, "__code__", None)
+    if code is None or code.co_names != ("super", "__init__") or code.co_freevars != ("__class__",):
+        return False
+    params = set(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount])
+    if code.co_nlocals != len(params) or any(value is not None for value in init.__defaults__ or ()) or init.__kwdefaults__:
+        return False
+    # keyword names are constants (a tuple, or strings for long calls), and cluster resources forward an empty namespace
+    return all(
+        const is None or const == "" or const in params or (type(const) is tuple and params.issuperset(const)) for const in code.co_consts
+    )
+
+
 @cache
 def snake_to_camel(name: str) -> str:
     components = name.split("_")
@@ -45,12 +75,14 @@ R = t.TypeVar("R", bound="KubernetesObject")
 
 
 class _TypedList(list):
-    __slots__ = ("type", "__dirty")
+    __slots__ = ("type", "__dirty", "_parent_")
 
     def __init__(self, ty: t.Type[R], dirty: bool, values: Iterable | None = None):
         super().__init__()
         self.type: t.Type[R] = ty
         self.__dirty = dirty
+        # object that implicitly created this list, and that must be marked dirty on first insertion.
+        self._parent_ = None
         if values:
             self.extend(values)
 
@@ -61,28 +93,29 @@ class _TypedList(list):
     def _cast(self, obj):
         if isinstance(obj, self.type):
             return obj
-        # required to workaround dubious StatefulSet persistent volume claim declaration.
-        if issubclass(self.type, KubernetesApiResource):
-            return self.type("").update(obj)
         try:
-            return self.type().update(obj)
+            # _empty_ is required to workaround dubious StatefulSet persistent volume claim declaration.
+            return self.type._empty_().update(obj)
         except ValueError as e:
             raise TypeError(f"cannot convert value of type {type(obj)} to expected type {self.type}") from e
 
     def append(self, obj):
         if obj is not None:
             super().append(self._cast(obj))
+            _touch(self)
 
     def insert(self, index: int, obj):
         # do not create null entries
         if obj is not None:
             super().insert(index, self._cast(obj))
+            _touch(self)
 
     def extend(self, values: Iterable):
         if not values:
             return
         if isinstance(values, _TypedList) and values.type == self.type:
             super().extend(values)
+            _touch(self)
         else:
             for item in values:
                 self.append(item)
@@ -105,6 +138,7 @@ class _TypedList(list):
         # convenient method to add a single item
         if isinstance(other, self.type):
             super().append(other)
+            _touch(self)
         elif isinstance(other, dict):
             self.append(other)
         else:
@@ -114,40 +148,306 @@ class _TypedList(list):
 
 
 # RawDict is used to define if a dict has been implicitly created by __get__ access, or explicitly set by the user.
-class RawDict(dict): ...
+class RawDict(dict):
+    __slots__ = ("_parent_",)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._parent_ = None
 
-class RawList(list): ...
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _touch(self)
 
+    def __ior__(self, other):
+        super().__ior__(other)
+        _touch(self)
+        return self
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        _touch(self)
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        _touch(self)
 
-def _create_generic_type(hint):
-    origin = _get_generic_origin(hint)
-    if not origin or origin is t.Union:
-        return None
 
+class RawList(list):
+    __slots__ = ("_parent_",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._parent_ = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _touch(self)
+
+    def __iadd__(self, other):
+        super().__iadd__(other)
+        _touch(self)
+        return self
+
+    def append(self, obj):
+        super().append(obj)
+        _touch(self)
+
+    def extend(self, values: Iterable):
+        super().extend(values)
+        _touch(self)
+
+    def insert(self, index: int, obj):
+        super().insert(index, obj)
+        _touch(self)
+
+
+# Implicitly created values keep a link to the object that created them (their parent) until first written.
+# This let clean objects be marked dirty when one of their implicit descendants is modified.
+def _touch(value: _TypedList | RawDict | RawList):
+    parent = value._parent_
+    if parent is not None:
+        value._parent_ = None
+        _set_dirty(parent)
+
+
+class _FieldKind(enum.Enum):
+    SCALAR = 0
+    OBJECT = 1
+    TYPED_LIST = 2
+    RAW_DICT = 3
+    RAW_LIST = 4
+    UNION = 5
+
+
+class _Field(t.NamedTuple):
+    name: str
+    camel_name: str
+    kind: _FieldKind
+    # object class (or item class for typed lists). For other kinds, the resolved type hint,
+    # or None if the table was built from generated field types.
+    type: t.Any
+    # create the implicit value returned when reading a field that is not set yet
+    factory: t.Callable[[], t.Any] | None
+    # merge a value into an object (see KubernetesObject.update())
+    decode: t.Callable[["KubernetesObject", t.Any, bool], None]
+
+
+def _value_decoder(camel_name: str):
+    def decode(obj: "KubernetesObject", value, strict: bool):
+        # kubernetes does not uses the concept of null value.
+        if value is None:
+            dict.pop(obj, camel_name, None)
+        else:
+            dict.__setitem__(obj, camel_name, value)
+
+    return decode
+
+
+def _object_decoder(camel_name: str, ty: t.Type["KubernetesObject"]):
+    def decode(obj: "KubernetesObject", value, strict: bool):
+        # merge recursively
+        child = dict.get(obj, camel_name)
+        if child is None:
+            child = ty._implicit_()
+            dict.__setitem__(obj, camel_name, child)
+        elif type(child) is dict:
+            child = ty._empty_()._load_(child)
+            dict.__setitem__(obj, camel_name, child)
+        child.update(value, strict=strict)
+
+    return decode
+
+
+def _typed_list_decoder(camel_name: str, ty: t.Type["KubernetesObject"]):
+    def decode(obj: "KubernetesObject", value, strict: bool):
+        if value is None:
+            dict.pop(obj, camel_name, None)
+        else:
+            dict.__setitem__(obj, camel_name, _TypedList(ty, True, value))
+
+    return decode
+
+
+def _make_field(name: str, camel_name: str, kind: _FieldKind, ty) -> _Field:
+    if kind is _FieldKind.OBJECT:
+        return _Field(name, camel_name, kind, ty, ty._implicit_, _object_decoder(camel_name, ty))
+    if kind is _FieldKind.TYPED_LIST:
+        return _Field(name, camel_name, kind, ty, functools.partial(_TypedList, ty, False), _typed_list_decoder(camel_name, ty))
+    if kind is _FieldKind.RAW_LIST:
+        return _Field(name, camel_name, kind, ty, RawList, _value_decoder(camel_name))
+    if kind is _FieldKind.RAW_DICT:
+        return _Field(name, camel_name, kind, ty, RawDict, _value_decoder(camel_name))
+    return _Field(name, camel_name, kind, ty, None, _value_decoder(camel_name))
+
+
+def _resolve_field(name: str, camel_name: str, hint) -> _Field:
+    if isinstance(hint, types.UnionType):
+        return _make_field(name, camel_name, _FieldKind.UNION, hint)
+
+    origin = getattr(hint, "__origin__", None)
     if origin is list:
-        if hint.__args__:
-            param = hint.__args__[0]
-            if not _is_generic_type(param) and issubclass(param, KubernetesObject):
-                lst = _TypedList(param, False)
-                return lst
-        return RawList()
+        args = getattr(hint, "__args__", None)
+        if args:
+            param = args[0]
+            if isinstance(param, type) and not _is_generic_type(param) and issubclass(param, KubernetesObject):
+                return _make_field(name, camel_name, _FieldKind.TYPED_LIST, param)
+        return _make_field(name, camel_name, _FieldKind.RAW_LIST, hint)
 
     if origin is dict:
         # assumes all parameters are base types
-        return RawDict()
+        return _make_field(name, camel_name, _FieldKind.RAW_DICT, hint)
+
+    if origin is t.Union:
+        return _make_field(name, camel_name, _FieldKind.UNION, hint)
 
-    return None
+    if origin is None and isinstance(hint, type) and issubclass(hint, KubernetesObject):
+        return _make_field(name, camel_name, _FieldKind.OBJECT, hint)
+
+    return _make_field(name, camel_name, _FieldKind.SCALAR, hint)
+
+
+_FIELD_KINDS = {kind.name.lower(): kind for kind in _FieldKind}
+
+
+# Generated classes declare their fields as `_field_types_ = {"name": "kind" | ("kind", "module.Class"), …}`,
+# so their table is built without evaluating any annotation. Only object classes are referenced,
+# by name relative to the class module.
+def _static_field(module: types.ModuleType, name: str, camel_name: str, desc: str | tuple[str, str]) -> _Field:
+    if isinstance(desc, str):
+        return _make_field(name, camel_name, _FIELD_KINDS[desc], None)
+
+    kind, ref = desc
+    ty = module
+    for part in ref.split("."):
+        # triggers the module __getattr__ for modules imported lazily
+        ty = getattr(ty, part)
+    return _make_field(name, camel_name, _FIELD_KINDS[kind], ty)
+
+
+# ================================================
+#              Lazy Module References
+# ================================================
+
+
+class _LazyModules:
+    """Module `__getattr__` (PEP 562) importing the modules referenced by a generated module on first access."""
+
+    __slots__ = ("globals", "modules")
+
+    def __init__(self, module_globals: dict, modules: dict[str, str]):
+        self.globals = module_globals
+        # module name -> package to import it from (relative to the generated module)
+        self.modules = modules
+
+    def __call__(self, name: str):
+        package = self.modules.get(name)
+        if package is None:
+            raise AttributeError(f"module {self.globals['__name__']!r} has no attribute {name!r}")
+        prefix = package if package.endswith(".") else package + "."
+        module = importlib.import_module(prefix + name, self.globals["__package__"])
+        # cache it in the module namespace, so the hook is not called anymore
+        self.globals[name] = module
+        return module
+
+
+def lazy_modules(module_globals: dict, **modules: str) -> _LazyModules:
+    """Make the modules referenced by a generated module importable on first access.
+
+    >>> __getattr__ = lazy_modules(globals(), core="..api", meta="..api")
+    """
+    return _LazyModules(module_globals, modules)
+
+
+class _LazyNamespace(Mapping):
+    """Namespace used to evaluate annotations that reference modules not imported yet."""
+
+    __slots__ = ("hooks",)
+
+    def __init__(self, hooks: list[_LazyModules]):
+        self.hooks = hooks
+
+    def __getitem__(self, name: str):
+        for hook in self.hooks:
+            if name in hook.modules:
+                return hook.globals[name] if name in hook.globals else hook(name)
+        raise KeyError(name)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+def get_type_hints(cls) -> dict[str, t.Any]:
+    """typing.get_type_hints() for kubic classes.
+
+    Generated modules only import the modules they reference on first access, so their annotations can't be
+    evaluated by typing.get_type_hints() (it raises NameError). This resolves them, importing referenced modules as needed.
+    """
+    hooks = []
+    for base in cls.__mro__:
+        module = sys.modules.get(base.__module__)
+        hook = getattr(module, "__dict__", {}).get("__getattr__")
+        if isinstance(hook, _LazyModules) and hook not in hooks:
+            hooks.append(hook)
+    if not hooks:
+        return t.get_type_hints(cls)
+    return t.get_type_hints(cls, localns=_LazyNamespace(hooks))
+
+
+_fields_lock = threading.Lock()
+
+
+def _build_fields(cls) -> Mapping[str, _Field]:
+    with _fields_lock:
+        # an other thread may have built the table while we were waiting for the lock
+        if cls._fields is not None:
+            return cls._fields
+
+        # Fields are merged along the MRO, like get_type_hints() does. Classes declaring field types (generated
+        # classes) do not need their annotations, which slim modules do not even have. Other classes (subclasses
+        # written by users) add the fields they annotate.
+        fields = {}
+        hints = None
+        for base in reversed(cls.__mro__):
+            if "_field_types_" in base.__dict__:
+                module = sys.modules[base.__module__]
+                for name, desc in base._field_types_.items():
+                    camel_name = cls._field_names_.get(name) or snake_to_camel(name)
+                    fields[name] = _static_field(module, name, camel_name, desc)
+            elif base.__dict__.get("__annotations__"):
+                if hints is None:
+                    hints = get_type_hints(cls)
+                for name in base.__annotations__:
+                    camel_name = cls._field_names_.get(name) or snake_to_camel(name)
+                    fields[name] = _resolve_field(name, camel_name, hints[name])
+
+        # update() accepts both kubernetes and python names, python names taking precedence.
+        input_fields = {field.camel_name: field for field in fields.values()}
+        for camel_name, name in cls._revfield_names_.items():
+            if name in fields:
+                input_fields[camel_name] = fields[name]
+        input_fields.update(fields)
+
+        cls._input_fields = types.MappingProxyType(input_fields)
+        # must be set last, as it is used to check if the table is ready
+        cls._fields = types.MappingProxyType(fields)
+        return cls._fields
 
 
 class KubernetesObject(dict, metaclass=_K8SResourceMeta):
-    __slots__ = ("__dirty",)
+    __slots__ = ("__dirty", "__parent")
     _field_names_ = {}
+    _plain_init = True
 
     def __init__(self, **kwargs):
         super().__init__()
         # defaults to True, to not have to handle all case where the objet is created by the API user.
-        self.__dirty = True
+        _dirty_slot.__set__(self, True)
+        _parent_slot.__set__(self, None)
         for key, value in kwargs.items():
             if value is not None:
                 setattr(self, key, value)
@@ -155,140 +455,156 @@ class KubernetesObject(dict, metaclass=_K8SResourceMeta):
     def __contains__(self, item):
         if super().__contains__(item):
             return True
-        # check if this is a managed field.
-        self._item_hint(item)
-        # convert the python field name into kubernetes name
-        camel_name = self._field_names_.get(item) or snake_to_camel(item)
-        return super().__contains__(camel_name)
+        # check if this is a managed field and convert the python field name into kubernetes name
+        return super().__contains__(self._field_(item).camel_name)
 
     def __getattr__(self, item):
-        if item == "__dirty":
-            return self.__dirty
-
         # check if this is a managed field.
-        hint = self._item_hint(item)
-        # convert the python field name into kubernetes name
-        camel_name = self._field_names_.get(item) or snake_to_camel(item)
+        field = self._field_(item)
         # fetch the stored value
         try:
-            return self[camel_name]
+            value = self[field.camel_name]
         except KeyError:
             # value not set yet
             pass
-
-        value = None
-        # Handle generic types
-        if _is_generic_type(hint):
-            value = _create_generic_type(hint)
-            if value is not None:
-                self[camel_name] = value
+        else:
+            # raw subtrees (see _load_()) are converted into their typed class on first access
+            if (type(value) is dict or type(value) is list) and field.kind in _LAZY_KINDS:
+                value = _load_raw(field, value)
+                # reading an object must not modify it
+                if not _read_only.get():
+                    dict.__setitem__(self, field.camel_name, value)
             return value
 
-        # workaround broken PersistentVolumeClaim used as subresource.
-        if issubclass(hint, KubernetesApiResource):
-            value = hint(name="")
-            value.__dirty = False
-            self[camel_name] = value
-        # handle resource instances
-        elif issubclass(hint, KubernetesObject):
-            value = hint()
-            value.__dirty = False
-            self[camel_name] = value
+        if field.factory is None:
+            return None
 
+        # do not alter objects while inspecting them
+        if _read_only.get() or _parent_slot.__get__(self) is _FROZEN:
+            return _read_only_value(field)
+
+        value = field.factory()
+        dict.__setitem__(self, field.camel_name, value)
+        if not _dirty_slot.__get__(self):
+            # let the implicit value mark this object dirty on first write
+            if field.kind is not _FieldKind.OBJECT:
+                value._parent_ = self
+            elif _dirty_slot.__get__(value):
+                _set_dirty(self)
+            else:
+                _parent_slot.__set__(value, self)
         return value
 
     def __setattr__(self, key, value):
-        try:
-            # do not interfere with existing attributes
-            return super().__setattr__(key, value)
-        except AttributeError:
-            pass
+        field = self._fields_().get(key)
+        if field is None:
+            # do not interfere with existing attributes (slots, properties, …)
+            if hasattr(type(self), key):
+                return super().__setattr__(key, value)
+            self._attribute_error(key)
 
-        self.__dirty = True
+        _set_dirty(self)
         # kubernetes does not uses the concept of null value.
         # So instead of setting to None, remove the entry.
         if value is None:
-            return self.__delattr__(key)
-
-        hint = self._item_hint(key)  # check key validity
+            super().pop(field.camel_name, None)
+            return None
 
-        if _is_generic_type(hint):
-            origin = _get_generic_origin(hint)
-            if (origin is list) and hint.__args__:
-                param = hint.__args__[0]
-                if issubclass(param, KubernetesObject):
-                    value = _TypedList(param, True, value)
-        elif issubclass(hint, KubernetesObject) and not isinstance(value, hint):
+        kind = field.kind
+        if kind is _FieldKind.TYPED_LIST:
+            value = _TypedList(field.type, True, value)
+        elif kind is _FieldKind.OBJECT and not isinstance(value, field.type):
             # assume this is a dict and convert it into object
-            value = hint.from_dict(value)
-        else:
-            # TODO: check base type ?
-            pass
+            value = field.type.from_dict(value)
+        # TODO: check base type ?
 
-        camel_name = self._field_names_.get(key) or snake_to_camel(key)
-        self[camel_name] = value
+        dict.__setitem__(self, field.camel_name, value)
         return None
 
-    def __delattr__(self, item):
-        self._item_hint(item)  # check key validity
+    def __setitem__(self, key, value):
+        _set_dirty(self)
+        super().__setitem__(key, value)
 
-        camel_name = self._field_names_.get(item) or snake_to_camel(item)
-        super().pop(camel_name, None)
+    def __delattr__(self, item):
+        super().pop(self._field_(item).camel_name, None)
 
     def __dir__(self):
-        return dir(type(self)) + list(self._hints_().keys())
-
-    def _hints_(self) -> dict:
-        cls = type(self)
-        if cls._hints is None:
-            cls._hints = t.get_type_hints(cls)
-        return cls._hints
+        return dir(type(self)) + list(self._fields_())
 
-    def _item_hint(self, key: str):
-        hint = self._hints_().get(key)
-        if not hint:
+    @classmethod
+    def _fields_(cls) -> Mapping[str, _Field]:
+        # an empty table (class without fields) is built too
+        fields = cls._fields
+        return fields if fields is not None else _build_fields(cls)
+
+    def _field_(self, key: str) -> _Field:
+        field = self._fields_().get(key)
+        if field is None:
             # if not -> raise an attribute error
             self._attribute_error(key)
-        return hint
+        return field
+
+    # generated constructors only forward their keyword arguments, so there is no need to call them.
+    @classmethod
+    def _empty_(cls):
+        if not cls._plain_init:
+            return cls()
+        value = cls.__new__(cls)
+        _dirty_slot.__set__(value, True)
+        _parent_slot.__set__(value, None)
+        return value
+
+    @classmethod
+    def _implicit_(cls):
+        # create a value for a field that is accessed but not explicitly set by the user.
+        value = cls._empty_()
+        _dirty_slot.__set__(value, False)
+        return value
 
     def _update(self, key: str, value, strict: bool):
         # Dict accepts keys in both python syntax and using the kubernetes case
         # it also accepts keyword properties with or without the trailing '_'.
-        factory = self._hints_().get(key)
-        if factory is None:
-            snake_name = self._revfield_names_.get(key) or camel_to_snake(key)
-            factory = self._hints_().get(snake_name)
-            if factory:
-                key = snake_name
-            elif strict:
-                self._attribute_error(key)
-            else:
+        if self._fields is None:
+            _build_fields(type(self))
+        field = self._input_fields.get(key)
+        if field is None:
+            field = self._fields.get(camel_to_snake(key))
+            if field is None:
+                if strict:
+                    self._attribute_error(key)
                 # raw value
                 super().__setitem__(key, value)
                 return
 
-        if not _is_generic_type(factory):
-            if issubclass(factory, KubernetesObject):
-                # merge recursively
-                getattr(self, key).update(value, strict=strict)
-                return
-            elif issubclass(factory, dict):
-                # merge recursively
-                getattr(self, key).update(value)
-                return
-        # else set the value
-        setattr(self, key, value)
+        field.decode(self, value, strict)
+
+    # Store values without converting them: nested objects and lists are converted on first access.
+    # Unknown keys are kept as raw values, and values are not validated.
+    def _load_(self, values: dict):
+        if self._fields is None:
+            _build_fields(type(self))
+        for key, value in values.items():
+            if value is None:
+                continue
+            field = self._input_fields.get(key) or self._fields.get(camel_to_snake(key))
+            dict.__setitem__(self, field.camel_name if field else key, value)
+        return self
 
     def update(self, values: dict = None, /, strict: bool = True):
-        self.__dirty = True
+        _set_dirty(self)
         if values:
             # assume iterable of pairs if not a dict
-            items = values.items() if isinstance(values, Mapping) else values
+            items = values.items() if isinstance(values, (dict, Mapping)) else values
             for key, value in items:
                 self._update(key, value, strict)
 
         return self
 
+    # Export as plain dicts and lists, skipping values implicitly created by attribute access (like the YAML representer).
+    # The result does not share any mutable value with this object.
+    def to_dict(self) -> dict:
+        return _to_plain_object(self)
+
     def __or__(self, other):
         # copy self, bypassing type checking
         copy = type(self)()
@@ -303,7 +619,7 @@ class KubernetesObject(dict, metaclass=_K8SResourceMeta):
 
     def _attribute_error(self, attr: str):
         raise AttributeError(
-            f"{type(self).__name__} does not have attribute {attr}. Available attributes are: {', '.join(self._hints_().keys())}"
+            f"{type(self).__name__} does not have attribute {attr}. Available attributes are: {', '.join(self._fields_())}"
         )
 
     @classmethod
@@ -311,16 +627,80 @@ class KubernetesObject(dict, metaclass=_K8SResourceMeta):
         if values is None:
             return None
 
-        return cls().update(values)
+        return cls._empty_().update(values)
 
 
-# Wrapper to properly handle types.UnionType which is not a generic type but should behave like one
-def _get_generic_origin(ty: t.Type) -> t.Type | None:
-    if isinstance(ty, types.UnionType):
-        return None
-    return getattr(ty, "__origin__")
+# direct access to the dirty flag and parent link, bypassing KubernetesObject.__setattr__
+_dirty_slot = KubernetesObject.__dict__["_KubernetesObject__dirty"]
+_parent_slot = KubernetesObject.__dict__["_KubernetesObject__parent"]
+
+
+# An object is dirty if it was explicitly set, or if one of its descendants was modified.
+# Dirtiness is propagated to ancestors on write, so it never has to be computed by walking the tree.
+def _set_dirty(obj: KubernetesObject):
+    while obj is not None and not _dirty_slot.__get__(obj):
+        parent = _parent_slot.__get__(obj)
+        if parent is _FROZEN:
+            raise AttributeError(f"{type(obj).__name__} is a read-only value returned for a missing field")
+        _dirty_slot.__set__(obj, True)
+        _parent_slot.__set__(obj, None)
+        obj = parent
+
+
+# ================================================
+#              Read-Only Access
+# ================================================
+
+_read_only = contextvars.ContextVar("kubic_read_only", default=False)
+
+# parent link of the shared empty objects returned in read-only mode.
+_FROZEN = object()
+_EMPTY_MAPPING = types.MappingProxyType({})
+_frozen_objects: dict[type, KubernetesObject] = {}
+
+
+# In read-only mode, accessing a missing field does not create and store an empty value.
+# Missing objects, lists and dicts are replaced by shared immutable empty values instead.
+@contextlib.contextmanager
+def read_only():
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def _read_only_value(field: _Field):
+    if field.kind is _FieldKind.RAW_DICT:
+        return _EMPTY_MAPPING
+
+    if field.kind is not _FieldKind.OBJECT:
+        return ()
+
+    value = _frozen_objects.get(field.type)
+    if value is None:
+        # bypass constructors, as API resources set their apiVersion, kind and name.
+        value = dict.__new__(field.type)
+        _dirty_slot.__set__(value, False)
+        _parent_slot.__set__(value, _FROZEN)
+        _frozen_objects[field.type] = value
+    return value
+
+
+_LAZY_KINDS = (_FieldKind.OBJECT, _FieldKind.TYPED_LIST)
+
+
+def _load_raw(field: _Field, value: dict | list):
+    if field.kind is _FieldKind.OBJECT:
+        return field.type._empty_()._load_(value)
+
+    ty = field.type
+    items = _TypedList(ty, True)
+    list.extend(items, (ty._empty_()._load_(item) if type(item) is dict else item for item in value if item is not None))
+    return items
 
 
+# types.UnionType is not a generic type but should behave like one
 def _is_generic_type(ty: t.Type) -> bool:
     return isinstance(ty, types.UnionType) or hasattr(ty, "__origin__")
 
@@ -387,6 +767,16 @@ class KubernetesApiResource(KubernetesObject, metaclass=_K8SApiResourceMeta):
     def is_namespaced(self) -> bool:
         return getattr(type(self), "_scope_", None) == "namespace"
 
+    # workaround broken PersistentVolumeClaim used as subresource.
+    @classmethod
+    def _empty_(cls):
+        return cls(name="")
+
+    # metadata.name is always set, so implicit resources are never clean.
+    @classmethod
+    def _implicit_(cls):
+        return cls._empty_()
+
     # Special case to be able to pass a whole object dict and don't have to worry about ignored fields
     def _update(self, key, value, strict):
         if key == "api_version" or key == "apiVersion":
@@ -408,6 +798,16 @@ class KubernetesApiResource(KubernetesObject, metaclass=_K8SApiResourceMeta):
 
         return super()._update(key, value, strict)
 
+    def _load_(self, values: dict):
+        raw = {}
+        for key, value in values.items():
+            if key in ("api_version", "apiVersion", "kind", "status", "metadata"):
+                # check read-only fields, ignore status, and eagerly decode (small) metadata without managedFields.
+                self._update(key, value, strict=False)
+            else:
+                raw[key] = value
+        return super()._load_(raw)
+
 
 # ================================================
 #              YAML Representation
@@ -417,9 +817,11 @@ yaml.SafeDumper.add_representer(_TypedList, yaml.SafeDumper.represent_list)
 yaml.SafeDumper.add_representer(RawList, yaml.SafeDumper.represent_list)
 yaml.SafeDumper.add_representer(RawDict, yaml.SafeDumper.represent_dict)
 
-yaml.CSafeDumper.add_representer(_TypedList, yaml.SafeDumper.represent_list)
-yaml.CSafeDumper.add_representer(RawList, yaml.SafeDumper.represent_list)
-yaml.CSafeDumper.add_representer(RawDict, yaml.SafeDumper.represent_dict)
+# CSafeDumper is only available when PyYAML is built with libyaml.
+if yaml.__with_libyaml__:
+    yaml.CSafeDumper.add_representer(_TypedList, yaml.SafeDumper.represent_list)
+    yaml.CSafeDumper.add_representer(RawList, yaml.SafeDumper.represent_list)
+    yaml.CSafeDumper.add_representer(RawDict, yaml.SafeDumper.represent_dict)
 
 
 # see represent_dict()
@@ -436,19 +838,7 @@ def represent_k8s_object(dumper, obj: KubernetesObject):
         except TypeError:
             pass
     for item_key, item_value in mapping:
-        # Skipping objets generated by __get__ accessor, but never updated.
-        if isinstance(item_value, KubernetesObject) and not _is_dirty(item_value):
-            continue
-
-        if isinstance(item_value, _TypedList) and not item_value and not _is_dirty(item_value):
-            continue
-
-        # Skipping empty dict if it was generated by __get__ accessor.
-        if isinstance(item_value, RawDict) and not item_value:
-            continue
-
-        # Skipping empty list if it was generated by __get__ accessor.
-        if isinstance(item_value, RawList) and not item_value:
+        if _is_implicit(item_value):
             continue
 
         node_key = dumper.represent_data(item_key)
@@ -466,24 +856,88 @@ def represent_k8s_object(dumper, obj: KubernetesObject):
     return node
 
 
-def _is_dirty(rsrc: object):
-    if isinstance(rsrc, KubernetesObject):
-        if rsrc.__dirty:
-            return True
-        for v in rsrc.values():
-            if _is_dirty(v):
-                return True
-    elif isinstance(rsrc, _TypedList):
-        if len(rsrc) > 0 or rsrc.is_dirty:
-            return True
-    elif isinstance(rsrc, RawDict):
-        if len(rsrc) > 0:
-            return True
-    elif isinstance(rsrc, list):
-        if len(rsrc) > 0:
-            return True
+def _is_implicit(value) -> bool:
+    # Skipping objets generated by __get__ accessor, but never updated.
+    if isinstance(value, KubernetesObject):
+        return not _dirty_slot.__get__(value)
+
+    if isinstance(value, _TypedList):
+        return not value and not value.is_dirty
+
+    # Skipping empty dict and list if they were generated by __get__ accessor.
+    if isinstance(value, (RawDict, RawList)):
+        return not value
+
     return False
 
 
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _to_plain(value):
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, KubernetesObject):
+        return _to_plain_object(value)
+    if isinstance(value, Mapping):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _to_plain_object(obj: KubernetesObject) -> dict:
+    return {key: _to_plain(value) for key, value in obj.items() if not _is_implicit(value)}
+
+
 yaml.SafeDumper.add_multi_representer(KubernetesObject, represent_k8s_object)
-yaml.CSafeDumper.add_multi_representer(KubernetesObject, represent_k8s_object)
+if yaml.__with_libyaml__:
+    yaml.CSafeDumper.add_multi_representer(KubernetesObject, represent_k8s_object)
+
+
+# ================================================
+#              JSON Serialization
+# ================================================
+
+
+# The json C encoder serializes dict subclasses as plain dicts and would not skip implicit values,
+# so objects are pruned with _to_plain() first, then encoded in a single C call.
+@cache
+def _json_encoder(compact: bool, sort_keys: bool) -> json.JSONEncoder:
+    if compact:
+        return json.JSONEncoder(separators=(",", ":"), sort_keys=sort_keys, check_circular=False)
+    return json.JSONEncoder(indent=2, sort_keys=sort_keys, check_circular=False)
+
+
+def dumps_json(obj: KubernetesObject, *, compact: bool = True, sort_keys: bool = False) -> str:
+    """Serialize a kubic object as JSON, skipping implicitly created values.
+
+    :param compact: emit without any whitespace, else indent with 2 spaces.
+    :param sort_keys: emit keys in a stable sorted order, else in insertion order.
+    """
+    return _json_encoder(compact, sort_keys).encode(_to_plain(obj))
+
+
+def dump_json(objs: Iterable[KubernetesObject], fp: t.TextIO, *, compact: bool = True, sort_keys: bool = False):
+    """Write objects to a text stream as a single v1 List document.
+
+    Objects are encoded and written one at a time, so `objs` may be a generator producing any number of objects.
+    """
+    encoder = _json_encoder(compact, sort_keys)
+    if compact:
+        prefix, separator, suffix = '{"apiVersion":"v1","kind":"List","items":[', ",", "]}"
+    else:
+        prefix, separator, suffix = '{\n  "apiVersion": "v1",\n  "kind": "List",\n  "items": [\n    ', ",\n    ", "\n  ]\n}"
+
+    fp.write(prefix)
+    first = True
+    for obj in objs:
+        chunk = encoder.encode(_to_plain(obj))
+        if not compact:
+            # JSON strings never contain raw newlines, so only structural lines are shifted.
+            chunk = chunk.replace("\n", "\n    ")
+        if not first:
+            fp.write(separator)
+        fp.write(chunk)
+        first = False
+    fp.write(suffix)
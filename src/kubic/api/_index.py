@@ -0,0 +1,121 @@
+# Generated by pykapi, do not edit.
+# Used by kubic.reader to import the module defining a resource only when this resource is first resolved.
+
+OBJECT_META = "meta"
+
+RESOURCES = {
+    ("", "binding"): ("v1", "core", "Binding"),
+    ("", "componentstatus"): ("v1", "core", "ComponentStatus"),
+    ("", "configmap"): ("v1", "core", "ConfigMap"),
+    ("", "endpoints"): ("v1", "core", "Endpoints"),
+    ("", "event"): ("v1", "core", "Event"),
+    ("", "limitrange"): ("v1", "core", "LimitRange"),
+    ("", "namespace"): ("v1", "core", "Namespace"),
+    ("", "node"): ("v1", "core", "Node"),
+    ("", "persistentvolume"): ("v1", "core", "PersistentVolume"),
+    ("", "persistentvolumeclaim"): ("v1", "core", "PersistentVolumeClaim"),
+    ("", "pod"): ("v1", "core", "Pod"),
+    ("", "podtemplate"): ("v1", "core", "PodTemplate"),
+    ("", "replicationcontroller"): ("v1", "core", "ReplicationController"),
+    ("", "resourcequota"): ("v1", "core", "ResourceQuota"),
+    ("", "secret"): ("v1", "core", "Secret"),
+    ("", "service"): ("v1", "core", "Service"),
+    ("", "serviceaccount"): ("v1", "core", "ServiceAccount"),
+    ("admissionregistration.k8s.io", "mutatingadmissionpolicy"): (
+        "admissionregistration.k8s.io/v1alpha1",
+        "admissionregistration",
+        "MutatingAdmissionPolicy",
+    ),
+    ("admissionregistration.k8s.io", "mutatingadmissionpolicybinding"): (
+        "admissionregistration.k8s.io/v1alpha1",
+        "admissionregistration",
+        "MutatingAdmissionPolicyBinding",
+    ),
+    ("admissionregistration.k8s.io", "mutatingwebhookconfiguration"): (
+        "admissionregistration.k8s.io/v1",
+        "admissionregistration",
+        "MutatingWebhookConfiguration",
+    ),
+    ("admissionregistration.k8s.io", "validatingadmissionpolicy"): (
+        "admissionregistration.k8s.io/v1",
+        "admissionregistration",
+        "ValidatingAdmissionPolicy",
+    ),
+    ("admissionregistration.k8s.io", "validatingadmissionpolicybinding"): (
+        "admissionregistration.k8s.io/v1",
+        "admissionregistration",
+        "ValidatingAdmissionPolicyBinding",
+    ),
+    ("admissionregistration.k8s.io", "validatingwebhookconfiguration"): (
+        "admissionregistration.k8s.io/v1",
+        "admissionregistration",
+        "ValidatingWebhookConfiguration",
+    ),
+    ("apiextensions.k8s.io", "customresourcedefinition"): ("apiextensions.k8s.io/v1", "apiextensions", "CustomResourceDefinition"),
+    ("apiregistration.k8s.io", "apiservice"): ("apiregistration.k8s.io/v1", "apiregistration", "APIService"),
+    ("apps", "controllerrevision"): ("apps/v1", "apps", "ControllerRevision"),
+    ("apps", "daemonset"): ("apps/v1", "apps", "DaemonSet"),
+    ("apps", "deployment"): ("apps/v1", "apps", "Deployment"),
+    ("apps", "replicaset"): ("apps/v1", "apps", "ReplicaSet"),
+    ("apps", "statefulset"): ("apps/v1", "apps", "StatefulSet"),
+    ("authentication.k8s.io", "selfsubjectreview"): ("authentication.k8s.io/v1", "authentication", "SelfSubjectReview"),
+    ("authentication.k8s.io", "tokenrequest"): ("authentication.k8s.io/v1", "authentication", "TokenRequest"),
+    ("authentication.k8s.io", "tokenreview"): ("authentication.k8s.io/v1", "authentication", "TokenReview"),
+    ("authorization.k8s.io", "localsubjectaccessreview"): ("authorization.k8s.io/v1", "authorization", "LocalSubjectAccessReview"),
+    ("authorization.k8s.io", "selfsubjectaccessreview"): ("authorization.k8s.io/v1", "authorization", "SelfSubjectAccessReview"),
+    ("authorization.k8s.io", "selfsubjectrulesreview"): ("authorization.k8s.io/v1", "authorization", "SelfSubjectRulesReview"),
+    ("authorization.k8s.io", "subjectaccessreview"): ("authorization.k8s.io/v1", "authorization", "SubjectAccessReview"),
+    ("autoscaling", "horizontalpodautoscaler"): ("autoscaling/v1", "autoscaling", "HorizontalPodAutoscaler"),
+    ("autoscaling", "scale"): ("autoscaling/v1", "autoscaling", "Scale"),
+    ("batch", "cronjob"): ("batch/v1", "batch", "CronJob"),
+    ("batch", "job"): ("batch/v1", "batch", "Job"),
+    ("certificates.k8s.io", "certificatesigningrequest"): ("certificates.k8s.io/v1", "certificates", "CertificateSigningRequest"),
+    ("certificates.k8s.io", "clustertrustbundle"): ("certificates.k8s.io/v1alpha1", "certificates", "ClusterTrustBundle"),
+    ("coordination.k8s.io", "lease"): ("coordination.k8s.io/v1", "coordination", "Lease"),
+    ("coordination.k8s.io", "leasecandidate"): ("coordination.k8s.io/v1alpha2", "coordination", "LeaseCandidate"),
+    ("discovery.k8s.io", "endpointslice"): ("discovery.k8s.io/v1", "discovery", "EndpointSlice"),
+    ("events.k8s.io", "event"): ("events.k8s.io/v1", "events", "Event"),
+    ("flowcontrol.apiserver.k8s.io", "flowschema"): ("flowcontrol.apiserver.k8s.io/v1", "flowcontrol", "FlowSchema"),
+    ("flowcontrol.apiserver.k8s.io", "prioritylevelconfiguration"): (
+        "flowcontrol.apiserver.k8s.io/v1",
+        "flowcontrol",
+        "PriorityLevelConfiguration",
+    ),
+    ("internal.apiserver.k8s.io", "storageversion"): ("internal.apiserver.k8s.io/v1alpha1", "internal", "StorageVersion"),
+    ("meta", "apigroup"): ("meta/v1", "meta", "APIGroup"),
+    ("meta", "apigrouplist"): ("meta/v1", "meta", "APIGroupList"),
+    ("meta", "apiresourcelist"): ("meta/v1", "meta", "APIResourceList"),
+    ("meta", "apiversions"): ("meta/v1", "meta", "APIVersions"),
+    ("meta", "deleteoptions"): ("meta/v1", "meta", "DeleteOptions"),
+    ("meta", "status"): ("meta/v1", "meta", "Status"),
+    ("meta", "watchevent"): ("meta/v1", "meta", "WatchEvent"),
+    ("networking.k8s.io", "ingress"): ("networking.k8s.io/v1", "networking", "Ingress"),
+    ("networking.k8s.io", "ingressclass"): ("networking.k8s.io/v1", "networking", "IngressClass"),
+    ("networking.k8s.io", "ipaddress"): ("networking.k8s.io/v1", "networking", "IPAddress"),
+    ("networking.k8s.io", "networkpolicy"): ("networking.k8s.io/v1", "networking", "NetworkPolicy"),
+    ("networking.k8s.io", "servicecidr"): ("networking.k8s.io/v1", "networking", "ServiceCIDR"),
+    ("node.k8s.io", "runtimeclass"): ("node.k8s.io/v1", "node", "RuntimeClass"),
+    ("policy", "eviction"): ("policy/v1", "policy", "Eviction"),
+    ("policy", "poddisruptionbudget"): ("policy/v1", "policy", "PodDisruptionBudget"),
+    ("rbac.authorization.k8s.io", "clusterrole"): ("rbac.authorization.k8s.io/v1", "rbac", "ClusterRole"),
+    ("rbac.authorization.k8s.io", "clusterrolebinding"): ("rbac.authorization.k8s.io/v1", "rbac", "ClusterRoleBinding"),
+    ("rbac.authorization.k8s.io", "role"): ("rbac.authorization.k8s.io/v1", "rbac", "Role"),
+    ("rbac.authorization.k8s.io", "rolebinding"): ("rbac.authorization.k8s.io/v1", "rbac", "RoleBinding"),
+    ("resource.k8s.io", "deviceclass"): ("resource.k8s.io/v1alpha3", "resource", "DeviceClass"),
+    ("resource.k8s.io", "devicetaintrule"): ("resource.k8s.io/v1alpha3", "resource", "DeviceTaintRule"),
+    ("resource.k8s.io", "resourceclaim"): ("resource.k8s.io/v1alpha3", "resource", "ResourceClaim"),
+    ("resource.k8s.io", "resourceclaimtemplate"): ("resource.k8s.io/v1alpha3", "resource", "ResourceClaimTemplate"),
+    ("resource.k8s.io", "resourceslice"): ("resource.k8s.io/v1alpha3", "resource", "ResourceSlice"),
+    ("scheduling.k8s.io", "priorityclass"): ("scheduling.k8s.io/v1", "scheduling", "PriorityClass"),
+    ("storage.k8s.io", "csidriver"): ("storage.k8s.io/v1", "storage", "CSIDriver"),
+    ("storage.k8s.io", "csinode"): ("storage.k8s.io/v1", "storage", "CSINode"),
+    ("storage.k8s.io", "csistoragecapacity"): ("storage.k8s.io/v1", "storage", "CSIStorageCapacity"),
+    ("storage.k8s.io", "storageclass"): ("storage.k8s.io/v1", "storage", "StorageClass"),
+    ("storage.k8s.io", "volumeattachment"): ("storage.k8s.io/v1", "storage", "VolumeAttachment"),
+    ("storage.k8s.io", "volumeattributesclass"): ("storage.k8s.io/v1alpha1", "storage", "VolumeAttributesClass"),
+    ("storagemigration.k8s.io", "storageversionmigration"): (
+        "storagemigration.k8s.io/v1alpha1",
+        "storagemigration",
+        "StorageVersionMigration",
+    ),
+}
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class ApplyConfiguration(KubernetesObject):
@@ -9,6 +17,10 @@ class ApplyConfiguration(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "expression": "scalar",
+    }
+
     expression: str
     """
     expression will be evaluated by CEL to create an apply configuration. ref: https://github.com/google/cel-spec
@@ -54,6 +66,11 @@ class AuditAnnotation(KubernetesObject):
 
     _required_ = ["key", "value_expression"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "value_expression": "scalar",
+    }
+
     key: str
     """
     key specifies the audit annotation key. The audit annotation keys of a ValidatingAdmissionPolicy must be unique. The key must be a qualified name ([A-Za-z0-9][-A-Za-z0-9_.]*) no more than 63 bytes in length.
@@ -86,6 +103,11 @@ class ExpressionWarning(KubernetesObject):
 
     _required_ = ["field_ref", "warning"]
 
+    _field_types_ = {
+        "field_ref": "scalar",
+        "warning": "scalar",
+    }
+
     field_ref: str
     """ The path to the field that refers the expression. For example, the reference to the expression of the first item of validations is "spec.validations[0].expression" """
     warning: str
@@ -102,6 +124,10 @@ class JSONPatch(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "expression": "scalar",
+    }
+
     expression: str
     """
     expression will be evaluated by CEL to create a [JSON patch](https://jsonpatch.com/). ref: https://github.com/google/cel-spec
@@ -173,6 +199,11 @@ class MatchCondition(KubernetesObject):
 
     _required_ = ["expression", "name"]
 
+    _field_types_ = {
+        "expression": "scalar",
+        "name": "scalar",
+    }
+
     expression: str
     """
     Expression represents the expression which will be evaluated by CEL. Must evaluate to bool. CEL expressions have access to the contents of the AdmissionRequest and Authorizer, organized into CEL variables:
@@ -203,6 +234,15 @@ class NamedRuleWithOperations(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "api_groups": "raw_list",
+        "api_versions": "raw_list",
+        "operations": "raw_list",
+        "resource_names": "raw_list",
+        "resources": "raw_list",
+        "scope": "scalar",
+    }
+
     api_groups: list[str]
     """ APIGroups is the API groups the resources belong to. '*' is all groups. If '*' is present, the length of the slice must be one. Required. """
     api_versions: list[str]
@@ -250,6 +290,14 @@ class MatchResources(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "exclude_resource_rules": ("typed_list", "NamedRuleWithOperations"),
+        "match_policy": "scalar",
+        "namespace_selector": ("object", "meta.LabelSelector"),
+        "object_selector": ("object", "meta.LabelSelector"),
+        "resource_rules": ("typed_list", "NamedRuleWithOperations"),
+    }
+
     exclude_resource_rules: list[NamedRuleWithOperations]
     """ ExcludeResourceRules describes what operations on what resources/subresources the ValidatingAdmissionPolicy should not care about. The exclude rules take precedence over include rules (if a resource matches both, it is excluded) """
     match_policy: str
@@ -327,6 +375,12 @@ class Mutation(KubernetesObject):
 
     _required_ = ["patch_type"]
 
+    _field_types_ = {
+        "apply_configuration": ("object", "ApplyConfiguration"),
+        "json_patch": ("object", "JSONPatch"),
+        "patch_type": "scalar",
+    }
+
     apply_configuration: ApplyConfiguration
     """ applyConfiguration defines the desired configuration values of an object. The configuration is applied to the admission object using [structured merge diff](https://github.com/kubernetes-sigs/structured-merge-diff). A CEL expression is used to create apply configuration. """
     json_patch: JSONPatch
@@ -345,6 +399,11 @@ class ParamKind(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "kind": "scalar",
+    }
+
     api_version: str
     """ APIVersion is the API group version the resources belong to. In format of "group/version". Required. """
     kind: str
@@ -363,6 +422,11 @@ class Variable(KubernetesObject):
 
     _required_ = ["expression", "name"]
 
+    _field_types_ = {
+        "expression": "scalar",
+        "name": "scalar",
+    }
+
     expression: str
     """ Expression is the expression that will be evaluated as the value of the variable. The CEL expression has access to the same identifiers as the CEL expressions in Validation. """
     name: str
@@ -379,6 +443,16 @@ class MutatingAdmissionPolicySpec(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "failure_policy": "scalar",
+        "match_conditions": ("typed_list", "MatchCondition"),
+        "match_constraints": ("object", "MatchResources"),
+        "mutations": ("typed_list", "Mutation"),
+        "param_kind": ("object", "ParamKind"),
+        "reinvocation_policy": "scalar",
+        "variables": ("typed_list", "Variable"),
+    }
+
     failure_policy: str
     """
     failurePolicy defines how to handle failures for the admission policy. Failures can occur from CEL expression parse errors, type check errors, runtime errors and invalid or mis-configured policy definitions or bindings.
@@ -454,6 +528,11 @@ class MutatingAdmissionPolicy(KubernetesApiResource):
     _kind_ = "MutatingAdmissionPolicy"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "MutatingAdmissionPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     spec: MutatingAdmissionPolicySpec
@@ -470,6 +549,13 @@ class ParamRef(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+        "parameter_not_found_action": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     name: str
     """
     name is the name of the resource being referenced.
@@ -518,6 +604,12 @@ class MutatingAdmissionPolicyBindingSpec(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "match_resources": ("object", "MatchResources"),
+        "param_ref": ("object", "ParamRef"),
+        "policy_name": "scalar",
+    }
+
     match_resources: MatchResources
     """ matchResources limits what resources match this binding and may be mutated by it. Note that if matchResources matches a resource, the resource must also match a policy's matchConstraints and matchConditions before the resource may be mutated. When matchResources is unset, it does not constrain resource matching, and only the policy's matchConstraints and matchConditions must match for the resource to be mutated. Additionally, matchResources.resourceRules are optional and do not constraint matching when unset. Note that this is differs from MutatingAdmissionPolicy matchConstraints, where resourceRules are required. The CREATE, UPDATE and CONNECT operations are allowed.  The DELETE operation may not be matched. '*' matches CREATE, UPDATE and CONNECT. """
     param_ref: ParamRef
@@ -545,6 +637,11 @@ class MutatingAdmissionPolicyBinding(KubernetesApiResource):
     _kind_ = "MutatingAdmissionPolicyBinding"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "MutatingAdmissionPolicyBindingSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     spec: MutatingAdmissionPolicyBindingSpec
@@ -563,6 +660,13 @@ class ServiceReference(KubernetesObject):
 
     _required_ = ["name", "namespace"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+        "path": "scalar",
+        "port": "scalar",
+    }
+
     name: str
     """ `name` is the name of the service. Required """
     namespace: str
@@ -583,6 +687,12 @@ class WebhookClientConfig(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "ca_bundle": "scalar",
+        "service": ("object", "ServiceReference"),
+        "url": "scalar",
+    }
+
     ca_bundle: core.Base64
     """ `caBundle` is a PEM encoded CA bundle which will be used to validate the webhook's server certificate. If unspecified, system trust roots on the apiserver are used. """
     service: ServiceReference
@@ -617,6 +727,14 @@ class RuleWithOperations(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "api_groups": "raw_list",
+        "api_versions": "raw_list",
+        "operations": "raw_list",
+        "resources": "raw_list",
+        "scope": "scalar",
+    }
+
     api_groups: list[str]
     """ APIGroups is the API groups the resources belong to. '*' is all groups. If '*' is present, the length of the slice must be one. Required. """
     api_versions: list[str]
@@ -656,6 +774,21 @@ class MutatingWebhook(KubernetesObject):
 
     _required_ = ["admission_review_versions", "client_config", "name", "side_effects"]
 
+    _field_types_ = {
+        "admission_review_versions": "raw_list",
+        "client_config": ("object", "WebhookClientConfig"),
+        "failure_policy": "scalar",
+        "match_conditions": ("typed_list", "MatchCondition"),
+        "match_policy": "scalar",
+        "name": "scalar",
+        "namespace_selector": ("object", "meta.LabelSelector"),
+        "object_selector": ("object", "meta.LabelSelector"),
+        "reinvocation_policy": "scalar",
+        "rules": ("typed_list", "RuleWithOperations"),
+        "side_effects": "scalar",
+        "timeout_seconds": "scalar",
+    }
+
     admission_review_versions: list[str]
     """ AdmissionReviewVersions is an ordered list of preferred `AdmissionReview` versions the Webhook expects. API server will try to use first version in the list which it supports. If none of the versions specified in this list supported by API server, validation will fail for this object. If a persisted webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail and be subject to the failure policy. """
     client_config: WebhookClientConfig
@@ -779,6 +912,11 @@ class MutatingWebhookConfiguration(KubernetesApiResource):
     _kind_ = "MutatingWebhookConfiguration"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "webhooks": ("typed_list", "MutatingWebhook"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     webhooks: list[MutatingWebhook]
@@ -795,6 +933,10 @@ class TypeChecking(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "expression_warnings": ("typed_list", "ExpressionWarning"),
+    }
+
     expression_warnings: list[ExpressionWarning]
     """ The type checking warnings for each expression. """
 
@@ -811,6 +953,13 @@ class Validation(KubernetesObject):
 
     _required_ = ["expression"]
 
+    _field_types_ = {
+        "expression": "scalar",
+        "message": "scalar",
+        "message_expression": "scalar",
+        "reason": "scalar",
+    }
+
     expression: str
     """
     Expression represents the expression which will be evaluated by CEL. ref: https://github.com/google/cel-spec CEL expressions have access to the contents of the API request/response, organized into CEL variables as well as some other useful variables:
@@ -858,6 +1007,16 @@ class ValidatingAdmissionPolicySpec(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "audit_annotations": ("typed_list", "AuditAnnotation"),
+        "failure_policy": "scalar",
+        "match_conditions": ("typed_list", "MatchCondition"),
+        "match_constraints": ("object", "MatchResources"),
+        "param_kind": ("object", "ParamKind"),
+        "validations": ("typed_list", "Validation"),
+        "variables": ("typed_list", "Variable"),
+    }
+
     audit_annotations: list[AuditAnnotation]
     """ auditAnnotations contains CEL expressions which are used to produce audit annotations for the audit event of the API request. validations and auditAnnotations may not both be empty; a least one of validations or auditAnnotations is required. """
     failure_policy: str
@@ -929,6 +1088,11 @@ class ValidatingAdmissionPolicy(KubernetesApiResource):
     _kind_ = "ValidatingAdmissionPolicy"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ValidatingAdmissionPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     spec: ValidatingAdmissionPolicySpec
@@ -945,6 +1109,13 @@ class ValidatingAdmissionPolicyBindingSpec(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "match_resources": ("object", "MatchResources"),
+        "param_ref": ("object", "ParamRef"),
+        "policy_name": "scalar",
+        "validation_actions": "raw_list",
+    }
+
     match_resources: MatchResources
     """ MatchResources declares what resources match this binding and will be validated by it. Note that this is intersected with the policy's matchConstraints, so only requests that are matched by the policy can be selected by this. If this is unset, all resources matched by the policy are validated by this binding When resourceRules is unset, it does not constrain resource matching. If a resource is matched by the other fields of this object, it will be validated. Note that this is differs from ValidatingAdmissionPolicy matchConstraints, where resourceRules are required. """
     param_ref: ParamRef
@@ -1002,6 +1173,11 @@ class ValidatingAdmissionPolicyBinding(KubernetesApiResource):
     _kind_ = "ValidatingAdmissionPolicyBinding"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ValidatingAdmissionPolicyBindingSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     spec: ValidatingAdmissionPolicyBindingSpec
@@ -1020,6 +1196,12 @@ class ValidatingAdmissionPolicyStatus(KubernetesObject):
 
     _api_version_ = "admissionregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "meta.Condition"),
+        "observed_generation": "scalar",
+        "type_checking": ("object", "TypeChecking"),
+    }
+
     conditions: list[meta.Condition]
     """ The conditions represent the latest available observations of a policy's current state. """
     observed_generation: int
@@ -1040,6 +1222,20 @@ class ValidatingWebhook(KubernetesObject):
 
     _required_ = ["admission_review_versions", "client_config", "name", "side_effects"]
 
+    _field_types_ = {
+        "admission_review_versions": "raw_list",
+        "client_config": ("object", "WebhookClientConfig"),
+        "failure_policy": "scalar",
+        "match_conditions": ("typed_list", "MatchCondition"),
+        "match_policy": "scalar",
+        "name": "scalar",
+        "namespace_selector": ("object", "meta.LabelSelector"),
+        "object_selector": ("object", "meta.LabelSelector"),
+        "rules": ("typed_list", "RuleWithOperations"),
+        "side_effects": "scalar",
+        "timeout_seconds": "scalar",
+    }
+
     admission_review_versions: list[str]
     """ AdmissionReviewVersions is an ordered list of preferred `AdmissionReview` versions the Webhook expects. API server will try to use first version in the list which it supports. If none of the versions specified in this list supported by API server, validation will fail for this object. If a persisted webhook configuration specifies allowed versions and does not include any versions known to the API Server, calls to the webhook will fail and be subject to the failure policy. """
     client_config: WebhookClientConfig
@@ -1151,6 +1347,11 @@ class ValidatingWebhookConfiguration(KubernetesApiResource):
     _kind_ = "ValidatingWebhookConfiguration"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "webhooks": ("typed_list", "ValidatingWebhook"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     webhooks: list[ValidatingWebhook]
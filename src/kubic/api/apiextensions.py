@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class CustomResourceColumnDefinition(KubernetesObject):
@@ -13,6 +19,15 @@ class CustomResourceColumnDefinition(KubernetesObject):
 
     _required_ = ["json_path", "name", "type"]
 
+    _field_types_ = {
+        "description": "scalar",
+        "format": "scalar",
+        "json_path": "scalar",
+        "name": "scalar",
+        "priority": "scalar",
+        "type": "scalar",
+    }
+
     description: str
     """ description is a human readable description of this column. """
     format: str
@@ -41,6 +56,13 @@ class ServiceReference(KubernetesObject):
 
     _required_ = ["name", "namespace"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+        "path": "scalar",
+        "port": "scalar",
+    }
+
     name: str
     """ name is the name of the service. Required """
     namespace: str
@@ -61,6 +83,12 @@ class WebhookClientConfig(KubernetesObject):
 
     _api_version_ = "apiextensions.k8s.io/v1"
 
+    _field_types_ = {
+        "ca_bundle": "scalar",
+        "service": ("object", "ServiceReference"),
+        "url": "scalar",
+    }
+
     ca_bundle: core.Base64
     """ caBundle is a PEM encoded CA bundle which will be used to validate the webhook's server certificate. If unspecified, system trust roots on the apiserver are used. """
     service: ServiceReference
@@ -97,6 +125,11 @@ class WebhookConversion(KubernetesObject):
 
     _required_ = ["conversion_review_versions"]
 
+    _field_types_ = {
+        "client_config": ("object", "WebhookClientConfig"),
+        "conversion_review_versions": "raw_list",
+    }
+
     client_config: WebhookClientConfig
     """ clientConfig is the instructions for how to call the webhook if strategy is `Webhook`. """
     conversion_review_versions: list[str]
@@ -115,6 +148,11 @@ class CustomResourceConversion(KubernetesObject):
 
     _required_ = ["strategy"]
 
+    _field_types_ = {
+        "strategy": "scalar",
+        "webhook": ("object", "WebhookConversion"),
+    }
+
     strategy: str
     """
     strategy specifies how custom resources are converted between versions. Allowed values are: - `"None"`: The converter only change the apiVersion and would not touch any other field in the custom resource. - `"Webhook"`: API Server will call to an external webhook to do the conversion. Additional information
@@ -136,6 +174,15 @@ class CustomResourceDefinitionNames(KubernetesObject):
 
     _required_ = ["kind", "plural"]
 
+    _field_types_ = {
+        "categories": "raw_list",
+        "kind": "scalar",
+        "list_kind": "scalar",
+        "plural": "scalar",
+        "short_names": "raw_list",
+        "singular": "scalar",
+    }
+
     categories: list[str]
     """ categories is a list of grouped resources this custom resource belongs to (e.g. 'all'). This is published in API discovery documents, and used by clients to support invocations like `kubectl get all`. """
     kind: str
@@ -180,6 +227,11 @@ class ExternalDocumentation(KubernetesObject):
 
     _api_version_ = "apiextensions.k8s.io/v1"
 
+    _field_types_ = {
+        "description": "scalar",
+        "url": "scalar",
+    }
+
     description: str
     url: str
 
@@ -200,6 +252,15 @@ class ValidationRule(KubernetesObject):
 
     _required_ = ["rule"]
 
+    _field_types_ = {
+        "field_path": "scalar",
+        "message": "scalar",
+        "message_expression": "scalar",
+        "optional_old_self": "scalar",
+        "reason": "scalar",
+        "rule": "scalar",
+    }
+
     field_path: str
     """ fieldPath represents the field path returned when the validation fails. It must be a relative JSON path (i.e. with array notation) scoped to the location of this x-kubernetes-validations extension in the schema and refer to an existing field. e.g. when validation checks if a specific attribute `foo` under a map `testMap`, the fieldPath could be set to `.testMap.foo` If the validation checks two lists must have unique attributes, the fieldPath could be set to either of the list: e.g. `.testList` It does not support list numeric index. It supports child operation to refer to an existing field currently. Refer to [JSONPath support in Kubernetes](https://kubernetes.io/docs/reference/kubectl/jsonpath/) for more info. Numeric index of array is not supported. For field name which contains special characters, use `['specialName']` to refer the field name. e.g. for attribute `foo.34$` appears in a list `testList`, the fieldPath could be set to `.testList['foo.34$']` """
     message: str
@@ -305,6 +366,53 @@ class JSONSchemaProps(KubernetesObject):
         "x-kubernetes-validations": "x_kubernetes_validations",
     }
 
+    _field_types_ = {
+        "ref_": "scalar",
+        "schema_": "scalar",
+        "additional_items": "union",
+        "additional_properties": "union",
+        "all_of": ("typed_list", "JSONSchemaProps"),
+        "any_of": ("typed_list", "JSONSchemaProps"),
+        "default": "union",
+        "definitions": "raw_dict",
+        "dependencies": "raw_dict",
+        "description": "scalar",
+        "enum": "raw_list",
+        "example": "union",
+        "exclusive_maximum": "scalar",
+        "exclusive_minimum": "scalar",
+        "external_docs": ("object", "ExternalDocumentation"),
+        "format": "scalar",
+        "id": "scalar",
+        "items": "union",
+        "max_items": "scalar",
+        "max_length": "scalar",
+        "max_properties": "scalar",
+        "maximum": "scalar",
+        "min_items": "scalar",
+        "min_length": "scalar",
+        "min_properties": "scalar",
+        "minimum": "scalar",
+        "multiple_of": "scalar",
+        "not_": ("object", "JSONSchemaProps"),
+        "nullable": "scalar",
+        "one_of": ("typed_list", "JSONSchemaProps"),
+        "pattern": "scalar",
+        "pattern_properties": "raw_dict",
+        "properties": "raw_dict",
+        "required": "raw_list",
+        "title": "scalar",
+        "type": "scalar",
+        "unique_items": "scalar",
+        "x_kubernetes_embedded_resource": "scalar",
+        "x_kubernetes_int_or_string": "scalar",
+        "x_kubernetes_list_map_keys": "raw_list",
+        "x_kubernetes_list_type": "scalar",
+        "x_kubernetes_map_type": "scalar",
+        "x_kubernetes_preserve_unknown_fields": "scalar",
+        "x_kubernetes_validations": ("typed_list", "ValidationRule"),
+    }
+
     ref_: str
     schema_: str
     additional_items: JSONSchemaPropsOrBool
@@ -513,6 +621,10 @@ class CustomResourceValidation(KubernetesObject):
         "openAPIV3Schema": "openapi_v3_schema",
     }
 
+    _field_types_ = {
+        "openapi_v3_schema": ("object", "JSONSchemaProps"),
+    }
+
     openapi_v3_schema: JSONSchemaProps
     """ openAPIV3Schema is the OpenAPI v3 schema to use for validation and pruning. """
 
@@ -529,6 +641,10 @@ class SelectableField(KubernetesObject):
 
     _required_ = ["json_path"]
 
+    _field_types_ = {
+        "json_path": "scalar",
+    }
+
     json_path: str
     """ jsonPath is a simple JSON path which is evaluated against each custom resource to produce a field selector value. Only JSON paths without the array notation are allowed. Must point to a field of type string, boolean or integer. Types with enum values and strings with formats are allowed. If jsonPath refers to absent field in a resource, the jsonPath evaluates to an empty string. Must not point to metdata fields. Required. """
 
@@ -545,6 +661,12 @@ class CustomResourceSubresourceScale(KubernetesObject):
 
     _required_ = ["spec_replicas_path", "status_replicas_path"]
 
+    _field_types_ = {
+        "label_selector_path": "scalar",
+        "spec_replicas_path": "scalar",
+        "status_replicas_path": "scalar",
+    }
+
     label_selector_path: str
     """ labelSelectorPath defines the JSON path inside of a custom resource that corresponds to Scale `status.selector`. Only JSON paths without the array notation are allowed. Must be a JSON Path under `.status` or `.spec`. Must be set to work with HorizontalPodAutoscaler. The field pointed by this JSON path must be a string field (not a complex selector struct) which contains a serialized label selector in string form. More info: https://kubernetes.io/docs/tasks/access-kubernetes-api/custom-resources/custom-resource-definitions#scale-subresource If there is no value under the given path in the custom resource, the `status.selector` value in the `/scale` subresource will default to the empty string. """
     spec_replicas_path: str
@@ -569,6 +691,11 @@ class CustomResourceSubresources(KubernetesObject):
 
     _api_version_ = "apiextensions.k8s.io/v1"
 
+    _field_types_ = {
+        "scale": ("object", "CustomResourceSubresourceScale"),
+        "status": "raw_dict",
+    }
+
     scale: CustomResourceSubresourceScale
     """ scale indicates the custom resource should serve a `/scale` subresource that returns an `autoscaling/v1` Scale object. """
     status: CustomResourceSubresourceStatus
@@ -587,6 +714,18 @@ class CustomResourceDefinitionVersion(KubernetesObject):
 
     _required_ = ["name", "served", "storage"]
 
+    _field_types_ = {
+        "additional_printer_columns": ("typed_list", "CustomResourceColumnDefinition"),
+        "deprecated": "scalar",
+        "deprecation_warning": "scalar",
+        "name": "scalar",
+        "schema": ("object", "CustomResourceValidation"),
+        "selectable_fields": ("typed_list", "SelectableField"),
+        "served": "scalar",
+        "storage": "scalar",
+        "subresources": ("object", "CustomResourceSubresources"),
+    }
+
     additional_printer_columns: list[CustomResourceColumnDefinition]
     """ additionalPrinterColumns specifies additional columns returned in Table output. See https://kubernetes.io/docs/reference/using-api/api-concepts/#receiving-resources-as-tables for details. If no columns are specified, a single column displaying the age of the custom resource is used. """
     deprecated: bool
@@ -640,6 +779,15 @@ class CustomResourceDefinitionSpec(KubernetesObject):
 
     _required_ = ["group", "names", "scope", "versions"]
 
+    _field_types_ = {
+        "conversion": ("object", "CustomResourceConversion"),
+        "group": "scalar",
+        "names": ("object", "CustomResourceDefinitionNames"),
+        "preserve_unknown_fields": "scalar",
+        "scope": "scalar",
+        "versions": ("typed_list", "CustomResourceDefinitionVersion"),
+    }
+
     conversion: CustomResourceConversion
     """ conversion defines conversion settings for the CRD. """
     group: str
@@ -679,6 +827,11 @@ class CustomResourceDefinition(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CustomResourceDefinitionSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: CustomResourceDefinitionSpec
@@ -697,6 +850,14 @@ class CustomResourceDefinitionCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ lastTransitionTime last time the condition transitioned from one status to another. """
     message: str
@@ -721,6 +882,12 @@ class CustomResourceDefinitionStatus(KubernetesObject):
 
     _api_version_ = "apiextensions.k8s.io/v1"
 
+    _field_types_ = {
+        "accepted_names": ("object", "CustomResourceDefinitionNames"),
+        "conditions": ("typed_list", "CustomResourceDefinitionCondition"),
+        "stored_versions": "raw_list",
+    }
+
     accepted_names: CustomResourceDefinitionNames
     """ acceptedNames are the names that are actually being used to serve discovery. They may be different than the names in spec. """
     conditions: list[CustomResourceDefinitionCondition]
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class ServiceReference(KubernetesObject):
@@ -9,6 +17,12 @@ class ServiceReference(KubernetesObject):
 
     _api_version_ = "apiregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+        "port": "scalar",
+    }
+
     name: str
     """ Name is the name of the service """
     namespace: str
@@ -36,6 +50,16 @@ class APIServiceSpec(KubernetesObject):
         "insecureSkipTLSVerify": "insecure_skip_tls_verify",
     }
 
+    _field_types_ = {
+        "ca_bundle": "scalar",
+        "group": "scalar",
+        "group_priority_minimum": "scalar",
+        "insecure_skip_tls_verify": "scalar",
+        "service": ("object", "ServiceReference"),
+        "version": "scalar",
+        "version_priority": "scalar",
+    }
+
     ca_bundle: core.Base64
     """ CABundle is a PEM encoded CA bundle which will be used to validate an API server's serving certificate. If unspecified, system trust roots on the apiserver are used. """
     group: str
@@ -82,6 +106,11 @@ class APIService(KubernetesApiResource):
     _kind_ = "APIService"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "APIServiceSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: APIServiceSpec
@@ -100,6 +129,14 @@ class APIServiceCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     message: str
@@ -124,6 +161,10 @@ class APIServiceStatus(KubernetesObject):
 
     _api_version_ = "apiregistration.k8s.io/v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "APIServiceCondition"),
+    }
+
     conditions: list[APIServiceCondition]
     """ Current service state of apiService. """
 
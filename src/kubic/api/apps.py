@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class ControllerRevision(KubernetesApiResource):
@@ -14,6 +22,12 @@ class ControllerRevision(KubernetesApiResource):
 
     _required_ = ["revision"]
 
+    _field_types_ = {
+        "data": "raw_dict",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "revision": "scalar",
+    }
+
     data: core.RawExtension
     """ Data is the serialized representation of the state. """
     metadata: meta.ObjectMeta
@@ -34,6 +48,11 @@ class RollingUpdateDaemonSet(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "max_surge": "union",
+        "max_unavailable": "union",
+    }
+
     max_surge: core.IntOrString
     """ The maximum number of nodes with an existing available DaemonSet pod that can have an updated DaemonSet pod during during an update. Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). This can not be 0 if MaxUnavailable is 0. Absolute number is calculated from percentage by rounding up to a minimum of 1. Default value is 0. Example: when this is set to 30%, at most 30% of the total number of nodes that should be running the daemon pod (i.e. status.desiredNumberScheduled) can have their a new pod created before the old pod is marked as deleted. The update starts by launching new pods on 30% of nodes. Once an updated pod is available (Ready for at least minReadySeconds) the old DaemonSet pod on that node is marked deleted. If the old pod becomes unavailable for any reason (Ready transitions to false, is evicted, or is drained) an updated pod is immediatedly created on that node without considering surge limits. Allowing surge implies the possibility that the resources consumed by the daemonset on any given node can double if the readiness check fails, and so resource intensive daemonsets should take into account that they may cause evictions during disruption. """
     max_unavailable: core.IntOrString
@@ -50,6 +69,11 @@ class DaemonSetUpdateStrategy(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "rolling_update": ("object", "RollingUpdateDaemonSet"),
+        "type": "scalar",
+    }
+
     rolling_update: RollingUpdateDaemonSet
     """ Rolling update config params. Present only if type = "RollingUpdate". """
     type: str
@@ -68,6 +92,14 @@ class DaemonSetSpec(KubernetesObject):
 
     _required_ = ["selector", "template"]
 
+    _field_types_ = {
+        "min_ready_seconds": "scalar",
+        "revision_history_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "template": ("object", "core.PodTemplateSpec"),
+        "update_strategy": ("object", "DaemonSetUpdateStrategy"),
+    }
+
     min_ready_seconds: int
     """ The minimum number of seconds for which a newly created DaemonSet pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready). """
     revision_history_limit: int
@@ -106,6 +138,11 @@ class DaemonSet(KubernetesApiResource):
     _kind_ = "DaemonSet"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "DaemonSetSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: DaemonSetSpec
@@ -124,6 +161,14 @@ class DaemonSetCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     message: str
@@ -150,6 +195,19 @@ class DaemonSetStatus(KubernetesObject):
 
     _required_ = ["current_number_scheduled", "desired_number_scheduled", "number_misscheduled", "number_ready"]
 
+    _field_types_ = {
+        "collision_count": "scalar",
+        "conditions": ("typed_list", "DaemonSetCondition"),
+        "current_number_scheduled": "scalar",
+        "desired_number_scheduled": "scalar",
+        "number_available": "scalar",
+        "number_misscheduled": "scalar",
+        "number_ready": "scalar",
+        "number_unavailable": "scalar",
+        "observed_generation": "scalar",
+        "updated_number_scheduled": "scalar",
+    }
+
     collision_count: int
     """ Count of hash collisions for the DaemonSet. The DaemonSet controller uses this field as a collision avoidance mechanism when it needs to create the name for the newest ControllerRevision. """
     conditions: list[DaemonSetCondition]
@@ -205,6 +263,11 @@ class RollingUpdateDeployment(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "max_surge": "union",
+        "max_unavailable": "union",
+    }
+
     max_surge: core.IntOrString
     """ The maximum number of pods that can be scheduled above the desired number of pods. Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). This can not be 0 if MaxUnavailable is 0. Absolute number is calculated from percentage by rounding up. Defaults to 25%. Example: when this is set to 30%, the new ReplicaSet can be scaled up immediately when the rolling update starts, such that the total number of old and new pods do not exceed 130% of desired pods. Once old pods have been killed, new ReplicaSet can be scaled up further, ensuring that total number of pods running at any time during the update is at most 130% of desired pods. """
     max_unavailable: core.IntOrString
@@ -221,6 +284,11 @@ class DeploymentStrategy(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "rolling_update": ("object", "RollingUpdateDeployment"),
+        "type": "scalar",
+    }
+
     rolling_update: RollingUpdateDeployment
     """ Rolling update config params. Present only if DeploymentStrategyType = RollingUpdate. """
     type: str
@@ -239,6 +307,17 @@ class DeploymentSpec(KubernetesObject):
 
     _required_ = ["selector", "template"]
 
+    _field_types_ = {
+        "min_ready_seconds": "scalar",
+        "paused": "scalar",
+        "progress_deadline_seconds": "scalar",
+        "replicas": "scalar",
+        "revision_history_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "strategy": ("object", "DeploymentStrategy"),
+        "template": ("object", "core.PodTemplateSpec"),
+    }
+
     min_ready_seconds: int
     """ Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) """
     paused: bool
@@ -289,6 +368,11 @@ class Deployment(KubernetesApiResource):
     _kind_ = "Deployment"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "DeploymentSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: DeploymentSpec
@@ -307,6 +391,15 @@ class DeploymentCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "last_update_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     last_update_time: meta.Time
@@ -346,6 +439,18 @@ class DeploymentStatus(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "available_replicas": "scalar",
+        "collision_count": "scalar",
+        "conditions": ("typed_list", "DeploymentCondition"),
+        "observed_generation": "scalar",
+        "ready_replicas": "scalar",
+        "replicas": "scalar",
+        "terminating_replicas": "scalar",
+        "unavailable_replicas": "scalar",
+        "updated_replicas": "scalar",
+    }
+
     available_replicas: int
     """ Total number of available non-terminating pods (ready for at least minReadySeconds) targeted by this deployment. """
     collision_count: int
@@ -403,6 +508,13 @@ class ReplicaSetSpec(KubernetesObject):
 
     _required_ = ["selector"]
 
+    _field_types_ = {
+        "min_ready_seconds": "scalar",
+        "replicas": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "template": ("object", "core.PodTemplateSpec"),
+    }
+
     min_ready_seconds: int
     """ Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) """
     replicas: int
@@ -432,6 +544,11 @@ class ReplicaSet(KubernetesApiResource):
     _kind_ = "ReplicaSet"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ReplicaSetSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ If the Labels of a ReplicaSet are empty, they are defaulted to be the same as the Pod(s) that the ReplicaSet manages. Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: ReplicaSetSpec
@@ -450,6 +567,14 @@ class ReplicaSetCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ The last time the condition transitioned from one status to another. """
     message: str
@@ -476,6 +601,16 @@ class ReplicaSetStatus(KubernetesObject):
 
     _required_ = ["replicas"]
 
+    _field_types_ = {
+        "available_replicas": "scalar",
+        "conditions": ("typed_list", "ReplicaSetCondition"),
+        "fully_labeled_replicas": "scalar",
+        "observed_generation": "scalar",
+        "ready_replicas": "scalar",
+        "replicas": "scalar",
+        "terminating_replicas": "scalar",
+    }
+
     available_replicas: int
     """ The number of available non-terminating pods (ready for at least minReadySeconds) for this replica set. """
     conditions: list[ReplicaSetCondition]
@@ -523,6 +658,11 @@ class RollingUpdateStatefulSetStrategy(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "max_unavailable": "union",
+        "partition": "scalar",
+    }
+
     max_unavailable: core.IntOrString
     """ The maximum number of pods that can be unavailable during the update. Value can be an absolute number (ex: 5) or a percentage of desired pods (ex: 10%). Absolute number is calculated from percentage by rounding up. This can not be 0. Defaults to 1. This field is alpha-level and is only honored by servers that enable the MaxUnavailableStatefulSet feature. The field applies to all pods in the range 0 to Replicas-1. That means if there is any unavailable pod in the range 0 to Replicas-1, it will be counted towards MaxUnavailable. """
     partition: int
@@ -539,6 +679,10 @@ class StatefulSetOrdinals(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "start": "scalar",
+    }
+
     start: int
     """
     start is the number representing the first replica's index. It may be used to number replicas from an alternate index (eg: 1-indexed) over the default 0-indexed names, or to orchestrate progressive movement of replicas from one StatefulSet to another. If set, replica indices will be in the range:
@@ -558,6 +702,11 @@ class StatefulSetPersistentVolumeClaimRetentionPolicy(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "when_deleted": "scalar",
+        "when_scaled": "scalar",
+    }
+
     when_deleted: str
     """ WhenDeleted specifies what happens to PVCs created from StatefulSet VolumeClaimTemplates when the StatefulSet is deleted. The default policy of `Retain` causes PVCs to not be affected by StatefulSet deletion. The `Delete` policy causes those PVCs to be deleted. """
     when_scaled: str
@@ -574,6 +723,11 @@ class StatefulSetUpdateStrategy(KubernetesObject):
 
     _api_version_ = "apps/v1"
 
+    _field_types_ = {
+        "rolling_update": ("object", "RollingUpdateStatefulSetStrategy"),
+        "type": "scalar",
+    }
+
     rolling_update: RollingUpdateStatefulSetStrategy
     """ RollingUpdate is used to communicate parameters when Type is RollingUpdateStatefulSetStrategyType. """
     type: str
@@ -592,6 +746,20 @@ class StatefulSetSpec(KubernetesObject):
 
     _required_ = ["selector", "template"]
 
+    _field_types_ = {
+        "min_ready_seconds": "scalar",
+        "ordinals": ("object", "StatefulSetOrdinals"),
+        "persistent_volume_claim_retention_policy": ("object", "StatefulSetPersistentVolumeClaimRetentionPolicy"),
+        "pod_management_policy": "scalar",
+        "replicas": "scalar",
+        "revision_history_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "service_name": "scalar",
+        "template": ("object", "core.PodTemplateSpec"),
+        "update_strategy": ("object", "StatefulSetUpdateStrategy"),
+        "volume_claim_templates": ("typed_list", "core.PersistentVolumeClaim"),
+    }
+
     min_ready_seconds: int
     """ Minimum number of seconds for which a newly created pod should be ready without any of its container crashing for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) """
     ordinals: StatefulSetOrdinals
@@ -660,6 +828,11 @@ class StatefulSet(KubernetesApiResource):
     _kind_ = "StatefulSet"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "StatefulSetSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: StatefulSetSpec
@@ -678,6 +851,14 @@ class StatefulSetCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     message: str
@@ -704,6 +885,19 @@ class StatefulSetStatus(KubernetesObject):
 
     _required_ = ["replicas"]
 
+    _field_types_ = {
+        "available_replicas": "scalar",
+        "collision_count": "scalar",
+        "conditions": ("typed_list", "StatefulSetCondition"),
+        "current_replicas": "scalar",
+        "current_revision": "scalar",
+        "observed_generation": "scalar",
+        "ready_replicas": "scalar",
+        "replicas": "scalar",
+        "update_revision": "scalar",
+        "updated_replicas": "scalar",
+    }
+
     available_replicas: int
     """ Total number of available pods (ready for at least minReadySeconds) targeted by this statefulset. """
     collision_count: int
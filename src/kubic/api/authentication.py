@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class BoundObjectReference(KubernetesObject):
@@ -9,6 +17,13 @@ class BoundObjectReference(KubernetesObject):
 
     _api_version_ = "authentication.k8s.io/v1"
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "uid": "scalar",
+    }
+
     api_version: str
     """ API version of the referent. """
     kind: str
@@ -32,6 +47,10 @@ class SelfSubjectReview(KubernetesApiResource):
     _kind_ = "SelfSubjectReview"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
 
@@ -46,6 +65,13 @@ class UserInfo(KubernetesObject):
 
     _api_version_ = "authentication.k8s.io/v1"
 
+    _field_types_ = {
+        "extra": "raw_dict",
+        "groups": "raw_list",
+        "uid": "scalar",
+        "username": "scalar",
+    }
+
     extra: dict[str, list[str]]
     """ Any additional information provided by the authenticator. """
     groups: list[str]
@@ -66,6 +92,10 @@ class SelfSubjectReviewStatus(KubernetesObject):
 
     _api_version_ = "authentication.k8s.io/v1"
 
+    _field_types_ = {
+        "user_info": ("object", "UserInfo"),
+    }
+
     user_info: UserInfo
     """ User attributes of the user making this request. """
 
@@ -82,6 +112,12 @@ class TokenRequestSpec(KubernetesObject):
 
     _required_ = ["audiences"]
 
+    _field_types_ = {
+        "audiences": "raw_list",
+        "bound_object_ref": ("object", "BoundObjectReference"),
+        "expiration_seconds": "scalar",
+    }
+
     audiences: list[str]
     """ Audiences are the intendend audiences of the token. A recipient of a token must identify themself with an identifier in the list of audiences of the token, and otherwise should reject the token. A token issued for multiple audiences may be used to authenticate against any of the audiences listed but implies a high degree of trust between the target audiences. """
     bound_object_ref: BoundObjectReference
@@ -105,6 +141,11 @@ class TokenRequest(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "TokenRequestSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: TokenRequestSpec
@@ -123,6 +164,11 @@ class TokenRequestStatus(KubernetesObject):
 
     _required_ = ["expiration_timestamp", "token"]
 
+    _field_types_ = {
+        "expiration_timestamp": "scalar",
+        "token": "scalar",
+    }
+
     expiration_timestamp: meta.Time
     """ ExpirationTimestamp is the time of expiration of the returned token. """
     token: str
@@ -139,6 +185,11 @@ class TokenReviewSpec(KubernetesObject):
 
     _api_version_ = "authentication.k8s.io/v1"
 
+    _field_types_ = {
+        "audiences": "raw_list",
+        "token": "scalar",
+    }
+
     audiences: list[str]
     """ Audiences is a list of the identifiers that the resource server presented with the token identifies as. Audience-aware token authenticators will verify that the token was intended for at least one of the audiences in this list. If no audiences are provided, the audience will default to the audience of the Kubernetes apiserver. """
     token: str
@@ -160,6 +211,11 @@ class TokenReview(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "TokenReviewSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: TokenReviewSpec
@@ -176,6 +232,13 @@ class TokenReviewStatus(KubernetesObject):
 
     _api_version_ = "authentication.k8s.io/v1"
 
+    _field_types_ = {
+        "audiences": "raw_list",
+        "authenticated": "scalar",
+        "error": "scalar",
+        "user": ("object", "UserInfo"),
+    }
+
     audiences: list[str]
     """ Audiences are audience identifiers chosen by the authenticator that are compatible with both the TokenReview and token. An identifier is any identifier in the intersection of the TokenReviewSpec audiences and the token's audiences. A client of the TokenReview API that sets the spec.audiences field should validate that a compatible audience identifier is returned in the status.audiences field to ensure that the TokenReview server is audience aware. If a TokenReview returns an empty status.audience field where status.authenticated is "true", the token is valid against the audience of the Kubernetes API server. """
     authenticated: bool
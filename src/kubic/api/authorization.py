@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class FieldSelectorAttributes(KubernetesObject):
@@ -9,6 +17,11 @@ class FieldSelectorAttributes(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "raw_selector": "scalar",
+        "requirements": ("typed_list", "meta.FieldSelectorRequirement"),
+    }
+
     raw_selector: str
     """ rawSelector is the serialization of a field selector that would be included in a query parameter. Webhook implementations are encouraged to ignore rawSelector. The kube-apiserver's *SubjectAccessReview will parse the rawSelector as long as the requirements are not present. """
     requirements: list[meta.FieldSelectorRequirement]
@@ -25,6 +38,11 @@ class LabelSelectorAttributes(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "raw_selector": "scalar",
+        "requirements": ("typed_list", "meta.LabelSelectorRequirement"),
+    }
+
     raw_selector: str
     """ rawSelector is the serialization of a field selector that would be included in a query parameter. Webhook implementations are encouraged to ignore rawSelector. The kube-apiserver's *SubjectAccessReview will parse the rawSelector as long as the requirements are not present. """
     requirements: list[meta.LabelSelectorRequirement]
@@ -41,6 +59,11 @@ class NonResourceAttributes(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "path": "scalar",
+        "verb": "scalar",
+    }
+
     path: str
     """ Path is the URL path of the request """
     verb: str
@@ -57,6 +80,18 @@ class ResourceAttributes(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "field_selector": ("object", "FieldSelectorAttributes"),
+        "group": "scalar",
+        "label_selector": ("object", "LabelSelectorAttributes"),
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource": "scalar",
+        "subresource": "scalar",
+        "verb": "scalar",
+        "version": "scalar",
+    }
+
     field_selector: FieldSelectorAttributes
     """
     fieldSelector describes the limitation on access based on field.  It can only limit access, not broaden it.
@@ -116,6 +151,15 @@ class SubjectAccessReviewSpec(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "extra": "raw_dict",
+        "groups": "raw_list",
+        "non_resource_attributes": ("object", "NonResourceAttributes"),
+        "resource_attributes": ("object", "ResourceAttributes"),
+        "uid": "scalar",
+        "user": "scalar",
+    }
+
     extra: dict[str, list[str]]
     """ Extra corresponds to the user.Info.GetExtra() method from the authenticator.  Since that is input to the authorizer it needs a reflection here. """
     groups: list[str]
@@ -160,6 +204,11 @@ class LocalSubjectAccessReview(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "SubjectAccessReviewSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: SubjectAccessReviewSpec
@@ -185,6 +234,11 @@ class NonResourceRule(KubernetesObject):
         "nonResourceURLs": "non_resource_urls",
     }
 
+    _field_types_ = {
+        "non_resource_urls": "raw_list",
+        "verbs": "raw_list",
+    }
+
     non_resource_urls: list[str]
     """ NonResourceURLs is a set of partial urls that a user should have access to.  *s are allowed, but only as the full, final step in the path.  "*" means all. """
     verbs: list[str]
@@ -203,6 +257,13 @@ class ResourceRule(KubernetesObject):
 
     _required_ = ["verbs"]
 
+    _field_types_ = {
+        "api_groups": "raw_list",
+        "resource_names": "raw_list",
+        "resources": "raw_list",
+        "verbs": "raw_list",
+    }
+
     api_groups: list[str]
     """ APIGroups is the name of the APIGroup that contains the resources.  If multiple API groups are specified, any action requested against one of the enumerated resources in any API group will be allowed.  "*" means all. """
     resource_names: list[str]
@@ -228,6 +289,11 @@ class SelfSubjectAccessReviewSpec(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "non_resource_attributes": ("object", "NonResourceAttributes"),
+        "resource_attributes": ("object", "ResourceAttributes"),
+    }
+
     non_resource_attributes: NonResourceAttributes
     """ NonResourceAttributes describes information for a non-resource access request """
     resource_attributes: ResourceAttributes
@@ -249,6 +315,11 @@ class SelfSubjectAccessReview(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "SelfSubjectAccessReviewSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: SelfSubjectAccessReviewSpec
@@ -265,6 +336,10 @@ class SelfSubjectRulesReviewSpec(KubernetesObject):
 
     _api_version_ = "authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "namespace": "scalar",
+    }
+
     namespace: str
     """ Namespace to evaluate rules for. Required. """
 
@@ -284,6 +359,11 @@ class SelfSubjectRulesReview(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "SelfSubjectRulesReviewSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: SelfSubjectRulesReviewSpec
@@ -305,6 +385,11 @@ class SubjectAccessReview(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "SubjectAccessReviewSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard list metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: SubjectAccessReviewSpec
@@ -323,6 +408,13 @@ class SubjectAccessReviewStatus(KubernetesObject):
 
     _required_ = ["allowed"]
 
+    _field_types_ = {
+        "allowed": "scalar",
+        "denied": "scalar",
+        "evaluation_error": "scalar",
+        "reason": "scalar",
+    }
+
     allowed: bool
     """ Allowed is required. True if the action would be allowed, false otherwise. """
     denied: bool
@@ -345,6 +437,13 @@ class SubjectRulesReviewStatus(KubernetesObject):
 
     _required_ = ["incomplete", "non_resource_rules", "resource_rules"]
 
+    _field_types_ = {
+        "evaluation_error": "scalar",
+        "incomplete": "scalar",
+        "non_resource_rules": ("typed_list", "NonResourceRule"),
+        "resource_rules": ("typed_list", "ResourceRule"),
+    }
+
     evaluation_error: str
     """ EvaluationError can appear in combination with Rules. It indicates an error occurred during rule evaluation, such as an authorizer that doesn't support rule evaluation, and that ResourceRules and/or NonResourceRules may be incomplete. """
     incomplete: bool
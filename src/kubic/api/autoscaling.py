@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class MetricTarget(KubernetesObject):
@@ -11,6 +19,13 @@ class MetricTarget(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "average_utilization": "scalar",
+        "average_value": "union",
+        "type": "scalar",
+        "value": "union",
+    }
+
     average_utilization: int
     """ averageUtilization is the target value of the average of the resource metric across all relevant pods, represented as a percentage of the requested value of the resource for the pods. Currently only valid for Resource metric source type """
     average_value: core.Quantity
@@ -33,6 +48,12 @@ class ContainerResourceMetricSource(KubernetesObject):
 
     _required_ = ["container", "name", "target"]
 
+    _field_types_ = {
+        "container": "scalar",
+        "name": "scalar",
+        "target": ("object", "MetricTarget"),
+    }
+
     container: str
     """ container is the name of the container in the pods of the scaling target """
     name: str
@@ -51,6 +72,12 @@ class MetricValueStatus(KubernetesObject):
 
     _api_version_ = "autoscaling/v2"
 
+    _field_types_ = {
+        "average_utilization": "scalar",
+        "average_value": "union",
+        "value": "union",
+    }
+
     average_utilization: int
     """ currentAverageUtilization is the current value of the average of the resource metric across all relevant pods, represented as a percentage of the requested value of the resource for the pods. """
     average_value: core.Quantity
@@ -71,6 +98,12 @@ class ContainerResourceMetricStatus(KubernetesObject):
 
     _required_ = ["container", "current", "name"]
 
+    _field_types_ = {
+        "container": "scalar",
+        "current": ("object", "MetricValueStatus"),
+        "name": "scalar",
+    }
+
     container: str
     """ container is the name of the container in the pods of the scaling target """
     current: MetricValueStatus
@@ -91,6 +124,12 @@ class CrossVersionObjectReference(KubernetesObject):
 
     _required_ = ["kind", "name"]
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     api_version: str
     """ apiVersion is the API version of the referent """
     kind: str
@@ -111,6 +150,11 @@ class MetricIdentifier(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     name: str
     """ name is the name of the given metric """
     selector: meta.LabelSelector
@@ -129,6 +173,11 @@ class ExternalMetricSource(KubernetesObject):
 
     _required_ = ["metric", "target"]
 
+    _field_types_ = {
+        "metric": ("object", "MetricIdentifier"),
+        "target": ("object", "MetricTarget"),
+    }
+
     metric: MetricIdentifier
     """ metric identifies the target metric by name and selector """
     target: MetricTarget
@@ -147,6 +196,11 @@ class ExternalMetricStatus(KubernetesObject):
 
     _required_ = ["current", "metric"]
 
+    _field_types_ = {
+        "current": ("object", "MetricValueStatus"),
+        "metric": ("object", "MetricIdentifier"),
+    }
+
     current: MetricValueStatus
     """ current contains the current value for the given metric """
     metric: MetricIdentifier
@@ -165,6 +219,12 @@ class HPAScalingPolicy(KubernetesObject):
 
     _required_ = ["period_seconds", "type", "value"]
 
+    _field_types_ = {
+        "period_seconds": "scalar",
+        "type": "scalar",
+        "value": "scalar",
+    }
+
     period_seconds: int
     """ periodSeconds specifies the window of time for which the policy should hold true. PeriodSeconds must be greater than zero and less than or equal to 1800 (30 min). """
     type: str
@@ -189,6 +249,13 @@ class HPAScalingRules(KubernetesObject):
 
     _api_version_ = "autoscaling/v2"
 
+    _field_types_ = {
+        "policies": ("typed_list", "HPAScalingPolicy"),
+        "select_policy": "scalar",
+        "stabilization_window_seconds": "scalar",
+        "tolerance": "union",
+    }
+
     policies: list[HPAScalingPolicy]
     """ policies is a list of potential scaling polices which can be used during scaling. If not set, use the default values: - For scale up: allow doubling the number of pods, or an absolute change of 4 pods in a 15s window. - For scale down: allow all pods to be removed in a 15s window. """
     select_policy: str
@@ -232,6 +299,13 @@ class HorizontalPodAutoscalerSpec(KubernetesObject):
         "targetCPUUtilizationPercentage": "target_cpu_utilization_percentage",
     }
 
+    _field_types_ = {
+        "max_replicas": "scalar",
+        "min_replicas": "scalar",
+        "scale_target_ref": ("object", "CrossVersionObjectReference"),
+        "target_cpu_utilization_percentage": "scalar",
+    }
+
     max_replicas: int
     """ maxReplicas is the upper limit for the number of pods that can be set by the autoscaler; cannot be smaller than MinReplicas. """
     min_replicas: int
@@ -266,6 +340,11 @@ class HorizontalPodAutoscaler(KubernetesApiResource):
     _kind_ = "HorizontalPodAutoscaler"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "HorizontalPodAutoscalerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: HorizontalPodAutoscalerSpec
@@ -282,6 +361,11 @@ class HorizontalPodAutoscalerBehavior(KubernetesObject):
 
     _api_version_ = "autoscaling/v2"
 
+    _field_types_ = {
+        "scale_down": ("object", "HPAScalingRules"),
+        "scale_up": ("object", "HPAScalingRules"),
+    }
+
     scale_down: HPAScalingRules
     """ scaleDown is scaling policy for scaling Down. If not set, the default value is to allow to scale down to minReplicas pods, with a 300 second stabilization window (i.e., the highest recommendation for the last 300sec is used). """
     scale_up: HPAScalingRules
@@ -305,6 +389,14 @@ class HorizontalPodAutoscalerCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ lastTransitionTime is the last time the condition transitioned from one status to another """
     message: str
@@ -338,6 +430,14 @@ class HorizontalPodAutoscalerStatus(KubernetesObject):
         "currentCPUUtilizationPercentage": "current_cpu_utilization_percentage",
     }
 
+    _field_types_ = {
+        "current_cpu_utilization_percentage": "scalar",
+        "current_replicas": "scalar",
+        "desired_replicas": "scalar",
+        "last_scale_time": "scalar",
+        "observed_generation": "scalar",
+    }
+
     current_cpu_utilization_percentage: int
     """ currentCPUUtilizationPercentage is the current average CPU utilization over all pods, represented as a percentage of requested CPU, e.g. 70 means that an average pod is using now 70% of its requested CPU. """
     current_replicas: int
@@ -375,6 +475,12 @@ class ObjectMetricSource(KubernetesObject):
 
     _required_ = ["described_object", "metric", "target"]
 
+    _field_types_ = {
+        "described_object": ("object", "CrossVersionObjectReference"),
+        "metric": ("object", "MetricIdentifier"),
+        "target": ("object", "MetricTarget"),
+    }
+
     described_object: CrossVersionObjectReference
     """ describedObject specifies the descriptions of a object,such as kind,name apiVersion """
     metric: MetricIdentifier
@@ -395,6 +501,11 @@ class PodsMetricSource(KubernetesObject):
 
     _required_ = ["metric", "target"]
 
+    _field_types_ = {
+        "metric": ("object", "MetricIdentifier"),
+        "target": ("object", "MetricTarget"),
+    }
+
     metric: MetricIdentifier
     """ metric identifies the target metric by name and selector """
     target: MetricTarget
@@ -413,6 +524,11 @@ class ResourceMetricSource(KubernetesObject):
 
     _required_ = ["name", "target"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "target": ("object", "MetricTarget"),
+    }
+
     name: str
     """ name is the name of the resource in question. """
     target: MetricTarget
@@ -431,6 +547,15 @@ class MetricSpec(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "container_resource": ("object", "ContainerResourceMetricSource"),
+        "external": ("object", "ExternalMetricSource"),
+        "object": ("object", "ObjectMetricSource"),
+        "pods": ("object", "PodsMetricSource"),
+        "resource": ("object", "ResourceMetricSource"),
+        "type": "scalar",
+    }
+
     container_resource: ContainerResourceMetricSource
     """ containerResource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing a single container in each pod of the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source. """
     external: ExternalMetricSource
@@ -465,6 +590,12 @@ class ObjectMetricStatus(KubernetesObject):
 
     _required_ = ["current", "described_object", "metric"]
 
+    _field_types_ = {
+        "current": ("object", "MetricValueStatus"),
+        "described_object": ("object", "CrossVersionObjectReference"),
+        "metric": ("object", "MetricIdentifier"),
+    }
+
     current: MetricValueStatus
     """ current contains the current value for the given metric """
     described_object: CrossVersionObjectReference
@@ -487,6 +618,11 @@ class PodsMetricStatus(KubernetesObject):
 
     _required_ = ["current", "metric"]
 
+    _field_types_ = {
+        "current": ("object", "MetricValueStatus"),
+        "metric": ("object", "MetricIdentifier"),
+    }
+
     current: MetricValueStatus
     """ current contains the current value for the given metric """
     metric: MetricIdentifier
@@ -505,6 +641,11 @@ class ResourceMetricStatus(KubernetesObject):
 
     _required_ = ["current", "name"]
 
+    _field_types_ = {
+        "current": ("object", "MetricValueStatus"),
+        "name": "scalar",
+    }
+
     current: MetricValueStatus
     """ current contains the current value for the given metric """
     name: str
@@ -523,6 +664,15 @@ class MetricStatus(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "container_resource": ("object", "ContainerResourceMetricStatus"),
+        "external": ("object", "ExternalMetricStatus"),
+        "object": ("object", "ObjectMetricStatus"),
+        "pods": ("object", "PodsMetricStatus"),
+        "resource": ("object", "ResourceMetricStatus"),
+        "type": "scalar",
+    }
+
     container_resource: ContainerResourceMetricStatus
     """ container resource refers to a resource metric (such as those specified in requests and limits) known to Kubernetes describing a single container in each pod in the current scale target (e.g. CPU or memory). Such metrics are built in to Kubernetes, and have special scaling options on top of those available to normal per-pod metrics using the "pods" source. """
     external: ExternalMetricStatus
@@ -555,6 +705,10 @@ class ScaleSpec(KubernetesObject):
 
     _api_version_ = "autoscaling/v1"
 
+    _field_types_ = {
+        "replicas": "scalar",
+    }
+
     replicas: int
     """ replicas is the desired number of instances for the scaled object. """
 
@@ -572,6 +726,11 @@ class Scale(KubernetesApiResource):
     _kind_ = "Scale"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ScaleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata; More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata. """
     spec: ScaleSpec
@@ -590,6 +749,11 @@ class ScaleStatus(KubernetesObject):
 
     _required_ = ["replicas"]
 
+    _field_types_ = {
+        "replicas": "scalar",
+        "selector": "scalar",
+    }
+
     replicas: int
     """ replicas is the actual number of observed instances of the scaled object. """
     selector: str
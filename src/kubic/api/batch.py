@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class PodFailurePolicyOnExitCodesRequirement(KubernetesObject):
@@ -11,6 +19,12 @@ class PodFailurePolicyOnExitCodesRequirement(KubernetesObject):
 
     _required_ = ["operator", "values"]
 
+    _field_types_ = {
+        "container_name": "scalar",
+        "operator": "scalar",
+        "values": "raw_list",
+    }
+
     container_name: str
     """ Restricts the check for exit codes to the container with the specified name. When null, the rule applies to all containers. When specified, it should match one the container or initContainer names in the pod template. """
     operator: str
@@ -41,6 +55,11 @@ class PodFailurePolicyOnPodConditionsPattern(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     status: str
     """ Specifies the required Pod condition status. To match a pod condition it is required that the specified status equals the pod condition status. Defaults to True. """
     type: str
@@ -59,6 +78,12 @@ class PodFailurePolicyRule(KubernetesObject):
 
     _required_ = ["action"]
 
+    _field_types_ = {
+        "action": "scalar",
+        "on_exit_codes": ("object", "PodFailurePolicyOnExitCodesRequirement"),
+        "on_pod_conditions": ("typed_list", "PodFailurePolicyOnPodConditionsPattern"),
+    }
+
     action: str
     """
     Specifies the action taken on a pod failure when the requirements are satisfied. Possible values are:
@@ -96,6 +121,10 @@ class PodFailurePolicy(KubernetesObject):
 
     _required_ = ["rules"]
 
+    _field_types_ = {
+        "rules": ("typed_list", "PodFailurePolicyRule"),
+    }
+
     rules: list[PodFailurePolicyRule]
     """ A list of pod failure policy rules. The rules are evaluated in order. Once a rule matches a Pod failure, the remaining of the rules are ignored. When no rule matches the Pod failure, the default handling applies - the counter of pod failures is incremented and it is checked against the backoffLimit. At most 20 elements are allowed. """
 
@@ -110,6 +139,11 @@ class SuccessPolicyRule(KubernetesObject):
 
     _api_version_ = "batch/v1"
 
+    _field_types_ = {
+        "succeeded_count": "scalar",
+        "succeeded_indexes": "scalar",
+    }
+
     succeeded_count: int
     """ succeededCount specifies the minimal required size of the actual set of the succeeded indexes for the Job. When succeededCount is used along with succeededIndexes, the check is constrained only to the set of indexes specified by succeededIndexes. For example, given that succeededIndexes is "1-4", succeededCount is "3", and completed indexes are "1", "3", and "5", the Job isn't declared as succeeded because only "1" and "3" indexes are considered in that rules. When this field is null, this doesn't default to any value and is never evaluated at any time. When specified it needs to be a positive integer. """
     succeeded_indexes: str
@@ -128,6 +162,10 @@ class SuccessPolicy(KubernetesObject):
 
     _required_ = ["rules"]
 
+    _field_types_ = {
+        "rules": ("typed_list", "SuccessPolicyRule"),
+    }
+
     rules: list[SuccessPolicyRule]
     """ rules represents the list of alternative rules for the declaring the Jobs as successful before `.status.succeeded >= .spec.completions`. Once any of the rules are met, the "SucceededCriteriaMet" condition is added, and the lingering pods are removed. The terminal state for such a Job has the "Complete" condition. Additionally, these rules are evaluated in order; Once the Job meets one of the rules, other rules are ignored. At most 20 elements are allowed. """
 
@@ -144,6 +182,25 @@ class JobSpec(KubernetesObject):
 
     _required_ = ["template"]
 
+    _field_types_ = {
+        "active_deadline_seconds": "scalar",
+        "backoff_limit": "scalar",
+        "backoff_limit_per_index": "scalar",
+        "completion_mode": "scalar",
+        "completions": "scalar",
+        "managed_by": "scalar",
+        "manual_selector": "scalar",
+        "max_failed_indexes": "scalar",
+        "parallelism": "scalar",
+        "pod_failure_policy": ("object", "PodFailurePolicy"),
+        "pod_replacement_policy": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "success_policy": ("object", "SuccessPolicy"),
+        "suspend": "scalar",
+        "template": ("object", "core.PodTemplateSpec"),
+        "ttl_seconds_after_finished": "scalar",
+    }
+
     active_deadline_seconds: int
     """ Specifies the duration in seconds relative to the startTime that the job may be continuously active before the system tries to terminate it; value must be positive integer. If a Job is suspended (at creation or through an update), this timer will effectively be stopped and reset when the Job is resumed again. """
     backoff_limit: int
@@ -242,6 +299,11 @@ class JobTemplateSpec(KubernetesObject):
 
     _api_version_ = "batch/v1"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "JobSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata of the jobs created from this template. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: JobSpec
@@ -260,6 +322,17 @@ class CronJobSpec(KubernetesObject):
 
     _required_ = ["job_template", "schedule"]
 
+    _field_types_ = {
+        "concurrency_policy": "scalar",
+        "failed_jobs_history_limit": "scalar",
+        "job_template": ("object", "JobTemplateSpec"),
+        "schedule": "scalar",
+        "starting_deadline_seconds": "scalar",
+        "successful_jobs_history_limit": "scalar",
+        "suspend": "scalar",
+        "time_zone": "scalar",
+    }
+
     concurrency_policy: str
     """
     Specifies how to treat concurrent executions of a Job. Valid values are:
@@ -314,6 +387,11 @@ class CronJob(KubernetesApiResource):
     _kind_ = "CronJob"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CronJobSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: CronJobSpec
@@ -330,6 +408,12 @@ class CronJobStatus(KubernetesObject):
 
     _api_version_ = "batch/v1"
 
+    _field_types_ = {
+        "active": ("typed_list", "core.ObjectReference"),
+        "last_schedule_time": "scalar",
+        "last_successful_time": "scalar",
+    }
+
     active: list[core.ObjectReference]
     """ A list of pointers to currently running jobs. """
     last_schedule_time: meta.Time
@@ -353,6 +437,11 @@ class Job(KubernetesApiResource):
     _kind_ = "Job"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "JobSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: JobSpec
@@ -371,6 +460,15 @@ class JobCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_probe_time": "scalar",
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_probe_time: meta.Time
     """ Last time the condition was checked. """
     last_transition_time: meta.Time
@@ -410,6 +508,11 @@ class UncountedTerminatedPods(KubernetesObject):
 
     _api_version_ = "batch/v1"
 
+    _field_types_ = {
+        "failed": "raw_list",
+        "succeeded": "raw_list",
+    }
+
     failed: list[str]
     """ failed holds UIDs of failed Pods. """
     succeeded: list[str]
@@ -426,6 +529,20 @@ class JobStatus(KubernetesObject):
 
     _api_version_ = "batch/v1"
 
+    _field_types_ = {
+        "active": "scalar",
+        "completed_indexes": "scalar",
+        "completion_time": "scalar",
+        "conditions": ("typed_list", "JobCondition"),
+        "failed": "scalar",
+        "failed_indexes": "scalar",
+        "ready": "scalar",
+        "start_time": "scalar",
+        "succeeded": "scalar",
+        "terminating": "scalar",
+        "uncounted_terminated_pods": ("object", "UncountedTerminatedPods"),
+    }
+
     active: int
     """ The number of pending and running pods which are not terminating (without a deletionTimestamp). The value is zero for finished jobs. """
     completed_indexes: str
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class CertificateSigningRequestSpec(KubernetesObject):
@@ -11,6 +19,17 @@ class CertificateSigningRequestSpec(KubernetesObject):
 
     _required_ = ["request", "signer_name"]
 
+    _field_types_ = {
+        "expiration_seconds": "scalar",
+        "extra": "raw_dict",
+        "groups": "raw_list",
+        "request": "scalar",
+        "signer_name": "scalar",
+        "uid": "scalar",
+        "usages": "raw_list",
+        "username": "scalar",
+    }
+
     expiration_seconds: int
     """
     expirationSeconds is the requested duration of validity of the issued certificate. The certificate signer may issue a certificate with a different validity duration so a client must check the delta between the notBefore and and notAfter fields in the issued certificate to determine the actual duration.
@@ -121,6 +140,11 @@ class CertificateSigningRequest(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CertificateSigningRequestSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CertificateSigningRequestSpec
     """ spec contains the certificate request, and is immutable after creation. Only the request, signerName, expirationSeconds, and usages fields can be set on creation. Other fields are derived by Kubernetes and cannot be modified by users. """
@@ -138,6 +162,15 @@ class CertificateSigningRequestCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "last_update_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ lastTransitionTime is the time the condition last transitioned from one status to another. If unset, when a new condition type is added or an existing condition's status is changed, the server defaults this to the current time. """
     last_update_time: meta.Time
@@ -189,6 +222,11 @@ class CertificateSigningRequestStatus(KubernetesObject):
 
     _api_version_ = "certificates.k8s.io/v1"
 
+    _field_types_ = {
+        "certificate": "scalar",
+        "conditions": ("typed_list", "CertificateSigningRequestCondition"),
+    }
+
     certificate: core.Base64
     """
     certificate is populated with an issued certificate by the signer after an Approved condition is present. This field is set via the /status subresource. Once populated, this field is immutable.
@@ -230,6 +268,11 @@ class ClusterTrustBundleSpec(KubernetesObject):
 
     _required_ = ["trust_bundle"]
 
+    _field_types_ = {
+        "signer_name": "scalar",
+        "trust_bundle": "scalar",
+    }
+
     signer_name: str
     """
     signerName indicates the associated signer, if any.
@@ -273,6 +316,11 @@ class ClusterTrustBundle(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ClusterTrustBundleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ metadata contains the object metadata. """
     spec: ClusterTrustBundleSpec
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class LeaseSpec(KubernetesObject):
@@ -9,6 +17,16 @@ class LeaseSpec(KubernetesObject):
 
     _api_version_ = "coordination.k8s.io/v1"
 
+    _field_types_ = {
+        "acquire_time": "scalar",
+        "holder_identity": "scalar",
+        "lease_duration_seconds": "scalar",
+        "lease_transitions": "scalar",
+        "preferred_holder": "scalar",
+        "renew_time": "scalar",
+        "strategy": "scalar",
+    }
+
     acquire_time: meta.MicroTime
     """ acquireTime is a time when the current lease was acquired. """
     holder_identity: str
@@ -55,6 +73,11 @@ class Lease(KubernetesApiResource):
     _kind_ = "Lease"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "LeaseSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: LeaseSpec
@@ -73,6 +96,15 @@ class LeaseCandidateSpec(KubernetesObject):
 
     _required_ = ["binary_version", "lease_name", "strategy"]
 
+    _field_types_ = {
+        "binary_version": "scalar",
+        "emulation_version": "scalar",
+        "lease_name": "scalar",
+        "ping_time": "scalar",
+        "renew_time": "scalar",
+        "strategy": "scalar",
+    }
+
     binary_version: str
     """ BinaryVersion is the binary version. It must be in a semver format without leading `v`. This field is required. """
     emulation_version: str
@@ -115,6 +147,11 @@ class LeaseCandidate(KubernetesApiResource):
     _kind_ = "LeaseCandidate"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "LeaseCandidateSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: LeaseCandidateSpec
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class AWSElasticBlockStoreVolumeSource(KubernetesObject):
@@ -24,6 +30,13 @@ class AWSElasticBlockStoreVolumeSource(KubernetesObject):
         "volumeID": "volume_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "partition": "scalar",
+        "read_only": "scalar",
+        "volume_id": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore """
     partition: int
@@ -46,6 +59,12 @@ class NodeSelectorRequirement(KubernetesObject):
 
     _required_ = ["key", "operator"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "operator": "scalar",
+        "values": "raw_list",
+    }
+
     key: str
     """ The label key that the selector applies to. """
     operator: str
@@ -64,6 +83,11 @@ class NodeSelectorTerm(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "match_expressions": ("typed_list", "NodeSelectorRequirement"),
+        "match_fields": ("typed_list", "NodeSelectorRequirement"),
+    }
+
     match_expressions: list[NodeSelectorRequirement]
     """ A list of node selector requirements by node's labels. """
     match_fields: list[NodeSelectorRequirement]
@@ -82,6 +106,11 @@ class PreferredSchedulingTerm(KubernetesObject):
 
     _required_ = ["preference", "weight"]
 
+    _field_types_ = {
+        "preference": ("object", "NodeSelectorTerm"),
+        "weight": "scalar",
+    }
+
     preference: NodeSelectorTerm
     """ A node selector term, associated with the corresponding weight. """
     weight: int
@@ -100,6 +129,10 @@ class NodeSelector(KubernetesObject):
 
     _required_ = ["node_selector_terms"]
 
+    _field_types_ = {
+        "node_selector_terms": ("typed_list", "NodeSelectorTerm"),
+    }
+
     node_selector_terms: list[NodeSelectorTerm]
     """ Required. A list of node selector terms. The terms are ORed. """
 
@@ -114,6 +147,11 @@ class NodeAffinity(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "preferred_during_scheduling_ignored_during_execution": ("typed_list", "PreferredSchedulingTerm"),
+        "required_during_scheduling_ignored_during_execution": ("object", "NodeSelector"),
+    }
+
     preferred_during_scheduling_ignored_during_execution: list[PreferredSchedulingTerm]
     """ The scheduler will prefer to schedule pods to nodes that satisfy the affinity expressions specified by this field, but it may choose a node that violates one or more of the expressions. The node that is most preferred is the one with the greatest sum of weights, i.e. for each node that meets all of the scheduling requirements (resource request, requiredDuringScheduling affinity expressions, etc.), compute a sum by iterating through the elements of this field and adding "weight" to the sum if the node matches the corresponding matchExpressions; the node(s) with the highest sum are the most preferred. """
     required_during_scheduling_ignored_during_execution: NodeSelector
@@ -139,6 +177,15 @@ class PodAffinityTerm(KubernetesObject):
 
     _required_ = ["topology_key"]
 
+    _field_types_ = {
+        "label_selector": ("object", "meta.LabelSelector"),
+        "match_label_keys": "raw_list",
+        "mismatch_label_keys": "raw_list",
+        "namespace_selector": ("object", "meta.LabelSelector"),
+        "namespaces": "raw_list",
+        "topology_key": "scalar",
+    }
+
     label_selector: meta.LabelSelector
     """ A label query over a set of resources, in this case pods. If it's null, this PodAffinityTerm matches with no Pods. """
     match_label_keys: list[str]
@@ -180,6 +227,11 @@ class WeightedPodAffinityTerm(KubernetesObject):
 
     _required_ = ["pod_affinity_term", "weight"]
 
+    _field_types_ = {
+        "pod_affinity_term": ("object", "PodAffinityTerm"),
+        "weight": "scalar",
+    }
+
     pod_affinity_term: PodAffinityTerm
     """ Required. A pod affinity term, associated with the corresponding weight. """
     weight: int
@@ -196,6 +248,11 @@ class PodAffinity(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "preferred_during_scheduling_ignored_during_execution": ("typed_list", "WeightedPodAffinityTerm"),
+        "required_during_scheduling_ignored_during_execution": ("typed_list", "PodAffinityTerm"),
+    }
+
     preferred_during_scheduling_ignored_during_execution: list[WeightedPodAffinityTerm]
     """ The scheduler will prefer to schedule pods to nodes that satisfy the affinity expressions specified by this field, but it may choose a node that violates one or more of the expressions. The node that is most preferred is the one with the greatest sum of weights, i.e. for each node that meets all of the scheduling requirements (resource request, requiredDuringScheduling affinity expressions, etc.), compute a sum by iterating through the elements of this field and adding "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the node(s) with the highest sum are the most preferred. """
     required_during_scheduling_ignored_during_execution: list[PodAffinityTerm]
@@ -219,6 +276,11 @@ class PodAntiAffinity(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "preferred_during_scheduling_ignored_during_execution": ("typed_list", "WeightedPodAffinityTerm"),
+        "required_during_scheduling_ignored_during_execution": ("typed_list", "PodAffinityTerm"),
+    }
+
     preferred_during_scheduling_ignored_during_execution: list[WeightedPodAffinityTerm]
     """ The scheduler will prefer to schedule pods to nodes that satisfy the anti-affinity expressions specified by this field, but it may choose a node that violates one or more of the expressions. The node that is most preferred is the one with the greatest sum of weights, i.e. for each node that meets all of the scheduling requirements (resource request, requiredDuringScheduling anti-affinity expressions, etc.), compute a sum by iterating through the elements of this field and adding "weight" to the sum if the node has pods which matches the corresponding podAffinityTerm; the node(s) with the highest sum are the most preferred. """
     required_during_scheduling_ignored_during_execution: list[PodAffinityTerm]
@@ -242,6 +304,12 @@ class Affinity(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "node_affinity": ("object", "NodeAffinity"),
+        "pod_affinity": ("object", "PodAffinity"),
+        "pod_anti_affinity": ("object", "PodAntiAffinity"),
+    }
+
     node_affinity: NodeAffinity
     """ Describes node affinity scheduling rules for the pod. """
     pod_affinity: PodAffinity
@@ -262,6 +330,11 @@ class AppArmorProfile(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "localhost_profile": "scalar",
+        "type": "scalar",
+    }
+
     localhost_profile: str
     """ localhostProfile indicates a profile loaded on the node that should be used. The profile must be preconfigured on the node to work. Must match the loaded name of the profile. Must be set if and only if type is "Localhost". """
     type: str
@@ -285,6 +358,11 @@ class AttachedVolume(KubernetesObject):
 
     _required_ = ["device_path", "name"]
 
+    _field_types_ = {
+        "device_path": "scalar",
+        "name": "scalar",
+    }
+
     device_path: str
     """ DevicePath represents the device path where the volume should be available """
     name: str
@@ -310,6 +388,15 @@ class AzureDiskVolumeSource(KubernetesObject):
         "diskURI": "disk_uri",
     }
 
+    _field_types_ = {
+        "caching_mode": "scalar",
+        "disk_name": "scalar",
+        "disk_uri": "scalar",
+        "fs_type": "scalar",
+        "kind": "scalar",
+        "read_only": "scalar",
+    }
+
     caching_mode: str
     """ cachingMode is the Host Caching mode: None, Read Only, Read Write. """
     disk_name: str
@@ -344,6 +431,13 @@ class AzureFilePersistentVolumeSource(KubernetesObject):
 
     _required_ = ["secret_name", "share_name"]
 
+    _field_types_ = {
+        "read_only": "scalar",
+        "secret_name": "scalar",
+        "secret_namespace": "scalar",
+        "share_name": "scalar",
+    }
+
     read_only: bool
     """ readOnly defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. """
     secret_name: str
@@ -366,6 +460,12 @@ class AzureFileVolumeSource(KubernetesObject):
 
     _required_ = ["secret_name", "share_name"]
 
+    _field_types_ = {
+        "read_only": "scalar",
+        "secret_name": "scalar",
+        "share_name": "scalar",
+    }
+
     read_only: bool
     """ readOnly defaults to false (read/write). ReadOnly here will force the ReadOnly setting in VolumeMounts. """
     secret_name: str
@@ -388,6 +488,16 @@ class ObjectReference(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "field_path": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource_version": "scalar",
+        "uid": "scalar",
+    }
+
     api_version: str
     """ API version of the referent. """
     field_path: str
@@ -436,6 +546,11 @@ class Binding(KubernetesApiResource):
 
     _required_ = ["target"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "target": ("object", "ObjectReference"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     target: ObjectReference
@@ -452,6 +567,11 @@ class SecretReference(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     name: str
     """ name is unique within a namespace to reference a secret resource. """
     namespace: str
@@ -470,6 +590,19 @@ class CSIPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["driver", "volume_handle"]
 
+    _field_types_ = {
+        "controller_expand_secret_ref": ("object", "SecretReference"),
+        "controller_publish_secret_ref": ("object", "SecretReference"),
+        "driver": "scalar",
+        "fs_type": "scalar",
+        "node_expand_secret_ref": ("object", "SecretReference"),
+        "node_publish_secret_ref": ("object", "SecretReference"),
+        "node_stage_secret_ref": ("object", "SecretReference"),
+        "read_only": "scalar",
+        "volume_attributes": "raw_dict",
+        "volume_handle": "scalar",
+    }
+
     controller_expand_secret_ref: SecretReference
     """ controllerExpandSecretRef is a reference to the secret object containing sensitive information to pass to the CSI driver to complete the CSI ControllerExpandVolume call. This field is optional, and may be empty if no secret is required. If the secret object contains more than one secret, all secrets are passed. """
     controller_publish_secret_ref: SecretReference
@@ -525,6 +658,10 @@ class LocalObjectReference(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ Name of the referent. This field is effectively required, but due to backwards compatibility is allowed to be empty. Instances of this type with an empty value here are almost certainly wrong. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names """
 
@@ -541,6 +678,14 @@ class CSIVolumeSource(KubernetesObject):
 
     _required_ = ["driver"]
 
+    _field_types_ = {
+        "driver": "scalar",
+        "fs_type": "scalar",
+        "node_publish_secret_ref": ("object", "LocalObjectReference"),
+        "read_only": "scalar",
+        "volume_attributes": "raw_dict",
+    }
+
     driver: str
     """ driver is the name of the CSI driver that handles this volume. Consult with your admin for the correct name as registered in the cluster. """
     fs_type: str
@@ -576,6 +721,11 @@ class Capabilities(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "add": "raw_list",
+        "drop": "raw_list",
+    }
+
     add: list[str]
     """ Added capabilities """
     drop: list[str]
@@ -594,6 +744,15 @@ class CephFSPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["monitors"]
 
+    _field_types_ = {
+        "monitors": "raw_list",
+        "path": "scalar",
+        "read_only": "scalar",
+        "secret_file": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+        "user": "scalar",
+    }
+
     monitors: list[str]
     """ monitors is Required: Monitors is a collection of Ceph monitors More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it """
     path: str
@@ -628,6 +787,15 @@ class CephFSVolumeSource(KubernetesObject):
 
     _required_ = ["monitors"]
 
+    _field_types_ = {
+        "monitors": "raw_list",
+        "path": "scalar",
+        "read_only": "scalar",
+        "secret_file": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "user": "scalar",
+    }
+
     monitors: list[str]
     """ monitors is Required: Monitors is a collection of Ceph monitors More info: https://examples.k8s.io/volumes/cephfs/README.md#how-to-use-it """
     path: str
@@ -669,6 +837,13 @@ class CinderPersistentVolumeSource(KubernetesObject):
         "volumeID": "volume_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+        "volume_id": "scalar",
+    }
+
     fs_type: str
     """ fsType Filesystem type to mount. Must be a filesystem type supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://examples.k8s.io/mysql-cinder-pd/README.md """
     read_only: bool
@@ -698,6 +873,13 @@ class CinderVolumeSource(KubernetesObject):
         "volumeID": "volume_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "volume_id": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://examples.k8s.io/mysql-cinder-pd/README.md """
     read_only: bool
@@ -718,6 +900,10 @@ class ClientIPConfig(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "timeout_seconds": "scalar",
+    }
+
     timeout_seconds: int
     """ timeoutSeconds specifies the seconds of ClientIP type session sticky time. The value must be >0 && <=86400(for 1 day) if ServiceAffinity == "ClientIP". Default value is 10800(for 3 hours). """
 
@@ -734,6 +920,14 @@ class ClusterTrustBundleProjection(KubernetesObject):
 
     _required_ = ["path"]
 
+    _field_types_ = {
+        "label_selector": ("object", "meta.LabelSelector"),
+        "name": "scalar",
+        "optional": "scalar",
+        "path": "scalar",
+        "signer_name": "scalar",
+    }
+
     label_selector: meta.LabelSelector
     """ Select all ClusterTrustBundles that match this label selector.  Only has effect if signerName is set.  Mutually-exclusive with name.  If unset, interpreted as "match nothing".  If set but empty, interpreted as "match everything". """
     name: str
@@ -760,6 +954,13 @@ class ComponentCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "error": "scalar",
+        "message": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     error: str
     """ Condition error code for a component. For example, a health check error code. """
     message: str
@@ -783,6 +984,11 @@ class ComponentStatus(KubernetesApiResource):
     _kind_ = "ComponentStatus"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "ComponentCondition"),
+        "metadata": ("object", "meta.ObjectMeta"),
+    }
+
     conditions: list[ComponentCondition]
     """ List of component conditions observed """
     metadata: meta.ObjectMeta
@@ -802,6 +1008,13 @@ class ConfigMap(KubernetesApiResource):
     _kind_ = "ConfigMap"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "binary_data": "raw_dict",
+        "data": "raw_dict",
+        "immutable": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+    }
+
     binary_data: dict[str, Base64]
     """ BinaryData contains the binary data. Each key must consist of alphanumeric characters, '-', '_' or '.'. BinaryData can contain byte sequences that are not in the UTF-8 range. The keys stored in BinaryData must not overlap with the ones in the Data field, this is enforced during validation process. Using this field will require 1.10+ apiserver and kubelet. """
     data: dict[str, str]
@@ -834,6 +1047,11 @@ class ConfigMapEnvSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     name: str
     """ Name of the referent. This field is effectively required, but due to backwards compatibility is allowed to be empty. Instances of this type with an empty value here are almost certainly wrong. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names """
     optional: bool
@@ -852,6 +1070,12 @@ class ConfigMapKeySelector(KubernetesObject):
 
     _required_ = ["key"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     key: str
     """ The key to select. """
     name: str
@@ -872,6 +1096,14 @@ class ConfigMapNodeConfigSource(KubernetesObject):
 
     _required_ = ["kubelet_config_key", "name", "namespace"]
 
+    _field_types_ = {
+        "kubelet_config_key": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource_version": "scalar",
+        "uid": "scalar",
+    }
+
     kubelet_config_key: str
     """ KubeletConfigKey declares which key of the referenced ConfigMap corresponds to the KubeletConfiguration structure This field is required in all cases. """
     name: str
@@ -898,6 +1130,12 @@ class KeyToPath(KubernetesObject):
 
     _required_ = ["key", "path"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "mode": "scalar",
+        "path": "scalar",
+    }
+
     key: str
     """ key is the key to project. """
     mode: int
@@ -920,6 +1158,12 @@ class ConfigMapProjection(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "items": ("typed_list", "KeyToPath"),
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     items: list[KeyToPath]
     """ items if unspecified, each key-value pair in the Data field of the referenced ConfigMap will be projected into the volume as a file whose name is the key and content is the value. If specified, the listed keys will be projected into the specified paths, and unlisted keys will not be present. If a key is specified which is not present in the ConfigMap, the volume setup will error unless it is marked optional. Paths must be relative and may not contain the '..' path or start with '..'. """
     name: str
@@ -942,6 +1186,13 @@ class ConfigMapVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "default_mode": "scalar",
+        "items": ("typed_list", "KeyToPath"),
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     default_mode: int
     """ defaultMode is optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. """
     items: list[KeyToPath]
@@ -964,6 +1215,11 @@ class ObjectFieldSelector(KubernetesObject):
 
     _required_ = ["field_path"]
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "field_path": "scalar",
+    }
+
     api_version: str
     """ Version of the schema the FieldPath is written in terms of, defaults to "v1". """
     field_path: str
@@ -986,6 +1242,12 @@ class ResourceFieldSelector(KubernetesObject):
 
     _required_ = ["resource"]
 
+    _field_types_ = {
+        "container_name": "scalar",
+        "divisor": "union",
+        "resource": "scalar",
+    }
+
     container_name: str
     """ Container name: required for volumes, optional for env vars """
     divisor: Quantity
@@ -1006,6 +1268,12 @@ class SecretKeySelector(KubernetesObject):
 
     _required_ = ["key"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     key: str
     """ The key of the secret to select from.  Must be a valid secret key. """
     name: str
@@ -1024,6 +1292,13 @@ class EnvVarSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "config_map_key_ref": ("object", "ConfigMapKeySelector"),
+        "field_ref": ("object", "ObjectFieldSelector"),
+        "resource_field_ref": ("object", "ResourceFieldSelector"),
+        "secret_key_ref": ("object", "SecretKeySelector"),
+    }
+
     config_map_key_ref: ConfigMapKeySelector
     """ Selects a key of a ConfigMap. """
     field_ref: ObjectFieldSelector
@@ -1054,6 +1329,12 @@ class EnvVar(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+        "value_from": ("object", "EnvVarSource"),
+    }
+
     name: str
     """ Name of the environment variable. Must be a C_IDENTIFIER. """
     value: str
@@ -1076,6 +1357,11 @@ class SecretEnvSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     name: str
     """ Name of the referent. This field is effectively required, but due to backwards compatibility is allowed to be empty. Instances of this type with an empty value here are almost certainly wrong. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names """
     optional: bool
@@ -1092,6 +1378,12 @@ class EnvFromSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "config_map_ref": ("object", "ConfigMapEnvSource"),
+        "prefix": "scalar",
+        "secret_ref": ("object", "SecretEnvSource"),
+    }
+
     config_map_ref: ConfigMapEnvSource
     """ The ConfigMap to select from """
     prefix: str
@@ -1110,6 +1402,10 @@ class ExecAction(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "command": "raw_list",
+    }
+
     command: list[str]
     """ Command is the command line to execute inside the container, the working directory for the command  is root ('/') in the container's filesystem. The command is simply exec'd, it is not run inside a shell, so traditional shell instructions ('|', etc) won't work. To use a shell, you need to explicitly call out to that shell. Exit status of 0 is treated as live/healthy and non-zero is unhealthy. """
 
@@ -1126,6 +1422,11 @@ class HTTPHeader(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     """ The header field name. This will be canonicalized upon output, so case-variant names will be understood as the same header. """
     value: str
@@ -1148,6 +1449,14 @@ class HTTPGetAction(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "host": "scalar",
+        "http_headers": ("typed_list", "HTTPHeader"),
+        "path": "scalar",
+        "port": "union",
+        "scheme": "scalar",
+    }
+
     host: str
     """ Host name to connect to, defaults to the pod IP. You probably want to set "Host" in httpHeaders instead. """
     http_headers: list[HTTPHeader]
@@ -1174,6 +1483,10 @@ class SleepAction(KubernetesObject):
 
     _required_ = ["seconds"]
 
+    _field_types_ = {
+        "seconds": "scalar",
+    }
+
     seconds: int
     """ Seconds is the number of seconds to sleep. """
 
@@ -1190,6 +1503,11 @@ class TCPSocketAction(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "host": "scalar",
+        "port": "union",
+    }
+
     host: str
     """ Optional: Host name to connect to, defaults to the pod IP. """
     port: IntOrString
@@ -1206,6 +1524,13 @@ class LifecycleHandler(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "exec": ("object", "ExecAction"),
+        "http_get": ("object", "HTTPGetAction"),
+        "sleep": ("object", "SleepAction"),
+        "tcp_socket": ("object", "TCPSocketAction"),
+    }
+
     exec: ExecAction
     """ Exec specifies a command to execute in the container. """
     http_get: HTTPGetAction
@@ -1228,6 +1553,12 @@ class Lifecycle(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "post_start": ("object", "LifecycleHandler"),
+        "pre_stop": ("object", "LifecycleHandler"),
+        "stop_signal": "scalar",
+    }
+
     post_start: LifecycleHandler
     """ PostStart is called immediately after a container is created. If the handler fails, the container is terminated and restarted according to its restart policy. Other management of the container blocks until the hook completes. More info: https://kubernetes.io/docs/concepts/containers/container-lifecycle-hooks/#container-hooks """
     pre_stop: LifecycleHandler
@@ -1248,6 +1579,11 @@ class GRPCAction(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "port": "scalar",
+        "service": "scalar",
+    }
+
     port: int
     """ Port number of the gRPC service. Number must be in the range 1 to 65535. """
     service: str
@@ -1268,6 +1604,19 @@ class Probe(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "exec": ("object", "ExecAction"),
+        "failure_threshold": "scalar",
+        "grpc": ("object", "GRPCAction"),
+        "http_get": ("object", "HTTPGetAction"),
+        "initial_delay_seconds": "scalar",
+        "period_seconds": "scalar",
+        "success_threshold": "scalar",
+        "tcp_socket": ("object", "TCPSocketAction"),
+        "termination_grace_period_seconds": "scalar",
+        "timeout_seconds": "scalar",
+    }
+
     exec: ExecAction
     """ Exec specifies a command to execute in the container. """
     failure_threshold: int
@@ -1332,6 +1681,14 @@ class ContainerPort(KubernetesObject):
         "hostIP": "host_ip",
     }
 
+    _field_types_ = {
+        "container_port": "scalar",
+        "host_ip": "scalar",
+        "host_port": "scalar",
+        "name": "scalar",
+        "protocol": "scalar",
+    }
+
     container_port: int
     """ Number of port to expose on the pod's IP address. This must be a valid port number, 0 < x < 65536. """
     host_ip: str
@@ -1356,6 +1713,11 @@ class ContainerResizePolicy(KubernetesObject):
 
     _required_ = ["resource_name", "restart_policy"]
 
+    _field_types_ = {
+        "resource_name": "scalar",
+        "restart_policy": "scalar",
+    }
+
     resource_name: str
     """ Name of the resource to which this resource resize policy applies. Supported values: cpu, memory. """
     restart_policy: str
@@ -1374,6 +1736,11 @@ class ResourceClaim(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "request": "scalar",
+    }
+
     name: str
     """ Name must match the name of one entry in pod.spec.resourceClaims of the Pod where this field is used. It makes that resource available inside a container. """
     request: str
@@ -1390,6 +1757,12 @@ class ResourceRequirements(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "claims": ("typed_list", "ResourceClaim"),
+        "limits": "raw_dict",
+        "requests": "raw_dict",
+    }
+
     claims: list[ResourceClaim]
     """
     Claims lists the names of resources, defined in spec.resourceClaims, that are used by this container.
@@ -1414,6 +1787,13 @@ class SELinuxOptions(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "level": "scalar",
+        "role": "scalar",
+        "type": "scalar",
+        "user": "scalar",
+    }
+
     level: str
     """ Level is SELinux level label that applies to the container. """
     role: str
@@ -1436,6 +1816,11 @@ class SeccompProfile(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "localhost_profile": "scalar",
+        "type": "scalar",
+    }
+
     localhost_profile: str
     """ localhostProfile indicates a profile defined in a file on the node should be used. The profile must be preconfigured on the node to work. Must be a descending path, relative to the kubelet's configured seccomp profile location. Must be set if type is "Localhost". Must NOT be set for any other type. """
     type: str
@@ -1456,6 +1841,13 @@ class WindowsSecurityContextOptions(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "gmsa_credential_spec": "scalar",
+        "gmsa_credential_spec_name": "scalar",
+        "host_process": "scalar",
+        "run_as_user_name": "scalar",
+    }
+
     gmsa_credential_spec: str
     """ GMSACredentialSpec is where the GMSA admission webhook (https://github.com/kubernetes-sigs/windows-gmsa) inlines the contents of the GMSA credential spec named by the GMSACredentialSpecName field. """
     gmsa_credential_spec_name: str
@@ -1487,6 +1879,21 @@ class SecurityContext(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "allow_privilege_escalation": "scalar",
+        "app_armor_profile": ("object", "AppArmorProfile"),
+        "capabilities": ("object", "Capabilities"),
+        "privileged": "scalar",
+        "proc_mount": "scalar",
+        "read_only_root_filesystem": "scalar",
+        "run_as_group": "scalar",
+        "run_as_non_root": "scalar",
+        "run_as_user": "scalar",
+        "se_linux_options": ("object", "SELinuxOptions"),
+        "seccomp_profile": ("object", "SeccompProfile"),
+        "windows_options": ("object", "WindowsSecurityContextOptions"),
+    }
+
     allow_privilege_escalation: bool
     """ AllowPrivilegeEscalation controls whether a process can gain more privileges than its parent process. This bool directly controls if the no_new_privs flag will be set on the container process. AllowPrivilegeEscalation is true always when the container is: 1) run as Privileged 2) has CAP_SYS_ADMIN Note that this field cannot be set when spec.os.name is windows. """
     app_armor_profile: AppArmorProfile
@@ -1552,6 +1959,11 @@ class VolumeDevice(KubernetesObject):
 
     _required_ = ["device_path", "name"]
 
+    _field_types_ = {
+        "device_path": "scalar",
+        "name": "scalar",
+    }
+
     device_path: str
     """ devicePath is the path inside of the container that the device will be mapped to. """
     name: str
@@ -1570,6 +1982,16 @@ class VolumeMount(KubernetesObject):
 
     _required_ = ["mount_path", "name"]
 
+    _field_types_ = {
+        "mount_path": "scalar",
+        "mount_propagation": "scalar",
+        "name": "scalar",
+        "read_only": "scalar",
+        "recursive_read_only": "scalar",
+        "sub_path": "scalar",
+        "sub_path_expr": "scalar",
+    }
+
     mount_path: str
     """ Path within the container at which the volume should be mounted.  Must not contain ':'. """
     mount_propagation: str
@@ -1625,6 +2047,33 @@ class Container(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "args": "raw_list",
+        "command": "raw_list",
+        "env": ("typed_list", "EnvVar"),
+        "env_from": ("typed_list", "EnvFromSource"),
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "lifecycle": ("object", "Lifecycle"),
+        "liveness_probe": ("object", "Probe"),
+        "name": "scalar",
+        "ports": ("typed_list", "ContainerPort"),
+        "readiness_probe": ("object", "Probe"),
+        "resize_policy": ("typed_list", "ContainerResizePolicy"),
+        "resources": ("object", "ResourceRequirements"),
+        "restart_policy": "scalar",
+        "security_context": ("object", "SecurityContext"),
+        "startup_probe": ("object", "Probe"),
+        "stdin": "scalar",
+        "stdin_once": "scalar",
+        "termination_message_path": "scalar",
+        "termination_message_policy": "scalar",
+        "tty": "scalar",
+        "volume_devices": ("typed_list", "VolumeDevice"),
+        "volume_mounts": ("typed_list", "VolumeMount"),
+        "working_dir": "scalar",
+    }
+
     args: list[str]
     """ Arguments to the entrypoint. The container image's CMD is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell """
     command: list[str]
@@ -1736,6 +2185,11 @@ class ContainerImage(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "names": "raw_list",
+        "size_bytes": "scalar",
+    }
+
     names: list[str]
     """ Names by which this image is known. e.g. ["kubernetes.example/hyperkube:v1.0.7", "cloud-vendor.registry.example/cloud-vendor/hyperkube:v1.0.7"] """
     size_bytes: int
@@ -1752,6 +2206,10 @@ class ContainerStateRunning(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "started_at": "scalar",
+    }
+
     started_at: meta.Time
     """ Time at which the container was last (re-)started """
 
@@ -1775,6 +2233,16 @@ class ContainerStateTerminated(KubernetesObject):
         "containerID": "container_id",
     }
 
+    _field_types_ = {
+        "container_id": "scalar",
+        "exit_code": "scalar",
+        "finished_at": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "signal": "scalar",
+        "started_at": "scalar",
+    }
+
     container_id: str
     """ Container's ID in the format '<type>://<container_id>' """
     exit_code: int
@@ -1818,6 +2286,11 @@ class ContainerStateWaiting(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "message": "scalar",
+        "reason": "scalar",
+    }
+
     message: str
     """ Message regarding why the container is not yet running. """
     reason: str
@@ -1834,6 +2307,12 @@ class ContainerState(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "running": ("object", "ContainerStateRunning"),
+        "terminated": ("object", "ContainerStateTerminated"),
+        "waiting": ("object", "ContainerStateWaiting"),
+    }
+
     running: ContainerStateRunning
     """ Details about a running container """
     terminated: ContainerStateTerminated
@@ -1863,6 +2342,11 @@ class ResourceHealth(KubernetesObject):
         "resourceID": "resource_id",
     }
 
+    _field_types_ = {
+        "health": "scalar",
+        "resource_id": "scalar",
+    }
+
     health: str
     """
     Health of the resource. can be one of:
@@ -1891,6 +2375,11 @@ class ResourceStatus(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "resources": ("typed_list", "ResourceHealth"),
+    }
+
     name: str
     """ Name of the resource. Must be unique within the pod and in case of non-DRA resource, match one of the resources from the pod spec. For DRA resources, the value must be "claim:<claim_name>/<request>". When this status is reported about a container, the "claim_name" and "request" must match one of the claims of this container. """
     resources: list[ResourceHealth]
@@ -1909,6 +2398,12 @@ class LinuxContainerUser(KubernetesObject):
 
     _required_ = ["gid", "uid"]
 
+    _field_types_ = {
+        "gid": "scalar",
+        "supplemental_groups": "raw_list",
+        "uid": "scalar",
+    }
+
     gid: int
     """ GID is the primary gid initially attached to the first process in the container """
     supplemental_groups: list[int]
@@ -1927,6 +2422,10 @@ class ContainerUser(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "linux": ("object", "LinuxContainerUser"),
+    }
+
     linux: LinuxContainerUser
     """ Linux holds user identity information initially attached to the first process of the containers in Linux. Note that the actual running identity can be changed if the process has enough privilege to do so. """
 
@@ -1943,6 +2442,13 @@ class VolumeMountStatus(KubernetesObject):
 
     _required_ = ["mount_path", "name"]
 
+    _field_types_ = {
+        "mount_path": "scalar",
+        "name": "scalar",
+        "read_only": "scalar",
+        "recursive_read_only": "scalar",
+    }
+
     mount_path: str
     """ MountPath corresponds to the original VolumeMount. """
     name: str
@@ -1974,6 +2480,24 @@ class ContainerStatus(KubernetesObject):
         "imageID": "image_id",
     }
 
+    _field_types_ = {
+        "allocated_resources": "raw_dict",
+        "allocated_resources_status": ("typed_list", "ResourceStatus"),
+        "container_id": "scalar",
+        "image": "scalar",
+        "image_id": "scalar",
+        "last_state": ("object", "ContainerState"),
+        "name": "scalar",
+        "ready": "scalar",
+        "resources": ("object", "ResourceRequirements"),
+        "restart_count": "scalar",
+        "started": "scalar",
+        "state": ("object", "ContainerState"),
+        "stop_signal": "scalar",
+        "user": ("object", "ContainerUser"),
+        "volume_mounts": ("typed_list", "VolumeMountStatus"),
+    }
+
     allocated_resources: dict[str, Quantity]
     """ AllocatedResources represents the compute resources allocated for this container by the node. Kubelet sets this value to Container.Resources.Requests upon successful pod admission and after successfully admitting desired pod resize. """
     allocated_resources_status: list[ResourceStatus]
@@ -2062,6 +2586,10 @@ class DaemonEndpoint(KubernetesObject):
         "Port": "port",
     }
 
+    _field_types_ = {
+        "port": "scalar",
+    }
+
     port: int
     """ Port number of the given endpoint. """
 
@@ -2078,6 +2606,13 @@ class DownwardAPIVolumeFile(KubernetesObject):
 
     _required_ = ["path"]
 
+    _field_types_ = {
+        "field_ref": ("object", "ObjectFieldSelector"),
+        "mode": "scalar",
+        "path": "scalar",
+        "resource_field_ref": ("object", "ResourceFieldSelector"),
+    }
+
     field_ref: ObjectFieldSelector
     """ Required: Selects a field of the pod: only annotations, labels, name, namespace and uid are supported. """
     mode: int
@@ -2100,6 +2635,10 @@ class DownwardAPIProjection(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "items": ("typed_list", "DownwardAPIVolumeFile"),
+    }
+
     items: list[DownwardAPIVolumeFile]
     """ Items is a list of DownwardAPIVolume file """
 
@@ -2114,6 +2653,11 @@ class DownwardAPIVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "default_mode": "scalar",
+        "items": ("typed_list", "DownwardAPIVolumeFile"),
+    }
+
     default_mode: int
     """ Optional: mode bits to use on created files by default. Must be a Optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. """
     items: list[DownwardAPIVolumeFile]
@@ -2130,6 +2674,11 @@ class EmptyDirVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "medium": "scalar",
+        "size_limit": "union",
+    }
+
     medium: str
     """ medium represents what type of storage medium should back this directory. The default is "" which means to use the node's default medium. Must be an empty string (default) or Memory. More info: https://kubernetes.io/docs/concepts/storage/volumes#emptydir """
     size_limit: Quantity
@@ -2148,6 +2697,13 @@ class EndpointAddress(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "ip": "scalar",
+        "node_name": "scalar",
+        "target_ref": ("object", "ObjectReference"),
+    }
+
     hostname: str
     """ The Hostname of this endpoint """
     ip: str
@@ -2170,6 +2726,13 @@ class EndpointPort(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "app_protocol": "scalar",
+        "name": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     app_protocol: str
     """
     The application protocol for this port. This is used as a hint for implementations to offer richer behavior for protocols that they understand. This field follows standard Kubernetes label syntax. Valid values are either:
@@ -2215,6 +2778,12 @@ class EndpointSubset(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "addresses": ("typed_list", "EndpointAddress"),
+        "not_ready_addresses": ("typed_list", "EndpointAddress"),
+        "ports": ("typed_list", "EndpointPort"),
+    }
+
     addresses: list[EndpointAddress]
     """ IP addresses which offer the related ports that are marked as ready. These endpoints should be considered safe for load balancers and clients to utilize. """
     not_ready_addresses: list[EndpointAddress]
@@ -2256,6 +2825,11 @@ class Endpoints(KubernetesApiResource):
     _kind_ = "Endpoints"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "subsets": ("typed_list", "EndpointSubset"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     subsets: list[EndpointSubset]
@@ -2278,6 +2852,34 @@ class EphemeralContainer(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "args": "raw_list",
+        "command": "raw_list",
+        "env": ("typed_list", "EnvVar"),
+        "env_from": ("typed_list", "EnvFromSource"),
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "lifecycle": ("object", "Lifecycle"),
+        "liveness_probe": ("object", "Probe"),
+        "name": "scalar",
+        "ports": ("typed_list", "ContainerPort"),
+        "readiness_probe": ("object", "Probe"),
+        "resize_policy": ("typed_list", "ContainerResizePolicy"),
+        "resources": ("object", "ResourceRequirements"),
+        "restart_policy": "scalar",
+        "security_context": ("object", "SecurityContext"),
+        "startup_probe": ("object", "Probe"),
+        "stdin": "scalar",
+        "stdin_once": "scalar",
+        "target_container_name": "scalar",
+        "termination_message_path": "scalar",
+        "termination_message_policy": "scalar",
+        "tty": "scalar",
+        "volume_devices": ("typed_list", "VolumeDevice"),
+        "volume_mounts": ("typed_list", "VolumeMount"),
+        "working_dir": "scalar",
+    }
+
     args: list[str]
     """ Arguments to the entrypoint. The image's CMD is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell """
     command: list[str]
@@ -2399,6 +3001,12 @@ class TypedLocalObjectReference(KubernetesObject):
 
     _required_ = ["kind", "name"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     api_group: str
     """ APIGroup is the group for the resource being referenced. If APIGroup is not specified, the specified Kind must be in the core API group. For any other third-party types, APIGroup is required. """
     kind: str
@@ -2419,6 +3027,13 @@ class TypedObjectReference(KubernetesObject):
 
     _required_ = ["kind", "name"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     api_group: str
     """ APIGroup is the group for the resource being referenced. If APIGroup is not specified, the specified Kind must be in the core API group. For any other third-party types, APIGroup is required. """
     kind: str
@@ -2439,6 +3054,11 @@ class VolumeResourceRequirements(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "limits": "raw_dict",
+        "requests": "raw_dict",
+    }
+
     limits: dict[str, Quantity]
     """ Limits describes the maximum amount of compute resources allowed. More info: https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/ """
     requests: dict[str, Quantity]
@@ -2455,6 +3075,18 @@ class PersistentVolumeClaimSpec(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "access_modes": "raw_list",
+        "data_source": ("object", "TypedLocalObjectReference"),
+        "data_source_ref": ("object", "TypedObjectReference"),
+        "resources": ("object", "VolumeResourceRequirements"),
+        "selector": ("object", "meta.LabelSelector"),
+        "storage_class_name": "scalar",
+        "volume_attributes_class_name": "scalar",
+        "volume_mode": "scalar",
+        "volume_name": "scalar",
+    }
+
     access_modes: list[str]
     """ accessModes contains the desired access modes the volume should have. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1 """
     data_source: TypedLocalObjectReference
@@ -2517,6 +3149,11 @@ class PersistentVolumeClaimTemplate(KubernetesObject):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PersistentVolumeClaimSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ May contain labels and annotations that will be copied into the PVC when creating it. No other fields are allowed and will be rejected during validation. """
     spec: PersistentVolumeClaimSpec
@@ -2533,6 +3170,10 @@ class EphemeralVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "volume_claim_template": ("object", "PersistentVolumeClaimTemplate"),
+    }
+
     volume_claim_template: PersistentVolumeClaimTemplate
     """
     Will be used to create a stand-alone PVC to provision the volume. The pod in which this EphemeralVolumeSource is embedded will be the owner of the PVC, i.e. the PVC will be deleted together with the pod.  The name of the PVC will be `<pod name>-<volume name>` where `<volume name>` is the name from the `PodSpec.Volumes` array entry. Pod validation will reject the pod if the concatenated name is not valid for a PVC (for example, too long).
@@ -2555,6 +3196,11 @@ class EventSeries(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "count": "scalar",
+        "last_observed_time": "scalar",
+    }
+
     count: int
     """ Number of occurrences in this series up to the last heartbeat time """
     last_observed_time: meta.MicroTime
@@ -2571,6 +3217,11 @@ class EventSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "component": "scalar",
+        "host": "scalar",
+    }
+
     component: str
     """ Component from which the event is generated. """
     host: str
@@ -2592,6 +3243,24 @@ class Event(KubernetesApiResource):
 
     _required_ = ["involved_object", "metadata"]
 
+    _field_types_ = {
+        "action": "scalar",
+        "count": "scalar",
+        "event_time": "scalar",
+        "first_timestamp": "scalar",
+        "involved_object": ("object", "ObjectReference"),
+        "last_timestamp": "scalar",
+        "message": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "reason": "scalar",
+        "related": ("object", "ObjectReference"),
+        "reporting_component": "scalar",
+        "reporting_instance": "scalar",
+        "series": ("object", "EventSeries"),
+        "source": ("object", "EventSource"),
+        "type": "scalar",
+    }
+
     action: str
     """ What action was taken/failed regarding to the Regarding object. """
     count: int
@@ -2678,6 +3347,14 @@ class FCVolumeSource(KubernetesObject):
         "targetWWNs": "target_wwns",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "lun": "scalar",
+        "read_only": "scalar",
+        "target_wwns": "raw_list",
+        "wwids": "raw_list",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. """
     lun: int
@@ -2704,6 +3381,14 @@ class FlexPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["driver"]
 
+    _field_types_ = {
+        "driver": "scalar",
+        "fs_type": "scalar",
+        "options": "raw_dict",
+        "read_only": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+    }
+
     driver: str
     """ driver is the name of the driver to use for this volume. """
     fs_type: str
@@ -2735,6 +3420,14 @@ class FlexVolumeSource(KubernetesObject):
 
     _required_ = ["driver"]
 
+    _field_types_ = {
+        "driver": "scalar",
+        "fs_type": "scalar",
+        "options": "raw_dict",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+    }
+
     driver: str
     """ driver is the name of the driver to use for this volume. """
     fs_type: str
@@ -2771,6 +3464,11 @@ class FlockerVolumeSource(KubernetesObject):
         "datasetUUID": "dataset_uuid",
     }
 
+    _field_types_ = {
+        "dataset_name": "scalar",
+        "dataset_uuid": "scalar",
+    }
+
     dataset_name: str
     """ datasetName is Name of the dataset stored as metadata -> name on the dataset for Flocker should be considered as deprecated """
     dataset_uuid: str
@@ -2793,6 +3491,13 @@ class GCEPersistentDiskVolumeSource(KubernetesObject):
 
     _required_ = ["pd_name"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "partition": "scalar",
+        "pd_name": "scalar",
+        "read_only": "scalar",
+    }
+
     fs_type: str
     """ fsType is filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#gcepersistentdisk """
     partition: int
@@ -2819,6 +3524,12 @@ class GitRepoVolumeSource(KubernetesObject):
 
     _required_ = ["repository"]
 
+    _field_types_ = {
+        "directory": "scalar",
+        "repository": "scalar",
+        "revision": "scalar",
+    }
+
     directory: str
     """ directory is the target directory name. Must not contain or start with '..'.  If '.' is supplied, the volume directory will be the git repository.  Otherwise, if specified, the volume will contain the git repository in the subdirectory with the given name. """
     repository: str
@@ -2839,6 +3550,13 @@ class GlusterfsPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["endpoints", "path"]
 
+    _field_types_ = {
+        "endpoints": "scalar",
+        "endpoints_namespace": "scalar",
+        "path": "scalar",
+        "read_only": "scalar",
+    }
+
     endpoints: str
     """ endpoints is the endpoint name that details Glusterfs topology. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod """
     endpoints_namespace: str
@@ -2861,6 +3579,12 @@ class GlusterfsVolumeSource(KubernetesObject):
 
     _required_ = ["endpoints", "path"]
 
+    _field_types_ = {
+        "endpoints": "scalar",
+        "path": "scalar",
+        "read_only": "scalar",
+    }
+
     endpoints: str
     """ endpoints is the endpoint name that details Glusterfs topology. More info: https://examples.k8s.io/volumes/glusterfs/README.md#create-a-pod """
     path: str
@@ -2881,6 +3605,11 @@ class HostAlias(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "hostnames": "raw_list",
+        "ip": "scalar",
+    }
+
     hostnames: list[str]
     """ Hostnames for the above IP address. """
     ip: str
@@ -2899,6 +3628,10 @@ class HostIP(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "ip": "scalar",
+    }
+
     ip: str
     """ IP is the IP address assigned to the host """
 
@@ -2915,6 +3648,11 @@ class HostPathVolumeSource(KubernetesObject):
 
     _required_ = ["path"]
 
+    _field_types_ = {
+        "path": "scalar",
+        "type": "scalar",
+    }
+
     path: str
     """ path of the directory on the host. If the path is a symlink, it will follow the link to the real path. More info: https://kubernetes.io/docs/concepts/storage/volumes#hostpath """
     type: str
@@ -2933,6 +3671,20 @@ class ISCSIPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["iqn", "lun", "target_portal"]
 
+    _field_types_ = {
+        "chap_auth_discovery": "scalar",
+        "chap_auth_session": "scalar",
+        "fs_type": "scalar",
+        "initiator_name": "scalar",
+        "iqn": "scalar",
+        "iscsi_interface": "scalar",
+        "lun": "scalar",
+        "portals": "raw_list",
+        "read_only": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+        "target_portal": "scalar",
+    }
+
     chap_auth_discovery: bool
     """ chapAuthDiscovery defines whether support iSCSI Discovery CHAP authentication """
     chap_auth_session: bool
@@ -2994,6 +3746,20 @@ class ISCSIVolumeSource(KubernetesObject):
 
     _required_ = ["iqn", "lun", "target_portal"]
 
+    _field_types_ = {
+        "chap_auth_discovery": "scalar",
+        "chap_auth_session": "scalar",
+        "fs_type": "scalar",
+        "initiator_name": "scalar",
+        "iqn": "scalar",
+        "iscsi_interface": "scalar",
+        "lun": "scalar",
+        "portals": "raw_list",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "target_portal": "scalar",
+    }
+
     chap_auth_discovery: bool
     """ chapAuthDiscovery defines whether support iSCSI Discovery CHAP authentication """
     chap_auth_session: bool
@@ -3053,6 +3819,11 @@ class ImageVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "pull_policy": "scalar",
+        "reference": "scalar",
+    }
+
     pull_policy: str
     """ Policy for pulling OCI objects. Possible values are: Always: the kubelet always attempts to pull the reference. Container creation will fail If the pull fails. Never: the kubelet never pulls the reference and only uses a local image or artifact. Container creation will fail if the reference isn't present. IfNotPresent: the kubelet pulls if the reference isn't already present on disk. Container creation will fail if the reference isn't present and the pull fails. Defaults to Always if :latest tag is specified, or IfNotPresent otherwise. """
     reference: str
@@ -3071,6 +3842,22 @@ class Info(KubernetesObject):
 
     _required_ = ["build_date", "compiler", "git_commit", "git_tree_state", "git_version", "go_version", "major", "minor", "platform"]
 
+    _field_types_ = {
+        "build_date": "scalar",
+        "compiler": "scalar",
+        "emulation_major": "scalar",
+        "emulation_minor": "scalar",
+        "git_commit": "scalar",
+        "git_tree_state": "scalar",
+        "git_version": "scalar",
+        "go_version": "scalar",
+        "major": "scalar",
+        "min_compatibility_major": "scalar",
+        "min_compatibility_minor": "scalar",
+        "minor": "scalar",
+        "platform": "scalar",
+    }
+
     build_date: str
     compiler: str
     emulation_major: str
@@ -3133,6 +3920,15 @@ class LimitRangeItem(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "default": "raw_dict",
+        "default_request": "raw_dict",
+        "max": "raw_dict",
+        "max_limit_request_ratio": "raw_dict",
+        "min": "raw_dict",
+        "type": "scalar",
+    }
+
     default: dict[str, Quantity]
     """ Default resource requirement limit value by resource name if resource limit is omitted. """
     default_request: dict[str, Quantity]
@@ -3169,6 +3965,10 @@ class LimitRangeSpec(KubernetesObject):
 
     _required_ = ["limits"]
 
+    _field_types_ = {
+        "limits": ("typed_list", "LimitRangeItem"),
+    }
+
     limits: list[LimitRangeItem]
     """ Limits is the list of LimitRangeItem objects that are enforced. """
 
@@ -3186,6 +3986,11 @@ class LimitRange(KubernetesApiResource):
     _kind_ = "LimitRange"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "LimitRangeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: LimitRangeSpec
@@ -3204,6 +4009,12 @@ class PortStatus(KubernetesObject):
 
     _required_ = ["port", "protocol"]
 
+    _field_types_ = {
+        "error": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     error: str
     """
     Error is to record the problem with the service port The format of the error shall comply with the following rules: - built-in error values shall be specified in this file and those shall use
@@ -3227,6 +4038,13 @@ class LoadBalancerIngress(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "ip": "scalar",
+        "ip_mode": "scalar",
+        "ports": ("typed_list", "PortStatus"),
+    }
+
     hostname: str
     """ Hostname is set for load-balancer ingress points that are DNS based (typically AWS load-balancers) """
     ip: str
@@ -3247,6 +4065,10 @@ class LoadBalancerStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "ingress": ("typed_list", "LoadBalancerIngress"),
+    }
+
     ingress: list[LoadBalancerIngress]
     """ Ingress is a list containing ingress points for the load-balancer. Traffic intended for the service should be sent to these ingress points. """
 
@@ -3263,6 +4085,11 @@ class LocalVolumeSource(KubernetesObject):
 
     _required_ = ["path"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "path": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. It applies only when the Path is a block device. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". The default value is to auto-select a filesystem if unspecified. """
     path: str
@@ -3281,6 +4108,11 @@ class ModifyVolumeStatus(KubernetesObject):
 
     _required_ = ["status"]
 
+    _field_types_ = {
+        "status": "scalar",
+        "target_volume_attributes_class_name": "scalar",
+    }
+
     status: str
     """
     status is the status of the ControllerModifyVolume operation. It can be in any of following states:
@@ -3310,6 +4142,12 @@ class NFSVolumeSource(KubernetesObject):
 
     _required_ = ["path", "server"]
 
+    _field_types_ = {
+        "path": "scalar",
+        "read_only": "scalar",
+        "server": "scalar",
+    }
+
     path: str
     """ path that is exported by the NFS server. More info: https://kubernetes.io/docs/concepts/storage/volumes#nfs """
     read_only: bool
@@ -3328,6 +4166,10 @@ class NamespaceSpec(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "finalizers": "raw_list",
+    }
+
     finalizers: list[str]
     """ Finalizers is an opaque list of values that must be empty to permanently remove object from storage. More info: https://kubernetes.io/docs/tasks/administer-cluster/namespaces/ """
 
@@ -3345,6 +4187,11 @@ class Namespace(KubernetesApiResource):
     _kind_ = "Namespace"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "NamespaceSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: NamespaceSpec
@@ -3363,6 +4210,14 @@ class NamespaceCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     message: str
@@ -3387,6 +4242,11 @@ class NamespaceStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "NamespaceCondition"),
+        "phase": "scalar",
+    }
+
     conditions: list[NamespaceCondition]
     """ Represents the latest available observations of a namespace's current state. """
     phase: str
@@ -3403,6 +4263,10 @@ class NodeConfigSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "config_map": ("object", "ConfigMapNodeConfigSource"),
+    }
+
     config_map: ConfigMapNodeConfigSource
     """ ConfigMap is a reference to a Node's ConfigMap """
 
@@ -3419,6 +4283,13 @@ class Taint(KubernetesObject):
 
     _required_ = ["effect", "key"]
 
+    _field_types_ = {
+        "effect": "scalar",
+        "key": "scalar",
+        "time_added": "scalar",
+        "value": "scalar",
+    }
+
     effect: str
     """ Required. The effect of the taint on pods that do not tolerate the taint. Valid effects are NoSchedule, PreferNoSchedule and NoExecute. """
     key: str
@@ -3452,6 +4323,16 @@ class NodeSpec(KubernetesObject):
         "providerID": "provider_id",
     }
 
+    _field_types_ = {
+        "config_source": ("object", "NodeConfigSource"),
+        "external_id": "scalar",
+        "pod_cidr": "scalar",
+        "pod_cidrs": "raw_list",
+        "provider_id": "scalar",
+        "taints": ("typed_list", "Taint"),
+        "unschedulable": "scalar",
+    }
+
     config_source: NodeConfigSource
     """ Deprecated: Previously used to specify the source of the node's configuration for the DynamicKubeletConfig feature. This feature is removed. """
     external_id: str
@@ -3498,6 +4379,11 @@ class Node(KubernetesApiResource):
     _kind_ = "Node"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "NodeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: NodeSpec
@@ -3516,6 +4402,11 @@ class NodeAddress(KubernetesObject):
 
     _required_ = ["address", "type"]
 
+    _field_types_ = {
+        "address": "scalar",
+        "type": "scalar",
+    }
+
     address: str
     """ The node address. """
     type: str
@@ -3534,6 +4425,15 @@ class NodeCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_heartbeat_time": "scalar",
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_heartbeat_time: meta.Time
     """ Last time we got an update on a given condition. """
     last_transition_time: meta.Time
@@ -3573,6 +4473,13 @@ class NodeConfigStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "active": ("object", "NodeConfigSource"),
+        "assigned": ("object", "NodeConfigSource"),
+        "error": "scalar",
+        "last_known_good": ("object", "NodeConfigSource"),
+    }
+
     active: NodeConfigSource
     """ Active reports the checkpointed config the node is actively using. Active will represent either the current version of the Assigned config, or the current LastKnownGood config, depending on whether attempting to use the Assigned config results in an error. """
     assigned: NodeConfigSource
@@ -3599,6 +4506,10 @@ class NodeDaemonEndpoints(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "kubelet_endpoint": ("object", "DaemonEndpoint"),
+    }
+
     kubelet_endpoint: DaemonEndpoint
     """ Endpoint on which Kubelet is listening. """
 
@@ -3613,6 +4524,10 @@ class NodeFeatures(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "supplemental_groups_policy": "scalar",
+    }
+
     supplemental_groups_policy: bool
     """ SupplementalGroupsPolicy is set to true if the runtime supports SupplementalGroupsPolicy and ContainerUser. """
 
@@ -3627,6 +4542,11 @@ class NodeRuntimeHandlerFeatures(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "recursive_read_only_mounts": "scalar",
+        "user_namespaces": "scalar",
+    }
+
     recursive_read_only_mounts: bool
     """ RecursiveReadOnlyMounts is set to true if the runtime handler supports RecursiveReadOnlyMounts. """
     user_namespaces: bool
@@ -3643,6 +4563,11 @@ class NodeRuntimeHandler(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "features": ("object", "NodeRuntimeHandlerFeatures"),
+        "name": "scalar",
+    }
+
     features: NodeRuntimeHandlerFeatures
     """ Supported features. """
     name: str
@@ -3659,6 +4584,10 @@ class NodeSwapStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "capacity": "scalar",
+    }
+
     capacity: int
     """ Total amount of swap memory in bytes. """
 
@@ -3697,6 +4626,20 @@ class NodeSystemInfo(KubernetesObject):
         "systemUUID": "system_uuid",
     }
 
+    _field_types_ = {
+        "architecture": "scalar",
+        "boot_id": "scalar",
+        "container_runtime_version": "scalar",
+        "kernel_version": "scalar",
+        "kube_proxy_version": "scalar",
+        "kubelet_version": "scalar",
+        "machine_id": "scalar",
+        "operating_system": "scalar",
+        "os_image": "scalar",
+        "swap": ("object", "NodeSwapStatus"),
+        "system_uuid": "scalar",
+    }
+
     architecture: str
     """ The Architecture reported by the node """
     boot_id: str
@@ -3756,6 +4699,22 @@ class NodeStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "addresses": ("typed_list", "NodeAddress"),
+        "allocatable": "raw_dict",
+        "capacity": "raw_dict",
+        "conditions": ("typed_list", "NodeCondition"),
+        "config": ("object", "NodeConfigStatus"),
+        "daemon_endpoints": ("object", "NodeDaemonEndpoints"),
+        "features": ("object", "NodeFeatures"),
+        "images": ("typed_list", "ContainerImage"),
+        "node_info": ("object", "NodeSystemInfo"),
+        "phase": "scalar",
+        "runtime_handlers": ("typed_list", "NodeRuntimeHandler"),
+        "volumes_attached": ("typed_list", "AttachedVolume"),
+        "volumes_in_use": "raw_list",
+    }
+
     addresses: list[NodeAddress]
     """ List of addresses reachable to the node. Queried from cloud provider, if available. More info: https://kubernetes.io/docs/reference/node/node-status/#addresses Note: This field is declared as mergeable, but the merge key is not sufficiently unique, which can cause data corruption when it is merged. Callers should instead use a full-replacement patch. See https://pr.k8s.io/79391 for an example. Consumers should assume that addresses can change during the lifetime of a Node. However, there are some exceptions where this may not be possible, such as Pods that inherit a Node's address in its own status or consumers of the downward API (status.hostIP). """
     allocatable: dict[str, Quantity]
@@ -3823,6 +4782,10 @@ class VolumeNodeAffinity(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "required": ("object", "NodeSelector"),
+    }
+
     required: NodeSelector
     """ required specifies hard node constraints that must be met. """
 
@@ -3846,6 +4809,11 @@ class PhotonPersistentDiskVolumeSource(KubernetesObject):
         "pdID": "pd_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "pd_id": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. """
     pd_id: str
@@ -3871,6 +4839,12 @@ class PortworxVolumeSource(KubernetesObject):
         "volumeID": "volume_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "read_only": "scalar",
+        "volume_id": "scalar",
+    }
+
     fs_type: str
     """ fSType represents the filesystem type to mount Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs". Implicitly inferred to be "ext4" if unspecified. """
     read_only: bool
@@ -3891,6 +4865,15 @@ class QuobyteVolumeSource(KubernetesObject):
 
     _required_ = ["registry", "volume"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "read_only": "scalar",
+        "registry": "scalar",
+        "tenant": "scalar",
+        "user": "scalar",
+        "volume": "scalar",
+    }
+
     group: str
     """ group to map volume access to Default is no group """
     read_only: bool
@@ -3919,6 +4902,17 @@ class RBDPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["image", "monitors"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "image": "scalar",
+        "keyring": "scalar",
+        "monitors": "raw_list",
+        "pool": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+        "user": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#rbd """
     image: str
@@ -3968,6 +4962,19 @@ class ScaleIOPersistentVolumeSource(KubernetesObject):
 
     _required_ = ["gateway", "secret_ref", "system"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "gateway": "scalar",
+        "protection_domain": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "SecretReference"),
+        "ssl_enabled": "scalar",
+        "storage_mode": "scalar",
+        "storage_pool": "scalar",
+        "system": "scalar",
+        "volume_name": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Default is "xfs" """
     gateway: str
@@ -4023,6 +5030,14 @@ class StorageOSPersistentVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "ObjectReference"),
+        "volume_name": "scalar",
+        "volume_namespace": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. """
     read_only: bool
@@ -4063,6 +5078,13 @@ class VsphereVirtualDiskVolumeSource(KubernetesObject):
         "storagePolicyID": "storage_policy_id",
     }
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "storage_policy_id": "scalar",
+        "storage_policy_name": "scalar",
+        "volume_path": "scalar",
+    }
+
     fs_type: str
     """ fsType is filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. """
     storage_policy_id: str
@@ -4092,6 +5114,40 @@ class PersistentVolumeSpec(KubernetesObject):
         "scaleIO": "scale_io",
     }
 
+    _field_types_ = {
+        "access_modes": "raw_list",
+        "aws_elastic_block_store": ("object", "AWSElasticBlockStoreVolumeSource"),
+        "azure_disk": ("object", "AzureDiskVolumeSource"),
+        "azure_file": ("object", "AzureFilePersistentVolumeSource"),
+        "capacity": "raw_dict",
+        "cephfs": ("object", "CephFSPersistentVolumeSource"),
+        "cinder": ("object", "CinderPersistentVolumeSource"),
+        "claim_ref": ("object", "ObjectReference"),
+        "csi": ("object", "CSIPersistentVolumeSource"),
+        "fc": ("object", "FCVolumeSource"),
+        "flex_volume": ("object", "FlexPersistentVolumeSource"),
+        "flocker": ("object", "FlockerVolumeSource"),
+        "gce_persistent_disk": ("object", "GCEPersistentDiskVolumeSource"),
+        "glusterfs": ("object", "GlusterfsPersistentVolumeSource"),
+        "host_path": ("object", "HostPathVolumeSource"),
+        "iscsi": ("object", "ISCSIPersistentVolumeSource"),
+        "local": ("object", "LocalVolumeSource"),
+        "mount_options": "raw_list",
+        "nfs": ("object", "NFSVolumeSource"),
+        "node_affinity": ("object", "VolumeNodeAffinity"),
+        "persistent_volume_reclaim_policy": "scalar",
+        "photon_persistent_disk": ("object", "PhotonPersistentDiskVolumeSource"),
+        "portworx_volume": ("object", "PortworxVolumeSource"),
+        "quobyte": ("object", "QuobyteVolumeSource"),
+        "rbd": ("object", "RBDPersistentVolumeSource"),
+        "scale_io": ("object", "ScaleIOPersistentVolumeSource"),
+        "storage_class_name": "scalar",
+        "storageos": ("object", "StorageOSPersistentVolumeSource"),
+        "volume_attributes_class_name": "scalar",
+        "volume_mode": "scalar",
+        "vsphere_volume": ("object", "VsphereVirtualDiskVolumeSource"),
+    }
+
     access_modes: list[str]
     """ accessModes contains all ways the volume can be mounted. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes """
     aws_elastic_block_store: AWSElasticBlockStoreVolumeSource
@@ -4234,6 +5290,11 @@ class PersistentVolume(KubernetesApiResource):
     _kind_ = "PersistentVolume"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PersistentVolumeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PersistentVolumeSpec
@@ -4253,6 +5314,11 @@ class PersistentVolumeClaim(KubernetesApiResource):
     _kind_ = "PersistentVolumeClaim"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PersistentVolumeClaimSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PersistentVolumeClaimSpec
@@ -4271,6 +5337,15 @@ class PersistentVolumeClaimCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_probe_time": "scalar",
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_probe_time: meta.Time
     """ lastProbeTime is the time we probed the condition. """
     last_transition_time: meta.Time
@@ -4310,6 +5385,17 @@ class PersistentVolumeClaimStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "access_modes": "raw_list",
+        "allocated_resource_statuses": "raw_dict",
+        "allocated_resources": "raw_dict",
+        "capacity": "raw_dict",
+        "conditions": ("typed_list", "PersistentVolumeClaimCondition"),
+        "current_volume_attributes_class_name": "scalar",
+        "modify_volume_status": ("object", "ModifyVolumeStatus"),
+        "phase": "scalar",
+    }
+
     access_modes: list[str]
     """ accessModes contains the actual access modes the volume backing the PVC has. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#access-modes-1 """
     allocated_resource_statuses: dict[str, str]
@@ -4402,6 +5488,11 @@ class PersistentVolumeClaimVolumeSource(KubernetesObject):
 
     _required_ = ["claim_name"]
 
+    _field_types_ = {
+        "claim_name": "scalar",
+        "read_only": "scalar",
+    }
+
     claim_name: str
     """ claimName is the name of a PersistentVolumeClaim in the same namespace as the pod using this volume. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes#persistentvolumeclaims """
     read_only: bool
@@ -4418,6 +5509,13 @@ class PersistentVolumeStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "last_phase_transition_time": "scalar",
+        "message": "scalar",
+        "phase": "scalar",
+        "reason": "scalar",
+    }
+
     last_phase_transition_time: meta.Time
     """ lastPhaseTransitionTime is the time the phase transitioned from one to another and automatically resets to current time everytime a volume phase transitions. """
     message: str
@@ -4438,6 +5536,11 @@ class PodDNSConfigOption(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     """ Name is this DNS resolver option's name. Required. """
     value: str
@@ -4454,6 +5557,12 @@ class PodDNSConfig(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "nameservers": "raw_list",
+        "options": ("typed_list", "PodDNSConfigOption"),
+        "searches": "raw_list",
+    }
+
     nameservers: list[str]
     """ A list of DNS name server IP addresses. This will be appended to the base nameservers generated from DNSPolicy. Duplicated nameservers will be removed. """
     options: list[PodDNSConfigOption]
@@ -4474,6 +5583,10 @@ class PodOS(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ Name is the name of the operating system. The currently supported values are linux and windows. Additional value may be defined in future and can be one of: https://github.com/opencontainers/runtime-spec/blob/master/config.md#platform-specific-configuration Clients should expect to handle additional values and treat unrecognized values in this field as os: null """
 
@@ -4490,6 +5603,10 @@ class PodReadinessGate(KubernetesObject):
 
     _required_ = ["condition_type"]
 
+    _field_types_ = {
+        "condition_type": "scalar",
+    }
+
     condition_type: str
     """ ConditionType refers to a condition in the pod's condition list with matching type. """
 
@@ -4510,6 +5627,12 @@ class PodResourceClaim(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "resource_claim_name": "scalar",
+        "resource_claim_template_name": "scalar",
+    }
+
     name: str
     """ Name uniquely identifies this resource claim inside the pod. This must be a DNS_LABEL. """
     resource_claim_name: str
@@ -4542,6 +5665,10 @@ class PodSchedulingGate(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ Name of the scheduling gate. Each scheduling gate must have a unique name field. """
 
@@ -4558,6 +5685,11 @@ class Sysctl(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     """ Name of a property to set """
     value: str
@@ -4574,6 +5706,22 @@ class PodSecurityContext(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "app_armor_profile": ("object", "AppArmorProfile"),
+        "fs_group": "scalar",
+        "fs_group_change_policy": "scalar",
+        "run_as_group": "scalar",
+        "run_as_non_root": "scalar",
+        "run_as_user": "scalar",
+        "se_linux_change_policy": "scalar",
+        "se_linux_options": ("object", "SELinuxOptions"),
+        "seccomp_profile": ("object", "SeccompProfile"),
+        "supplemental_groups": "raw_list",
+        "supplemental_groups_policy": "scalar",
+        "sysctls": ("typed_list", "Sysctl"),
+        "windows_options": ("object", "WindowsSecurityContextOptions"),
+    }
+
     app_armor_profile: AppArmorProfile
     """ appArmorProfile is the AppArmor options to use by the containers in this pod. Note that this field cannot be set when spec.os.name is windows. """
     fs_group: int
@@ -4659,6 +5807,14 @@ class Toleration(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "effect": "scalar",
+        "key": "scalar",
+        "operator": "scalar",
+        "toleration_seconds": "scalar",
+        "value": "scalar",
+    }
+
     effect: str
     """ Effect indicates the taint effect to match. Empty means match all taint effects. When specified, allowed values are NoSchedule, PreferNoSchedule and NoExecute. """
     key: str
@@ -4683,6 +5839,17 @@ class TopologySpreadConstraint(KubernetesObject):
 
     _required_ = ["max_skew", "topology_key", "when_unsatisfiable"]
 
+    _field_types_ = {
+        "label_selector": ("object", "meta.LabelSelector"),
+        "match_label_keys": "raw_list",
+        "max_skew": "scalar",
+        "min_domains": "scalar",
+        "node_affinity_policy": "scalar",
+        "node_taints_policy": "scalar",
+        "topology_key": "scalar",
+        "when_unsatisfiable": "scalar",
+    }
+
     label_selector: meta.LabelSelector
     """ LabelSelector is used to find matching pods. Pods that match this label selector are counted to determine the number of pods in their corresponding topology domain. """
     match_label_keys: list[str]
@@ -4755,6 +5922,12 @@ class SecretProjection(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "items": ("typed_list", "KeyToPath"),
+        "name": "scalar",
+        "optional": "scalar",
+    }
+
     items: list[KeyToPath]
     """ items if unspecified, each key-value pair in the Data field of the referenced Secret will be projected into the volume as a file whose name is the key and content is the value. If specified, the listed keys will be projected into the specified paths, and unlisted keys will not be present. If a key is specified which is not present in the Secret, the volume setup will error unless it is marked optional. Paths must be relative and may not contain the '..' path or start with '..'. """
     name: str
@@ -4775,6 +5948,12 @@ class ServiceAccountTokenProjection(KubernetesObject):
 
     _required_ = ["path"]
 
+    _field_types_ = {
+        "audience": "scalar",
+        "expiration_seconds": "scalar",
+        "path": "scalar",
+    }
+
     audience: str
     """ audience is the intended audience of the token. A recipient of a token must identify itself with an identifier specified in the audience of the token, and otherwise should reject the token. The audience defaults to the identifier of the apiserver. """
     expiration_seconds: int
@@ -4800,6 +5979,14 @@ class VolumeProjection(KubernetesObject):
         "downwardAPI": "downward_api",
     }
 
+    _field_types_ = {
+        "cluster_trust_bundle": ("object", "ClusterTrustBundleProjection"),
+        "config_map": ("object", "ConfigMapProjection"),
+        "downward_api": ("object", "DownwardAPIProjection"),
+        "secret": ("object", "SecretProjection"),
+        "service_account_token": ("object", "ServiceAccountTokenProjection"),
+    }
+
     cluster_trust_bundle: ClusterTrustBundleProjection
     """
     ClusterTrustBundle allows a pod to access the `.spec.trustBundle` field of ClusterTrustBundle objects in an auto-updating file.
@@ -4843,6 +6030,11 @@ class ProjectedVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "default_mode": "scalar",
+        "sources": ("typed_list", "VolumeProjection"),
+    }
+
     default_mode: int
     """ defaultMode are the mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. """
     sources: list[VolumeProjection]
@@ -4861,6 +6053,17 @@ class RBDVolumeSource(KubernetesObject):
 
     _required_ = ["image", "monitors"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "image": "scalar",
+        "keyring": "scalar",
+        "monitors": "raw_list",
+        "pool": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "user": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type of the volume that you want to mount. Tip: Ensure that the filesystem type is supported by the host operating system. Examples: "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. More info: https://kubernetes.io/docs/concepts/storage/volumes#rbd """
     image: str
@@ -4910,6 +6113,19 @@ class ScaleIOVolumeSource(KubernetesObject):
 
     _required_ = ["gateway", "secret_ref", "system"]
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "gateway": "scalar",
+        "protection_domain": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "ssl_enabled": "scalar",
+        "storage_mode": "scalar",
+        "storage_pool": "scalar",
+        "system": "scalar",
+        "volume_name": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Default is "xfs". """
     gateway: str
@@ -4969,6 +6185,13 @@ class SecretVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "default_mode": "scalar",
+        "items": ("typed_list", "KeyToPath"),
+        "optional": "scalar",
+        "secret_name": "scalar",
+    }
+
     default_mode: int
     """ defaultMode is Optional: mode bits used to set permissions on created files by default. Must be an octal value between 0000 and 0777 or a decimal value between 0 and 511. YAML accepts both octal and decimal values, JSON requires decimal values for mode bits. Defaults to 0644. Directories within the path are not affected by this setting. This might be in conflict with other options that affect the file mode, like fsGroup, and the result can be other mode bits set. """
     items: list[KeyToPath]
@@ -4989,6 +6212,14 @@ class StorageOSVolumeSource(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "fs_type": "scalar",
+        "read_only": "scalar",
+        "secret_ref": ("object", "LocalObjectReference"),
+        "volume_name": "scalar",
+        "volume_namespace": "scalar",
+    }
+
     fs_type: str
     """ fsType is the filesystem type to mount. Must be a filesystem type supported by the host operating system. Ex. "ext4", "xfs", "ntfs". Implicitly inferred to be "ext4" if unspecified. """
     read_only: bool
@@ -5031,6 +6262,40 @@ class Volume(KubernetesObject):
         "scaleIO": "scale_io",
     }
 
+    _field_types_ = {
+        "aws_elastic_block_store": ("object", "AWSElasticBlockStoreVolumeSource"),
+        "azure_disk": ("object", "AzureDiskVolumeSource"),
+        "azure_file": ("object", "AzureFileVolumeSource"),
+        "cephfs": ("object", "CephFSVolumeSource"),
+        "cinder": ("object", "CinderVolumeSource"),
+        "config_map": ("object", "ConfigMapVolumeSource"),
+        "csi": ("object", "CSIVolumeSource"),
+        "downward_api": ("object", "DownwardAPIVolumeSource"),
+        "empty_dir": ("object", "EmptyDirVolumeSource"),
+        "ephemeral": ("object", "EphemeralVolumeSource"),
+        "fc": ("object", "FCVolumeSource"),
+        "flex_volume": ("object", "FlexVolumeSource"),
+        "flocker": ("object", "FlockerVolumeSource"),
+        "gce_persistent_disk": ("object", "GCEPersistentDiskVolumeSource"),
+        "git_repo": ("object", "GitRepoVolumeSource"),
+        "glusterfs": ("object", "GlusterfsVolumeSource"),
+        "host_path": ("object", "HostPathVolumeSource"),
+        "image": ("object", "ImageVolumeSource"),
+        "iscsi": ("object", "ISCSIVolumeSource"),
+        "name": "scalar",
+        "nfs": ("object", "NFSVolumeSource"),
+        "persistent_volume_claim": ("object", "PersistentVolumeClaimVolumeSource"),
+        "photon_persistent_disk": ("object", "PhotonPersistentDiskVolumeSource"),
+        "portworx_volume": ("object", "PortworxVolumeSource"),
+        "projected": ("object", "ProjectedVolumeSource"),
+        "quobyte": ("object", "QuobyteVolumeSource"),
+        "rbd": ("object", "RBDVolumeSource"),
+        "scale_io": ("object", "ScaleIOVolumeSource"),
+        "secret": ("object", "SecretVolumeSource"),
+        "storageos": ("object", "StorageOSVolumeSource"),
+        "vsphere_volume": ("object", "VsphereVirtualDiskVolumeSource"),
+    }
+
     aws_elastic_block_store: AWSElasticBlockStoreVolumeSource
     """ awsElasticBlockStore represents an AWS Disk resource that is attached to a kubelet's host machine and then exposed to the pod. Deprecated: AWSElasticBlockStore is deprecated. All operations for the in-tree awsElasticBlockStore type are redirected to the ebs.csi.aws.com CSI driver. More info: https://kubernetes.io/docs/concepts/storage/volumes#awselasticblockstore """
     azure_disk: AzureDiskVolumeSource
@@ -5204,6 +6469,49 @@ class PodSpec(KubernetesObject):
         "setHostnameAsFQDN": "set_hostname_as_fqdn",
     }
 
+    _field_types_ = {
+        "active_deadline_seconds": "scalar",
+        "affinity": ("object", "Affinity"),
+        "automount_service_account_token": "scalar",
+        "containers": ("typed_list", "Container"),
+        "dns_config": ("object", "PodDNSConfig"),
+        "dns_policy": "scalar",
+        "enable_service_links": "scalar",
+        "ephemeral_containers": ("typed_list", "EphemeralContainer"),
+        "host_aliases": ("typed_list", "HostAlias"),
+        "host_ipc": "scalar",
+        "host_network": "scalar",
+        "host_pid": "scalar",
+        "host_users": "scalar",
+        "hostname": "scalar",
+        "image_pull_secrets": ("typed_list", "LocalObjectReference"),
+        "init_containers": ("typed_list", "Container"),
+        "node_name": "scalar",
+        "node_selector": "raw_dict",
+        "os": ("object", "PodOS"),
+        "overhead": "raw_dict",
+        "preemption_policy": "scalar",
+        "priority": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_gates": ("typed_list", "PodReadinessGate"),
+        "resource_claims": ("typed_list", "PodResourceClaim"),
+        "resources": ("object", "ResourceRequirements"),
+        "restart_policy": "scalar",
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "scheduling_gates": ("typed_list", "PodSchedulingGate"),
+        "security_context": ("object", "PodSecurityContext"),
+        "service_account": "scalar",
+        "service_account_name": "scalar",
+        "set_hostname_as_fqdn": "scalar",
+        "share_process_namespace": "scalar",
+        "subdomain": "scalar",
+        "termination_grace_period_seconds": "scalar",
+        "tolerations": ("typed_list", "Toleration"),
+        "topology_spread_constraints": ("typed_list", "TopologySpreadConstraint"),
+        "volumes": ("typed_list", "Volume"),
+    }
+
     active_deadline_seconds: int
     """ Optional duration in seconds the pod may be active on the node relative to StartTime before the system will actively try to mark it failed and kill associated containers. Value must be a positive integer. """
     affinity: Affinity
@@ -5404,6 +6712,11 @@ class Pod(KubernetesApiResource):
     _kind_ = "Pod"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PodSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PodSpec
@@ -5422,6 +6735,16 @@ class PodCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_probe_time": "scalar",
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "observed_generation": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_probe_time: meta.Time
     """ Last time we probed the condition. """
     last_transition_time: meta.Time
@@ -5467,6 +6790,10 @@ class PodIP(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "ip": "scalar",
+    }
+
     ip: str
     """ IP is the IP address assigned to the pod """
 
@@ -5483,6 +6810,11 @@ class PodResourceClaimStatus(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "resource_claim_name": "scalar",
+    }
+
     name: str
     """ Name uniquely identifies this resource claim inside the pod. This must match the name of an entry in pod.spec.resourceClaims, which implies that the string must be a DNS_LABEL. """
     resource_claim_name: str
@@ -5512,6 +6844,26 @@ class PodStatus(KubernetesObject):
         "podIPs": "pod_ips",
     }
 
+    _field_types_ = {
+        "conditions": ("typed_list", "PodCondition"),
+        "container_statuses": ("typed_list", "ContainerStatus"),
+        "ephemeral_container_statuses": ("typed_list", "ContainerStatus"),
+        "host_ip": "scalar",
+        "host_ips": ("typed_list", "HostIP"),
+        "init_container_statuses": ("typed_list", "ContainerStatus"),
+        "message": "scalar",
+        "nominated_node_name": "scalar",
+        "observed_generation": "scalar",
+        "phase": "scalar",
+        "pod_ip": "scalar",
+        "pod_ips": ("typed_list", "PodIP"),
+        "qos_class": "scalar",
+        "reason": "scalar",
+        "resize": "scalar",
+        "resource_claim_statuses": ("typed_list", "PodResourceClaimStatus"),
+        "start_time": "scalar",
+    }
+
     conditions: list[PodCondition]
     """ Current service state of pod. More info: https://kubernetes.io/docs/concepts/workloads/pods/pod-lifecycle#pod-conditions """
     container_statuses: list[ContainerStatus]
@@ -5601,6 +6953,11 @@ class PodTemplateSpec(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PodSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PodSpec
@@ -5620,6 +6977,11 @@ class PodTemplate(KubernetesApiResource):
     _kind_ = "PodTemplate"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "template": ("object", "PodTemplateSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     template: PodTemplateSpec
@@ -5679,6 +7041,13 @@ class ReplicationControllerSpec(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "min_ready_seconds": "scalar",
+        "replicas": "scalar",
+        "selector": "raw_dict",
+        "template": ("object", "PodTemplateSpec"),
+    }
+
     min_ready_seconds: int
     """ Minimum number of seconds for which a newly created pod should be ready without any of its container crashing, for it to be considered available. Defaults to 0 (pod will be considered available as soon as it is ready) """
     replicas: int
@@ -5704,6 +7073,11 @@ class ReplicationController(KubernetesApiResource):
     _kind_ = "ReplicationController"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ReplicationControllerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ If the Labels of a ReplicationController are empty, they are defaulted to be the same as the Pod(s) that the replication controller manages. Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: ReplicationControllerSpec
@@ -5722,6 +7096,14 @@ class ReplicationControllerCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ The last time the condition transitioned from one status to another. """
     message: str
@@ -5748,6 +7130,15 @@ class ReplicationControllerStatus(KubernetesObject):
 
     _required_ = ["replicas"]
 
+    _field_types_ = {
+        "available_replicas": "scalar",
+        "conditions": ("typed_list", "ReplicationControllerCondition"),
+        "fully_labeled_replicas": "scalar",
+        "observed_generation": "scalar",
+        "ready_replicas": "scalar",
+        "replicas": "scalar",
+    }
+
     available_replicas: int
     """ The number of available replicas (ready for at least minReadySeconds) for this replication controller. """
     conditions: list[ReplicationControllerCondition]
@@ -5789,6 +7180,12 @@ class ScopedResourceSelectorRequirement(KubernetesObject):
 
     _required_ = ["operator", "scope_name"]
 
+    _field_types_ = {
+        "operator": "scalar",
+        "scope_name": "scalar",
+        "values": "raw_list",
+    }
+
     operator: str
     """ Represents a scope's relationship to a set of values. Valid operators are In, NotIn, Exists, DoesNotExist. """
     scope_name: str
@@ -5807,6 +7204,10 @@ class ScopeSelector(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "match_expressions": ("typed_list", "ScopedResourceSelectorRequirement"),
+    }
+
     match_expressions: list[ScopedResourceSelectorRequirement]
     """ A list of scope selector requirements by scope of the resources. """
 
@@ -5821,6 +7222,12 @@ class ResourceQuotaSpec(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "hard": "raw_dict",
+        "scope_selector": ("object", "ScopeSelector"),
+        "scopes": "raw_list",
+    }
+
     hard: dict[str, Quantity]
     """ hard is the set of desired hard limits for each named resource. More info: https://kubernetes.io/docs/concepts/policy/resource-quotas/ """
     scope_selector: ScopeSelector
@@ -5842,6 +7249,11 @@ class ResourceQuota(KubernetesApiResource):
     _kind_ = "ResourceQuota"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ResourceQuotaSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: ResourceQuotaSpec
@@ -5858,6 +7270,11 @@ class ResourceQuotaStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "hard": "raw_dict",
+        "used": "raw_dict",
+    }
+
     hard: dict[str, Quantity]
     """ Hard is the set of enforced hard limits for each named resource. More info: https://kubernetes.io/docs/concepts/policy/resource-quotas/ """
     used: dict[str, Quantity]
@@ -5877,6 +7294,14 @@ class Secret(KubernetesApiResource):
     _kind_ = "Secret"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "data": "raw_dict",
+        "immutable": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "string_data": "raw_dict",
+        "type": "scalar",
+    }
+
     data: dict[str, Base64]
     """ Data contains the secret data. Each key must consist of alphanumeric characters, '-', '_' or '.'. The serialized form of the secret data is a base64 encoded string, representing the arbitrary (possibly non-string) data value here. Described in https://tools.ietf.org/html/rfc4648#section-4 """
     immutable: bool
@@ -5910,6 +7335,15 @@ class ServicePort(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "app_protocol": "scalar",
+        "name": "scalar",
+        "node_port": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+        "target_port": "union",
+    }
+
     app_protocol: str
     """
     The application protocol for this port. This is used as a hint for implementations to offer richer behavior for protocols that they understand. This field follows standard Kubernetes label syntax. Valid values are either:
@@ -5960,6 +7394,10 @@ class SessionAffinityConfig(KubernetesObject):
         "clientIP": "client_ip",
     }
 
+    _field_types_ = {
+        "client_ip": ("object", "ClientIPConfig"),
+    }
+
     client_ip: ClientIPConfig
     """ clientIP contains the configurations of Client IP based session affinity. """
 
@@ -5987,6 +7425,29 @@ class ServiceSpec(KubernetesObject):
         "loadBalancerIP": "load_balancer_ip",
     }
 
+    _field_types_ = {
+        "allocate_load_balancer_node_ports": "scalar",
+        "cluster_ip": "scalar",
+        "cluster_ips": "raw_list",
+        "external_ips": "raw_list",
+        "external_name": "scalar",
+        "external_traffic_policy": "scalar",
+        "health_check_node_port": "scalar",
+        "internal_traffic_policy": "scalar",
+        "ip_families": "raw_list",
+        "ip_family_policy": "scalar",
+        "load_balancer_class": "scalar",
+        "load_balancer_ip": "scalar",
+        "load_balancer_source_ranges": "raw_list",
+        "ports": ("typed_list", "ServicePort"),
+        "publish_not_ready_addresses": "scalar",
+        "selector": "raw_dict",
+        "session_affinity": "scalar",
+        "session_affinity_config": ("object", "SessionAffinityConfig"),
+        "traffic_distribution": "scalar",
+        "type": "scalar",
+    }
+
     allocate_load_balancer_node_ports: bool
     """ allocateLoadBalancerNodePorts defines if NodePorts will be automatically allocated for services with type LoadBalancer.  Default is "true". It may be set to "false" if the cluster load-balancer does not rely on NodePorts.  If the caller requests specific NodePorts (by specifying a value), those requests will be respected, regardless of this field. This field may only be set for services with type LoadBalancer and will be cleared if the type is changed to any other type. """
     cluster_ip: str
@@ -6093,6 +7554,11 @@ class Service(KubernetesApiResource):
     _kind_ = "Service"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ServiceSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: ServiceSpec
@@ -6112,6 +7578,13 @@ class ServiceAccount(KubernetesApiResource):
     _kind_ = "ServiceAccount"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "automount_service_account_token": "scalar",
+        "image_pull_secrets": ("typed_list", "LocalObjectReference"),
+        "metadata": ("object", "meta.ObjectMeta"),
+        "secrets": ("typed_list", "ObjectReference"),
+    }
+
     automount_service_account_token: bool
     """ AutomountServiceAccountToken indicates whether pods running as this service account should have an API token automatically mounted. Can be overridden at the pod level. """
     image_pull_secrets: list[LocalObjectReference]
@@ -6147,6 +7620,11 @@ class ServiceStatus(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "meta.Condition"),
+        "load_balancer": ("object", "LoadBalancerStatus"),
+    }
+
     conditions: list[meta.Condition]
     """ Current service state """
     load_balancer: LoadBalancerStatus
@@ -6165,6 +7643,11 @@ class TopologySelectorLabelRequirement(KubernetesObject):
 
     _required_ = ["key", "values"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "values": "raw_list",
+    }
+
     key: str
     """ The label key that the selector applies to. """
     values: list[str]
@@ -6181,6 +7664,10 @@ class TopologySelectorTerm(KubernetesObject):
 
     _api_version_ = "v1"
 
+    _field_types_ = {
+        "match_label_expressions": ("typed_list", "TopologySelectorLabelRequirement"),
+    }
+
     match_label_expressions: list[TopologySelectorLabelRequirement]
     """ A list of topology selector requirements by labels. """
 
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class EndpointConditions(KubernetesObject):
@@ -9,6 +17,12 @@ class EndpointConditions(KubernetesObject):
 
     _api_version_ = "discovery.k8s.io/v1"
 
+    _field_types_ = {
+        "ready": "scalar",
+        "serving": "scalar",
+        "terminating": "scalar",
+    }
+
     ready: bool
     """ ready indicates that this endpoint is ready to receive traffic, according to whatever system is managing the endpoint. A nil value should be interpreted as "true". In general, an endpoint should be marked ready if it is serving and not terminating, though this can be overridden in some cases, such as when the associated Service has set the publishNotReadyAddresses flag. """
     serving: bool
@@ -29,6 +43,10 @@ class ForNode(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ name represents the name of the node. """
 
@@ -45,6 +63,10 @@ class ForZone(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ name represents the name of the zone. """
 
@@ -59,6 +81,11 @@ class EndpointHints(KubernetesObject):
 
     _api_version_ = "discovery.k8s.io/v1"
 
+    _field_types_ = {
+        "for_nodes": ("typed_list", "ForNode"),
+        "for_zones": ("typed_list", "ForZone"),
+    }
+
     for_nodes: list[ForNode]
     """ forNodes indicates the node(s) this endpoint should be consumed by when using topology aware routing. May contain a maximum of 8 entries. This is an Alpha feature and is only used when the PreferSameTrafficDistribution feature gate is enabled. """
     for_zones: list[ForZone]
@@ -77,6 +104,17 @@ class Endpoint(KubernetesObject):
 
     _required_ = ["addresses"]
 
+    _field_types_ = {
+        "addresses": "raw_list",
+        "conditions": ("object", "EndpointConditions"),
+        "deprecated_topology": "raw_dict",
+        "hints": ("object", "EndpointHints"),
+        "hostname": "scalar",
+        "node_name": "scalar",
+        "target_ref": ("object", "core.ObjectReference"),
+        "zone": "scalar",
+    }
+
     addresses: list[str]
     """ addresses of this endpoint. For EndpointSlices of addressType "IPv4" or "IPv6", the values are IP addresses in canonical form. The syntax and semantics of other addressType values are not defined. This must contain at least one address but no more than 100. EndpointSlices generated by the EndpointSlice controller will always have exactly 1 address. No semantics are defined for additional addresses beyond the first, and kube-proxy does not look at them. """
     conditions: EndpointConditions
@@ -124,6 +162,13 @@ class EndpointPort(KubernetesObject):
 
     _api_version_ = "discovery.k8s.io/v1"
 
+    _field_types_ = {
+        "app_protocol": "scalar",
+        "name": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     app_protocol: str
     """
     The application protocol for this port. This is used as a hint for implementations to offer richer behavior for protocols that they understand. This field follows standard Kubernetes label syntax. Valid values are either:
@@ -160,6 +205,13 @@ class EndpointSlice(KubernetesApiResource):
 
     _required_ = ["address_type", "endpoints"]
 
+    _field_types_ = {
+        "address_type": "scalar",
+        "endpoints": ("typed_list", "Endpoint"),
+        "metadata": ("object", "meta.ObjectMeta"),
+        "ports": ("typed_list", "EndpointPort"),
+    }
+
     address_type: str
     """ addressType specifies the type of address carried by this EndpointSlice. All addresses in this slice must be the same type. This field is immutable after creation. The following address types are currently supported: * IPv4: Represents an IPv4 Address. * IPv6: Represents an IPv6 Address. * FQDN: Represents a Fully Qualified Domain Name. (Deprecated) The EndpointSlice controller only generates, and kube-proxy only processes, slices of addressType "IPv4" and "IPv6". No semantics are defined for the "FQDN" type. """
     endpoints: list[Endpoint]
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class EventSeries(KubernetesObject):
@@ -11,6 +19,11 @@ class EventSeries(KubernetesObject):
 
     _required_ = ["count", "last_observed_time"]
 
+    _field_types_ = {
+        "count": "scalar",
+        "last_observed_time": "scalar",
+    }
+
     count: int
     """ count is the number of occurrences in this series up to the last heartbeat time. """
     last_observed_time: meta.MicroTime
@@ -32,6 +45,24 @@ class Event(KubernetesApiResource):
 
     _required_ = ["event_time"]
 
+    _field_types_ = {
+        "action": "scalar",
+        "deprecated_count": "scalar",
+        "deprecated_first_timestamp": "scalar",
+        "deprecated_last_timestamp": "scalar",
+        "deprecated_source": ("object", "core.EventSource"),
+        "event_time": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "note": "scalar",
+        "reason": "scalar",
+        "regarding": ("object", "core.ObjectReference"),
+        "related": ("object", "core.ObjectReference"),
+        "reporting_controller": "scalar",
+        "reporting_instance": "scalar",
+        "series": ("object", "EventSeries"),
+        "type": "scalar",
+    }
+
     action: str
     """ action is what action was taken/failed regarding to the regarding object. It is machine-readable. This field cannot be empty for new Events and it can have at most 128 characters. """
     deprecated_count: int
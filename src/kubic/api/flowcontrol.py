@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class ExemptPriorityLevelConfiguration(KubernetesObject):
@@ -9,6 +17,11 @@ class ExemptPriorityLevelConfiguration(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "lendable_percent": "scalar",
+        "nominal_concurrency_shares": "scalar",
+    }
+
     lendable_percent: int
     """
     `lendablePercent` prescribes the fraction of the level's NominalCL that can be borrowed by other priority levels.  This value of this field must be between 0 and 100, inclusive, and it defaults to 0. The number of seats that other levels can borrow from this level, known as this level's LendableConcurrencyLimit (LendableCL), is defined as follows.
@@ -37,6 +50,10 @@ class FlowDistinguisherMethod(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "type": "scalar",
+    }
+
     type: str
     """ `type` is the type of flow distinguisher method The supported types are "ByUser" and "ByNamespace". Required. """
 
@@ -53,6 +70,10 @@ class PriorityLevelConfigurationReference(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ `name` is the name of the priority level configuration being referenced Required. """
 
@@ -76,6 +97,11 @@ class NonResourcePolicyRule(KubernetesObject):
         "nonResourceURLs": "non_resource_urls",
     }
 
+    _field_types_ = {
+        "non_resource_urls": "raw_list",
+        "verbs": "raw_list",
+    }
+
     non_resource_urls: list[str]
     """
     `nonResourceURLs` is a set of url prefixes that a user should have access to and may not be empty. For example:
@@ -102,6 +128,14 @@ class ResourcePolicyRule(KubernetesObject):
 
     _required_ = ["api_groups", "resources", "verbs"]
 
+    _field_types_ = {
+        "api_groups": "raw_list",
+        "cluster_scope": "scalar",
+        "namespaces": "raw_list",
+        "resources": "raw_list",
+        "verbs": "raw_list",
+    }
+
     api_groups: list[str]
     """ `apiGroups` is a list of matching API groups and may not be empty. "*" matches all API groups and, if present, must be the only entry. Required. """
     cluster_scope: bool
@@ -133,6 +167,10 @@ class GroupSubject(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ name is the user group that matches, or "*" to match all user groups. See https://github.com/kubernetes/apiserver/blob/master/pkg/authentication/user/user.go for some well-known group names. Required. """
 
@@ -149,6 +187,11 @@ class ServiceAccountSubject(KubernetesObject):
 
     _required_ = ["name", "namespace"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     name: str
     """ `name` is the name of matching ServiceAccount objects, or "*" to match regardless of name. Required. """
     namespace: str
@@ -167,6 +210,10 @@ class UserSubject(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
     """ `name` is the username that matches, or "*" to match all usernames. Required. """
 
@@ -183,6 +230,13 @@ class Subject(KubernetesObject):
 
     _required_ = ["kind"]
 
+    _field_types_ = {
+        "group": ("object", "GroupSubject"),
+        "kind": "scalar",
+        "service_account": ("object", "ServiceAccountSubject"),
+        "user": ("object", "UserSubject"),
+    }
+
     group: GroupSubject
     """ `group` matches based on user group name. """
     kind: str
@@ -207,6 +261,12 @@ class PolicyRulesWithSubjects(KubernetesObject):
 
     _required_ = ["subjects"]
 
+    _field_types_ = {
+        "non_resource_rules": ("typed_list", "NonResourcePolicyRule"),
+        "resource_rules": ("typed_list", "ResourcePolicyRule"),
+        "subjects": ("typed_list", "Subject"),
+    }
+
     non_resource_rules: list[NonResourcePolicyRule]
     """ `nonResourceRules` is a list of NonResourcePolicyRules that identify matching requests according to their verb and the target non-resource URL. """
     resource_rules: list[ResourcePolicyRule]
@@ -232,6 +292,13 @@ class FlowSchemaSpec(KubernetesObject):
 
     _required_ = ["priority_level_configuration"]
 
+    _field_types_ = {
+        "distinguisher_method": ("object", "FlowDistinguisherMethod"),
+        "matching_precedence": "scalar",
+        "priority_level_configuration": ("object", "PriorityLevelConfigurationReference"),
+        "rules": ("typed_list", "PolicyRulesWithSubjects"),
+    }
+
     distinguisher_method: FlowDistinguisherMethod
     """ `distinguisherMethod` defines how to compute the flow distinguisher for requests that match this schema. `nil` specifies that the distinguisher is disabled and thus will always be the empty string. """
     matching_precedence: int
@@ -266,6 +333,11 @@ class FlowSchema(KubernetesApiResource):
     _kind_ = "FlowSchema"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "FlowSchemaSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ `metadata` is the standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: FlowSchemaSpec
@@ -282,6 +354,14 @@ class FlowSchemaCondition(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ `lastTransitionTime` is the last time the condition transitioned from one status to another. """
     message: str
@@ -306,6 +386,10 @@ class FlowSchemaStatus(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "FlowSchemaCondition"),
+    }
+
     conditions: list[FlowSchemaCondition]
     """ `conditions` is a list of the current states of FlowSchema. """
 
@@ -320,6 +404,12 @@ class QueuingConfiguration(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "hand_size": "scalar",
+        "queue_length_limit": "scalar",
+        "queues": "scalar",
+    }
+
     hand_size: int
     """ `handSize` is a small positive number that configures the shuffle sharding of requests into queues.  When enqueuing a request at this priority level the request's flow identifier (a string pair) is hashed and the hash value is used to shuffle the list of queues and deal a hand of the size specified here.  The request is put into one of the shortest queues in that hand. `handSize` must be no larger than `queues`, and should be significantly smaller (so that a few heavy flows do not saturate most of the queues).  See the user-facing documentation for more extensive guidance on setting this field.  This field has a default value of 8. """
     queue_length_limit: int
@@ -340,6 +430,11 @@ class LimitResponse(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "queuing": ("object", "QueuingConfiguration"),
+        "type": "scalar",
+    }
+
     queuing: QueuingConfiguration
     """ `queuing` holds the configuration parameters for queuing. This field may be non-empty only if `type` is `"Queue"`. """
     type: str
@@ -360,6 +455,13 @@ class LimitedPriorityLevelConfiguration(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "borrowing_limit_percent": "scalar",
+        "lendable_percent": "scalar",
+        "limit_response": ("object", "LimitResponse"),
+        "nominal_concurrency_shares": "scalar",
+    }
+
     borrowing_limit_percent: int
     """
     `borrowingLimitPercent`, if present, configures a limit on how many seats this priority level can borrow from other priority levels. The limit is known as this level's BorrowingConcurrencyLimit (BorrowingCL) and is a limit on the total number of seats that this level may borrow at any one time. This field holds the ratio of that limit to the level's nominal concurrency limit. When this field is non-nil, it must hold a non-negative integer and the limit is calculated as follows.
@@ -413,6 +515,12 @@ class PriorityLevelConfigurationSpec(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "exempt": ("object", "ExemptPriorityLevelConfiguration"),
+        "limited": ("object", "LimitedPriorityLevelConfiguration"),
+        "type": "scalar",
+    }
+
     exempt: ExemptPriorityLevelConfiguration
     """ `exempt` specifies how requests are handled for an exempt priority level. This field MUST be empty if `type` is `"Limited"`. This field MAY be non-empty if `type` is `"Exempt"`. If empty and `type` is `"Exempt"` then the default values for `ExemptPriorityLevelConfiguration` apply. """
     limited: LimitedPriorityLevelConfiguration
@@ -436,6 +544,11 @@ class PriorityLevelConfiguration(KubernetesApiResource):
     _kind_ = "PriorityLevelConfiguration"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PriorityLevelConfigurationSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ `metadata` is the standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PriorityLevelConfigurationSpec
@@ -452,6 +565,14 @@ class PriorityLevelConfigurationCondition(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ `lastTransitionTime` is the last time the condition transitioned from one status to another. """
     message: str
@@ -476,6 +597,10 @@ class PriorityLevelConfigurationStatus(KubernetesObject):
 
     _api_version_ = "flowcontrol.apiserver.k8s.io/v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "PriorityLevelConfigurationCondition"),
+    }
+
     conditions: list[PriorityLevelConfigurationCondition]
     """ `conditions` is the current state of "request-priority". """
 
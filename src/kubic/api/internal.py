@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class ServerStorageVersion(KubernetesObject):
@@ -18,6 +24,13 @@ class ServerStorageVersion(KubernetesObject):
         "apiServerID": "api_server_id",
     }
 
+    _field_types_ = {
+        "api_server_id": "scalar",
+        "decodable_versions": "raw_list",
+        "encoding_version": "scalar",
+        "served_versions": "raw_list",
+    }
+
     api_server_id: str
     """ The ID of the reporting API server. """
     decodable_versions: list[str]
@@ -58,6 +71,11 @@ class StorageVersion(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": "raw_dict",
+    }
+
     metadata: meta.ObjectMeta
     """ The name is <group>.<resource>. """
     spec: StorageVersionSpec
@@ -76,6 +94,15 @@ class StorageVersionCondition(KubernetesObject):
 
     _required_ = ["message", "reason", "status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "observed_generation": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: meta.Time
     """ Last time the condition transitioned from one status to another. """
     message: str
@@ -115,6 +142,12 @@ class StorageVersionStatus(KubernetesObject):
 
     _api_version_ = "internal.apiserver.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "common_encoding_version": "scalar",
+        "conditions": ("typed_list", "StorageVersionCondition"),
+        "storage_versions": ("typed_list", "ServerStorageVersion"),
+    }
+
     common_encoding_version: str
     """ If all API server instances agree on the same encoding storage version, then this field is set to that version. Otherwise this field is left empty. API servers should finish updating its storageVersionStatus entry before serving write operations, so that this field will be in sync with the reality. """
     conditions: list[StorageVersionCondition]
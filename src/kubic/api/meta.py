@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import typing as t
 
 from kubic import KubernetesApiResource, KubernetesObject
@@ -12,6 +14,11 @@ class GroupVersionForDiscovery(KubernetesObject):
 
     _required_ = ["group_version", "version"]
 
+    _field_types_ = {
+        "group_version": "scalar",
+        "version": "scalar",
+    }
+
     group_version: str
     """ groupVersion specifies the API group and version in the form "group/version" """
     version: str
@@ -37,6 +44,11 @@ class ServerAddressByClientCIDR(KubernetesObject):
         "clientCIDR": "client_cidr",
     }
 
+    _field_types_ = {
+        "client_cidr": "scalar",
+        "server_address": "scalar",
+    }
+
     client_cidr: str
     """ The CIDR with which clients can match their IP to figure out the server address that they should use. """
     server_address: str
@@ -67,6 +79,13 @@ class APIGroup(KubernetesApiResource):
         "serverAddressByClientCIDRs": "server_address_by_client_cidrs",
     }
 
+    _field_types_ = {
+        "group_name": "scalar",
+        "preferred_version": ("object", "GroupVersionForDiscovery"),
+        "server_address_by_client_cidrs": ("typed_list", "ServerAddressByClientCIDR"),
+        "versions": ("typed_list", "GroupVersionForDiscovery"),
+    }
+
     group_name: str
     """ name is the name of the group. """
     preferred_version: GroupVersionForDiscovery
@@ -107,6 +126,10 @@ class APIGroupList(KubernetesApiResource):
 
     _required_ = ["groups"]
 
+    _field_types_ = {
+        "groups": ("typed_list", "APIGroup"),
+    }
+
     groups: list[APIGroup]
     """ groups is a list of APIGroup. """
 
@@ -123,6 +146,19 @@ class APIResource(KubernetesObject):
 
     _required_ = ["kind", "name", "namespaced", "singular_name", "verbs"]
 
+    _field_types_ = {
+        "categories": "raw_list",
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespaced": "scalar",
+        "short_names": "raw_list",
+        "singular_name": "scalar",
+        "storage_version_hash": "scalar",
+        "verbs": "raw_list",
+        "version": "scalar",
+    }
+
     categories: list[str]
     """ categories is a list of the grouped resources this resource belongs to (e.g. 'all') """
     group: str
@@ -183,6 +219,11 @@ class APIResourceList(KubernetesApiResource):
 
     _required_ = ["group_version", "resources"]
 
+    _field_types_ = {
+        "group_version": "scalar",
+        "resources": ("typed_list", "APIResource"),
+    }
+
     group_version: str
     """ groupVersion is the group and version this APIResourceList is for. """
     resources: list[APIResource]
@@ -211,6 +252,11 @@ class APIVersions(KubernetesApiResource):
         "serverAddressByClientCIDRs": "server_address_by_client_cidrs",
     }
 
+    _field_types_ = {
+        "server_address_by_client_cidrs": ("typed_list", "ServerAddressByClientCIDR"),
+        "versions": "raw_list",
+    }
+
     server_address_by_client_cidrs: list[ServerAddressByClientCIDR]
     """ a map of client CIDR to server address that is serving this group. This is to help clients reach servers in the most network-efficient way possible. Clients can use the appropriate server address as per the CIDR that they match. In case of multiple matches, clients should use the longest matching CIDR. The server returns only those CIDRs that it thinks that the client can match. For example: the master will return an internal IP CIDR only, if the client reaches the server using an internal IP. Server looks at X-Forwarded-For header or X-Real-Ip header or request.RemoteAddr (in that order) to get the client IP. """
     versions: list[str]
@@ -239,6 +285,15 @@ class Condition(KubernetesObject):
 
     _required_ = ["last_transition_time", "message", "reason", "status", "type"]
 
+    _field_types_ = {
+        "last_transition_time": "scalar",
+        "message": "scalar",
+        "observed_generation": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_transition_time: Time
     """ lastTransitionTime is the last time the condition transitioned from one status to another. This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable. """
     message: str
@@ -278,6 +333,11 @@ class Preconditions(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "resource_version": "scalar",
+        "uid": "scalar",
+    }
+
     resource_version: str
     """ Specifies the target ResourceVersion """
     uid: str
@@ -297,6 +357,15 @@ class DeleteOptions(KubernetesApiResource):
     _kind_ = "DeleteOptions"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "dry_run": "raw_list",
+        "grace_period_seconds": "scalar",
+        "ignore_store_read_error_with_cluster_breaking_potential": "scalar",
+        "orphan_dependents": "scalar",
+        "preconditions": ("object", "Preconditions"),
+        "propagation_policy": "scalar",
+    }
+
     dry_run: list[str]
     """ When present, indicates that modifications should not be persisted. An invalid or unrecognized dryRun directive will result in an error response and no further processing of the request. Valid values are: - All: all dry run stages will be processed """
     grace_period_seconds: int
@@ -342,6 +411,12 @@ class FieldSelectorRequirement(KubernetesObject):
 
     _required_ = ["key", "operator"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "operator": "scalar",
+        "values": "raw_list",
+    }
+
     key: str
     """ key is the field selector key that the requirement applies to. """
     operator: str
@@ -372,6 +447,12 @@ class LabelSelectorRequirement(KubernetesObject):
 
     _required_ = ["key", "operator"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "operator": "scalar",
+        "values": "raw_list",
+    }
+
     key: str
     """ key is the label key that the selector applies to. """
     operator: str
@@ -390,6 +471,11 @@ class LabelSelector(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "match_expressions": ("typed_list", "LabelSelectorRequirement"),
+        "match_labels": "raw_dict",
+    }
+
     match_expressions: list[LabelSelectorRequirement]
     """ matchExpressions is a list of label selector requirements. The requirements are ANDed. """
     match_labels: dict[str, str]
@@ -410,6 +496,13 @@ class ListMeta(KubernetesObject):
         "continue": "continue_",
     }
 
+    _field_types_ = {
+        "continue_": "scalar",
+        "remaining_item_count": "scalar",
+        "resource_version": "scalar",
+        "self_link": "scalar",
+    }
+
     continue_: str
     """ continue may be set if the user set a limit on the number of items returned, and indicates that the server has more data available. The value is opaque and may be used to issue another request to the endpoint that served this list to retrieve the next set of available objects. Continuing a consistent list may not be possible if the server configuration has changed or more than a few minutes have passed. The resourceVersion field returned when using this continue value will be identical to the value in the first response, unless you have received this token from an error message. """
     remaining_item_count: int
@@ -432,6 +525,16 @@ class ManagedFieldsEntry(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "fields_type": "scalar",
+        "fields_v1": "raw_dict",
+        "manager": "scalar",
+        "operation": "scalar",
+        "subresource": "scalar",
+        "time": "scalar",
+    }
+
     api_version: str
     """ APIVersion defines the version of this resource that this field set applies to. The format is "group/version" just like the top-level APIVersion field. It is necessary to track the version of a field set because it cannot be automatically converted. """
     fields_type: str
@@ -481,6 +584,15 @@ class OwnerReference(KubernetesObject):
 
     _required_ = ["api_version", "kind", "name", "uid"]
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "block_owner_deletion": "scalar",
+        "controller": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "uid": "scalar",
+    }
+
     api_version: str
     """ API version of the referent. """
     block_owner_deletion: bool
@@ -515,6 +627,23 @@ class ObjectMeta(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "creation_timestamp": "scalar",
+        "deletion_grace_period_seconds": "scalar",
+        "deletion_timestamp": "scalar",
+        "finalizers": "raw_list",
+        "generate_name": "scalar",
+        "generation": "scalar",
+        "labels": "raw_dict",
+        "name": "scalar",
+        "namespace": "scalar",
+        "owner_references": ("typed_list", "OwnerReference"),
+        "resource_version": "scalar",
+        "self_link": "scalar",
+        "uid": "scalar",
+    }
+
     annotations: dict[str, str]
     """ Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata. They are not queryable and should be preserved when modifying objects. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations """
     creation_timestamp: Time
@@ -616,6 +745,12 @@ class StatusCause(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "field": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+    }
+
     field: str
     """
     The field of the resource that has caused this error, as named by its JSON serialization. May include dot and postfix notation for nested attributes. Arrays are zero-indexed.  Fields may appear more than once in an array of causes due to fields having multiple errors. Optional.
@@ -640,6 +775,15 @@ class StatusDetails(KubernetesObject):
 
     _api_version_ = "meta/v1"
 
+    _field_types_ = {
+        "causes": ("typed_list", "StatusCause"),
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "retry_after_seconds": "scalar",
+        "uid": "scalar",
+    }
+
     causes: list[StatusCause]
     """ The Causes array includes more details associated with the StatusReason failure. Not all StatusReasons may provide detailed causes. """
     group: str
@@ -675,6 +819,14 @@ class Status(KubernetesApiResource):
     _kind_ = "Status"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "code": "scalar",
+        "details": ("object", "StatusDetails"),
+        "message": "scalar",
+        "metadata": ("object", "ListMeta"),
+        "reason": "scalar",
+    }
+
     code: int
     """ Suggested HTTP return code for this status, 0 if not set. """
     details: StatusDetails
@@ -711,6 +863,11 @@ class WatchEvent(KubernetesApiResource):
 
     _required_ = ["object", "type"]
 
+    _field_types_ = {
+        "object": "raw_dict",
+        "type": "scalar",
+    }
+
     object: dict[str, t.Any]
     type: str
 
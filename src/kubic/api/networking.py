@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class ServiceBackendPort(KubernetesObject):
@@ -9,6 +17,11 @@ class ServiceBackendPort(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "name": "scalar",
+        "number": "scalar",
+    }
+
     name: str
     """ name is the name of the port on the Service. This is a mutually exclusive setting with "Number". """
     number: int
@@ -27,6 +40,11 @@ class IngressServiceBackend(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "port": ("object", "ServiceBackendPort"),
+    }
+
     name: str
     """ name is the referenced service. The service must exist in the same namespace as the Ingress object. """
     port: ServiceBackendPort
@@ -43,6 +61,11 @@ class IngressBackend(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "resource": ("object", "core.TypedLocalObjectReference"),
+        "service": ("object", "IngressServiceBackend"),
+    }
+
     resource: core.TypedLocalObjectReference
     """ resource is an ObjectRef to another Kubernetes resource in the namespace of the Ingress object. If resource is specified, a service.Name and service.Port must not be specified. This is a mutually exclusive setting with "Service". """
     service: IngressServiceBackend
@@ -61,6 +84,12 @@ class HTTPIngressPath(KubernetesObject):
 
     _required_ = ["backend", "path_type"]
 
+    _field_types_ = {
+        "backend": ("object", "IngressBackend"),
+        "path": "scalar",
+        "path_type": "scalar",
+    }
+
     backend: IngressBackend
     """ backend defines the referenced service endpoint to which the traffic will be forwarded to. """
     path: str
@@ -93,6 +122,10 @@ class HTTPIngressRuleValue(KubernetesObject):
 
     _required_ = ["paths"]
 
+    _field_types_ = {
+        "paths": ("typed_list", "HTTPIngressPath"),
+    }
+
     paths: list[HTTPIngressPath]
     """ paths is a collection of paths that map requests to backends. """
 
@@ -109,6 +142,13 @@ class ParentReference(KubernetesObject):
 
     _required_ = ["name", "resource"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource": "scalar",
+    }
+
     group: str
     """ Group is the group of the object being referenced. """
     name: str
@@ -131,6 +171,10 @@ class IPAddressSpec(KubernetesObject):
 
     _required_ = ["parent_ref"]
 
+    _field_types_ = {
+        "parent_ref": ("object", "ParentReference"),
+    }
+
     parent_ref: ParentReference
     """ ParentRef references the resource that an IPAddress is attached to. An IPAddress must reference a parent object. """
 
@@ -148,6 +192,11 @@ class IPAddress(KubernetesApiResource):
     _kind_ = "IPAddress"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "IPAddressSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: IPAddressSpec
@@ -170,6 +219,11 @@ class IPBlock(KubernetesObject):
         "except": "except_",
     }
 
+    _field_types_ = {
+        "cidr": "scalar",
+        "except_": "raw_list",
+    }
+
     cidr: str
     """ cidr is a string representing the IPBlock Valid examples are "192.168.1.0/24" or "2001:db8::/64" """
     except_: list[str]
@@ -186,6 +240,11 @@ class IngressRule(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "host": "scalar",
+        "http": ("object", "HTTPIngressRuleValue"),
+    }
+
     host: str
     """
     host is the fully qualified domain name of a network host, as defined by RFC 3986. Note the following deviations from the "host" part of the URI as defined in RFC 3986: 1. IPs are not allowed. Currently an IngressRuleValue can only apply to
@@ -210,6 +269,11 @@ class IngressTLS(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "hosts": "raw_list",
+        "secret_name": "scalar",
+    }
+
     hosts: list[str]
     """ hosts is a list of hosts included in the TLS certificate. The values in this list must match the name/s used in the tlsSecret. Defaults to the wildcard host setting for the loadbalancer controller fulfilling this Ingress, if left unspecified. """
     secret_name: str
@@ -226,6 +290,13 @@ class IngressSpec(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "default_backend": ("object", "IngressBackend"),
+        "ingress_class_name": "scalar",
+        "rules": ("typed_list", "IngressRule"),
+        "tls": ("typed_list", "IngressTLS"),
+    }
+
     default_backend: IngressBackend
     """ defaultBackend is the backend that should handle requests that don't match any rule. If Rules are not specified, DefaultBackend must be specified. If DefaultBackend is not set, the handling of requests that do not match any of the rules will be up to the Ingress controller. """
     ingress_class_name: str
@@ -255,6 +326,11 @@ class Ingress(KubernetesApiResource):
     _kind_ = "Ingress"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "IngressSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: IngressSpec
@@ -273,6 +349,14 @@ class IngressClassParametersReference(KubernetesObject):
 
     _required_ = ["kind", "name"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "scope": "scalar",
+    }
+
     api_group: str
     """ apiGroup is the group for the resource being referenced. If APIGroup is not specified, the specified Kind must be in the core API group. For any other third-party types, APIGroup is required. """
     kind: str
@@ -295,6 +379,11 @@ class IngressClassSpec(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "controller": "scalar",
+        "parameters": ("object", "IngressClassParametersReference"),
+    }
+
     controller: str
     """ controller refers to the name of the controller that should handle this class. This allows for different "flavors" that are controlled by the same controller. For example, you may have different parameters for the same implementing controller. This should be specified as a domain-prefixed path no more than 250 characters in length, e.g. "acme.io/ingress-controller". This field is immutable. """
     parameters: IngressClassParametersReference
@@ -314,6 +403,11 @@ class IngressClass(KubernetesApiResource):
     _kind_ = "IngressClass"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "IngressClassSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: IngressClassSpec
@@ -332,6 +426,12 @@ class IngressPortStatus(KubernetesObject):
 
     _required_ = ["port", "protocol"]
 
+    _field_types_ = {
+        "error": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     error: str
     """
     error is to record the problem with the service port The format of the error shall comply with the following rules: - built-in error values shall be specified in this file and those shall use
@@ -355,6 +455,12 @@ class IngressLoadBalancerIngress(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "ip": "scalar",
+        "ports": ("typed_list", "IngressPortStatus"),
+    }
+
     hostname: str
     """ hostname is set for load-balancer ingress points that are DNS based. """
     ip: str
@@ -373,6 +479,10 @@ class IngressLoadBalancerStatus(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "ingress": ("typed_list", "IngressLoadBalancerIngress"),
+    }
+
     ingress: list[IngressLoadBalancerIngress]
     """ ingress is a list containing ingress points for the load-balancer. """
 
@@ -387,6 +497,10 @@ class IngressStatus(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "load_balancer": ("object", "IngressLoadBalancerStatus"),
+    }
+
     load_balancer: IngressLoadBalancerStatus
     """ loadBalancer contains the current status of the load-balancer. """
 
@@ -401,6 +515,12 @@ class NetworkPolicyPort(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "end_port": "scalar",
+        "port": "union",
+        "protocol": "scalar",
+    }
+
     end_port: int
     """ endPort indicates that the range of ports from port to endPort if set, inclusive, should be allowed by the policy. This field cannot be defined if the port field is not defined or if the port field is defined as a named (string) port. The endPort must be equal or greater than port. """
     port: core.IntOrString
@@ -419,6 +539,12 @@ class NetworkPolicyPeer(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "ip_block": ("object", "IPBlock"),
+        "namespace_selector": ("object", "meta.LabelSelector"),
+        "pod_selector": ("object", "meta.LabelSelector"),
+    }
+
     ip_block: IPBlock
     """ ipBlock defines policy on a particular IPBlock. If this field is set then neither of the other fields can be. """
     namespace_selector: meta.LabelSelector
@@ -445,6 +571,11 @@ class NetworkPolicyEgressRule(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "ports": ("typed_list", "NetworkPolicyPort"),
+        "to": ("typed_list", "NetworkPolicyPeer"),
+    }
+
     ports: list[NetworkPolicyPort]
     """ ports is a list of destination ports for outgoing traffic. Each item in this list is combined using a logical OR. If this field is empty or missing, this rule matches all ports (traffic not restricted by port). If this field is present and contains at least one item, then this rule allows traffic only if the traffic matches at least one port in the list. """
     to: list[NetworkPolicyPeer]
@@ -465,6 +596,11 @@ class NetworkPolicyIngressRule(KubernetesObject):
         "from": "from_",
     }
 
+    _field_types_ = {
+        "from_": ("typed_list", "NetworkPolicyPeer"),
+        "ports": ("typed_list", "NetworkPolicyPort"),
+    }
+
     from_: list[NetworkPolicyPeer]
     """ from is a list of sources which should be able to access the pods selected for this rule. Items in this list are combined using a logical OR operation. If this field is empty or missing, this rule matches all sources (traffic not restricted by source). If this field is present and contains at least one item, this rule allows traffic only if the traffic matches at least one item in the from list. """
     ports: list[NetworkPolicyPort]
@@ -483,6 +619,13 @@ class NetworkPolicySpec(KubernetesObject):
 
     _required_ = ["pod_selector"]
 
+    _field_types_ = {
+        "egress": ("typed_list", "NetworkPolicyEgressRule"),
+        "ingress": ("typed_list", "NetworkPolicyIngressRule"),
+        "pod_selector": ("object", "meta.LabelSelector"),
+        "policy_types": "raw_list",
+    }
+
     egress: list[NetworkPolicyEgressRule]
     """ egress is a list of egress rules to be applied to the selected pods. Outgoing traffic is allowed if there are no NetworkPolicies selecting the pod (and cluster policy otherwise allows the traffic), OR if the traffic matches at least one egress rule across all of the NetworkPolicy objects whose podSelector matches the pod. If this field is empty then this NetworkPolicy limits all outgoing traffic (and serves solely to ensure that the pods it selects are isolated by default). This field is beta-level in 1.8 """
     ingress: list[NetworkPolicyIngressRule]
@@ -512,6 +655,11 @@ class NetworkPolicy(KubernetesApiResource):
     _kind_ = "NetworkPolicy"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "NetworkPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: NetworkPolicySpec
@@ -528,6 +676,10 @@ class ServiceCIDRSpec(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "cidrs": "raw_list",
+    }
+
     cidrs: list[str]
     """ CIDRs defines the IP blocks in CIDR notation (e.g. "192.168.0.0/24" or "2001:db8::/64") from which to assign service cluster IPs. Max of two CIDRs is allowed, one of each IP family. This field is immutable. """
 
@@ -545,6 +697,11 @@ class ServiceCIDR(KubernetesApiResource):
     _kind_ = "ServiceCIDR"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ServiceCIDRSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: ServiceCIDRSpec
@@ -561,6 +718,10 @@ class ServiceCIDRStatus(KubernetesObject):
 
     _api_version_ = "networking.k8s.io/v1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "meta.Condition"),
+    }
+
     conditions: list[meta.Condition]
     """ conditions holds an array of metav1.Condition that describe the state of the ServiceCIDR. Current service state """
 
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class Overhead(KubernetesObject):
@@ -9,6 +17,10 @@ class Overhead(KubernetesObject):
 
     _api_version_ = "node.k8s.io/v1"
 
+    _field_types_ = {
+        "pod_fixed": "raw_dict",
+    }
+
     pod_fixed: dict[str, core.Quantity]
     """ podFixed represents the fixed resource overhead associated with running a pod. """
 
@@ -23,6 +35,11 @@ class Scheduling(KubernetesObject):
 
     _api_version_ = "node.k8s.io/v1"
 
+    _field_types_ = {
+        "node_selector": "raw_dict",
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     node_selector: dict[str, str]
     """ nodeSelector lists labels that must be present on nodes that support this RuntimeClass. Pods using this RuntimeClass can only be scheduled to a node matched by this selector. The RuntimeClass nodeSelector is merged with a pod's existing nodeSelector. Any conflicts will cause the pod to be rejected in admission. """
     tolerations: list[core.Toleration]
@@ -44,6 +61,13 @@ class RuntimeClass(KubernetesApiResource):
 
     _required_ = ["handler"]
 
+    _field_types_ = {
+        "handler": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "overhead": ("object", "Overhead"),
+        "scheduling": ("object", "Scheduling"),
+    }
+
     handler: str
     """ handler specifies the underlying runtime and configuration that the CRI implementation will use to handle pods of this class. The possible values are specific to the node & CRI configuration.  It is assumed that all handlers are available on every node, and handlers of the same name are equivalent on every node. For example, a handler called "runc" might specify that the runc OCI runtime (using native Linux containers) will be used to run the containers in a pod. The Handler must be lowercase, conform to the DNS Label (RFC 1123) requirements, and is immutable. """
     metadata: meta.ObjectMeta
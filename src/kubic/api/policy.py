@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class Eviction(KubernetesApiResource):
@@ -12,6 +20,11 @@ class Eviction(KubernetesApiResource):
     _kind_ = "Eviction"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "delete_options": ("object", "meta.DeleteOptions"),
+        "metadata": ("object", "meta.ObjectMeta"),
+    }
+
     delete_options: meta.DeleteOptions
     """ DeleteOptions may be provided """
     metadata: meta.ObjectMeta
@@ -28,6 +41,13 @@ class PodDisruptionBudgetSpec(KubernetesObject):
 
     _api_version_ = "policy/v1"
 
+    _field_types_ = {
+        "max_unavailable": "union",
+        "min_available": "union",
+        "selector": ("object", "meta.LabelSelector"),
+        "unhealthy_pod_eviction_policy": "scalar",
+    }
+
     max_unavailable: core.IntOrString
     """ An eviction is allowed if at most "maxUnavailable" pods selected by "selector" are unavailable after the eviction, i.e. even in absence of the evicted pod. For example, one can prevent all voluntary evictions by specifying 0. This is a mutually exclusive setting with "minAvailable". """
     min_available: core.IntOrString
@@ -72,6 +92,11 @@ class PodDisruptionBudget(KubernetesApiResource):
     _kind_ = "PodDisruptionBudget"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PodDisruptionBudgetSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: PodDisruptionBudgetSpec
@@ -90,6 +115,16 @@ class PodDisruptionBudgetStatus(KubernetesObject):
 
     _required_ = ["current_healthy", "desired_healthy", "disruptions_allowed", "expected_pods"]
 
+    _field_types_ = {
+        "conditions": ("typed_list", "meta.Condition"),
+        "current_healthy": "scalar",
+        "desired_healthy": "scalar",
+        "disrupted_pods": "raw_dict",
+        "disruptions_allowed": "scalar",
+        "expected_pods": "scalar",
+        "observed_generation": "scalar",
+    }
+
     conditions: list[meta.Condition]
     """
     Conditions contain conditions for PDB. The disruption controller sets the DisruptionAllowed condition. The following are known values for the reason field (additional reasons could be added in the future): - SyncFailed: The controller encountered an error and wasn't able to compute
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class AggregationRule(KubernetesObject):
@@ -9,6 +17,10 @@ class AggregationRule(KubernetesObject):
 
     _api_version_ = "rbac.authorization.k8s.io/v1"
 
+    _field_types_ = {
+        "cluster_role_selectors": ("typed_list", "meta.LabelSelector"),
+    }
+
     cluster_role_selectors: list[meta.LabelSelector]
     """ ClusterRoleSelectors holds a list of selectors which will be used to find ClusterRoles and create the rules. If any of the selectors match, then the ClusterRole's permissions will be added """
 
@@ -32,6 +44,14 @@ class PolicyRule(KubernetesObject):
         "nonResourceURLs": "non_resource_urls",
     }
 
+    _field_types_ = {
+        "api_groups": "raw_list",
+        "non_resource_urls": "raw_list",
+        "resource_names": "raw_list",
+        "resources": "raw_list",
+        "verbs": "raw_list",
+    }
+
     api_groups: list[str]
     """ APIGroups is the name of the APIGroup that contains the resources.  If multiple API groups are specified, any action requested against one of the enumerated resources in any API group will be allowed. "" represents the core API group and "*" represents all API groups. """
     non_resource_urls: list[str]
@@ -66,6 +86,12 @@ class ClusterRole(KubernetesApiResource):
     _kind_ = "ClusterRole"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "aggregation_rule": ("object", "AggregationRule"),
+        "metadata": ("object", "meta.ObjectMeta"),
+        "rules": ("typed_list", "PolicyRule"),
+    }
+
     aggregation_rule: AggregationRule
     """ AggregationRule is an optional field that describes how to build the Rules for this ClusterRole. If AggregationRule is set, then the Rules are controller managed and direct changes to Rules will be stomped by the controller. """
     metadata: meta.ObjectMeta
@@ -88,6 +114,12 @@ class RoleRef(KubernetesObject):
 
     _required_ = ["api_group", "kind", "name"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     api_group: str
     """ APIGroup is the group for the resource being referenced """
     kind: str
@@ -108,6 +140,13 @@ class Subject(KubernetesObject):
 
     _required_ = ["kind", "name"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     api_group: str
     """ APIGroup holds the API group of the referenced subject. Defaults to "" for ServiceAccount subjects. Defaults to "rbac.authorization.k8s.io" for User and Group subjects. """
     kind: str
@@ -133,6 +172,12 @@ class ClusterRoleBinding(KubernetesApiResource):
 
     _required_ = ["role_ref"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "role_ref": ("object", "RoleRef"),
+        "subjects": ("typed_list", "Subject"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. """
     role_ref: RoleRef
@@ -154,6 +199,11 @@ class Role(KubernetesApiResource):
     _kind_ = "Role"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "rules": ("typed_list", "PolicyRule"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. """
     rules: list[PolicyRule]
@@ -175,6 +225,12 @@ class RoleBinding(KubernetesApiResource):
 
     _required_ = ["role_ref"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "role_ref": ("object", "RoleRef"),
+        "subjects": ("typed_list", "Subject"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. """
     role_ref: RoleRef
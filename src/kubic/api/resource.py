@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class NetworkDeviceData(KubernetesObject):
@@ -9,6 +17,12 @@ class NetworkDeviceData(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "hardware_address": "scalar",
+        "interface_name": "scalar",
+        "ips": "raw_list",
+    }
+
     hardware_address: str
     """
     HardwareAddress represents the hardware address (e.g. MAC Address) of the device's network interface.
@@ -41,6 +55,15 @@ class AllocatedDeviceStatus(KubernetesObject):
 
     _required_ = ["device", "driver", "pool"]
 
+    _field_types_ = {
+        "conditions": ("typed_list", "meta.Condition"),
+        "data": "raw_dict",
+        "device": "scalar",
+        "driver": "scalar",
+        "network_data": ("object", "NetworkDeviceData"),
+        "pool": "scalar",
+    }
+
     conditions: list[meta.Condition]
     """
     Conditions contains the latest observation of the device's state. If the device has been configured according to the class and claim config references, the `Ready` condition should be True.
@@ -91,6 +114,11 @@ class OpaqueDeviceConfiguration(KubernetesObject):
 
     _required_ = ["driver", "parameters"]
 
+    _field_types_ = {
+        "driver": "scalar",
+        "parameters": "raw_dict",
+    }
+
     driver: str
     """
     Driver is used to determine which kubelet plugin needs to be passed these configuration parameters.
@@ -119,6 +147,12 @@ class DeviceAllocationConfiguration(KubernetesObject):
 
     _required_ = ["source"]
 
+    _field_types_ = {
+        "opaque": ("object", "OpaqueDeviceConfiguration"),
+        "requests": "raw_list",
+        "source": "scalar",
+    }
+
     opaque: OpaqueDeviceConfiguration
     """ Opaque provides driver-specific configuration parameters. """
     requests: list[str]
@@ -141,6 +175,14 @@ class DeviceToleration(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "effect": "scalar",
+        "key": "scalar",
+        "operator": "scalar",
+        "toleration_seconds": "scalar",
+        "value": "scalar",
+    }
+
     effect: str
     """ Effect indicates the taint effect to match. Empty means match all taint effects. When specified, allowed values are NoSchedule and NoExecute. """
     key: str
@@ -165,6 +207,15 @@ class DeviceRequestAllocationResult(KubernetesObject):
 
     _required_ = ["device", "driver", "pool", "request"]
 
+    _field_types_ = {
+        "admin_access": "scalar",
+        "device": "scalar",
+        "driver": "scalar",
+        "pool": "scalar",
+        "request": "scalar",
+        "tolerations": ("typed_list", "DeviceToleration"),
+    }
+
     admin_access: bool
     """
     AdminAccess indicates that this device was allocated for administrative access. See the corresponding request field for a definition of mode.
@@ -219,6 +270,11 @@ class DeviceAllocationResult(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "config": ("typed_list", "DeviceAllocationConfiguration"),
+        "results": ("typed_list", "DeviceRequestAllocationResult"),
+    }
+
     config: list[DeviceAllocationConfiguration]
     """
     This field is a combination of all the claim and class configuration parameters. Drivers can distinguish between those based on a flag.
@@ -239,6 +295,11 @@ class AllocationResult(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "devices": ("object", "DeviceAllocationResult"),
+        "node_selector": ("object", "core.NodeSelector"),
+    }
+
     devices: DeviceAllocationResult
     """ Devices is the result of allocating devices. """
     node_selector: core.NodeSelector
@@ -255,6 +316,13 @@ class DeviceAttribute(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "bool": "scalar",
+        "int": "scalar",
+        "string": "scalar",
+        "version": "scalar",
+    }
+
     bool: bool
     """ BoolValue is a true/false value. """
     int: int
@@ -277,6 +345,10 @@ class Counter(KubernetesObject):
 
     _required_ = ["value"]
 
+    _field_types_ = {
+        "value": "union",
+    }
+
     value: core.Quantity
     """ Value defines how much of a certain device counter is available. """
 
@@ -293,6 +365,11 @@ class DeviceCounterConsumption(KubernetesObject):
 
     _required_ = ["counter_set", "counters"]
 
+    _field_types_ = {
+        "counter_set": "scalar",
+        "counters": "raw_dict",
+    }
+
     counter_set: str
     """ CounterSet defines the set from which the counters defined will be consumed. """
     counters: dict[str, Counter]
@@ -315,6 +392,13 @@ class DeviceTaint(KubernetesObject):
 
     _required_ = ["effect", "key"]
 
+    _field_types_ = {
+        "effect": "scalar",
+        "key": "scalar",
+        "time_added": "scalar",
+        "value": "scalar",
+    }
+
     effect: str
     """ The effect of the taint on claims that do not tolerate the taint and through such claims on the pods using them. Valid effects are NoSchedule and NoExecute. PreferNoSchedule as used for nodes is not valid here. """
     key: str
@@ -335,6 +419,16 @@ class BasicDevice(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "all_nodes": "scalar",
+        "attributes": "raw_dict",
+        "capacity": "raw_dict",
+        "consumes_counters": ("typed_list", "DeviceCounterConsumption"),
+        "node_name": "scalar",
+        "node_selector": ("object", "core.NodeSelector"),
+        "taints": ("typed_list", "DeviceTaint"),
+    }
+
     all_nodes: bool
     """
     AllNodes indicates that all nodes have access to the device.
@@ -412,6 +506,10 @@ class CELDeviceSelector(KubernetesObject):
 
     _required_ = ["expression"]
 
+    _field_types_ = {
+        "expression": "scalar",
+    }
+
     expression: str
     """
     Expression is a CEL expression which evaluates a single device. It must evaluate to true when the device under consideration satisfies the desired criteria, and false when it does not. Any other result is an error and causes allocation of devices to abort.
@@ -462,6 +560,11 @@ class CounterSet(KubernetesObject):
 
     _required_ = ["counters", "name"]
 
+    _field_types_ = {
+        "counters": "raw_dict",
+        "name": "scalar",
+    }
+
     counters: dict[str, Counter]
     """
     Counters defines the counters that will be consumed by the device. The name of each counter must be unique in that set and must be a DNS label.
@@ -486,6 +589,11 @@ class Device(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "basic": ("object", "BasicDevice"),
+        "name": "scalar",
+    }
+
     basic: BasicDevice
     """ Basic defines one device instance. """
     name: str
@@ -504,6 +612,10 @@ class DeviceCapacity(KubernetesObject):
 
     _required_ = ["value"]
 
+    _field_types_ = {
+        "value": "union",
+    }
+
     value: core.Quantity
     """ Value defines how much of a certain device capacity is available. """
 
@@ -518,6 +630,11 @@ class DeviceClaimConfiguration(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "opaque": ("object", "OpaqueDeviceConfiguration"),
+        "requests": "raw_list",
+    }
+
     opaque: OpaqueDeviceConfiguration
     """ Opaque provides driver-specific configuration parameters. """
     requests: list[str]
@@ -538,6 +655,11 @@ class DeviceConstraint(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "match_attribute": "scalar",
+        "requests": "raw_list",
+    }
+
     match_attribute: str
     """
     MatchAttribute requires that all devices in question have this attribute and that its type and value are the same across those devices.
@@ -564,6 +686,10 @@ class DeviceSelector(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "cel": ("object", "CELDeviceSelector"),
+    }
+
     cel: CELDeviceSelector
     """ CEL contains a CEL expression for selecting a device. """
 
@@ -584,6 +710,15 @@ class DeviceSubRequest(KubernetesObject):
 
     _required_ = ["device_class_name", "name"]
 
+    _field_types_ = {
+        "allocation_mode": "scalar",
+        "count": "scalar",
+        "device_class_name": "scalar",
+        "name": "scalar",
+        "selectors": ("typed_list", "DeviceSelector"),
+        "tolerations": ("typed_list", "DeviceToleration"),
+    }
+
     allocation_mode: str
     """
     AllocationMode and its related fields define how devices are allocated to satisfy this request. Supported values are:
@@ -659,6 +794,17 @@ class DeviceRequest(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "admin_access": "scalar",
+        "allocation_mode": "scalar",
+        "count": "scalar",
+        "device_class_name": "scalar",
+        "first_available": ("typed_list", "DeviceSubRequest"),
+        "name": "scalar",
+        "selectors": ("typed_list", "DeviceSelector"),
+        "tolerations": ("typed_list", "DeviceToleration"),
+    }
+
     admin_access: bool
     """
     AdminAccess indicates that this is a claim for administrative access to the device(s). Claims with AdminAccess are expected to be used for monitoring or other management services for a device.  They ignore all ordinary claims to the device with respect to access modes and any resource allocations.
@@ -765,6 +911,12 @@ class DeviceClaim(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "config": ("typed_list", "DeviceClaimConfiguration"),
+        "constraints": ("typed_list", "DeviceConstraint"),
+        "requests": ("typed_list", "DeviceRequest"),
+    }
+
     config: list[DeviceClaimConfiguration]
     """ This field holds configuration for multiple potential drivers which could satisfy requests in this claim. It is ignored while allocating the claim. """
     constraints: list[DeviceConstraint]
@@ -788,6 +940,10 @@ class DeviceClassConfiguration(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "opaque": ("object", "OpaqueDeviceConfiguration"),
+    }
+
     opaque: OpaqueDeviceConfiguration
     """ Opaque provides driver-specific configuration parameters. """
 
@@ -802,6 +958,11 @@ class DeviceClassSpec(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "config": ("typed_list", "DeviceClassConfiguration"),
+        "selectors": ("typed_list", "DeviceSelector"),
+    }
+
     config: list[DeviceClassConfiguration]
     """
     Config defines configuration parameters that apply to each device that is claimed via this class. Some classses may potentially be satisfied by multiple drivers, so each instance of a vendor configuration applies to exactly one driver.
@@ -831,6 +992,11 @@ class DeviceClass(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "DeviceClassSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata """
     spec: DeviceClassSpec
@@ -853,6 +1019,14 @@ class DeviceTaintSelector(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "device": "scalar",
+        "device_class_name": "scalar",
+        "driver": "scalar",
+        "pool": "scalar",
+        "selectors": ("typed_list", "DeviceSelector"),
+    }
+
     device: str
     """
     If device is set, only devices with that name are selected. This field corresponds to slice.spec.devices[].name.
@@ -892,6 +1066,11 @@ class DeviceTaintRuleSpec(KubernetesObject):
 
     _required_ = ["taint"]
 
+    _field_types_ = {
+        "device_selector": ("object", "DeviceTaintSelector"),
+        "taint": ("object", "DeviceTaint"),
+    }
+
     device_selector: DeviceTaintSelector
     """ DeviceSelector defines which device(s) the taint is applied to. All selector criteria must be satified for a device to match. The empty selector matches all devices. Without a selector, no devices are matches. """
     taint: DeviceTaint
@@ -913,6 +1092,11 @@ class DeviceTaintRule(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "DeviceTaintRuleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata """
     spec: DeviceTaintRuleSpec
@@ -935,6 +1119,15 @@ class ExactDeviceRequest(KubernetesObject):
 
     _required_ = ["device_class_name"]
 
+    _field_types_ = {
+        "admin_access": "scalar",
+        "allocation_mode": "scalar",
+        "count": "scalar",
+        "device_class_name": "scalar",
+        "selectors": ("typed_list", "DeviceSelector"),
+        "tolerations": ("typed_list", "DeviceToleration"),
+    }
+
     admin_access: bool
     """
     AdminAccess indicates that this is a claim for administrative access to the device(s). Claims with AdminAccess are expected to be used for monitoring or other management services for a device.  They ignore all ordinary claims to the device with respect to access modes and any resource allocations.
@@ -1009,6 +1202,10 @@ class ResourceClaimSpec(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "devices": ("object", "DeviceClaim"),
+    }
+
     devices: DeviceClaim
     """ Devices defines how to request devices. """
 
@@ -1032,6 +1229,11 @@ class ResourceClaim(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ResourceClaimSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata """
     spec: ResourceClaimSpec
@@ -1050,6 +1252,13 @@ class ResourceClaimConsumerReference(KubernetesObject):
 
     _required_ = ["name", "resource", "uid"]
 
+    _field_types_ = {
+        "api_group": "scalar",
+        "name": "scalar",
+        "resource": "scalar",
+        "uid": "scalar",
+    }
+
     api_group: str
     """ APIGroup is the group for the resource being referenced. It is empty for the core API. This matches the group in the APIVersion that is used when creating the resources. """
     name: str
@@ -1070,6 +1279,12 @@ class ResourceClaimStatus(KubernetesObject):
 
     _api_version_ = "resource.k8s.io/v1alpha3"
 
+    _field_types_ = {
+        "allocation": ("object", "AllocationResult"),
+        "devices": ("typed_list", "AllocatedDeviceStatus"),
+        "reserved_for": ("typed_list", "ResourceClaimConsumerReference"),
+    }
+
     allocation: AllocationResult
     """ Allocation is set once the claim has been allocated successfully. """
     devices: list[AllocatedDeviceStatus]
@@ -1103,6 +1318,11 @@ class ResourceClaimTemplateSpec(KubernetesObject):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ResourceClaimSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ ObjectMeta may contain labels and annotations that will be copied into the ResourceClaim when creating it. No other fields are allowed and will be rejected during validation. """
     spec: ResourceClaimSpec
@@ -1128,6 +1348,11 @@ class ResourceClaimTemplate(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ResourceClaimTemplateSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata """
     spec: ResourceClaimTemplateSpec
@@ -1150,6 +1375,12 @@ class ResourcePool(KubernetesObject):
 
     _required_ = ["generation", "name", "resource_slice_count"]
 
+    _field_types_ = {
+        "generation": "scalar",
+        "name": "scalar",
+        "resource_slice_count": "scalar",
+    }
+
     generation: int
     """
     Generation tracks the change in a pool over time. Whenever a driver changes something about one or more of the resources in a pool, it must change the generation in all ResourceSlices which are part of that pool. Consumers of ResourceSlices should only consider resources from the pool with the highest generation number. The generation may be reset by drivers, which should be fine for consumers, assuming that all ResourceSlices in a pool are updated to match or deleted.
@@ -1182,6 +1413,17 @@ class ResourceSliceSpec(KubernetesObject):
 
     _required_ = ["driver", "pool"]
 
+    _field_types_ = {
+        "all_nodes": "scalar",
+        "devices": ("typed_list", "Device"),
+        "driver": "scalar",
+        "node_name": "scalar",
+        "node_selector": ("object", "core.NodeSelector"),
+        "per_device_node_selection": "scalar",
+        "pool": ("object", "ResourcePool"),
+        "shared_counters": ("typed_list", "CounterSet"),
+    }
+
     all_nodes: bool
     """
     AllNodes indicates that all nodes have access to the resources in the pool.
@@ -1280,6 +1522,11 @@ class ResourceSlice(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ResourceSliceSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata """
     spec: ResourceSliceSpec
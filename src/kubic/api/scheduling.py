@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class PriorityClass(KubernetesApiResource):
@@ -14,6 +22,14 @@ class PriorityClass(KubernetesApiResource):
 
     _required_ = ["value"]
 
+    _field_types_ = {
+        "description": "scalar",
+        "global_default": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "preemption_policy": "scalar",
+        "value": "scalar",
+    }
+
     description: str
     """ description is an arbitrary string that usually provides guidelines on when this priority class should be used. """
     global_default: bool
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import core, meta
+
+__getattr__ = lazy_modules(globals(), core=".", meta=".")
 
 
 class TokenRequest(KubernetesObject):
@@ -11,6 +19,11 @@ class TokenRequest(KubernetesObject):
 
     _required_ = ["audience"]
 
+    _field_types_ = {
+        "audience": "scalar",
+        "expiration_seconds": "scalar",
+    }
+
     audience: str
     """ audience is the intended audience of the token in "TokenRequestSpec". It will default to the audiences of kube apiserver. """
     expiration_seconds: int
@@ -27,6 +40,18 @@ class CSIDriverSpec(KubernetesObject):
 
     _api_version_ = "storage.k8s.io/v1"
 
+    _field_types_ = {
+        "attach_required": "scalar",
+        "fs_group_policy": "scalar",
+        "node_allocatable_update_period_seconds": "scalar",
+        "pod_info_on_mount": "scalar",
+        "requires_republish": "scalar",
+        "se_linux_mount": "scalar",
+        "storage_capacity": "scalar",
+        "token_requests": ("typed_list", "TokenRequest"),
+        "volume_lifecycle_modes": "raw_list",
+    }
+
     attach_required: bool
     """
     attachRequired indicates this CSI volume driver requires an attach operation (because it implements the CSI ControllerPublishVolume() method), and that the Kubernetes attach detach controller should call the attach volume interface which checks the volumeattachment status and waits until the volume is attached before proceeding to mounting. The CSI external-attacher coordinates with CSI volume driver and updates the volumeattachment status when the attach operation is complete. If the CSIDriverRegistry feature gate is enabled and the value is specified to false, the attach operation will be skipped. Otherwise the attach operation will be called.
@@ -148,6 +173,11 @@ class CSIDriver(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CSIDriverSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata. metadata.Name indicates the name of the CSI driver that this object refers to; it MUST be the same name returned by the CSI GetPluginName() call for that driver. The driver name must be 63 characters or less, beginning and ending with an alphanumeric character ([a-z0-9A-Z]) with dashes (-), dots (.), and alphanumerics between. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: CSIDriverSpec
@@ -164,6 +194,10 @@ class VolumeNodeResources(KubernetesObject):
 
     _api_version_ = "storage.k8s.io/v1"
 
+    _field_types_ = {
+        "count": "scalar",
+    }
+
     count: int
     """ count indicates the maximum number of unique volumes managed by the CSI driver that can be used on a node. A volume that is both attached and mounted on a node is considered to be used once, not twice. The same rule applies for a unique volume that is shared among multiple pods on the same node. If this field is not specified, then the supported number of volumes on this node is unbounded. """
 
@@ -187,6 +221,13 @@ class CSINodeDriver(KubernetesObject):
         "nodeID": "node_id",
     }
 
+    _field_types_ = {
+        "allocatable": ("object", "VolumeNodeResources"),
+        "name": "scalar",
+        "node_id": "scalar",
+        "topology_keys": "raw_list",
+    }
+
     allocatable: VolumeNodeResources
     """ allocatable represents the volume resources of a node that are available for scheduling. This field is beta. """
     name: str
@@ -209,6 +250,10 @@ class CSINodeSpec(KubernetesObject):
 
     _required_ = ["drivers"]
 
+    _field_types_ = {
+        "drivers": ("typed_list", "CSINodeDriver"),
+    }
+
     drivers: list[CSINodeDriver]
     """ drivers is a list of information of all CSI Drivers existing on a node. If all drivers in the list are uninstalled, this can become empty. """
 
@@ -228,6 +273,11 @@ class CSINode(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CSINodeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object's metadata. metadata.name must be the Kubernetes node name. """
     spec: CSINodeSpec
@@ -259,6 +309,14 @@ class CSIStorageCapacity(KubernetesApiResource):
 
     _required_ = ["storage_class_name"]
 
+    _field_types_ = {
+        "capacity": "union",
+        "maximum_volume_size": "union",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "node_topology": ("object", "meta.LabelSelector"),
+        "storage_class_name": "scalar",
+    }
+
     capacity: core.Quantity
     """
     capacity is the value reported by the CSI driver in its GetCapacityResponse for a GetCapacityRequest with topology and parameters that match the previous fields.
@@ -321,6 +379,17 @@ class StorageClass(KubernetesApiResource):
 
     _required_ = ["provisioner"]
 
+    _field_types_ = {
+        "allow_volume_expansion": "scalar",
+        "allowed_topologies": ("typed_list", "core.TopologySelectorTerm"),
+        "metadata": ("object", "meta.ObjectMeta"),
+        "mount_options": "raw_list",
+        "parameters": "raw_dict",
+        "provisioner": "scalar",
+        "reclaim_policy": "scalar",
+        "volume_binding_mode": "scalar",
+    }
+
     allow_volume_expansion: bool
     """ allowVolumeExpansion shows whether the storage class allow volume expand. """
     allowed_topologies: list[core.TopologySelectorTerm]
@@ -371,6 +440,11 @@ class VolumeAttachmentSource(KubernetesObject):
 
     _api_version_ = "storage.k8s.io/v1"
 
+    _field_types_ = {
+        "inline_volume_spec": ("object", "core.PersistentVolumeSpec"),
+        "persistent_volume_name": "scalar",
+    }
+
     inline_volume_spec: core.PersistentVolumeSpec
     """ inlineVolumeSpec contains all the information necessary to attach a persistent volume defined by a pod's inline VolumeSource. This field is populated only for the CSIMigration feature. It contains translated fields from a pod's inline VolumeSource to a PersistentVolumeSpec. This field is beta-level and is only honored by servers that enabled the CSIMigration feature. """
     persistent_volume_name: str
@@ -389,6 +463,12 @@ class VolumeAttachmentSpec(KubernetesObject):
 
     _required_ = ["attacher", "node_name", "source"]
 
+    _field_types_ = {
+        "attacher": "scalar",
+        "node_name": "scalar",
+        "source": ("object", "VolumeAttachmentSource"),
+    }
+
     attacher: str
     """ attacher indicates the name of the volume driver that MUST handle this request. This is the name returned by GetPluginName(). """
     node_name: str
@@ -416,6 +496,11 @@ class VolumeAttachment(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VolumeAttachmentSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: VolumeAttachmentSpec
@@ -432,6 +517,12 @@ class VolumeError(KubernetesObject):
 
     _api_version_ = "storage.k8s.io/v1"
 
+    _field_types_ = {
+        "error_code": "scalar",
+        "message": "scalar",
+        "time": "scalar",
+    }
+
     error_code: int
     """
     errorCode is a numeric gRPC code representing the error encountered during Attach or Detach operations.
@@ -456,6 +547,13 @@ class VolumeAttachmentStatus(KubernetesObject):
 
     _required_ = ["attached"]
 
+    _field_types_ = {
+        "attach_error": ("object", "VolumeError"),
+        "attached": "scalar",
+        "attachment_metadata": "raw_dict",
+        "detach_error": ("object", "VolumeError"),
+    }
+
     attach_error: VolumeError
     """ attachError represents the last error encountered during attach operation, if any. This field must only be set by the entity completing the attach operation, i.e. the external-attacher. """
     attached: bool
@@ -487,6 +585,12 @@ class VolumeAttributesClass(KubernetesApiResource):
 
     _required_ = ["driver_name"]
 
+    _field_types_ = {
+        "driver_name": "scalar",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "parameters": "raw_dict",
+    }
+
     driver_name: str
     """ Name of the CSI driver This field is immutable. """
     metadata: meta.ObjectMeta
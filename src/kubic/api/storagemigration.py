@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from . import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from . import meta
+
+__getattr__ = lazy_modules(globals(), meta=".")
 
 
 class GroupVersionResource(KubernetesObject):
@@ -9,6 +17,12 @@ class GroupVersionResource(KubernetesObject):
 
     _api_version_ = "storagemigration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "group": "scalar",
+        "resource": "scalar",
+        "version": "scalar",
+    }
+
     group: str
     """ The name of the group. """
     resource: str
@@ -29,6 +43,14 @@ class MigrationCondition(KubernetesObject):
 
     _required_ = ["status", "type"]
 
+    _field_types_ = {
+        "last_update_time": "scalar",
+        "message": "scalar",
+        "reason": "scalar",
+        "status": "scalar",
+        "type": "scalar",
+    }
+
     last_update_time: meta.Time
     """ The last time this condition was updated. """
     message: str
@@ -53,6 +75,11 @@ class StorageVersionMigrationSpec(KubernetesObject):
 
     _required_ = ["resource"]
 
+    _field_types_ = {
+        "continue_token": "scalar",
+        "resource": ("object", "GroupVersionResource"),
+    }
+
     continue_token: str
     """ The token used in the list options to get the next chunk of objects to migrate. When the .status.conditions indicates the migration is "Running", users can use this token to check the progress of the migration. """
     resource: GroupVersionResource
@@ -72,6 +99,11 @@ class StorageVersionMigration(KubernetesApiResource):
     _kind_ = "StorageVersionMigration"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "StorageVersionMigrationSpec"),
+    }
+
     metadata: meta.ObjectMeta
     """ Standard object metadata. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata """
     spec: StorageVersionMigrationSpec
@@ -88,6 +120,11 @@ class StorageVersionMigrationStatus(KubernetesObject):
 
     _api_version_ = "storagemigration.k8s.io/v1alpha1"
 
+    _field_types_ = {
+        "conditions": ("typed_list", "MigrationCondition"),
+        "resource_version": "scalar",
+    }
+
     conditions: list[MigrationCondition]
     """ The latest available observations of the migration's current state. """
     resource_version: str
@@ -0,0 +1,83 @@
+# Generated by pykapi, do not edit.
+# Used by kubic.reader to import the module defining a resource only when this resource is first resolved.
+
+OBJECT_META = None
+
+RESOURCES = {
+    ("acme.cert-manager.io", "challenge"): ("acme.cert-manager.io/v1", "cert_manager", "Challenge"),
+    ("acme.cert-manager.io", "order"): ("acme.cert-manager.io/v1", "cert_manager", "Order"),
+    ("bitnami.com", "sealedsecret"): ("bitnami.com/v1alpha1", "bitnami", "SealedSecret"),
+    ("ceph.rook.io", "cephblockpool"): ("ceph.rook.io/v1", "rook", "CephBlockPool"),
+    ("ceph.rook.io", "cephblockpoolradosnamespace"): ("ceph.rook.io/v1", "rook", "CephBlockPoolRadosNamespace"),
+    ("ceph.rook.io", "cephbucketnotification"): ("ceph.rook.io/v1", "rook", "CephBucketNotification"),
+    ("ceph.rook.io", "cephbuckettopic"): ("ceph.rook.io/v1", "rook", "CephBucketTopic"),
+    ("ceph.rook.io", "cephclient"): ("ceph.rook.io/v1", "rook", "CephClient"),
+    ("ceph.rook.io", "cephcluster"): ("ceph.rook.io/v1", "rook", "CephCluster"),
+    ("ceph.rook.io", "cephfilesystem"): ("ceph.rook.io/v1", "rook", "CephFilesystem"),
+    ("ceph.rook.io", "cephfilesystemmirror"): ("ceph.rook.io/v1", "rook", "CephFilesystemMirror"),
+    ("ceph.rook.io", "cephfilesystemsubvolumegroup"): ("ceph.rook.io/v1", "rook", "CephFilesystemSubVolumeGroup"),
+    ("ceph.rook.io", "cephnfs"): ("ceph.rook.io/v1", "rook", "CephNFS"),
+    ("ceph.rook.io", "cephobjectrealm"): ("ceph.rook.io/v1", "rook", "CephObjectRealm"),
+    ("ceph.rook.io", "cephobjectstore"): ("ceph.rook.io/v1", "rook", "CephObjectStore"),
+    ("ceph.rook.io", "cephobjectstoreuser"): ("ceph.rook.io/v1", "rook", "CephObjectStoreUser"),
+    ("ceph.rook.io", "cephobjectzone"): ("ceph.rook.io/v1", "rook", "CephObjectZone"),
+    ("ceph.rook.io", "cephobjectzonegroup"): ("ceph.rook.io/v1", "rook", "CephObjectZoneGroup"),
+    ("ceph.rook.io", "cephrbdmirror"): ("ceph.rook.io/v1", "rook", "CephRBDMirror"),
+    ("cert-manager.io", "certificate"): ("cert-manager.io/v1", "cert_manager", "Certificate"),
+    ("cert-manager.io", "certificaterequest"): ("cert-manager.io/v1", "cert_manager", "CertificateRequest"),
+    ("cert-manager.io", "clusterissuer"): ("cert-manager.io/v1", "cert_manager", "ClusterIssuer"),
+    ("cert-manager.io", "issuer"): ("cert-manager.io/v1", "cert_manager", "Issuer"),
+    ("cilium.io", "ciliumbgpadvertisement"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPAdvertisement"),
+    ("cilium.io", "ciliumbgpclusterconfig"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPClusterConfig"),
+    ("cilium.io", "ciliumbgpnodeconfig"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPNodeConfig"),
+    ("cilium.io", "ciliumbgpnodeconfigoverride"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPNodeConfigOverride"),
+    ("cilium.io", "ciliumbgppeerconfig"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPPeerConfig"),
+    ("cilium.io", "ciliumbgppeeringpolicy"): ("cilium.io/v2alpha1", "cilium", "CiliumBGPPeeringPolicy"),
+    ("cilium.io", "ciliumcidrgroup"): ("cilium.io/v2alpha1", "cilium", "CiliumCIDRGroup"),
+    ("cilium.io", "ciliumclusterwideenvoyconfig"): ("cilium.io/v2", "cilium", "CiliumClusterwideEnvoyConfig"),
+    ("cilium.io", "ciliumclusterwidenetworkpolicy"): ("cilium.io/v2", "cilium", "CiliumClusterwideNetworkPolicy"),
+    ("cilium.io", "ciliumendpoint"): ("cilium.io/v2", "cilium", "CiliumEndpoint"),
+    ("cilium.io", "ciliumendpointslice"): ("cilium.io/v2alpha1", "cilium", "CiliumEndpointSlice"),
+    ("cilium.io", "ciliumenvoyconfig"): ("cilium.io/v2", "cilium", "CiliumEnvoyConfig"),
+    ("cilium.io", "ciliumexternalworkload"): ("cilium.io/v2", "cilium", "CiliumExternalWorkload"),
+    ("cilium.io", "ciliumidentity"): ("cilium.io/v2", "cilium", "CiliumIdentity"),
+    ("cilium.io", "ciliuml2announcementpolicy"): ("cilium.io/v2alpha1", "cilium", "CiliumL2AnnouncementPolicy"),
+    ("cilium.io", "ciliumloadbalancerippool"): ("cilium.io/v2alpha1", "cilium", "CiliumLoadBalancerIPPool"),
+    ("cilium.io", "ciliumnetworkpolicy"): ("cilium.io/v2", "cilium", "CiliumNetworkPolicy"),
+    ("cilium.io", "ciliumnode"): ("cilium.io/v2", "cilium", "CiliumNode"),
+    ("cilium.io", "ciliumnodeconfig"): ("cilium.io/v2", "cilium", "CiliumNodeConfig"),
+    ("cilium.io", "ciliumpodippool"): ("cilium.io/v2alpha1", "cilium", "CiliumPodIPPool"),
+    ("externaldns.k8s.io", "dnsendpoint"): ("externaldns.k8s.io/v1alpha1", "externaldns", "DNSEndpoint"),
+    ("gateway.networking.k8s.io", "gateway"): ("gateway.networking.k8s.io/v1beta1", "gateway", "Gateway"),
+    ("gateway.networking.k8s.io", "gatewayclass"): ("gateway.networking.k8s.io/v1beta1", "gateway", "GatewayClass"),
+    ("gateway.networking.k8s.io", "httproute"): ("gateway.networking.k8s.io/v1beta1", "gateway", "HTTPRoute"),
+    ("monitoring.coreos.com", "alertmanager"): ("monitoring.coreos.com/v1", "monitoring", "Alertmanager"),
+    ("monitoring.coreos.com", "alertmanagerconfig"): ("monitoring.coreos.com/v1alpha1", "monitoring", "AlertmanagerConfig"),
+    ("monitoring.coreos.com", "podmonitor"): ("monitoring.coreos.com/v1", "monitoring", "PodMonitor"),
+    ("monitoring.coreos.com", "probe"): ("monitoring.coreos.com/v1", "monitoring", "Probe"),
+    ("monitoring.coreos.com", "prometheus"): ("monitoring.coreos.com/v1", "monitoring", "Prometheus"),
+    ("monitoring.coreos.com", "prometheusagent"): ("monitoring.coreos.com/v1alpha1", "monitoring", "PrometheusAgent"),
+    ("monitoring.coreos.com", "prometheusrule"): ("monitoring.coreos.com/v1", "monitoring", "PrometheusRule"),
+    ("monitoring.coreos.com", "scrapeconfig"): ("monitoring.coreos.com/v1alpha1", "monitoring", "ScrapeConfig"),
+    ("monitoring.coreos.com", "servicemonitor"): ("monitoring.coreos.com/v1", "monitoring", "ServiceMonitor"),
+    ("monitoring.coreos.com", "thanosruler"): ("monitoring.coreos.com/v1", "monitoring", "ThanosRuler"),
+    ("objectbucket.io", "objectbucket"): ("objectbucket.io/v1alpha1", "rook", "ObjectBucket"),
+    ("objectbucket.io", "objectbucketclaim"): ("objectbucket.io/v1alpha1", "rook", "ObjectBucketClaim"),
+    ("operator.victoriametrics.com", "vmagent"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMAgent"),
+    ("operator.victoriametrics.com", "vmalert"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMAlert"),
+    ("operator.victoriametrics.com", "vmalertmanager"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMAlertmanager"),
+    ("operator.victoriametrics.com", "vmcluster"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMCluster"),
+    ("operator.victoriametrics.com", "vmnodescrape"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMNodeScrape"),
+    ("operator.victoriametrics.com", "vmpodscrape"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMPodScrape"),
+    ("operator.victoriametrics.com", "vmprobe"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMProbe"),
+    ("operator.victoriametrics.com", "vmrule"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMRule"),
+    ("operator.victoriametrics.com", "vmservicescrape"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMServiceScrape"),
+    ("operator.victoriametrics.com", "vmsingle"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMSingle"),
+    ("operator.victoriametrics.com", "vmstaticscrape"): ("operator.victoriametrics.com/v1beta1", "victoriametrics", "VMStaticScrape"),
+    ("postgres-operator.crunchydata.com", "pgupgrade"): ("postgres-operator.crunchydata.com/v1beta1", "postgres_operator", "PGUpgrade"),
+    ("postgres-operator.crunchydata.com", "postgrescluster"): (
+        "postgres-operator.crunchydata.com/v1beta1",
+        "postgres_operator",
+        "PostgresCluster",
+    ),
+}
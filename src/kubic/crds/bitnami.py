@@ -1,10 +1,24 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class Template(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "data": "raw_dict",
+        "metadata": ("object", "meta.ObjectMeta"),
+        "type": "scalar",
+    }
+
     data: dict[str, str]
     metadata: meta.ObjectMeta
     type: str
@@ -16,6 +30,11 @@ class Template(KubernetesObject):
 class SealedSecretSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "encrypted_data": "raw_dict",
+        "template": ("object", "Template"),
+    }
+
     encrypted_data: dict[str, core.Base64]
     template: Template
 
@@ -31,6 +50,11 @@ class SealedSecret(KubernetesApiResource):
     _kind_ = "SealedSecret"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "SealedSecretSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: SealedSecretSpec
 
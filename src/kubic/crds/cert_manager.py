@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class SecretRef(KubernetesObject):
@@ -9,6 +15,11 @@ class SecretRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "name": "scalar",
+    }
+
     key: str
     name: str
 
@@ -28,6 +39,12 @@ class ExternalAccountBinding(KubernetesObject):
         "keyID": "key_id",
     }
 
+    _field_types_ = {
+        "key_algorithm": "scalar",
+        "key_id": "scalar",
+        "key_secret_ref": ("object", "SecretRef"),
+    }
+
     key_algorithm: str
     key_id: str
     key_secret_ref: SecretRef
@@ -41,6 +58,11 @@ class AcmeDNS(KubernetesObject):
 
     _required_ = ["account_secret_ref", "host"]
 
+    _field_types_ = {
+        "account_secret_ref": ("object", "SecretRef"),
+        "host": "scalar",
+    }
+
     account_secret_ref: SecretRef
     host: str
 
@@ -53,6 +75,13 @@ class Akamai(KubernetesObject):
 
     _required_ = ["access_token_secret_ref", "client_secret_secret_ref", "client_token_secret_ref", "service_consumer_domain"]
 
+    _field_types_ = {
+        "access_token_secret_ref": ("object", "SecretRef"),
+        "client_secret_secret_ref": ("object", "SecretRef"),
+        "client_token_secret_ref": ("object", "SecretRef"),
+        "service_consumer_domain": "scalar",
+    }
+
     access_token_secret_ref: SecretRef
     client_secret_secret_ref: SecretRef
     client_token_secret_ref: SecretRef
@@ -85,6 +114,11 @@ class ManagedIdentity(KubernetesObject):
         "resourceID": "resource_id",
     }
 
+    _field_types_ = {
+        "client_id": "scalar",
+        "resource_id": "scalar",
+    }
+
     client_id: str
     resource_id: str
 
@@ -108,6 +142,17 @@ class AzureDNS(KubernetesObject):
         "tenantID": "tenant_id",
     }
 
+    _field_types_ = {
+        "client_id": "scalar",
+        "client_secret_secret_ref": ("object", "SecretRef"),
+        "environment": "scalar",
+        "hosted_zone_name": "scalar",
+        "managed_identity": ("object", "ManagedIdentity"),
+        "resource_group_name": "scalar",
+        "subscription_id": "scalar",
+        "tenant_id": "scalar",
+    }
+
     client_id: str
     client_secret_secret_ref: SecretRef
     environment: str
@@ -145,6 +190,12 @@ class CloudDNS(KubernetesObject):
 
     _required_ = ["project"]
 
+    _field_types_ = {
+        "hosted_zone_name": "scalar",
+        "project": "scalar",
+        "service_account_secret_ref": ("object", "SecretRef"),
+    }
+
     hosted_zone_name: str
     project: str
     service_account_secret_ref: SecretRef
@@ -156,6 +207,12 @@ class CloudDNS(KubernetesObject):
 class Cloudflare(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "api_key_secret_ref": ("object", "SecretRef"),
+        "api_token_secret_ref": ("object", "SecretRef"),
+        "email": "scalar",
+    }
+
     api_key_secret_ref: SecretRef
     api_token_secret_ref: SecretRef
     email: str
@@ -169,6 +226,10 @@ class Digitalocean(KubernetesObject):
 
     _required_ = ["token_secret_ref"]
 
+    _field_types_ = {
+        "token_secret_ref": ("object", "SecretRef"),
+    }
+
     token_secret_ref: SecretRef
 
     def __init__(self, token_secret_ref: SecretRef = None):
@@ -180,6 +241,13 @@ class RFC2136(KubernetesObject):
 
     _required_ = ["nameserver"]
 
+    _field_types_ = {
+        "nameserver": "scalar",
+        "tsig_algorithm": "scalar",
+        "tsig_key_name": "scalar",
+        "tsig_secret_secret_ref": ("object", "SecretRef"),
+    }
+
     nameserver: str
     tsig_algorithm: str
     tsig_key_name: str
@@ -207,6 +275,14 @@ class Route53(KubernetesObject):
         "hostedZoneID": "hosted_zone_id",
     }
 
+    _field_types_ = {
+        "access_key_id": "scalar",
+        "hosted_zone_id": "scalar",
+        "region": "scalar",
+        "role": "scalar",
+        "secret_access_key_secret_ref": ("object", "SecretRef"),
+    }
+
     access_key_id: str
     hosted_zone_id: str
     region: str
@@ -235,6 +311,12 @@ class Webhook(KubernetesObject):
 
     _required_ = ["group_name", "solver_name"]
 
+    _field_types_ = {
+        "config": "scalar",
+        "group_name": "scalar",
+        "solver_name": "scalar",
+    }
+
     config: t.Any
     group_name: str
     solver_name: str
@@ -257,6 +339,19 @@ class Dns01(KubernetesObject):
         "cloudDNS": "cloud_dns",
     }
 
+    _field_types_ = {
+        "acme_dns": ("object", "AcmeDNS"),
+        "akamai": ("object", "Akamai"),
+        "azure_dns": ("object", "AzureDNS"),
+        "cloud_dns": ("object", "CloudDNS"),
+        "cloudflare": ("object", "Cloudflare"),
+        "cname_strategy": "scalar",
+        "digitalocean": ("object", "Digitalocean"),
+        "rfc2136": ("object", "RFC2136"),
+        "route53": ("object", "Route53"),
+        "webhook": ("object", "Webhook"),
+    }
+
     acme_dns: AcmeDNS
     akamai: Akamai
     azure_dns: AzureDNS
@@ -298,6 +393,11 @@ class Dns01(KubernetesObject):
 class GatewayHTTPRoute(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "labels": "raw_dict",
+        "service_type": "scalar",
+    }
+
     labels: dict[str, str]
     service_type: str
 
@@ -308,6 +408,11 @@ class GatewayHTTPRoute(KubernetesObject):
 class Metadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
 
@@ -318,6 +423,10 @@ class Metadata(KubernetesObject):
 class IngressTemplate(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "metadata": ("object", "Metadata"),
+    }
+
     metadata: Metadata
 
     def __init__(self, metadata: Metadata = None):
@@ -327,6 +436,14 @@ class IngressTemplate(KubernetesObject):
 class PodTemplateSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "node_selector": "raw_dict",
+        "priority_class_name": "scalar",
+        "service_account_name": "scalar",
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     node_selector: dict[str, str]
     priority_class_name: str
@@ -353,6 +470,11 @@ class PodTemplateSpec(KubernetesObject):
 class PodTemplate(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "metadata": ("object", "Metadata"),
+        "spec": ("object", "PodTemplateSpec"),
+    }
+
     metadata: Metadata
     spec: PodTemplateSpec
 
@@ -367,6 +489,14 @@ class Ingress(KubernetesObject):
         "class": "class_",
     }
 
+    _field_types_ = {
+        "class_": "scalar",
+        "ingress_template": ("object", "IngressTemplate"),
+        "name": "scalar",
+        "pod_template": ("object", "PodTemplate"),
+        "service_type": "scalar",
+    }
+
     class_: str
     ingress_template: IngressTemplate
     name: str
@@ -394,6 +524,11 @@ class Http01(KubernetesObject):
         "gatewayHTTPRoute": "gateway_http_route",
     }
 
+    _field_types_ = {
+        "gateway_http_route": ("object", "GatewayHTTPRoute"),
+        "ingress": ("object", "Ingress"),
+    }
+
     gateway_http_route: GatewayHTTPRoute
     ingress: Ingress
 
@@ -404,6 +539,12 @@ class Http01(KubernetesObject):
 class Selector(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "dns_names": "raw_list",
+        "dns_zones": "raw_list",
+        "match_labels": "raw_dict",
+    }
+
     dns_names: list[str]
     dns_zones: list[str]
     match_labels: dict[str, str]
@@ -415,6 +556,12 @@ class Selector(KubernetesObject):
 class Solver(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "dns01": ("object", "Dns01"),
+        "http01": ("object", "Http01"),
+        "selector": ("object", "Selector"),
+    }
+
     dns01: Dns01
     http01: Http01
     selector: Selector
@@ -435,6 +582,18 @@ class Acme(KubernetesObject):
         "skipTLSVerify": "skip_tls_verify",
     }
 
+    _field_types_ = {
+        "disable_account_key_generation": "scalar",
+        "email": "scalar",
+        "enable_duration_feature": "scalar",
+        "external_account_binding": ("object", "ExternalAccountBinding"),
+        "preferred_chain": "scalar",
+        "private_key_secret_ref": ("object", "SecretRef"),
+        "server": "scalar",
+        "skip_tls_verify": "scalar",
+        "solvers": ("typed_list", "Solver"),
+    }
+
     disable_account_key_generation: bool
     email: str
     enable_duration_feature: bool
@@ -475,6 +634,10 @@ class AdditionalOutputFormat(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "type": "scalar",
+    }
+
     type: str
 
     def __init__(self, type: str = None):
@@ -486,6 +649,12 @@ class AppRole(KubernetesObject):
 
     _required_ = ["path", "role_id", "secret_ref"]
 
+    _field_types_ = {
+        "path": "scalar",
+        "role_id": "scalar",
+        "secret_ref": ("object", "SecretRef"),
+    }
+
     path: str
     role_id: str
     secret_ref: SecretRef
@@ -499,6 +668,12 @@ class Kubernete(KubernetesObject):
 
     _required_ = ["role", "secret_ref"]
 
+    _field_types_ = {
+        "mount_path": "scalar",
+        "role": "scalar",
+        "secret_ref": ("object", "SecretRef"),
+    }
+
     mount_path: str
     role: str
     secret_ref: SecretRef
@@ -510,6 +685,12 @@ class Kubernete(KubernetesObject):
 class Auth(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "app_role": ("object", "AppRole"),
+        "kubernetes": ("object", "Kubernete"),
+        "token_secret_ref": ("object", "SecretRef"),
+    }
+
     app_role: AppRole
     kubernetes: Kubernete
     token_secret_ref: SecretRef
@@ -523,6 +704,12 @@ class CA(KubernetesObject):
 
     _required_ = ["secret_name"]
 
+    _field_types_ = {
+        "crl_distribution_points": "raw_list",
+        "ocsp_servers": "raw_list",
+        "secret_name": "scalar",
+    }
+
     crl_distribution_points: list[str]
     ocsp_servers: list[str]
     secret_name: str
@@ -536,6 +723,12 @@ class IssuerRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -549,6 +742,11 @@ class JKS(KubernetesObject):
 
     _required_ = ["create", "password_secret_ref"]
 
+    _field_types_ = {
+        "create": "scalar",
+        "password_secret_ref": ("object", "SecretRef"),
+    }
+
     create: bool
     password_secret_ref: SecretRef
 
@@ -561,6 +759,11 @@ class PKCS12(KubernetesObject):
 
     _required_ = ["create", "password_secret_ref"]
 
+    _field_types_ = {
+        "create": "scalar",
+        "password_secret_ref": ("object", "SecretRef"),
+    }
+
     create: bool
     password_secret_ref: SecretRef
 
@@ -571,6 +774,11 @@ class PKCS12(KubernetesObject):
 class Keystore(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "jks": ("object", "JKS"),
+        "pkcs12": ("object", "PKCS12"),
+    }
+
     jks: JKS
     pkcs12: PKCS12
 
@@ -581,6 +789,13 @@ class Keystore(KubernetesObject):
 class PrivateKey(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "algorithm": "scalar",
+        "encoding": "scalar",
+        "rotation_policy": "scalar",
+        "size": "scalar",
+    }
+
     algorithm: str
     encoding: str
     rotation_policy: str
@@ -593,6 +808,11 @@ class PrivateKey(KubernetesObject):
 class SecretTemplate(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
 
@@ -603,6 +823,17 @@ class SecretTemplate(KubernetesObject):
 class Subject(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "countries": "raw_list",
+        "localities": "raw_list",
+        "organizational_units": "raw_list",
+        "organizations": "raw_list",
+        "postal_codes": "raw_list",
+        "provinces": "raw_list",
+        "serial_number": "scalar",
+        "street_addresses": "raw_list",
+    }
+
     countries: list[str]
     localities: list[str]
     organizational_units: list[str]
@@ -647,6 +878,27 @@ class CertificateSpec(KubernetesObject):
         "isCA": "is_ca",
     }
 
+    _field_types_ = {
+        "additional_output_formats": ("typed_list", "AdditionalOutputFormat"),
+        "common_name": "scalar",
+        "dns_names": "raw_list",
+        "duration": "scalar",
+        "email_addresses": "raw_list",
+        "encode_usages_in_request": "scalar",
+        "ip_addresses": "raw_list",
+        "is_ca": "scalar",
+        "issuer_ref": ("object", "IssuerRef"),
+        "keystores": ("object", "Keystore"),
+        "private_key": ("object", "PrivateKey"),
+        "renew_before": "scalar",
+        "revision_history_limit": "scalar",
+        "secret_name": "scalar",
+        "secret_template": ("object", "SecretTemplate"),
+        "subject": ("object", "Subject"),
+        "uris": "raw_list",
+        "usages": "raw_list",
+    }
+
     additional_output_formats: list[AdditionalOutputFormat]
     common_name: str
     dns_names: list[str]
@@ -719,6 +971,11 @@ class Certificate(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CertificateSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CertificateSpec
 
@@ -738,6 +995,18 @@ class CertificateRequestSpec(KubernetesObject):
         "isCA": "is_ca",
     }
 
+    _field_types_ = {
+        "duration": "scalar",
+        "extra": "raw_dict",
+        "groups": "raw_list",
+        "is_ca": "scalar",
+        "issuer_ref": ("object", "IssuerRef"),
+        "request": "scalar",
+        "uid": "scalar",
+        "usages": "raw_list",
+        "username": "scalar",
+    }
+
     duration: str
     extra: dict[str, list[str]]
     groups: list[str]
@@ -783,6 +1052,11 @@ class CertificateRequest(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CertificateRequestSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CertificateRequestSpec
 
@@ -802,6 +1076,18 @@ class ChallengeSpec(KubernetesObject):
         "authorizationURL": "authorization_url",
     }
 
+    _field_types_ = {
+        "authorization_url": "scalar",
+        "dns_name": "scalar",
+        "issuer_ref": ("object", "IssuerRef"),
+        "key": "scalar",
+        "solver": ("object", "Solver"),
+        "token": "scalar",
+        "type": "scalar",
+        "url": "scalar",
+        "wildcard": "scalar",
+    }
+
     authorization_url: str
     dns_name: str
     issuer_ref: IssuerRef
@@ -847,6 +1133,11 @@ class Challenge(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ChallengeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ChallengeSpec
 
@@ -859,6 +1150,11 @@ class Cloud(KubernetesObject):
 
     _required_ = ["api_token_secret_ref"]
 
+    _field_types_ = {
+        "api_token_secret_ref": ("object", "SecretRef"),
+        "url": "scalar",
+    }
+
     api_token_secret_ref: SecretRef
     url: str
 
@@ -869,6 +1165,10 @@ class Cloud(KubernetesObject):
 class SelfSigned(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "crl_distribution_points": "raw_list",
+    }
+
     crl_distribution_points: list[str]
 
     def __init__(self, crl_distribution_points: list[str] = None):
@@ -880,6 +1180,14 @@ class Vault(KubernetesObject):
 
     _required_ = ["auth", "path", "server"]
 
+    _field_types_ = {
+        "auth": ("object", "Auth"),
+        "ca_bundle": "scalar",
+        "namespace": "scalar",
+        "path": "scalar",
+        "server": "scalar",
+    }
+
     auth: Auth
     ca_bundle: core.Base64
     namespace: str
@@ -895,6 +1203,10 @@ class CredentialsRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
 
     def __init__(self, name: str = None):
@@ -906,6 +1218,12 @@ class TPP(KubernetesObject):
 
     _required_ = ["credentials_ref", "url"]
 
+    _field_types_ = {
+        "ca_bundle": "scalar",
+        "credentials_ref": ("object", "CredentialsRef"),
+        "url": "scalar",
+    }
+
     ca_bundle: core.Base64
     credentials_ref: CredentialsRef
     url: str
@@ -919,6 +1237,12 @@ class Venafi(KubernetesObject):
 
     _required_ = ["zone"]
 
+    _field_types_ = {
+        "cloud": ("object", "Cloud"),
+        "tpp": ("object", "TPP"),
+        "zone": "scalar",
+    }
+
     cloud: Cloud
     tpp: TPP
     zone: str
@@ -930,6 +1254,14 @@ class Venafi(KubernetesObject):
 class IssuerSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "acme": ("object", "Acme"),
+        "ca": ("object", "CA"),
+        "self_signed": ("object", "SelfSigned"),
+        "vault": ("object", "Vault"),
+        "venafi": ("object", "Venafi"),
+    }
+
     acme: Acme
     ca: CA
     self_signed: SelfSigned
@@ -950,6 +1282,11 @@ class ClusterIssuer(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "IssuerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: IssuerSpec
 
@@ -967,6 +1304,11 @@ class Issuer(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "IssuerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: IssuerSpec
 
@@ -979,6 +1321,15 @@ class OrderSpec(KubernetesObject):
 
     _required_ = ["issuer_ref", "request"]
 
+    _field_types_ = {
+        "common_name": "scalar",
+        "dns_names": "raw_list",
+        "duration": "scalar",
+        "ip_addresses": "raw_list",
+        "issuer_ref": ("object", "IssuerRef"),
+        "request": "scalar",
+    }
+
     common_name: str
     dns_names: list[str]
     duration: str
@@ -1015,6 +1366,11 @@ class Order(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "OrderSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: OrderSpec
 
@@ -1,12 +1,25 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class AWS(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "labels": "raw_dict",
+        "region": "scalar",
+        "security_groups_ids": "raw_list",
+        "security_groups_names": "raw_list",
+    }
+
     labels: dict[str, str]
     region: str
     security_groups_ids: list[str]
@@ -25,6 +38,11 @@ class AWS(KubernetesObject):
 class Addresse(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ip": "scalar",
+        "type": "scalar",
+    }
+
     ip: str
     """ IP is an IP of a node """
     type: str
@@ -37,6 +55,11 @@ class Addresse(KubernetesObject):
 class Addressing(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ipv4": "scalar",
+        "ipv6": "scalar",
+    }
+
     ipv4: str
     ipv6: str
 
@@ -47,6 +70,12 @@ class Addressing(KubernetesObject):
 class Communities(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "large": "raw_list",
+        "standard": "raw_list",
+        "well_known": "raw_list",
+    }
+
     large: list[str]
     """ Large holds a list of the BGP Large Communities Attribute (RFC 8092) values. """
     standard: list[str]
@@ -66,6 +95,13 @@ class AdvertisedPathAttribute(KubernetesObject):
 
     _required_ = ["selector_type"]
 
+    _field_types_ = {
+        "communities": ("object", "Communities"),
+        "local_preference": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "selector_type": "scalar",
+    }
+
     communities: Communities
     """
     Communities defines a set of community values advertised in the supported BGP Communities path attributes.
@@ -106,6 +142,11 @@ class AdvertisedPathAttribute(KubernetesObject):
 class Attributes(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "communities": ("object", "Communities"),
+        "local_preference": "scalar",
+    }
+
     communities: Communities
     """
     Communities sets the community attributes in the route.
@@ -126,6 +167,10 @@ class AdvertisementService(KubernetesObject):
 
     _required_ = ["addresses"]
 
+    _field_types_ = {
+        "addresses": "raw_list",
+    }
+
     addresses: list[str]
     """ Addresses is a list of service address types which needs to be advertised via BGP. """
 
@@ -138,6 +183,13 @@ class Advertisement(KubernetesObject):
 
     _required_ = ["advertisement_type"]
 
+    _field_types_ = {
+        "advertisement_type": "scalar",
+        "attributes": ("object", "Attributes"),
+        "selector": ("object", "meta.LabelSelector"),
+        "service": ("object", "AdvertisementService"),
+    }
+
     advertisement_type: str
     """ AdvertisementType defines type of advertisement which has to be advertised. """
     attributes: Attributes
@@ -185,6 +237,17 @@ class AlibabaCloud(KubernetesObject):
         "vswitch-tags": "vswitch_tags",
     }
 
+    _field_types_ = {
+        "availability_zone": "scalar",
+        "cidr_block": "scalar",
+        "instance_type": "scalar",
+        "security_group_tags": "raw_dict",
+        "security_groups": "raw_list",
+        "vpc_id": "scalar",
+        "vswitch_tags": "raw_dict",
+        "vswitches": "raw_list",
+    }
+
     availability_zone: str
     """
     AvailabilityZone is the availability zone to use when allocating
@@ -245,6 +308,11 @@ class Allocated(KubernetesObject):
 
     _required_ = ["pool"]
 
+    _field_types_ = {
+        "cidrs": "raw_list",
+        "pool": "scalar",
+    }
+
     cidrs: list[CIDR]
     """ CIDRs contains a list of pod CIDRs currently allocated from this pool """
     pool: str
@@ -259,6 +327,10 @@ class Authentication(KubernetesObject):
 
     _required_ = ["mode"]
 
+    _field_types_ = {
+        "mode": "scalar",
+    }
+
     mode: str
     """ Mode is the required authentication mode for the allowed traffic, if any. """
 
@@ -276,6 +348,10 @@ class Azure(KubernetesObject):
         "interface-name": "interface_name",
     }
 
+    _field_types_ = {
+        "interface_name": "scalar",
+    }
+
     interface_name: str
     """
     InterfaceName is the name of the interface the cilium-operator
@@ -291,6 +367,12 @@ class BackendService(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "namespace": "scalar",
+        "number": "raw_list",
+    }
+
     name: str
     """ Name is the name of a destination Kubernetes service that identifies traffic to be redirected. """
     namespace: str
@@ -307,6 +389,12 @@ class PeerConfigRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     group: str
     """
     Group is the group of the peer config resource.
@@ -339,6 +427,14 @@ class BgpInstancePeer(KubernetesObject):
         "peerASN": "peer_asn",
     }
 
+    _field_types_ = {
+        "local_address": "scalar",
+        "name": "scalar",
+        "peer_asn": "scalar",
+        "peer_address": "scalar",
+        "peer_config_ref": ("object", "PeerConfigRef"),
+    }
+
     local_address: str
     """
     LocalAddress is the IP address of the local interface to use for the peering session.
@@ -380,6 +476,12 @@ class BgpInstancePeer1(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "local_address": "scalar",
+        "local_port": "scalar",
+        "name": "scalar",
+    }
+
     local_address: str
     """ LocalAddress is the IP address to use for connecting to this peer. """
     local_port: int
@@ -403,6 +505,13 @@ class BgpInstancePeer2(KubernetesObject):
         "peerASN": "peer_asn",
     }
 
+    _field_types_ = {
+        "name": "scalar",
+        "peer_asn": "scalar",
+        "peer_address": "scalar",
+        "peer_config_ref": ("object", "PeerConfigRef"),
+    }
+
     name: str
     """ Name is the name of the BGP peer. It is a unique identifier for the peer within the BGP instance. """
     peer_asn: int
@@ -431,6 +540,12 @@ class BgpInstancePeer2(KubernetesObject):
 class Block(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "cidr": "scalar",
+        "start": "scalar",
+        "stop": "scalar",
+    }
+
     cidr: CIDR
     start: str
     stop: str
@@ -444,6 +559,10 @@ class CiliumBGPAdvertisementSpec(KubernetesObject):
 
     _required_ = ["advertisements"]
 
+    _field_types_ = {
+        "advertisements": ("typed_list", "Advertisement"),
+    }
+
     advertisements: list[Advertisement]
     """ Advertisements is a list of BGP advertisements. """
 
@@ -463,6 +582,11 @@ class CiliumBGPAdvertisement(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPAdvertisementSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPAdvertisementSpec
 
@@ -482,6 +606,12 @@ class CiliumBGPClusterConfigSpecBgpInstance(KubernetesObject):
         "localASN": "local_asn",
     }
 
+    _field_types_ = {
+        "local_asn": "scalar",
+        "name": "scalar",
+        "peers": ("typed_list", "BgpInstancePeer2"),
+    }
+
     local_asn: int
     """
     LocalASN is the ASN of this BGP instance.
@@ -504,6 +634,11 @@ class CiliumBGPClusterConfigSpec(KubernetesObject):
 
     _required_ = ["bgp_instances"]
 
+    _field_types_ = {
+        "bgp_instances": ("typed_list", "CiliumBGPClusterConfigSpecBgpInstance"),
+        "node_selector": ("object", "meta.LabelSelector"),
+    }
+
     bgp_instances: list[CiliumBGPClusterConfigSpecBgpInstance]
     """
     A list of CiliumBGPInstance(s) which instructs
@@ -532,6 +667,11 @@ class CiliumBGPClusterConfig(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPClusterConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPClusterConfigSpec
     """ Spec defines the desired cluster configuration of the BGP control plane. """
@@ -557,6 +697,14 @@ class CiliumBGPNodeConfigSpecBgpInstance(KubernetesObject):
         "routerID": "router_id",
     }
 
+    _field_types_ = {
+        "local_asn": "scalar",
+        "local_port": "scalar",
+        "name": "scalar",
+        "peers": ("typed_list", "BgpInstancePeer"),
+        "router_id": "scalar",
+    }
+
     local_asn: int
     """
     LocalASN is the ASN of this virtual router.
@@ -591,6 +739,10 @@ class CiliumBGPNodeConfigSpec(KubernetesObject):
 
     _required_ = ["bgp_instances"]
 
+    _field_types_ = {
+        "bgp_instances": ("typed_list", "CiliumBGPNodeConfigSpecBgpInstance"),
+    }
+
     bgp_instances: list[CiliumBGPNodeConfigSpecBgpInstance]
     """ BGPInstances is a list of BGP router instances on the node. """
 
@@ -613,6 +765,11 @@ class CiliumBGPNodeConfig(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPNodeConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPNodeConfigSpec
     """ Spec is the specification of the desired behavior of the CiliumBGPNodeConfig. """
@@ -633,6 +790,13 @@ class CiliumBGPNodeConfigOverrideSpecBgpInstance(KubernetesObject):
         "routerID": "router_id",
     }
 
+    _field_types_ = {
+        "local_port": "scalar",
+        "name": "scalar",
+        "peers": ("typed_list", "BgpInstancePeer1"),
+        "router_id": "scalar",
+    }
+
     local_port: int
     """ LocalPort is port to use for this BGP instance. """
     name: str
@@ -651,6 +815,10 @@ class CiliumBGPNodeConfigOverrideSpec(KubernetesObject):
 
     _required_ = ["bgp_instances"]
 
+    _field_types_ = {
+        "bgp_instances": ("typed_list", "CiliumBGPNodeConfigOverrideSpecBgpInstance"),
+    }
+
     bgp_instances: list[CiliumBGPNodeConfigOverrideSpecBgpInstance]
     """ BGPInstances is a list of BGP instances to override. """
 
@@ -675,6 +843,11 @@ class CiliumBGPNodeConfigOverride(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPNodeConfigOverrideSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPNodeConfigOverrideSpec
     """ Spec is the specification of the desired behavior of the CiliumBGPNodeConfigOverride. """
@@ -688,6 +861,12 @@ class CiliumBGPPeerConfigSpecFamily(KubernetesObject):
 
     _required_ = ["afi", "safi"]
 
+    _field_types_ = {
+        "advertisements": ("object", "meta.LabelSelector"),
+        "afi": "scalar",
+        "safi": "scalar",
+    }
+
     advertisements: meta.LabelSelector
     """
     Advertisements selects group of BGP Advertisement(s) to advertise for this family.
@@ -711,6 +890,11 @@ class GracefulRestart(KubernetesObject):
 
     _required_ = ["enabled"]
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "restart_time_seconds": "scalar",
+    }
+
     enabled: bool
     """ Enabled flag, when set enables graceful restart capability. """
     restart_time_seconds: int
@@ -728,6 +912,12 @@ class GracefulRestart(KubernetesObject):
 class Timers(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "connect_retry_time_seconds": "scalar",
+        "hold_time_seconds": "scalar",
+        "keep_alive_time_seconds": "scalar",
+    }
+
     connect_retry_time_seconds: int
     """
     ConnectRetryTimeSeconds defines the initial value for the BGP ConnectRetryTimer (RFC 4271, Section 8).
@@ -760,6 +950,11 @@ class Timers(KubernetesObject):
 class Transport(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "local_port": "scalar",
+        "peer_port": "scalar",
+    }
+
     local_port: int
     """
     Deprecated
@@ -784,6 +979,15 @@ class Transport(KubernetesObject):
 class CiliumBGPPeerConfigSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "auth_secret_ref": "scalar",
+        "ebgp_multihop": "scalar",
+        "families": ("typed_list", "CiliumBGPPeerConfigSpecFamily"),
+        "graceful_restart": ("object", "GracefulRestart"),
+        "timers": ("object", "Timers"),
+        "transport": ("object", "Transport"),
+    }
+
     auth_secret_ref: str
     """
     AuthSecretRef is the name of the secret to use to fetch a TCP
@@ -855,6 +1059,11 @@ class CiliumBGPPeerConfig(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPPeerConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPPeerConfigSpec
     """ Spec is the specification of the desired behavior of the CiliumBGPPeerConfig. """
@@ -868,6 +1077,11 @@ class NeighborFamily(KubernetesObject):
 
     _required_ = ["afi", "safi"]
 
+    _field_types_ = {
+        "afi": "scalar",
+        "safi": "scalar",
+    }
+
     afi: str
     """ Afi is the Address Family Identifier (AFI) of the family. """
     safi: str
@@ -891,6 +1105,20 @@ class Neighbor(KubernetesObject):
         "peerASN": "peer_asn",
     }
 
+    _field_types_ = {
+        "advertised_path_attributes": ("typed_list", "AdvertisedPathAttribute"),
+        "auth_secret_ref": "scalar",
+        "connect_retry_time_seconds": "scalar",
+        "e_bgp_multihop_ttl": "scalar",
+        "families": ("typed_list", "NeighborFamily"),
+        "graceful_restart": ("object", "GracefulRestart"),
+        "hold_time_seconds": "scalar",
+        "keep_alive_time_seconds": "scalar",
+        "peer_asn": "scalar",
+        "peer_address": "scalar",
+        "peer_port": "scalar",
+    }
+
     advertised_path_attributes: list[AdvertisedPathAttribute]
     """
     AdvertisedPathAttributes can be used to apply additional path attributes
@@ -996,6 +1224,15 @@ class VirtualRouter(KubernetesObject):
         "podIPPoolSelector": "pod_ip_pool_selector",
     }
 
+    _field_types_ = {
+        "export_pod_cidr": "scalar",
+        "local_asn": "scalar",
+        "neighbors": ("typed_list", "Neighbor"),
+        "pod_ip_pool_selector": ("object", "meta.LabelSelector"),
+        "service_advertisements": "raw_list",
+        "service_selector": ("object", "meta.LabelSelector"),
+    }
+
     export_pod_cidr: bool
     """
     ExportPodCIDR determines whether to export the Node's private CIDR block
@@ -1057,6 +1294,11 @@ class CiliumBGPPeeringPolicySpec(KubernetesObject):
 
     _required_ = ["virtual_routers"]
 
+    _field_types_ = {
+        "node_selector": ("object", "meta.LabelSelector"),
+        "virtual_routers": ("typed_list", "VirtualRouter"),
+    }
+
     node_selector: meta.LabelSelector
     """
     NodeSelector selects a group of nodes where this BGP Peering
@@ -1089,6 +1331,11 @@ class CiliumBGPPeeringPolicy(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumBGPPeeringPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumBGPPeeringPolicySpec
     """ Spec is a human readable description of a BGP peering policy """
@@ -1109,6 +1356,10 @@ class CiliumCIDRGroupSpec(KubernetesObject):
         "externalCIDRs": "external_cidrs",
     }
 
+    _field_types_ = {
+        "external_cidrs": "raw_list",
+    }
+
     external_cidrs: list[CIDR]
     """ ExternalCIDRs is a list of CIDRs selecting peers outside the clusters. """
 
@@ -1132,6 +1383,11 @@ class CiliumCIDRGroup(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumCIDRGroupSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumCIDRGroupSpec
 
@@ -1144,6 +1400,13 @@ class Service(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "listener": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "ports": "raw_list",
+    }
+
     listener: str
     """
     Listener specifies the name of the Envoy listener the service traffic is redirected to. The listener must be specified in the Envoy 'resources' of the same CiliumEnvoyConfig. 
@@ -1163,6 +1426,13 @@ class Service(KubernetesObject):
 class CiliumClusterwideEnvoyConfigSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "backend_services": ("typed_list", "BackendService"),
+        "node_selector": ("object", "meta.LabelSelector"),
+        "resources": "raw_list",
+        "services": ("typed_list", "Service"),
+    }
+
     backend_services: list[BackendService]
     """ BackendServices specifies Kubernetes services whose backends are automatically synced to Envoy using EDS.  Traffic for these services is not forwarded to an Envoy listener. This allows an Envoy listener load balance traffic to these backends while normal Cilium service load balancing takes care of balancing traffic for these services at the same time. """
     node_selector: meta.LabelSelector
@@ -1192,6 +1462,11 @@ class CiliumClusterwideEnvoyConfig(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumClusterwideEnvoyConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumClusterwideEnvoyConfigSpec
 
@@ -1204,6 +1479,11 @@ class Field(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "family": "scalar",
+        "type": "union",
+    }
+
     family: str
     """
     Family is a IP address version.
@@ -1235,6 +1515,10 @@ class Field(KubernetesObject):
 class Icmp(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "fields": ("typed_list", "Field"),
+    }
+
     fields: list[Field]
     """ Fields is a list of ICMP fields. """
 
@@ -1249,6 +1533,13 @@ class ToCIDRSet(KubernetesObject):
         "except": "except_",
     }
 
+    _field_types_ = {
+        "cidr": "scalar",
+        "cidr_group_ref": "scalar",
+        "cidr_group_selector": ("object", "meta.LabelSelector"),
+        "except_": "raw_list",
+    }
+
     cidr: CIDR
     """ CIDR is a CIDR prefix / IP Block. """
     cidr_group_ref: str
@@ -1282,6 +1573,11 @@ class ToCIDRSet(KubernetesObject):
 class ToFQDN(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "match_name": "scalar",
+        "match_pattern": "scalar",
+    }
+
     match_name: str
     """
     MatchName matches literal DNS names. A trailing "." is automatically added
@@ -1315,6 +1611,10 @@ class ToFQDN(KubernetesObject):
 class ToGroup(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "aws": ("object", "AWS"),
+    }
+
     aws: AWS
     """ AWSGroup is an structure that can be used to whitelisting information from AWS integration """
 
@@ -1327,6 +1627,11 @@ class EnvoyConfig(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     kind: str
     """
     Kind is the resource type being referred to. Defaults to CiliumEnvoyConfig or
@@ -1350,6 +1655,12 @@ class Listener(KubernetesObject):
 
     _required_ = ["envoy_config", "name"]
 
+    _field_types_ = {
+        "envoy_config": ("object", "EnvoyConfig"),
+        "name": "scalar",
+        "priority": "scalar",
+    }
+
     envoy_config: EnvoyConfig
     """
     EnvoyConfig is a reference to the CEC or CCEC resource in which
@@ -1379,6 +1690,13 @@ class OriginatingTLS(KubernetesObject):
         "trustedCA": "trusted_ca",
     }
 
+    _field_types_ = {
+        "certificate": "scalar",
+        "private_key": "scalar",
+        "secret": ("object", "core.SecretReference"),
+        "trusted_ca": "scalar",
+    }
+
     certificate: str
     """
     Certificate is the file name or k8s secret item name for the certificate
@@ -1417,6 +1735,12 @@ class Port(KubernetesObject):
 
     _required_ = ["port"]
 
+    _field_types_ = {
+        "end_port": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     end_port: int
     """ EndPort can only be an L4 port number. """
     port: str
@@ -1442,6 +1766,11 @@ class Port(KubernetesObject):
 class DNS(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "match_name": "scalar",
+        "match_pattern": "scalar",
+    }
+
     match_name: str
     """
     MatchName matches literal DNS names. A trailing "." is automatically added
@@ -1477,6 +1806,13 @@ class HeaderMatche(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "mismatch": "scalar",
+        "name": "scalar",
+        "secret": ("object", "core.SecretReference"),
+        "value": "scalar",
+    }
+
     mismatch: str
     """
     Mismatch identifies what to do in case there is no match. The default is
@@ -1508,6 +1844,14 @@ IDNHostname: t.TypeAlias = str
 class Http(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "header_matches": ("typed_list", "HeaderMatche"),
+        "headers": "raw_list",
+        "host": "scalar",
+        "method": "scalar",
+        "path": "scalar",
+    }
+
     header_matches: list[HeaderMatche]
     """
     HeaderMatches is a list of HTTP headers which must be
@@ -1567,6 +1911,14 @@ class Kafka(KubernetesObject):
         "clientID": "client_id",
     }
 
+    _field_types_ = {
+        "api_key": "scalar",
+        "api_version": "scalar",
+        "client_id": "scalar",
+        "role": "scalar",
+        "topic": "scalar",
+    }
+
     api_key: str
     """
     APIKey is a case-insensitive string matched against the key of a
@@ -1640,6 +1992,14 @@ class Kafka(KubernetesObject):
 class Rules(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "dns": ("typed_list", "DNS"),
+        "http": ("typed_list", "Http"),
+        "kafka": ("typed_list", "Kafka"),
+        "l7": "raw_list",
+        "l7proto": "scalar",
+    }
+
     dns: list[DNS]
     """ DNS-specific rules. """
     http: list[Http]
@@ -1674,6 +2034,13 @@ class TerminatingTLS(KubernetesObject):
         "trustedCA": "trusted_ca",
     }
 
+    _field_types_ = {
+        "certificate": "scalar",
+        "private_key": "scalar",
+        "secret": ("object", "core.SecretReference"),
+        "trusted_ca": "scalar",
+    }
+
     certificate: str
     """
     Certificate is the file name or k8s secret item name for the certificate
@@ -1719,6 +2086,15 @@ class ToPort2(KubernetesObject):
         "terminatingTLS": "terminating_tls",
     }
 
+    _field_types_ = {
+        "listener": ("object", "Listener"),
+        "originating_tls": ("object", "OriginatingTLS"),
+        "ports": ("typed_list", "Port"),
+        "rules": ("object", "Rules"),
+        "server_names": "raw_list",
+        "terminating_tls": ("object", "TerminatingTLS"),
+    }
+
     listener: Listener
     """
     listener specifies the name of a custom Envoy listener to which this traffic should be
@@ -1779,6 +2155,11 @@ class ToPort2(KubernetesObject):
 class K8sService(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "namespace": "scalar",
+        "service_name": "scalar",
+    }
+
     namespace: str
     service_name: str
 
@@ -1791,6 +2172,11 @@ class K8sServiceSelector(KubernetesObject):
 
     _required_ = ["selector"]
 
+    _field_types_ = {
+        "namespace": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     namespace: str
     selector: meta.LabelSelector
     """ ServiceSelector is a label selector for k8s services """
@@ -1802,6 +2188,11 @@ class K8sServiceSelector(KubernetesObject):
 class ToService(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "k8s_service": ("object", "K8sService"),
+        "k8s_service_selector": ("object", "K8sServiceSelector"),
+    }
+
     k8s_service: K8sService
     """ K8sService selects service by name and namespace pair """
     k8s_service_selector: K8sServiceSelector
@@ -1825,6 +2216,21 @@ class Egress(KubernetesObject):
         "toFQDNs": "to_fqdns",
     }
 
+    _field_types_ = {
+        "authentication": ("object", "Authentication"),
+        "icmps": ("typed_list", "Icmp"),
+        "to_cidr": "raw_list",
+        "to_cidr_set": ("typed_list", "ToCIDRSet"),
+        "to_endpoints": ("typed_list", "meta.LabelSelector"),
+        "to_entities": "raw_list",
+        "to_fqdns": ("typed_list", "ToFQDN"),
+        "to_groups": ("typed_list", "ToGroup"),
+        "to_nodes": ("typed_list", "meta.LabelSelector"),
+        "to_ports": ("typed_list", "ToPort2"),
+        "to_requires": ("typed_list", "meta.LabelSelector"),
+        "to_services": ("typed_list", "ToService"),
+    }
+
     authentication: Authentication
     """ Authentication is the required authentication type for the allowed traffic, if any. """
     icmps: list[Icmp]
@@ -1977,6 +2383,10 @@ class Egress(KubernetesObject):
 class ToPort(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ports": ("typed_list", "Port"),
+    }
+
     ports: list[Port]
     """ Ports is a list of L4 port/protocol """
 
@@ -1996,6 +2406,19 @@ class EgressDeny(KubernetesObject):
         "toCIDRSet": "to_cidr_set",
     }
 
+    _field_types_ = {
+        "icmps": ("typed_list", "Icmp"),
+        "to_cidr": "raw_list",
+        "to_cidr_set": ("typed_list", "ToCIDRSet"),
+        "to_endpoints": ("typed_list", "meta.LabelSelector"),
+        "to_entities": "raw_list",
+        "to_groups": ("typed_list", "ToGroup"),
+        "to_nodes": ("typed_list", "meta.LabelSelector"),
+        "to_ports": ("typed_list", "ToPort"),
+        "to_requires": ("typed_list", "meta.LabelSelector"),
+        "to_services": ("typed_list", "ToService"),
+    }
+
     icmps: list[Icmp]
     """
     ICMPs is a list of ICMP rule identified by type number
@@ -2126,6 +2549,11 @@ class EgressDeny(KubernetesObject):
 class EnableDefaultDeny(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "egress": "scalar",
+        "ingress": "scalar",
+    }
+
     egress: bool
     """
     Whether or not the endpoint should have a default-deny rule applied
@@ -2148,6 +2576,13 @@ class FromCIDRSet(KubernetesObject):
         "except": "except_",
     }
 
+    _field_types_ = {
+        "cidr": "scalar",
+        "cidr_group_ref": "scalar",
+        "cidr_group_selector": ("object", "meta.LabelSelector"),
+        "except_": "raw_list",
+    }
+
     cidr: CIDR
     """ CIDR is a CIDR prefix / IP Block. """
     cidr_group_ref: str
@@ -2181,6 +2616,10 @@ class FromCIDRSet(KubernetesObject):
 class FromGroup(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "aws": ("object", "AWS"),
+    }
+
     aws: AWS
     """ AWSGroup is an structure that can be used to whitelisting information from AWS integration """
 
@@ -2200,6 +2639,19 @@ class Ingress(KubernetesObject):
         "fromCIDRSet": "from_cidr_set",
     }
 
+    _field_types_ = {
+        "authentication": ("object", "Authentication"),
+        "from_cidr": "raw_list",
+        "from_cidr_set": ("typed_list", "FromCIDRSet"),
+        "from_endpoints": ("typed_list", "meta.LabelSelector"),
+        "from_entities": "raw_list",
+        "from_groups": ("typed_list", "FromGroup"),
+        "from_nodes": ("typed_list", "meta.LabelSelector"),
+        "from_requires": ("typed_list", "meta.LabelSelector"),
+        "icmps": ("typed_list", "Icmp"),
+        "to_ports": ("typed_list", "ToPort2"),
+    }
+
     authentication: Authentication
     """ Authentication is the required authentication type for the allowed traffic, if any. """
     from_cidr: list[CIDR]
@@ -2336,6 +2788,18 @@ class IngressDeny(KubernetesObject):
         "fromCIDRSet": "from_cidr_set",
     }
 
+    _field_types_ = {
+        "from_cidr": "raw_list",
+        "from_cidr_set": ("typed_list", "FromCIDRSet"),
+        "from_endpoints": ("typed_list", "meta.LabelSelector"),
+        "from_entities": "raw_list",
+        "from_groups": ("typed_list", "FromGroup"),
+        "from_nodes": ("typed_list", "meta.LabelSelector"),
+        "from_requires": ("typed_list", "meta.LabelSelector"),
+        "icmps": ("typed_list", "Icmp"),
+        "to_ports": ("typed_list", "ToPort"),
+    }
+
     from_cidr: list[CIDR]
     """
     FromCIDR is a list of IP blocks which the endpoint subject to the
@@ -2461,6 +2925,12 @@ class Label(KubernetesObject):
 
     _required_ = ["key"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "source": "scalar",
+        "value": "scalar",
+    }
+
     key: str
     source: str
     """ Source can be one of the above values (e.g.: LabelSourceContainer). """
@@ -2473,6 +2943,18 @@ class Label(KubernetesObject):
 class CiliumClusterwideNetworkPolicySpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "description": "scalar",
+        "egress": ("typed_list", "Egress"),
+        "egress_deny": ("typed_list", "EgressDeny"),
+        "enable_default_deny": ("object", "EnableDefaultDeny"),
+        "endpoint_selector": ("object", "meta.LabelSelector"),
+        "ingress": ("typed_list", "Ingress"),
+        "ingress_deny": ("typed_list", "IngressDeny"),
+        "labels": ("typed_list", "Label"),
+        "node_selector": ("object", "meta.LabelSelector"),
+    }
+
     description: str
     """
     Description is a free form string, it can be used by the creator of
@@ -2582,6 +3064,12 @@ class CiliumClusterwideNetworkPolicy(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumClusterwideNetworkPolicySpec"),
+        "specs": ("typed_list", "CiliumClusterwideNetworkPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumClusterwideNetworkPolicySpec
     """ Spec is the desired Cilium specific rule specification. """
@@ -2610,6 +3098,10 @@ class CiliumEndpoint(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+    }
+
     metadata: meta.ObjectMeta
 
     def __init__(self, name: str, namespace: str = None, metadata: meta.ObjectMeta = None):
@@ -2619,6 +3111,10 @@ class CiliumEndpoint(KubernetesApiResource):
 class Encryption(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "key": "scalar",
+    }
+
     key: int
     """ Key is the index to the key to use for encryption or 0 if encryption is disabled. """
 
@@ -2629,6 +3125,12 @@ class Encryption(KubernetesObject):
 class NamedPort(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "name": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+    }
+
     name: str
     """ Optional layer 4 port name """
     port: int
@@ -2645,6 +3147,11 @@ class Networking(KubernetesObject):
 
     _required_ = ["addressing"]
 
+    _field_types_ = {
+        "addressing": ("typed_list", "Addressing"),
+        "node": "scalar",
+    }
+
     addressing: list[Addressing]
     """ IP4/6 addresses assigned to this Endpoint """
     node: str
@@ -2664,6 +3171,14 @@ class Endpoint(KubernetesObject):
         "named-ports": "named_ports",
     }
 
+    _field_types_ = {
+        "encryption": ("object", "Encryption"),
+        "id": "scalar",
+        "name": "scalar",
+        "named_ports": ("typed_list", "NamedPort"),
+        "networking": ("object", "Networking"),
+    }
+
     encryption: Encryption
     """ EncryptionSpec defines the encryption relevant configuration of a node. """
     id: int
@@ -2701,6 +3216,12 @@ class CiliumEndpointSlice(KubernetesApiResource):
 
     _required_ = ["endpoints", "metadata"]
 
+    _field_types_ = {
+        "endpoints": ("typed_list", "Endpoint"),
+        "metadata": ("object", "meta.ObjectMeta"),
+        "namespace": "scalar",
+    }
+
     endpoints: list[Endpoint]
     """ Endpoints is a list of coreCEPs packed in a CiliumEndpointSlice """
     metadata: meta.ObjectMeta
@@ -2714,6 +3235,13 @@ class CiliumEndpointSlice(KubernetesApiResource):
 class CiliumEnvoyConfigSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "backend_services": ("typed_list", "BackendService"),
+        "node_selector": ("object", "meta.LabelSelector"),
+        "resources": "raw_list",
+        "services": ("typed_list", "Service"),
+    }
+
     backend_services: list[BackendService]
     """ BackendServices specifies Kubernetes services whose backends are automatically synced to Envoy using EDS.  Traffic for these services is not forwarded to an Envoy listener. This allows an Envoy listener load balance traffic to these backends while normal Cilium service load balancing takes care of balancing traffic for these services at the same time. """
     node_selector: meta.LabelSelector
@@ -2743,6 +3271,11 @@ class CiliumEnvoyConfig(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumEnvoyConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumEnvoyConfigSpec
 
@@ -2762,6 +3295,11 @@ class CiliumExternalWorkloadSpec(KubernetesObject):
         "ipv6-alloc-cidr": "ipv6_alloc_cidr",
     }
 
+    _field_types_ = {
+        "ipv4_alloc_cidr": "scalar",
+        "ipv6_alloc_cidr": "scalar",
+    }
+
     ipv4_alloc_cidr: str
     """
     IPv4AllocCIDR is the range of IPv4 addresses in the CIDR format that the external workload can
@@ -2801,6 +3339,11 @@ class CiliumExternalWorkload(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumExternalWorkloadSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumExternalWorkloadSpec
     """ Spec is the desired configuration of the external Cilium workload. """
@@ -2844,6 +3387,11 @@ class CiliumIdentity(KubernetesApiResource):
         "security-labels": "security_labels",
     }
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "security_labels": "raw_dict",
+    }
+
     metadata: meta.ObjectMeta
     security_labels: dict[str, str]
     """ SecurityLabels is the source-of-truth set of labels for this identity. """
@@ -2864,6 +3412,14 @@ class CiliumL2AnnouncementPolicySpec(KubernetesObject):
         "loadBalancerIPs": "load_balancer_ips",
     }
 
+    _field_types_ = {
+        "external_ips": "scalar",
+        "interfaces": "raw_list",
+        "load_balancer_ips": "scalar",
+        "node_selector": ("object", "meta.LabelSelector"),
+        "service_selector": ("object", "meta.LabelSelector"),
+    }
+
     external_ips: bool
     """ If true, the external IPs of the services are announced """
     interfaces: list[str]
@@ -2929,6 +3485,11 @@ class CiliumL2AnnouncementPolicy(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumL2AnnouncementPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumL2AnnouncementPolicySpec
     """ Spec is a human readable description of a L2 announcement policy """
@@ -2947,6 +3508,13 @@ class CiliumLoadBalancerIPPoolSpec(KubernetesObject):
         "allowFirstLastIPs": "allow_first_last_ips",
     }
 
+    _field_types_ = {
+        "allow_first_last_ips": "scalar",
+        "blocks": ("typed_list", "Block"),
+        "disabled": "scalar",
+        "service_selector": ("object", "meta.LabelSelector"),
+    }
+
     allow_first_last_ips: str
     """
     AllowFirstLastIPs, if set to `Yes` or undefined means that the first and last IPs of each CIDR will be allocatable.
@@ -2989,6 +3557,11 @@ class CiliumLoadBalancerIPPool(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumLoadBalancerIPPoolSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumLoadBalancerIPPoolSpec
     """
@@ -3003,6 +3576,18 @@ class CiliumLoadBalancerIPPool(KubernetesApiResource):
 class CiliumNetworkPolicySpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "description": "scalar",
+        "egress": ("typed_list", "Egress"),
+        "egress_deny": ("typed_list", "EgressDeny"),
+        "enable_default_deny": ("object", "EnableDefaultDeny"),
+        "endpoint_selector": ("object", "meta.LabelSelector"),
+        "ingress": ("typed_list", "Ingress"),
+        "ingress_deny": ("typed_list", "IngressDeny"),
+        "labels": ("typed_list", "Label"),
+        "node_selector": ("object", "meta.LabelSelector"),
+    }
+
     description: str
     """
     Description is a free form string, it can be used by the creator of
@@ -3111,6 +3696,12 @@ class CiliumNetworkPolicy(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumNetworkPolicySpec"),
+        "specs": ("typed_list", "CiliumNetworkPolicySpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumNetworkPolicySpec
     """ Spec is the desired Cilium specific rule specification. """
@@ -3170,6 +3761,26 @@ class ENI(KubernetesObject):
         "vpc-id": "vpc_id",
     }
 
+    _field_types_ = {
+        "availability_zone": "scalar",
+        "delete_on_termination": "scalar",
+        "disable_prefix_delegation": "scalar",
+        "exclude_interface_tags": "raw_dict",
+        "first_interface_index": "scalar",
+        "instance_id": "scalar",
+        "instance_type": "scalar",
+        "max_above_watermark": "scalar",
+        "min_allocate": "scalar",
+        "node_subnet_id": "scalar",
+        "pre_allocate": "scalar",
+        "security_group_tags": "raw_dict",
+        "security_groups": "raw_list",
+        "subnet_ids": "raw_list",
+        "subnet_tags": "raw_dict",
+        "use_primary_address": "scalar",
+        "vpc_id": "scalar",
+    }
+
     availability_zone: str
     """
     AvailabilityZone is the availability zone to use when allocating
@@ -3315,6 +3926,11 @@ class ENI(KubernetesObject):
 class Health(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ipv4": "scalar",
+        "ipv6": "scalar",
+    }
+
     ipv4: str
     """ IPv4 is the IPv4 address of the IPv4 health endpoint. """
     ipv6: str
@@ -3327,6 +3943,11 @@ class Health(KubernetesObject):
 class CiliumNodeSpecIngress(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ipv4": "scalar",
+        "ipv6": "scalar",
+    }
+
     ipv4: str
     ipv6: str
 
@@ -3337,6 +3958,11 @@ class CiliumNodeSpecIngress(KubernetesObject):
 class Ipv6Pool(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "owner": "scalar",
+        "resource": "scalar",
+    }
+
     owner: str
     """
     Owner is the owner of the IP. This field is set if the IP has been
@@ -3360,6 +3986,11 @@ class Ipv6Pool(KubernetesObject):
 class Pool(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "owner": "scalar",
+        "resource": "scalar",
+    }
+
     owner: str
     """
     Owner is the owner of the IP. This field is set if the IP has been
@@ -3392,6 +4023,11 @@ class Needed(KubernetesObject):
         "ipv6-addrs": "ipv6_addrs",
     }
 
+    _field_types_ = {
+        "ipv4_addrs": "scalar",
+        "ipv6_addrs": "scalar",
+    }
+
     ipv4_addrs: int
     """
     IPv4Addrs contains the number of requested IPv4 addresses out of a given
@@ -3412,6 +4048,11 @@ class Requested(KubernetesObject):
 
     _required_ = ["pool"]
 
+    _field_types_ = {
+        "needed": ("object", "Needed"),
+        "pool": "scalar",
+    }
+
     needed: Needed
     """
     Needed indicates how many IPs out of the above Pool this node requests
@@ -3429,6 +4070,11 @@ class Requested(KubernetesObject):
 class Pools(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "allocated": ("typed_list", "Allocated"),
+        "requested": ("typed_list", "Requested"),
+    }
+
     allocated: list[Allocated]
     """
     Allocated contains the list of pooled CIDR assigned to this node. The
@@ -3468,6 +4114,18 @@ class IPAM(KubernetesObject):
         "static-ip-tags": "static_ip_tags",
     }
 
+    _field_types_ = {
+        "ipv6_pool": "raw_dict",
+        "max_above_watermark": "scalar",
+        "max_allocate": "scalar",
+        "min_allocate": "scalar",
+        "pod_cidrs": "raw_list",
+        "pool": "raw_dict",
+        "pools": ("object", "Pools"),
+        "pre_allocate": "scalar",
+        "static_ip_tags": "raw_dict",
+    }
+
     ipv6_pool: dict[str, Ipv6Pool]
     """
     IPv6Pool is the list of IPv6 addresses available to the node for allocation.
@@ -3562,6 +4220,20 @@ class CiliumNodeSpec(KubernetesObject):
         "instance-id": "instance_id",
     }
 
+    _field_types_ = {
+        "addresses": ("typed_list", "Addresse"),
+        "alibaba_cloud": ("object", "AlibabaCloud"),
+        "azure": ("object", "Azure"),
+        "bootid": "scalar",
+        "encryption": ("object", "Encryption"),
+        "eni": ("object", "ENI"),
+        "health": ("object", "Health"),
+        "ingress": ("object", "CiliumNodeSpecIngress"),
+        "instance_id": "scalar",
+        "ipam": ("object", "IPAM"),
+        "nodeidentity": "scalar",
+    }
+
     addresses: list[Addresse]
     """ Addresses is the list of all node addresses. """
     alibaba_cloud: AlibabaCloud
@@ -3642,6 +4314,11 @@ class CiliumNode(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumNodeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumNodeSpec
     """ Spec defines the desired specification/configuration of the node. """
@@ -3655,6 +4332,11 @@ class CiliumNodeConfigSpec(KubernetesObject):
 
     _required_ = ["defaults", "node_selector"]
 
+    _field_types_ = {
+        "defaults": "raw_dict",
+        "node_selector": ("object", "meta.LabelSelector"),
+    }
+
     defaults: dict[str, str]
     """
     Defaults is treated the same as the cilium-config ConfigMap - a set
@@ -3691,6 +4373,11 @@ class CiliumNodeConfig(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumNodeConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumNodeConfigSpec
     """ Spec is the desired Cilium configuration overrides for a given node """
@@ -3704,6 +4391,11 @@ class Ipv6(KubernetesObject):
 
     _required_ = ["cidrs", "mask_size"]
 
+    _field_types_ = {
+        "cidrs": "raw_list",
+        "mask_size": "scalar",
+    }
+
     cidrs: list[CIDR]
     """ CIDRs is a list of IPv6 CIDRs that are part of the pool. """
     mask_size: int
@@ -3716,6 +4408,11 @@ class Ipv6(KubernetesObject):
 class CiliumPodIPPoolSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ipv4": "scalar",
+        "ipv6": ("object", "Ipv6"),
+    }
+
     ipv4: Ipv4
     """ IPv4 specifies the IPv4 CIDRs and mask sizes of the pool """
     ipv6: Ipv6
@@ -3740,6 +4437,11 @@ class CiliumPodIPPool(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CiliumPodIPPoolSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CiliumPodIPPoolSpec
 
@@ -1,10 +1,23 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import meta
+
+__getattr__ = lazy_modules(globals(), meta="..api")
 
 
 class ProviderSpecific(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     value: str
 
@@ -22,6 +35,16 @@ class Endpoint(KubernetesObject):
         "recordTTL": "record_ttl",
     }
 
+    _field_types_ = {
+        "dns_name": "scalar",
+        "labels": "raw_dict",
+        "provider_specific": ("typed_list", "ProviderSpecific"),
+        "record_ttl": "scalar",
+        "record_type": "scalar",
+        "set_identifier": "scalar",
+        "targets": "raw_list",
+    }
+
     dns_name: str
     labels: dict[str, str]
     provider_specific: list[ProviderSpecific]
@@ -54,6 +77,10 @@ class Endpoint(KubernetesObject):
 class DNSEndpointSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "endpoints": ("typed_list", "Endpoint"),
+    }
+
     endpoints: list[Endpoint]
 
     def __init__(self, endpoints: list[Endpoint] = None):
@@ -68,6 +95,11 @@ class DNSEndpoint(KubernetesApiResource):
     _kind_ = "DNSEndpoint"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "DNSEndpointSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: DNSEndpointSpec
 
@@ -1,5 +1,13 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import meta
+
+__getattr__ = lazy_modules(globals(), meta="..api")
 
 
 class Addresse(KubernetesObject):
@@ -7,6 +15,11 @@ class Addresse(KubernetesObject):
 
     _required_ = ["value"]
 
+    _field_types_ = {
+        "type": "scalar",
+        "value": "scalar",
+    }
+
     type: str
     value: str
 
@@ -19,6 +32,11 @@ class Kind(KubernetesObject):
 
     _required_ = ["kind"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+    }
+
     group: str
     kind: str
 
@@ -33,6 +51,11 @@ class Namespace(KubernetesObject):
         "from": "from_",
     }
 
+    _field_types_ = {
+        "from_": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     from_: str
     selector: meta.LabelSelector
 
@@ -43,6 +66,11 @@ class Namespace(KubernetesObject):
 class AllowedRoute(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "kinds": ("typed_list", "Kind"),
+        "namespaces": ("object", "Namespace"),
+    }
+
     kinds: list[Kind]
     namespaces: Namespace
 
@@ -55,6 +83,13 @@ class CertificateRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -69,6 +104,12 @@ class ExtensionRef(KubernetesObject):
 
     _required_ = ["group", "kind", "name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -82,6 +123,11 @@ class RequestHeader(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     value: str
 
@@ -92,6 +138,12 @@ class RequestHeader(KubernetesObject):
 class RequestHeaderModifier(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "add": ("typed_list", "RequestHeader"),
+        "remove": "raw_list",
+        "set": ("typed_list", "RequestHeader"),
+    }
+
     add: list[RequestHeader]
     remove: list[str]
     set: list[RequestHeader]
@@ -105,6 +157,14 @@ class RequestMirrorBackendRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "port": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -120,6 +180,10 @@ class RequestMirror(KubernetesObject):
 
     _required_ = ["backend_ref"]
 
+    _field_types_ = {
+        "backend_ref": ("object", "RequestMirrorBackendRef"),
+    }
+
     backend_ref: RequestMirrorBackendRef
 
     def __init__(self, backend_ref: RequestMirrorBackendRef = None):
@@ -129,6 +193,13 @@ class RequestMirror(KubernetesObject):
 class RequestRedirect(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "port": "scalar",
+        "scheme": "scalar",
+        "status_code": "scalar",
+    }
+
     hostname: str
     port: int
     scheme: str
@@ -143,6 +214,14 @@ class Filter(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "extension_ref": ("object", "ExtensionRef"),
+        "request_header_modifier": ("object", "RequestHeaderModifier"),
+        "request_mirror": ("object", "RequestMirror"),
+        "request_redirect": ("object", "RequestRedirect"),
+        "type": "scalar",
+    }
+
     extension_ref: ExtensionRef
     request_header_modifier: RequestHeaderModifier
     request_mirror: RequestMirror
@@ -169,6 +248,12 @@ class Filter(KubernetesObject):
 class TLS(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "certificate_refs": ("typed_list", "CertificateRef"),
+        "mode": "scalar",
+        "options": "raw_dict",
+    }
+
     certificate_refs: list[CertificateRef]
     mode: str
     options: dict[str, str]
@@ -182,6 +267,15 @@ class Listener(KubernetesObject):
 
     _required_ = ["name", "port", "protocol"]
 
+    _field_types_ = {
+        "allowed_routes": ("object", "AllowedRoute"),
+        "hostname": "scalar",
+        "name": "scalar",
+        "port": "scalar",
+        "protocol": "scalar",
+        "tls": ("object", "TLS"),
+    }
+
     allowed_routes: AllowedRoute
     hostname: str
     name: str
@@ -206,6 +300,12 @@ class GatewaySpec(KubernetesObject):
 
     _required_ = ["gateway_class_name", "listeners"]
 
+    _field_types_ = {
+        "addresses": ("typed_list", "Addresse"),
+        "gateway_class_name": "scalar",
+        "listeners": ("typed_list", "Listener"),
+    }
+
     addresses: list[Addresse]
     gateway_class_name: str
     listeners: list[Listener]
@@ -224,6 +324,11 @@ class Gateway(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "GatewaySpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: GatewaySpec
 
@@ -236,6 +341,13 @@ class ParametersRef(KubernetesObject):
 
     _required_ = ["group", "kind", "name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -250,6 +362,12 @@ class GatewayClassSpec(KubernetesObject):
 
     _required_ = ["controller_name"]
 
+    _field_types_ = {
+        "controller_name": "scalar",
+        "description": "scalar",
+        "parameters_ref": ("object", "ParametersRef"),
+    }
+
     controller_name: str
     description: str
     parameters_ref: ParametersRef
@@ -268,6 +386,11 @@ class GatewayClass(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "GatewayClassSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: GatewayClassSpec
 
@@ -280,6 +403,14 @@ class ParentRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "section_name": "scalar",
+    }
+
     group: str
     kind: str
     name: str
@@ -295,6 +426,16 @@ class RuleBackendRef(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "filters": ("typed_list", "Filter"),
+        "group": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "port": "scalar",
+        "weight": "scalar",
+    }
+
     filters: list[Filter]
     group: str
     kind: str
@@ -321,6 +462,12 @@ class Header(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "type": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     type: str
     value: str
@@ -332,6 +479,11 @@ class Header(KubernetesObject):
 class Path(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "type": "scalar",
+        "value": "scalar",
+    }
+
     type: str
     value: str
 
@@ -344,6 +496,12 @@ class QueryParam(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "type": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     type: str
     value: str
@@ -355,6 +513,13 @@ class QueryParam(KubernetesObject):
 class Match(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "headers": ("typed_list", "Header"),
+        "method": "scalar",
+        "path": ("object", "Path"),
+        "query_params": ("typed_list", "QueryParam"),
+    }
+
     headers: list[Header]
     method: str
     path: Path
@@ -367,6 +532,12 @@ class Match(KubernetesObject):
 class Rule(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "backend_refs": ("typed_list", "RuleBackendRef"),
+        "filters": ("typed_list", "Filter"),
+        "matches": ("typed_list", "Match"),
+    }
+
     backend_refs: list[RuleBackendRef]
     filters: list[Filter]
     matches: list[Match]
@@ -378,6 +549,12 @@ class Rule(KubernetesObject):
 class HTTPRouteSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "hostnames": "raw_list",
+        "parent_refs": ("typed_list", "ParentRef"),
+        "rules": ("typed_list", "Rule"),
+    }
+
     hostnames: list[str]
     parent_refs: list[ParentRef]
     rules: list[Rule]
@@ -396,6 +573,11 @@ class HTTPRoute(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "HTTPRouteSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: HTTPRouteSpec
 
@@ -1,12 +1,24 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class Authorization2(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "credentials": ("object", "core.ConfigMapKeySelector"),
+        "credentials_file": "scalar",
+        "type": "scalar",
+    }
+
     credentials: core.ConfigMapKeySelector
     credentials_file: str
     type: str
@@ -18,6 +30,11 @@ class Authorization2(KubernetesObject):
 class BasicAuth(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "password": ("object", "core.SecretKeySelector"),
+        "username": ("object", "core.ConfigMapKeySelector"),
+    }
+
     password: core.SecretKeySelector
     username: core.ConfigMapKeySelector
 
@@ -28,6 +45,11 @@ class BasicAuth(KubernetesObject):
 class CA(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -38,6 +60,11 @@ class CA(KubernetesObject):
 class Cert(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -48,6 +75,17 @@ class Cert(KubernetesObject):
 class TLSConfig2(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ca": ("object", "CA"),
+        "ca_file": "scalar",
+        "cert": ("object", "Cert"),
+        "cert_file": "scalar",
+        "insecure_skip_verify": "scalar",
+        "key_file": "scalar",
+        "key_secret": ("object", "core.SecretKeySelector"),
+        "server_name": "scalar",
+    }
+
     ca: CA
     ca_file: str
     cert: Cert
@@ -85,6 +123,15 @@ class APIserverConfig(KubernetesObject):
 
     _required_ = ["host"]
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization2"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token": "scalar",
+        "bearer_token_file": "scalar",
+        "host": "scalar",
+        "tls_config": ("object", "TLSConfig2"),
+    }
+
     authorization: Authorization2
     basic_auth: BasicAuth
     bearer_token: str
@@ -116,6 +163,13 @@ class Confirm(KubernetesObject):
 
     _required_ = ["text"]
 
+    _field_types_ = {
+        "dismiss_text": "scalar",
+        "ok_text": "scalar",
+        "text": "scalar",
+        "title": "scalar",
+    }
+
     dismiss_text: str
     ok_text: str
     text: str
@@ -130,6 +184,16 @@ class Action(KubernetesObject):
 
     _required_ = ["text", "type"]
 
+    _field_types_ = {
+        "confirm": ("object", "Confirm"),
+        "name": "scalar",
+        "style": "scalar",
+        "text": "scalar",
+        "type": "scalar",
+        "url": "scalar",
+        "value": "scalar",
+    }
+
     confirm: Confirm
     name: str
     style: str
@@ -156,6 +220,11 @@ class AdditionalArg(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     value: str
 
@@ -166,6 +235,12 @@ class AdditionalArg(KubernetesObject):
 class Alert(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "for_grace_period": "scalar",
+        "for_outage_tolerance": "scalar",
+        "resend_delay": "scalar",
+    }
+
     for_grace_period: str
     for_outage_tolerance: str
     resend_delay: str
@@ -177,6 +252,11 @@ class Alert(KubernetesObject):
 class Authorization(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "credentials": ("object", "core.ConfigMapKeySelector"),
+        "type": "scalar",
+    }
+
     credentials: core.ConfigMapKeySelector
     type: str
 
@@ -189,6 +269,21 @@ class AlertingAlertmanager(KubernetesObject):
 
     _required_ = ["name", "namespace", "port"]
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_file": "scalar",
+        "enable_http2": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "path_prefix": "scalar",
+        "port": "union",
+        "scheme": "scalar",
+        "timeout": "scalar",
+        "tls_config": ("object", "TLSConfig2"),
+    }
+
     api_version: str
     authorization: Authorization
     basic_auth: BasicAuth
@@ -238,6 +333,10 @@ class Alerting(KubernetesObject):
 
     _required_ = ["alertmanagers"]
 
+    _field_types_ = {
+        "alertmanagers": ("typed_list", "AlertingAlertmanager"),
+    }
+
     alertmanagers: list[AlertingAlertmanager]
 
     def __init__(self, alertmanagers: list[AlertingAlertmanager] = None):
@@ -247,6 +346,10 @@ class Alerting(KubernetesObject):
 class AlertmanagerConfigMatcherStrategy(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "type": "scalar",
+    }
+
     type: str
 
     def __init__(self, type: str = None):
@@ -256,6 +359,11 @@ class AlertmanagerConfigMatcherStrategy(KubernetesObject):
 class ClientId(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -268,6 +376,14 @@ class Oauth2(KubernetesObject):
 
     _required_ = ["client_id", "client_secret", "token_url"]
 
+    _field_types_ = {
+        "client_id": ("object", "ClientId"),
+        "client_secret": ("object", "core.ConfigMapKeySelector"),
+        "endpoint_params": "raw_dict",
+        "scopes": "raw_list",
+        "token_url": "scalar",
+    }
+
     client_id: ClientId
     client_secret: core.ConfigMapKeySelector
     endpoint_params: dict[str, str]
@@ -290,6 +406,14 @@ class Oauth2(KubernetesObject):
 class TLSConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ca": ("object", "CA"),
+        "cert": ("object", "Cert"),
+        "insecure_skip_verify": "scalar",
+        "key_secret": ("object", "core.SecretKeySelector"),
+        "server_name": "scalar",
+    }
+
     ca: CA
     cert: Cert
     insecure_skip_verify: bool
@@ -317,6 +441,16 @@ class HttpConfig(KubernetesObject):
         "proxyURL": "proxy_url",
     }
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "follow_redirects": "scalar",
+        "oauth2": ("object", "Oauth2"),
+        "proxy_url": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     bearer_token_secret: core.ConfigMapKeySelector
@@ -349,6 +483,15 @@ class HttpConfig(KubernetesObject):
 class Global(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "http_config": ("object", "HttpConfig"),
+        "ops_genie_api_key": ("object", "core.ConfigMapKeySelector"),
+        "ops_genie_api_url": ("object", "core.ConfigMapKeySelector"),
+        "pagerduty_url": "scalar",
+        "resolve_timeout": "scalar",
+        "slack_api_url": ("object", "core.ConfigMapKeySelector"),
+    }
+
     http_config: HttpConfig
     ops_genie_api_key: core.ConfigMapKeySelector
     ops_genie_api_url: core.ConfigMapKeySelector
@@ -378,6 +521,11 @@ class Global(KubernetesObject):
 class Template(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -392,6 +540,12 @@ class AlertmanagerConfiguration(KubernetesObject):
         "global": "global_",
     }
 
+    _field_types_ = {
+        "global_": ("object", "Global"),
+        "name": "scalar",
+        "templates": ("typed_list", "Template"),
+    }
+
     global_: Global
     name: str
     templates: list[Template]
@@ -405,6 +559,11 @@ class HostAliase(KubernetesObject):
 
     _required_ = ["hostnames", "ip"]
 
+    _field_types_ = {
+        "hostnames": "raw_list",
+        "ip": "scalar",
+    }
+
     hostnames: list[str]
     ip: str
 
@@ -415,6 +574,12 @@ class HostAliase(KubernetesObject):
 class PodMetadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "name": "scalar",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
     name: str
@@ -426,6 +591,13 @@ class PodMetadata(KubernetesObject):
 class Storage(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disable_mount_sub_path": "scalar",
+        "empty_dir": ("object", "core.EmptyDirVolumeSource"),
+        "ephemeral": ("object", "core.EphemeralVolumeSource"),
+        "volume_claim_template": ("object", "core.PersistentVolumeClaim"),
+    }
+
     disable_mount_sub_path: bool
     empty_dir: core.EmptyDirVolumeSource
     ephemeral: core.EphemeralVolumeSource
@@ -456,6 +628,14 @@ class HttpConfigHeader(KubernetesObject):
         "xXSSProtection": "x_xss_protection",
     }
 
+    _field_types_ = {
+        "content_security_policy": "scalar",
+        "strict_transport_security": "scalar",
+        "x_content_type_options": "scalar",
+        "x_frame_options": "scalar",
+        "x_xss_protection": "scalar",
+    }
+
     content_security_policy: str
     strict_transport_security: str
     x_content_type_options: str
@@ -482,6 +662,11 @@ class HttpConfigHeader(KubernetesObject):
 class WEBHttpConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "headers": ("object", "HttpConfigHeader"),
+        "http2": "scalar",
+    }
+
     headers: HttpConfigHeader
     http2: bool
 
@@ -498,6 +683,18 @@ class WEBTLSConfig(KubernetesObject):
         "client_ca": "client_ca",
     }
 
+    _field_types_ = {
+        "cert": ("object", "Cert"),
+        "cipher_suites": "raw_list",
+        "client_auth_type": "scalar",
+        "client_ca": ("object", "CA"),
+        "curve_preferences": "raw_list",
+        "key_secret": ("object", "core.SecretKeySelector"),
+        "max_version": "scalar",
+        "min_version": "scalar",
+        "prefer_server_cipher_suites": "scalar",
+    }
+
     cert: Cert
     cipher_suites: list[str]
     client_auth_type: str
@@ -536,6 +733,13 @@ class WEBTLSConfig(KubernetesObject):
 class AlertmanagerSpecWEB(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "get_concurrency": "scalar",
+        "http_config": ("object", "WEBHttpConfig"),
+        "timeout": "scalar",
+        "tls_config": ("object", "WEBTLSConfig"),
+    }
+
     get_concurrency: int
     http_config: WEBHttpConfig
     timeout: int
@@ -550,6 +754,56 @@ class AlertmanagerSpecWEB(KubernetesObject):
 class AlertmanagerSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_peers": "raw_list",
+        "affinity": ("object", "core.Affinity"),
+        "alertmanager_config_matcher_strategy": ("object", "AlertmanagerConfigMatcherStrategy"),
+        "alertmanager_config_namespace_selector": ("object", "meta.LabelSelector"),
+        "alertmanager_config_selector": ("object", "meta.LabelSelector"),
+        "alertmanager_configuration": ("object", "AlertmanagerConfiguration"),
+        "automount_service_account_token": "scalar",
+        "base_image": "scalar",
+        "cluster_advertise_address": "scalar",
+        "cluster_gossip_interval": "scalar",
+        "cluster_peer_timeout": "scalar",
+        "cluster_pushpull_interval": "scalar",
+        "config_maps": "raw_list",
+        "config_secret": "scalar",
+        "containers": ("typed_list", "core.Container"),
+        "external_url": "scalar",
+        "force_enable_cluster_mode": "scalar",
+        "host_aliases": ("typed_list", "HostAliase"),
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "listen_local": "scalar",
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "min_ready_seconds": "scalar",
+        "node_selector": "raw_dict",
+        "paused": "scalar",
+        "pod_metadata": ("object", "PodMetadata"),
+        "port_name": "scalar",
+        "priority_class_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "retention": "scalar",
+        "route_prefix": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "sha": "scalar",
+        "storage": ("object", "Storage"),
+        "tag": "scalar",
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "version": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+        "web": ("object", "AlertmanagerSpecWEB"),
+    }
+
     additional_peers: list[str]
     affinity: core.Affinity
     alertmanager_config_matcher_strategy: AlertmanagerConfigMatcherStrategy
@@ -709,6 +963,11 @@ class Alertmanager(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "AlertmanagerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: AlertmanagerSpec
 
@@ -721,6 +980,13 @@ class SourceMatch(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "match_type": "scalar",
+        "name": "scalar",
+        "regex": "scalar",
+        "value": "scalar",
+    }
+
     match_type: str
     name: str
     regex: bool
@@ -735,6 +1001,13 @@ class TargetMatch(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "match_type": "scalar",
+        "name": "scalar",
+        "regex": "scalar",
+        "value": "scalar",
+    }
+
     match_type: str
     name: str
     regex: bool
@@ -747,6 +1020,12 @@ class TargetMatch(KubernetesObject):
 class InhibitRule(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "equal": "raw_list",
+        "source_match": ("typed_list", "SourceMatch"),
+        "target_match": ("typed_list", "TargetMatch"),
+    }
+
     equal: list[str]
     source_match: list[SourceMatch]
     target_match: list[TargetMatch]
@@ -758,6 +1037,11 @@ class InhibitRule(KubernetesObject):
 class DaysOfMonth(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "end": "scalar",
+        "start": "scalar",
+    }
+
     end: int
     start: int
 
@@ -768,6 +1052,11 @@ class DaysOfMonth(KubernetesObject):
 class Time(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "end_time": "scalar",
+        "start_time": "scalar",
+    }
+
     end_time: str
     start_time: str
 
@@ -778,6 +1067,14 @@ class Time(KubernetesObject):
 class TimeInterval(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "days_of_month": ("typed_list", "DaysOfMonth"),
+        "months": "raw_list",
+        "times": ("typed_list", "Time"),
+        "weekdays": "raw_list",
+        "years": "raw_list",
+    }
+
     days_of_month: list[DaysOfMonth]
     months: list[str]
     times: list[Time]
@@ -798,6 +1095,11 @@ class TimeInterval(KubernetesObject):
 class MuteTimeInterval(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "name": "scalar",
+        "time_intervals": ("typed_list", "TimeInterval"),
+    }
+
     name: str
     time_intervals: list[TimeInterval]
 
@@ -810,6 +1112,11 @@ class EmailConfigHeader(KubernetesObject):
 
     _required_ = ["key", "value"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "value": "scalar",
+    }
+
     key: str
     value: str
 
@@ -828,6 +1135,23 @@ class EmailConfig(KubernetesObject):
         "requireTLS": "require_tls",
     }
 
+    _field_types_ = {
+        "auth_identity": "scalar",
+        "auth_password": ("object", "core.ConfigMapKeySelector"),
+        "auth_secret": ("object", "core.ConfigMapKeySelector"),
+        "auth_username": "scalar",
+        "from_": "scalar",
+        "headers": ("typed_list", "EmailConfigHeader"),
+        "hello": "scalar",
+        "html": "scalar",
+        "require_tls": "scalar",
+        "send_resolved": "scalar",
+        "smarthost": "scalar",
+        "text": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+        "to": "scalar",
+    }
+
     auth_identity: str
     auth_password: core.ConfigMapKeySelector
     auth_secret: core.ConfigMapKeySelector
@@ -883,6 +1207,11 @@ class Detail(KubernetesObject):
 
     _required_ = ["key", "value"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "value": "scalar",
+    }
+
     key: str
     value: str
 
@@ -895,6 +1224,13 @@ class Responder(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "id": "scalar",
+        "name": "scalar",
+        "type": "scalar",
+        "username": "scalar",
+    }
+
     id: str
     name: str
     type: str
@@ -914,6 +1250,24 @@ class OpsgenieConfig(KubernetesObject):
         "apiURL": "api_url",
     }
 
+    _field_types_ = {
+        "actions": "scalar",
+        "api_key": ("object", "core.ConfigMapKeySelector"),
+        "api_url": "scalar",
+        "description": "scalar",
+        "details": ("typed_list", "Detail"),
+        "entity": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "message": "scalar",
+        "note": "scalar",
+        "priority": "scalar",
+        "responders": ("typed_list", "Responder"),
+        "send_resolved": "scalar",
+        "source": "scalar",
+        "tags": "scalar",
+        "update_alerts": "scalar",
+    }
+
     actions: str
     api_key: core.ConfigMapKeySelector
     api_url: str
@@ -970,6 +1324,12 @@ class OpsgenieConfig(KubernetesObject):
 class PagerDutyImageConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "alt": "scalar",
+        "href": "scalar",
+        "src": "scalar",
+    }
+
     alt: str
     href: str
     src: str
@@ -981,6 +1341,11 @@ class PagerDutyImageConfig(KubernetesObject):
 class PagerDutyLinkConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "alt": "scalar",
+        "href": "scalar",
+    }
+
     alt: str
     href: str
 
@@ -999,6 +1364,24 @@ class PagerdutyConfig(KubernetesObject):
         "clientURL": "client_url",
     }
 
+    _field_types_ = {
+        "class_": "scalar",
+        "client": "scalar",
+        "client_url": "scalar",
+        "component": "scalar",
+        "description": "scalar",
+        "details": ("typed_list", "Detail"),
+        "group": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "pager_duty_image_configs": ("typed_list", "PagerDutyImageConfig"),
+        "pager_duty_link_configs": ("typed_list", "PagerDutyLinkConfig"),
+        "routing_key": ("object", "core.ConfigMapKeySelector"),
+        "send_resolved": "scalar",
+        "service_key": ("object", "core.ConfigMapKeySelector"),
+        "severity": "scalar",
+        "url": "scalar",
+    }
+
     class_: str
     client: str
     client_url: str
@@ -1055,6 +1438,22 @@ class PagerdutyConfig(KubernetesObject):
 class PushoverConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "expire": "scalar",
+        "html": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "message": "scalar",
+        "priority": "scalar",
+        "retry": "scalar",
+        "send_resolved": "scalar",
+        "sound": "scalar",
+        "title": "scalar",
+        "token": ("object", "core.ConfigMapKeySelector"),
+        "url": "scalar",
+        "url_title": "scalar",
+        "user_key": ("object", "core.ConfigMapKeySelector"),
+    }
+
     expire: str
     html: bool
     http_config: HttpConfig
@@ -1107,6 +1506,12 @@ class Field(KubernetesObject):
 
     _required_ = ["title", "value"]
 
+    _field_types_ = {
+        "short": "scalar",
+        "title": "scalar",
+        "value": "scalar",
+    }
+
     short: bool
     title: str
     value: str
@@ -1131,6 +1536,31 @@ class SlackConfig(KubernetesObject):
         "thumbURL": "thumb_url",
     }
 
+    _field_types_ = {
+        "actions": ("typed_list", "Action"),
+        "api_url": ("object", "core.ConfigMapKeySelector"),
+        "callback_id": "scalar",
+        "channel": "scalar",
+        "color": "scalar",
+        "fallback": "scalar",
+        "fields": ("typed_list", "Field"),
+        "footer": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "icon_emoji": "scalar",
+        "icon_url": "scalar",
+        "image_url": "scalar",
+        "link_names": "scalar",
+        "mrkdwn_in": "raw_list",
+        "pretext": "scalar",
+        "send_resolved": "scalar",
+        "short_fields": "scalar",
+        "text": "scalar",
+        "thumb_url": "scalar",
+        "title": "scalar",
+        "title_link": "scalar",
+        "username": "scalar",
+    }
+
     actions: list[Action]
     api_url: core.ConfigMapKeySelector
     callback_id: str
@@ -1208,6 +1638,14 @@ class SlackConfig(KubernetesObject):
 class Sigv4(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "access_key": ("object", "core.ConfigMapKeySelector"),
+        "profile": "scalar",
+        "region": "scalar",
+        "role_arn": "scalar",
+        "secret_key": ("object", "core.SecretKeySelector"),
+    }
+
     access_key: core.ConfigMapKeySelector
     profile: str
     region: str
@@ -1239,6 +1677,19 @@ class SnsConfig(KubernetesObject):
         "topicARN": "topic_arn",
     }
 
+    _field_types_ = {
+        "api_url": "scalar",
+        "attributes": "raw_dict",
+        "http_config": ("object", "HttpConfig"),
+        "message": "scalar",
+        "phone_number": "scalar",
+        "send_resolved": "scalar",
+        "sigv4": ("object", "Sigv4"),
+        "subject": "scalar",
+        "target_arn": "scalar",
+        "topic_arn": "scalar",
+    }
+
     api_url: str
     attributes: dict[str, str]
     http_config: HttpConfig
@@ -1289,6 +1740,17 @@ class TelegramConfig(KubernetesObject):
         "chatID": "chat_id",
     }
 
+    _field_types_ = {
+        "api_url": "scalar",
+        "bot_token": ("object", "core.ConfigMapKeySelector"),
+        "chat_id": "scalar",
+        "disable_notifications": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "message": "scalar",
+        "parse_mode": "scalar",
+        "send_resolved": "scalar",
+    }
+
     api_url: str
     bot_token: core.ConfigMapKeySelector
     chat_id: int
@@ -1326,6 +1788,11 @@ class CustomField(KubernetesObject):
 
     _required_ = ["key", "value"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "value": "scalar",
+    }
+
     key: str
     value: str
 
@@ -1336,6 +1803,19 @@ class CustomField(KubernetesObject):
 class VictoropsConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "api_key": ("object", "core.ConfigMapKeySelector"),
+        "api_url": "scalar",
+        "custom_fields": ("typed_list", "CustomField"),
+        "entity_display_name": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "message_type": "scalar",
+        "monitoring_tool": "scalar",
+        "routing_key": "scalar",
+        "send_resolved": "scalar",
+        "state_message": "scalar",
+    }
+
     api_key: core.ConfigMapKeySelector
     api_url: str
     custom_fields: list[CustomField]
@@ -1377,6 +1857,14 @@ class VictoropsConfig(KubernetesObject):
 class WebhookConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "http_config": ("object", "HttpConfig"),
+        "max_alerts": "scalar",
+        "send_resolved": "scalar",
+        "url": "scalar",
+        "url_secret": ("object", "core.ConfigMapKeySelector"),
+    }
+
     http_config: HttpConfig
     max_alerts: int
     send_resolved: bool
@@ -1408,6 +1896,20 @@ class WechatConfig(KubernetesObject):
         "corpID": "corp_id",
     }
 
+    _field_types_ = {
+        "agent_id": "scalar",
+        "api_secret": ("object", "core.ConfigMapKeySelector"),
+        "api_url": "scalar",
+        "corp_id": "scalar",
+        "http_config": ("object", "HttpConfig"),
+        "message": "scalar",
+        "message_type": "scalar",
+        "send_resolved": "scalar",
+        "to_party": "scalar",
+        "to_tag": "scalar",
+        "to_user": "scalar",
+    }
+
     agent_id: str
     api_secret: core.ConfigMapKeySelector
     api_url: str
@@ -1454,6 +1956,20 @@ class Receiver(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "email_configs": ("typed_list", "EmailConfig"),
+        "name": "scalar",
+        "opsgenie_configs": ("typed_list", "OpsgenieConfig"),
+        "pagerduty_configs": ("typed_list", "PagerdutyConfig"),
+        "pushover_configs": ("typed_list", "PushoverConfig"),
+        "slack_configs": ("typed_list", "SlackConfig"),
+        "sns_configs": ("typed_list", "SnsConfig"),
+        "telegram_configs": ("typed_list", "TelegramConfig"),
+        "victorops_configs": ("typed_list", "VictoropsConfig"),
+        "webhook_configs": ("typed_list", "WebhookConfig"),
+        "wechat_configs": ("typed_list", "WechatConfig"),
+    }
+
     email_configs: list[EmailConfig]
     name: str
     opsgenie_configs: list[OpsgenieConfig]
@@ -1500,6 +2016,13 @@ class Matcher(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "match_type": "scalar",
+        "name": "scalar",
+        "regex": "scalar",
+        "value": "scalar",
+    }
+
     match_type: str
     name: str
     regex: bool
@@ -1516,6 +2039,19 @@ class Route(KubernetesObject):
         "continue": "continue_",
     }
 
+    _field_types_ = {
+        "active_time_intervals": "raw_list",
+        "continue_": "scalar",
+        "group_by": "raw_list",
+        "group_interval": "scalar",
+        "group_wait": "scalar",
+        "matchers": ("typed_list", "Matcher"),
+        "mute_time_intervals": "raw_list",
+        "receiver": "scalar",
+        "repeat_interval": "scalar",
+        "routes": "raw_list",
+    }
+
     active_time_intervals: list[str]
     continue_: bool
     group_by: list[str]
@@ -1557,6 +2093,13 @@ class Route(KubernetesObject):
 class AlertmanagerConfigSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "inhibit_rules": ("typed_list", "InhibitRule"),
+        "mute_time_intervals": ("typed_list", "MuteTimeInterval"),
+        "receivers": ("typed_list", "Receiver"),
+        "route": ("object", "Route"),
+    }
+
     inhibit_rules: list[InhibitRule]
     mute_time_intervals: list[MuteTimeInterval]
     receivers: list[Receiver]
@@ -1582,6 +2125,11 @@ class AlertmanagerConfig(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "AlertmanagerConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: AlertmanagerConfigSpec
 
@@ -1592,6 +2140,10 @@ class AlertmanagerConfig(KubernetesApiResource):
 class ArbitraryFSAccessThroughSM(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "deny": "scalar",
+    }
+
     deny: bool
 
     def __init__(self, deny: bool = None):
@@ -1601,6 +2153,10 @@ class ArbitraryFSAccessThroughSM(KubernetesObject):
 class AttachMetadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "node": "scalar",
+    }
+
     node: bool
 
     def __init__(self, node: bool = None):
@@ -1610,6 +2166,16 @@ class AttachMetadata(KubernetesObject):
 class MetricRelabeling(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "action": "scalar",
+        "modulus": "scalar",
+        "regex": "scalar",
+        "replacement": "scalar",
+        "separator": "scalar",
+        "source_labels": "raw_list",
+        "target_label": "scalar",
+    }
+
     action: str
     modulus: int
     regex: str
@@ -1642,6 +2208,16 @@ class MetricRelabeling(KubernetesObject):
 class Relabeling(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "action": "scalar",
+        "modulus": "scalar",
+        "regex": "scalar",
+        "replacement": "scalar",
+        "separator": "scalar",
+        "source_labels": "raw_list",
+        "target_label": "scalar",
+    }
+
     action: str
     modulus: int
     regex: str
@@ -1674,6 +2250,30 @@ class Relabeling(KubernetesObject):
 class Endpoint(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_file": "scalar",
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "enable_http2": "scalar",
+        "filter_running": "scalar",
+        "follow_redirects": "scalar",
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "interval": "scalar",
+        "metric_relabelings": ("typed_list", "MetricRelabeling"),
+        "oauth2": ("object", "Oauth2"),
+        "params": "raw_dict",
+        "path": "scalar",
+        "port": "scalar",
+        "proxy_url": "scalar",
+        "relabelings": ("typed_list", "Relabeling"),
+        "scheme": "scalar",
+        "scrape_timeout": "scalar",
+        "target_port": "union",
+        "tls_config": ("object", "TLSConfig2"),
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     bearer_token_file: str
@@ -1750,6 +2350,13 @@ class ExcludedFromEnforcement(KubernetesObject):
 
     _required_ = ["namespace", "resource"]
 
+    _field_types_ = {
+        "group": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource": "scalar",
+    }
+
     group: str
     name: str
     namespace: str
@@ -1762,6 +2369,10 @@ class ExcludedFromEnforcement(KubernetesObject):
 class Exemplar(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "max_size": "scalar",
+    }
+
     max_size: int
 
     def __init__(self, max_size: int = None):
@@ -1773,6 +2384,11 @@ class FileSDConfig(KubernetesObject):
 
     _required_ = ["files"]
 
+    _field_types_ = {
+        "files": "raw_list",
+        "refresh_interval": "scalar",
+    }
+
     files: list[str]
     refresh_interval: str
 
@@ -1792,6 +2408,16 @@ class GroupRule(KubernetesObject):
         "for": "for_",
     }
 
+    _field_types_ = {
+        "alert": "scalar",
+        "annotations": "raw_dict",
+        "expr": "union",
+        "for_": "scalar",
+        "keep_firing_for": "scalar",
+        "labels": "raw_dict",
+        "record": "scalar",
+    }
+
     alert: str
     annotations: dict[str, str]
     expr: core.IntOrString
@@ -1824,6 +2450,14 @@ class Group(KubernetesObject):
         "partial_response_strategy": "partial_response_strategy",
     }
 
+    _field_types_ = {
+        "interval": "scalar",
+        "limit": "scalar",
+        "name": "scalar",
+        "partial_response_strategy": "scalar",
+        "rules": ("typed_list", "GroupRule"),
+    }
+
     interval: str
     limit: int
     name: str
@@ -1844,6 +2478,17 @@ class Group(KubernetesObject):
 class GrpcServerTlsConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ca": ("object", "CA"),
+        "ca_file": "scalar",
+        "cert": ("object", "Cert"),
+        "cert_file": "scalar",
+        "insecure_skip_verify": "scalar",
+        "key_file": "scalar",
+        "key_secret": ("object", "core.SecretKeySelector"),
+        "server_name": "scalar",
+    }
+
     ca: CA
     ca_file: str
     cert: Cert
@@ -1881,6 +2526,13 @@ class HttpSDConfig(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "refresh_interval": "scalar",
+        "url": "scalar",
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     refresh_interval: str
@@ -1893,6 +2545,11 @@ class HttpSDConfig(KubernetesObject):
 class NamespaceSelector(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "any": "scalar",
+        "match_names": "raw_list",
+    }
+
     any: bool
     match_names: list[str]
 
@@ -1903,6 +2560,16 @@ class NamespaceSelector(KubernetesObject):
 class RelabelingConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "action": "scalar",
+        "modulus": "scalar",
+        "regex": "scalar",
+        "replacement": "scalar",
+        "separator": "scalar",
+        "source_labels": "raw_list",
+        "target_label": "scalar",
+    }
+
     action: str
     modulus: int
     regex: str
@@ -1935,6 +2602,12 @@ class RelabelingConfig(KubernetesObject):
 class Ingress(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "relabeling_configs": ("typed_list", "RelabelingConfig"),
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     namespace_selector: NamespaceSelector
     relabeling_configs: list[RelabelingConfig]
     selector: meta.LabelSelector
@@ -1951,6 +2624,11 @@ class Ingress(KubernetesObject):
 class MetadataConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "send": "scalar",
+        "send_interval": "scalar",
+    }
+
     send: bool
     send_interval: str
 
@@ -1961,6 +2639,29 @@ class MetadataConfig(KubernetesObject):
 class PodMetricsEndpoint(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "enable_http2": "scalar",
+        "filter_running": "scalar",
+        "follow_redirects": "scalar",
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "interval": "scalar",
+        "metric_relabelings": ("typed_list", "MetricRelabeling"),
+        "oauth2": ("object", "Oauth2"),
+        "params": "raw_dict",
+        "path": "scalar",
+        "port": "scalar",
+        "proxy_url": "scalar",
+        "relabelings": ("typed_list", "Relabeling"),
+        "scheme": "scalar",
+        "scrape_timeout": "scalar",
+        "target_port": "union",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     bearer_token_secret: core.ConfigMapKeySelector
@@ -2034,6 +2735,20 @@ class PodMonitorSpec(KubernetesObject):
 
     _required_ = ["pod_metrics_endpoints", "selector"]
 
+    _field_types_ = {
+        "attach_metadata": ("object", "AttachMetadata"),
+        "job_label": "scalar",
+        "label_limit": "scalar",
+        "label_name_length_limit": "scalar",
+        "label_value_length_limit": "scalar",
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "pod_metrics_endpoints": ("typed_list", "PodMetricsEndpoint"),
+        "pod_target_labels": "raw_list",
+        "sample_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "target_limit": "scalar",
+    }
+
     attach_metadata: AttachMetadata
     job_label: str
     label_limit: int
@@ -2085,6 +2800,11 @@ class PodMonitor(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PodMonitorSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PodMonitorSpec
 
@@ -2097,6 +2817,13 @@ class Prober(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "path": "scalar",
+        "proxy_url": "scalar",
+        "scheme": "scalar",
+        "url": "scalar",
+    }
+
     path: str
     proxy_url: str
     scheme: str
@@ -2109,6 +2836,12 @@ class Prober(KubernetesObject):
 class TargetStaticConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "labels": "raw_dict",
+        "relabeling_configs": ("typed_list", "RelabelingConfig"),
+        "static": "raw_list",
+    }
+
     labels: dict[str, str]
     relabeling_configs: list[RelabelingConfig]
     static: list[str]
@@ -2120,6 +2853,11 @@ class TargetStaticConfig(KubernetesObject):
 class Target(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ingress": ("object", "Ingress"),
+        "static_config": ("object", "TargetStaticConfig"),
+    }
+
     ingress: Ingress
     static_config: TargetStaticConfig
 
@@ -2130,6 +2868,26 @@ class Target(KubernetesObject):
 class ProbeSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "interval": "scalar",
+        "job_name": "scalar",
+        "label_limit": "scalar",
+        "label_name_length_limit": "scalar",
+        "label_value_length_limit": "scalar",
+        "metric_relabelings": ("typed_list", "MetricRelabeling"),
+        "module": "scalar",
+        "oauth2": ("object", "Oauth2"),
+        "prober": ("object", "Prober"),
+        "sample_limit": "scalar",
+        "scrape_timeout": "scalar",
+        "target_limit": "scalar",
+        "targets": ("object", "Target"),
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     bearer_token_secret: core.ConfigMapKeySelector
@@ -2199,6 +2957,11 @@ class Probe(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ProbeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ProbeSpec
 
@@ -2211,6 +2974,11 @@ class PrometheusRulesExcludedFromEnforce(KubernetesObject):
 
     _required_ = ["rule_name", "rule_namespace"]
 
+    _field_types_ = {
+        "rule_name": "scalar",
+        "rule_namespace": "scalar",
+    }
+
     rule_name: str
     rule_namespace: str
 
@@ -2221,6 +2989,13 @@ class PrometheusRulesExcludedFromEnforce(KubernetesObject):
 class Query(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "lookback_delta": "scalar",
+        "max_concurrency": "scalar",
+        "max_samples": "scalar",
+        "timeout": "scalar",
+    }
+
     lookback_delta: str
     max_concurrency: int
     max_samples: int
@@ -2235,6 +3010,24 @@ class RemoteRead(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization2"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token": "scalar",
+        "bearer_token_file": "scalar",
+        "filter_external_labels": "scalar",
+        "follow_redirects": "scalar",
+        "headers": "raw_dict",
+        "name": "scalar",
+        "oauth2": ("object", "Oauth2"),
+        "proxy_url": "scalar",
+        "read_recent": "scalar",
+        "remote_timeout": "scalar",
+        "required_matchers": "raw_dict",
+        "tls_config": ("object", "TLSConfig2"),
+        "url": "scalar",
+    }
+
     authorization: Authorization2
     basic_auth: BasicAuth
     bearer_token: str
@@ -2291,6 +3084,18 @@ class RemoteRead(KubernetesObject):
 class QueueConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "batch_send_deadline": "scalar",
+        "capacity": "scalar",
+        "max_backoff": "scalar",
+        "max_retries": "scalar",
+        "max_samples_per_send": "scalar",
+        "max_shards": "scalar",
+        "min_backoff": "scalar",
+        "min_shards": "scalar",
+        "retry_on_rate_limit": "scalar",
+    }
+
     batch_send_deadline: str
     capacity: int
     max_backoff: str
@@ -2329,6 +3134,16 @@ class QueueConfig(KubernetesObject):
 class WriteRelabelConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "action": "scalar",
+        "modulus": "scalar",
+        "regex": "scalar",
+        "replacement": "scalar",
+        "separator": "scalar",
+        "source_labels": "raw_list",
+        "target_label": "scalar",
+    }
+
     action: str
     modulus: int
     regex: str
@@ -2363,6 +3178,26 @@ class RemoteWrite(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization2"),
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token": "scalar",
+        "bearer_token_file": "scalar",
+        "headers": "raw_dict",
+        "metadata_config": ("object", "MetadataConfig"),
+        "name": "scalar",
+        "oauth2": ("object", "Oauth2"),
+        "proxy_url": "scalar",
+        "queue_config": ("object", "QueueConfig"),
+        "remote_timeout": "scalar",
+        "send_exemplars": "scalar",
+        "send_native_histograms": "scalar",
+        "sigv4": ("object", "Sigv4"),
+        "tls_config": ("object", "TLSConfig2"),
+        "url": "scalar",
+        "write_relabel_configs": ("typed_list", "WriteRelabelConfig"),
+    }
+
     authorization: Authorization2
     basic_auth: BasicAuth
     bearer_token: str
@@ -2425,6 +3260,10 @@ class RemoteWrite(KubernetesObject):
 class PrometheusSpecRule(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "alert": ("object", "Alert"),
+    }
+
     alert: Alert
 
     def __init__(self, alert: Alert = None):
@@ -2436,6 +3275,15 @@ class VolumeMount(KubernetesObject):
 
     _required_ = ["mount_path", "name"]
 
+    _field_types_ = {
+        "mount_path": "scalar",
+        "mount_propagation": "scalar",
+        "name": "scalar",
+        "read_only": "scalar",
+        "sub_path": "scalar",
+        "sub_path_expr": "scalar",
+    }
+
     mount_path: str
     mount_propagation: str
     name: str
@@ -2465,6 +3313,32 @@ class VolumeMount(KubernetesObject):
 class Thano(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_args": ("typed_list", "AdditionalArg"),
+        "base_image": "scalar",
+        "block_size": "scalar",
+        "get_config_interval": "scalar",
+        "get_config_timeout": "scalar",
+        "grpc_listen_local": "scalar",
+        "grpc_server_tls_config": ("object", "GrpcServerTlsConfig"),
+        "http_listen_local": "scalar",
+        "image": "scalar",
+        "listen_local": "scalar",
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "min_time": "scalar",
+        "object_storage_config": ("object", "core.ConfigMapKeySelector"),
+        "object_storage_config_file": "scalar",
+        "ready_timeout": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "sha": "scalar",
+        "tag": "scalar",
+        "tracing_config": ("object", "core.ConfigMapKeySelector"),
+        "tracing_config_file": "scalar",
+        "version": "scalar",
+        "volume_mounts": ("typed_list", "VolumeMount"),
+    }
+
     additional_args: list[AdditionalArg]
     base_image: str
     block_size: str
@@ -2547,6 +3421,17 @@ class TracingConfig(KubernetesObject):
 
     _required_ = ["endpoint"]
 
+    _field_types_ = {
+        "client_type": "scalar",
+        "compression": "scalar",
+        "endpoint": "scalar",
+        "headers": "raw_dict",
+        "insecure": "scalar",
+        "sampling_fraction": "union",
+        "timeout": "scalar",
+        "tls_config": ("object", "TLSConfig2"),
+    }
+
     client_type: str
     compression: str
     endpoint: str
@@ -2582,6 +3467,10 @@ class TracingConfig(KubernetesObject):
 class Tsdb(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "out_of_order_time_window": "scalar",
+    }
+
     out_of_order_time_window: str
 
     def __init__(self, out_of_order_time_window: str = None):
@@ -2591,6 +3480,13 @@ class Tsdb(KubernetesObject):
 class WEB(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "http_config": ("object", "WEBHttpConfig"),
+        "max_connections": "scalar",
+        "page_title": "scalar",
+        "tls_config": ("object", "WEBTLSConfig"),
+    }
+
     http_config: WEBHttpConfig
     max_connections: int
     page_title: str
@@ -2614,6 +3510,98 @@ class PrometheusSpec(KubernetesObject):
         "enableAdminAPI": "enable_admin_api",
     }
 
+    _field_types_ = {
+        "additional_alert_manager_configs": ("object", "core.ConfigMapKeySelector"),
+        "additional_alert_relabel_configs": ("object", "core.ConfigMapKeySelector"),
+        "additional_args": ("typed_list", "AdditionalArg"),
+        "additional_scrape_configs": ("object", "core.ConfigMapKeySelector"),
+        "affinity": ("object", "core.Affinity"),
+        "alerting": ("object", "Alerting"),
+        "allow_overlapping_blocks": "scalar",
+        "apiserver_config": ("object", "APIserverConfig"),
+        "arbitrary_fs_access_through_sms": ("object", "ArbitraryFSAccessThroughSM"),
+        "base_image": "scalar",
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "disable_compaction": "scalar",
+        "enable_admin_api": "scalar",
+        "enable_features": "raw_list",
+        "enable_remote_write_receiver": "scalar",
+        "enforced_body_size_limit": "scalar",
+        "enforced_label_limit": "scalar",
+        "enforced_label_name_length_limit": "scalar",
+        "enforced_label_value_length_limit": "scalar",
+        "enforced_namespace_label": "scalar",
+        "enforced_sample_limit": "scalar",
+        "enforced_target_limit": "scalar",
+        "evaluation_interval": "scalar",
+        "excluded_from_enforcement": ("typed_list", "ExcludedFromEnforcement"),
+        "exemplars": ("object", "Exemplar"),
+        "external_labels": "raw_dict",
+        "external_url": "scalar",
+        "host_aliases": ("typed_list", "HostAliase"),
+        "host_network": "scalar",
+        "ignore_namespace_selectors": "scalar",
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "listen_local": "scalar",
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "min_ready_seconds": "scalar",
+        "node_selector": "raw_dict",
+        "override_honor_labels": "scalar",
+        "override_honor_timestamps": "scalar",
+        "paused": "scalar",
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_monitor_namespace_selector": ("object", "meta.LabelSelector"),
+        "pod_monitor_selector": ("object", "meta.LabelSelector"),
+        "pod_target_labels": "raw_list",
+        "port_name": "scalar",
+        "priority_class_name": "scalar",
+        "probe_namespace_selector": ("object", "meta.LabelSelector"),
+        "probe_selector": ("object", "meta.LabelSelector"),
+        "prometheus_external_label_name": "scalar",
+        "prometheus_rules_excluded_from_enforce": ("typed_list", "PrometheusRulesExcludedFromEnforce"),
+        "query": ("object", "Query"),
+        "query_log_file": "scalar",
+        "remote_read": ("typed_list", "RemoteRead"),
+        "remote_write": ("typed_list", "RemoteWrite"),
+        "replica_external_label_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "retention": "scalar",
+        "retention_size": "scalar",
+        "route_prefix": "scalar",
+        "rule_namespace_selector": ("object", "meta.LabelSelector"),
+        "rule_selector": ("object", "meta.LabelSelector"),
+        "rules": ("object", "PrometheusSpecRule"),
+        "scrape_config_namespace_selector": ("object", "meta.LabelSelector"),
+        "scrape_config_selector": ("object", "meta.LabelSelector"),
+        "scrape_interval": "scalar",
+        "scrape_timeout": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_monitor_namespace_selector": ("object", "meta.LabelSelector"),
+        "service_monitor_selector": ("object", "meta.LabelSelector"),
+        "sha": "scalar",
+        "shards": "scalar",
+        "storage": ("object", "Storage"),
+        "tag": "scalar",
+        "thanos": ("object", "Thano"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "tracing_config": ("object", "TracingConfig"),
+        "tsdb": ("object", "Tsdb"),
+        "version": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+        "wal_compression": "scalar",
+        "web": ("object", "WEB"),
+    }
+
     additional_alert_manager_configs: core.ConfigMapKeySelector
     additional_alert_relabel_configs: core.ConfigMapKeySelector
     additional_args: list[AdditionalArg]
@@ -2899,6 +3887,11 @@ class Prometheus(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PrometheusSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PrometheusSpec
 
@@ -2916,6 +3909,76 @@ class PrometheusAgentSpec(KubernetesObject):
         "arbitraryFSAccessThroughSMs": "arbitrary_fs_access_through_sms",
     }
 
+    _field_types_ = {
+        "additional_args": ("typed_list", "AdditionalArg"),
+        "additional_scrape_configs": ("object", "core.ConfigMapKeySelector"),
+        "affinity": ("object", "core.Affinity"),
+        "apiserver_config": ("object", "APIserverConfig"),
+        "arbitrary_fs_access_through_sms": ("object", "ArbitraryFSAccessThroughSM"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "enable_features": "raw_list",
+        "enable_remote_write_receiver": "scalar",
+        "enforced_body_size_limit": "scalar",
+        "enforced_label_limit": "scalar",
+        "enforced_label_name_length_limit": "scalar",
+        "enforced_label_value_length_limit": "scalar",
+        "enforced_namespace_label": "scalar",
+        "enforced_sample_limit": "scalar",
+        "enforced_target_limit": "scalar",
+        "excluded_from_enforcement": ("typed_list", "ExcludedFromEnforcement"),
+        "external_labels": "raw_dict",
+        "external_url": "scalar",
+        "host_aliases": ("typed_list", "HostAliase"),
+        "host_network": "scalar",
+        "ignore_namespace_selectors": "scalar",
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "listen_local": "scalar",
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "min_ready_seconds": "scalar",
+        "node_selector": "raw_dict",
+        "override_honor_labels": "scalar",
+        "override_honor_timestamps": "scalar",
+        "paused": "scalar",
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_monitor_namespace_selector": ("object", "meta.LabelSelector"),
+        "pod_monitor_selector": ("object", "meta.LabelSelector"),
+        "pod_target_labels": "raw_list",
+        "port_name": "scalar",
+        "priority_class_name": "scalar",
+        "probe_namespace_selector": ("object", "meta.LabelSelector"),
+        "probe_selector": ("object", "meta.LabelSelector"),
+        "prometheus_external_label_name": "scalar",
+        "remote_write": ("typed_list", "RemoteWrite"),
+        "replica_external_label_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "route_prefix": "scalar",
+        "scrape_config_namespace_selector": ("object", "meta.LabelSelector"),
+        "scrape_config_selector": ("object", "meta.LabelSelector"),
+        "scrape_interval": "scalar",
+        "scrape_timeout": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_monitor_namespace_selector": ("object", "meta.LabelSelector"),
+        "service_monitor_selector": ("object", "meta.LabelSelector"),
+        "shards": "scalar",
+        "storage": ("object", "Storage"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "tracing_config": ("object", "TracingConfig"),
+        "version": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+        "wal_compression": "scalar",
+        "web": ("object", "WEB"),
+    }
+
     additional_args: list[AdditionalArg]
     additional_scrape_configs: core.ConfigMapKeySelector
     affinity: core.Affinity
@@ -3135,6 +4198,11 @@ class PrometheusAgent(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PrometheusAgentSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PrometheusAgentSpec
 
@@ -3145,6 +4213,10 @@ class PrometheusAgent(KubernetesApiResource):
 class PrometheusRuleSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "groups": ("typed_list", "Group"),
+    }
+
     groups: list[Group]
 
     def __init__(self, groups: list[Group] = None):
@@ -3161,6 +4233,11 @@ class PrometheusRule(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PrometheusRuleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PrometheusRuleSpec
 
@@ -3171,6 +4248,11 @@ class PrometheusRule(KubernetesApiResource):
 class ScrapeConfigSpecStaticConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "labels": "raw_dict",
+        "targets": "raw_list",
+    }
+
     labels: dict[str, str]
     targets: list[str]
 
@@ -3190,6 +4272,18 @@ class ScrapeConfigSpec(KubernetesObject):
         "httpSDConfigs": "http_sd_configs",
     }
 
+    _field_types_ = {
+        "authorization": ("object", "Authorization"),
+        "basic_auth": ("object", "BasicAuth"),
+        "file_sd_configs": ("typed_list", "FileSDConfig"),
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "http_sd_configs": ("typed_list", "HttpSDConfig"),
+        "metrics_path": "scalar",
+        "relabelings": ("typed_list", "Relabeling"),
+        "static_configs": ("typed_list", "ScrapeConfigSpecStaticConfig"),
+    }
+
     authorization: Authorization
     basic_auth: BasicAuth
     file_sd_configs: list[FileSDConfig]
@@ -3235,6 +4329,11 @@ class ScrapeConfig(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ScrapeConfigSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ScrapeConfigSpec
 
@@ -3247,6 +4346,21 @@ class ServiceMonitorSpec(KubernetesObject):
 
     _required_ = ["endpoints", "selector"]
 
+    _field_types_ = {
+        "attach_metadata": ("object", "AttachMetadata"),
+        "endpoints": ("typed_list", "Endpoint"),
+        "job_label": "scalar",
+        "label_limit": "scalar",
+        "label_name_length_limit": "scalar",
+        "label_value_length_limit": "scalar",
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "pod_target_labels": "raw_list",
+        "sample_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "target_labels": "raw_list",
+        "target_limit": "scalar",
+    }
+
     attach_metadata: AttachMetadata
     endpoints: list[Endpoint]
     job_label: str
@@ -3301,6 +4415,11 @@ class ServiceMonitor(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ServiceMonitorSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ServiceMonitorSpec
 
@@ -3311,6 +4430,59 @@ class ServiceMonitor(KubernetesApiResource):
 class ThanosRulerSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_args": ("typed_list", "AdditionalArg"),
+        "affinity": ("object", "core.Affinity"),
+        "alert_drop_labels": "raw_list",
+        "alert_query_url": "scalar",
+        "alert_relabel_config_file": "scalar",
+        "alert_relabel_configs": ("object", "core.ConfigMapKeySelector"),
+        "alertmanagers_config": ("object", "core.ConfigMapKeySelector"),
+        "alertmanagers_url": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "enforced_namespace_label": "scalar",
+        "evaluation_interval": "scalar",
+        "excluded_from_enforcement": ("typed_list", "ExcludedFromEnforcement"),
+        "external_prefix": "scalar",
+        "grpc_server_tls_config": ("object", "GrpcServerTlsConfig"),
+        "host_aliases": ("typed_list", "HostAliase"),
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "labels": "raw_dict",
+        "listen_local": "scalar",
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "min_ready_seconds": "scalar",
+        "node_selector": "raw_dict",
+        "object_storage_config": ("object", "core.ConfigMapKeySelector"),
+        "object_storage_config_file": "scalar",
+        "paused": "scalar",
+        "pod_metadata": ("object", "PodMetadata"),
+        "port_name": "scalar",
+        "priority_class_name": "scalar",
+        "prometheus_rules_excluded_from_enforce": ("typed_list", "PrometheusRulesExcludedFromEnforce"),
+        "query_config": ("object", "core.ConfigMapKeySelector"),
+        "query_endpoints": "raw_list",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "retention": "scalar",
+        "route_prefix": "scalar",
+        "rule_namespace_selector": ("object", "meta.LabelSelector"),
+        "rule_selector": ("object", "meta.LabelSelector"),
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "storage": ("object", "Storage"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "tracing_config": ("object", "core.ConfigMapKeySelector"),
+        "tracing_config_file": "scalar",
+        "version": "scalar",
+        "volume_mounts": ("typed_list", "VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     additional_args: list[AdditionalArg]
     affinity: core.Affinity
     alert_drop_labels: list[str]
@@ -3479,6 +4651,11 @@ class ThanosRuler(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ThanosRulerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ThanosRulerSpec
 
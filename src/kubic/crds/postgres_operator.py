@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class Azure(KubernetesObject):
@@ -9,6 +15,10 @@ class Azure(KubernetesObject):
 
     _required_ = ["container"]
 
+    _field_types_ = {
+        "container": "scalar",
+    }
+
     container: str
 
     def __init__(self, container: str = None):
@@ -18,6 +28,13 @@ class Azure(KubernetesObject):
 class JOB(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     priority_class_name: str
     resources: core.ResourceRequirements
@@ -38,6 +55,11 @@ class Manual(KubernetesObject):
 
     _required_ = ["repo_name"]
 
+    _field_types_ = {
+        "options": "raw_list",
+        "repo_name": "scalar",
+    }
+
     options: list[str]
     repo_name: str
 
@@ -48,6 +70,11 @@ class Manual(KubernetesObject):
 class Metadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
 
@@ -58,6 +85,16 @@ class Metadata(KubernetesObject):
 class RepoHost(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "ssh_config_map": ("object", "core.SecretProjection"),
+        "ssh_secret": ("object", "core.SecretProjection"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+    }
+
     affinity: core.Affinity
     priority_class_name: str
     resources: core.ResourceRequirements
@@ -92,6 +129,10 @@ class GCS(KubernetesObject):
 
     _required_ = ["bucket"]
 
+    _field_types_ = {
+        "bucket": "scalar",
+    }
+
     bucket: str
 
     def __init__(self, bucket: str = None):
@@ -103,6 +144,12 @@ class S3(KubernetesObject):
 
     _required_ = ["bucket", "endpoint", "region"]
 
+    _field_types_ = {
+        "bucket": "scalar",
+        "endpoint": "scalar",
+        "region": "scalar",
+    }
+
     bucket: str
     endpoint: str
     region: str
@@ -114,6 +161,12 @@ class S3(KubernetesObject):
 class Schedule(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "differential": "scalar",
+        "full": "scalar",
+        "incremental": "scalar",
+    }
+
     differential: str
     full: str
     incremental: str
@@ -127,6 +180,10 @@ class RepoVolume(KubernetesObject):
 
     _required_ = ["volume_claim_spec"]
 
+    _field_types_ = {
+        "volume_claim_spec": ("object", "core.PersistentVolumeClaimSpec"),
+    }
+
     volume_claim_spec: core.PersistentVolumeClaimSpec
 
     def __init__(self, volume_claim_spec: core.PersistentVolumeClaimSpec = None):
@@ -138,6 +195,15 @@ class Repo(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "azure": ("object", "Azure"),
+        "gcs": ("object", "GCS"),
+        "name": "scalar",
+        "s3": ("object", "S3"),
+        "schedules": ("object", "Schedule"),
+        "volume": ("object", "RepoVolume"),
+    }
+
     azure: Azure
     gcs: GCS
     name: str
@@ -156,6 +222,18 @@ class Restore(KubernetesObject):
 
     _required_ = ["enabled", "repo_name"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "cluster_name": "scalar",
+        "cluster_namespace": "scalar",
+        "enabled": "scalar",
+        "options": "raw_list",
+        "priority_class_name": "scalar",
+        "repo_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     cluster_name: str
     cluster_namespace: str
@@ -194,6 +272,10 @@ class Restore(KubernetesObject):
 class SidecarPgbackrest(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     resources: core.ResourceRequirements
 
     def __init__(self, resources: core.ResourceRequirements = None):
@@ -203,6 +285,10 @@ class SidecarPgbackrest(KubernetesObject):
 class PgbackrestConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     resources: core.ResourceRequirements
 
     def __init__(self, resources: core.ResourceRequirements = None):
@@ -212,6 +298,11 @@ class PgbackrestConfig(KubernetesObject):
 class PgbackrestSidecar(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pgbackrest": ("object", "SidecarPgbackrest"),
+        "pgbackrest_config": ("object", "PgbackrestConfig"),
+    }
+
     pgbackrest: SidecarPgbackrest
     pgbackrest_config: PgbackrestConfig
 
@@ -228,6 +319,19 @@ class BackupPgbackrest(KubernetesObject):
         "global": "global_",
     }
 
+    _field_types_ = {
+        "configuration": ("typed_list", "core.VolumeProjection"),
+        "global_": "raw_dict",
+        "image": "scalar",
+        "jobs": ("object", "JOB"),
+        "manual": ("object", "Manual"),
+        "metadata": ("object", "Metadata"),
+        "repo_host": ("object", "RepoHost"),
+        "repos": ("typed_list", "Repo"),
+        "restore": ("object", "Restore"),
+        "sidecars": ("object", "PgbackrestSidecar"),
+    }
+
     configuration: list[core.VolumeProjection]
     global_: dict[str, str]
     image: str
@@ -271,6 +375,10 @@ class Backup(KubernetesObject):
 
     _required_ = ["pgbackrest"]
 
+    _field_types_ = {
+        "pgbackrest": ("object", "BackupPgbackrest"),
+    }
+
     pgbackrest: BackupPgbackrest
 
     def __init__(self, pgbackrest: BackupPgbackrest = None):
@@ -286,6 +394,18 @@ class DataSourcePgbackrest(KubernetesObject):
         "global": "global_",
     }
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "configuration": ("typed_list", "core.VolumeProjection"),
+        "global_": "raw_dict",
+        "options": "raw_list",
+        "priority_class_name": "scalar",
+        "repo": ("object", "Repo"),
+        "resources": ("object", "core.ResourceRequirements"),
+        "stanza": "scalar",
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     configuration: list[core.VolumeProjection]
     global_: dict[str, str]
@@ -326,6 +446,17 @@ class DataSourcePostgresCluster(KubernetesObject):
 
     _required_ = ["repo_name"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "cluster_name": "scalar",
+        "cluster_namespace": "scalar",
+        "options": "raw_list",
+        "priority_class_name": "scalar",
+        "repo_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     cluster_name: str
     cluster_namespace: str
@@ -363,6 +494,11 @@ class PgBackRestVolume(KubernetesObject):
 
     _required_ = ["pvc_name"]
 
+    _field_types_ = {
+        "directory": "scalar",
+        "pvc_name": "scalar",
+    }
+
     directory: str
     pvc_name: str
 
@@ -375,6 +511,11 @@ class PgDataVolume(KubernetesObject):
 
     _required_ = ["pvc_name"]
 
+    _field_types_ = {
+        "directory": "scalar",
+        "pvc_name": "scalar",
+    }
+
     directory: str
     pvc_name: str
 
@@ -387,6 +528,11 @@ class PgWALVolume(KubernetesObject):
 
     _required_ = ["pvc_name"]
 
+    _field_types_ = {
+        "directory": "scalar",
+        "pvc_name": "scalar",
+    }
+
     directory: str
     pvc_name: str
 
@@ -404,6 +550,12 @@ class DataSourceVolume(KubernetesObject):
         "pgWALVolume": "pg_wal_volume",
     }
 
+    _field_types_ = {
+        "pg_back_rest_volume": ("object", "PgBackRestVolume"),
+        "pg_data_volume": ("object", "PgDataVolume"),
+        "pg_wal_volume": ("object", "PgWALVolume"),
+    }
+
     pg_back_rest_volume: PgBackRestVolume
     pg_data_volume: PgDataVolume
     pg_wal_volume: PgWALVolume
@@ -417,6 +569,12 @@ class DataSourceVolume(KubernetesObject):
 class DataSource(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pgbackrest": ("object", "DataSourcePgbackrest"),
+        "postgres_cluster": ("object", "DataSourcePostgresCluster"),
+        "volumes": ("object", "DataSourceVolume"),
+    }
+
     pgbackrest: DataSourcePgbackrest
     postgres_cluster: DataSourcePostgresCluster
     volumes: DataSourceVolume
@@ -432,6 +590,11 @@ class DatabaseInitSQL(KubernetesObject):
 
     _required_ = ["key", "name"]
 
+    _field_types_ = {
+        "key": "scalar",
+        "name": "scalar",
+    }
+
     key: str
     name: str
 
@@ -442,6 +605,12 @@ class DatabaseInitSQL(KubernetesObject):
 class Exporter(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "configuration": ("typed_list", "core.VolumeProjection"),
+        "image": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     configuration: list[core.VolumeProjection]
     image: str
     resources: core.ResourceRequirements
@@ -453,6 +622,10 @@ class Exporter(KubernetesObject):
 class ReplicaCertCopy(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     resources: core.ResourceRequirements
 
     def __init__(self, resources: core.ResourceRequirements = None):
@@ -462,6 +635,10 @@ class ReplicaCertCopy(KubernetesObject):
 class InstanceSidecar(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "replica_cert_copy": ("object", "ReplicaCertCopy"),
+    }
+
     replica_cert_copy: ReplicaCertCopy
 
     def __init__(self, replica_cert_copy: ReplicaCertCopy = None):
@@ -473,6 +650,22 @@ class Instance(KubernetesObject):
 
     _required_ = ["data_volume_claim_spec"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "containers": ("typed_list", "core.Container"),
+        "data_volume_claim_spec": ("object", "core.PersistentVolumeClaimSpec"),
+        "metadata": ("object", "Metadata"),
+        "min_available": "union",
+        "name": "scalar",
+        "priority_class_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "sidecars": ("object", "InstanceSidecar"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "wal_volume_claim_spec": ("object", "core.PersistentVolumeClaimSpec"),
+    }
+
     affinity: core.Affinity
     containers: list[core.Container]
     data_volume_claim_spec: core.PersistentVolumeClaimSpec
@@ -523,6 +716,10 @@ class Instance(KubernetesObject):
 class Pgmonitor(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "exporter": ("object", "Exporter"),
+    }
+
     exporter: Exporter
 
     def __init__(self, exporter: Exporter = None):
@@ -532,6 +729,10 @@ class Pgmonitor(KubernetesObject):
 class Monitoring(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pgmonitor": ("object", "Pgmonitor"),
+    }
+
     pgmonitor: Pgmonitor
 
     def __init__(self, pgmonitor: Pgmonitor = None):
@@ -543,6 +744,21 @@ class PGUpgradeSpec(KubernetesObject):
 
     _required_ = ["from_postgres_version", "postgres_cluster_name", "to_postgres_version"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "from_postgres_version": "scalar",
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "metadata": ("object", "Metadata"),
+        "postgres_cluster_name": "scalar",
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "to_postgres_image": "scalar",
+        "to_postgres_version": "scalar",
+        "tolerations": ("typed_list", "core.Toleration"),
+    }
+
     affinity: core.Affinity
     from_postgres_version: int
     image: str
@@ -595,6 +811,11 @@ class PGUpgrade(KubernetesApiResource):
     _kind_ = "PGUpgrade"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PGUpgradeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PGUpgradeSpec
 
@@ -607,6 +828,10 @@ class Password(KubernetesObject):
 
     _required_ = ["type"]
 
+    _field_types_ = {
+        "type": "scalar",
+    }
+
     type: str
 
     def __init__(self, type: str = None):
@@ -618,6 +843,12 @@ class Switchover(KubernetesObject):
 
     _required_ = ["enabled"]
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "target_instance": "scalar",
+        "type": "scalar",
+    }
+
     enabled: bool
     target_instance: str
     type: str
@@ -629,6 +860,14 @@ class Switchover(KubernetesObject):
 class Patroni(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "dynamic_configuration": "raw_dict",
+        "leader_lease_duration_seconds": "scalar",
+        "port": "scalar",
+        "switchover": ("object", "Switchover"),
+        "sync_period_seconds": "scalar",
+    }
+
     dynamic_configuration: dict[str, t.Any]
     leader_lease_duration_seconds: int
     port: int
@@ -655,6 +894,12 @@ class Patroni(KubernetesObject):
 class PgAdminConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "files": ("typed_list", "core.VolumeProjection"),
+        "ldap_bind_password": ("object", "core.ConfigMapKeySelector"),
+        "settings": "raw_dict",
+    }
+
     files: list[core.VolumeProjection]
     ldap_bind_password: core.ConfigMapKeySelector
     settings: dict[str, t.Any]
@@ -671,6 +916,12 @@ class PgAdminConfig(KubernetesObject):
 class Service(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "metadata": ("object", "Metadata"),
+        "node_port": "scalar",
+        "type": "scalar",
+    }
+
     metadata: Metadata
     node_port: int
     type: str
@@ -684,6 +935,20 @@ class PgAdmin(KubernetesObject):
 
     _required_ = ["data_volume_claim_spec"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config": ("object", "PgAdminConfig"),
+        "data_volume_claim_spec": ("object", "core.PersistentVolumeClaimSpec"),
+        "image": "scalar",
+        "metadata": ("object", "Metadata"),
+        "priority_class_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "service": ("object", "Service"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+    }
+
     affinity: core.Affinity
     config: PgAdminConfig
     data_volume_claim_spec: core.PersistentVolumeClaimSpec
@@ -732,6 +997,13 @@ class PgBouncerConfig(KubernetesObject):
         "global": "global_",
     }
 
+    _field_types_ = {
+        "databases": "raw_dict",
+        "files": ("typed_list", "core.VolumeProjection"),
+        "global_": "raw_dict",
+        "users": "raw_dict",
+    }
+
     databases: dict[str, str]
     files: list[core.VolumeProjection]
     global_: dict[str, str]
@@ -750,6 +1022,10 @@ class PgBouncerConfig(KubernetesObject):
 class PgbouncerConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     resources: core.ResourceRequirements
 
     def __init__(self, resources: core.ResourceRequirements = None):
@@ -759,6 +1035,10 @@ class PgbouncerConfig(KubernetesObject):
 class PgBouncerSidecar(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pgbouncer_config": ("object", "PgbouncerConfig"),
+    }
+
     pgbouncer_config: PgbouncerConfig
 
     def __init__(self, pgbouncer_config: PgbouncerConfig = None):
@@ -775,6 +1055,24 @@ class PgBouncer(KubernetesObject):
         "customTLSSecret": "custom_tls_secret",
     }
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config": ("object", "PgBouncerConfig"),
+        "containers": ("typed_list", "core.Container"),
+        "custom_tls_secret": ("object", "core.SecretProjection"),
+        "image": "scalar",
+        "metadata": ("object", "Metadata"),
+        "min_available": "union",
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "replicas": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "service": ("object", "Service"),
+        "sidecars": ("object", "PgBouncerSidecar"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+    }
+
     affinity: core.Affinity
     config: PgBouncerConfig
     containers: list[core.Container]
@@ -831,6 +1129,10 @@ class PgBouncer(KubernetesObject):
 class PostgresClusterSpecConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "files": ("typed_list", "core.VolumeProjection"),
+    }
+
     files: list[core.VolumeProjection]
 
     def __init__(self, files: list[core.VolumeProjection] = None):
@@ -842,6 +1144,10 @@ class Proxy(KubernetesObject):
 
     _required_ = ["pg_bouncer"]
 
+    _field_types_ = {
+        "pg_bouncer": ("object", "PgBouncer"),
+    }
+
     pg_bouncer: PgBouncer
 
     def __init__(self, pg_bouncer: PgBouncer = None):
@@ -851,6 +1157,13 @@ class Proxy(KubernetesObject):
 class Standby(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "host": "scalar",
+        "port": "scalar",
+        "repo_name": "scalar",
+    }
+
     enabled: bool
     host: str
     port: int
@@ -865,6 +1178,10 @@ class UserInterface(KubernetesObject):
 
     _required_ = ["pg_admin"]
 
+    _field_types_ = {
+        "pg_admin": ("object", "PgAdmin"),
+    }
+
     pg_admin: PgAdmin
 
     def __init__(self, pg_admin: PgAdmin = None):
@@ -876,6 +1193,13 @@ class User(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "databases": "raw_list",
+        "name": "scalar",
+        "options": "scalar",
+        "password": ("object", "Password"),
+    }
+
     databases: list[str]
     name: str
     options: str
@@ -903,6 +1227,35 @@ class PostgresClusterSpec(KubernetesObject):
         "postGISVersion": "post_gis_version",
     }
 
+    _field_types_ = {
+        "backups": ("object", "Backup"),
+        "config": ("object", "PostgresClusterSpecConfig"),
+        "custom_replication_tls_secret": ("object", "core.SecretProjection"),
+        "custom_tls_secret": ("object", "core.SecretProjection"),
+        "data_source": ("object", "DataSource"),
+        "database_init_sql": ("object", "DatabaseInitSQL"),
+        "disable_default_pod_scheduling": "scalar",
+        "image": "scalar",
+        "image_pull_policy": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "instances": ("typed_list", "Instance"),
+        "metadata": ("object", "Metadata"),
+        "monitoring": ("object", "Monitoring"),
+        "openshift": "scalar",
+        "patroni": ("object", "Patroni"),
+        "paused": "scalar",
+        "port": "scalar",
+        "post_gis_version": "scalar",
+        "postgres_version": "scalar",
+        "proxy": ("object", "Proxy"),
+        "service": ("object", "Service"),
+        "shutdown": "scalar",
+        "standby": ("object", "Standby"),
+        "supplemental_groups": "raw_list",
+        "user_interface": ("object", "UserInterface"),
+        "users": ("typed_list", "User"),
+    }
+
     backups: Backup
     config: PostgresClusterSpecConfig
     custom_replication_tls_secret: core.SecretProjection
@@ -997,6 +1350,11 @@ class PostgresCluster(KubernetesApiResource):
     _kind_ = "PostgresCluster"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "PostgresClusterSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: PostgresClusterSpec
 
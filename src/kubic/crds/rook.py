@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import typing as t
 
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import core, meta
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import core, meta
+
+__getattr__ = lazy_modules(globals(), core="..api", meta="..api")
 
 
 class Amqp(KubernetesObject):
@@ -16,6 +22,13 @@ class Amqp(KubernetesObject):
         "disableVerifySSL": "disable_verify_ssl",
     }
 
+    _field_types_ = {
+        "ack_level": "scalar",
+        "disable_verify_ssl": "scalar",
+        "exchange": "scalar",
+        "uri": "scalar",
+    }
+
     ack_level: str
     disable_verify_ssl: bool
     exchange: str
@@ -28,6 +41,12 @@ class Amqp(KubernetesObject):
 class Bucket(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "interval": "scalar",
+        "timeout": "scalar",
+    }
+
     disabled: bool
     interval: str
     timeout: str
@@ -39,6 +58,14 @@ class Bucket(KubernetesObject):
 class Capability(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "bucket": "scalar",
+        "metadata": "scalar",
+        "usage": "scalar",
+        "user": "scalar",
+        "zone": "scalar",
+    }
+
     bucket: str
     metadata: str
     usage: str
@@ -54,6 +81,12 @@ class ErasureCoded(KubernetesObject):
 
     _required_ = ["coding_chunks", "data_chunks"]
 
+    _field_types_ = {
+        "algorithm": "scalar",
+        "coding_chunks": "scalar",
+        "data_chunks": "scalar",
+    }
+
     algorithm: str
     coding_chunks: int
     data_chunks: int
@@ -65,6 +98,10 @@ class ErasureCoded(KubernetesObject):
 class Peer(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "secret_names": "raw_list",
+    }
+
     secret_names: list[str]
 
     def __init__(self, secret_names: list[str] = None):
@@ -74,6 +111,12 @@ class Peer(KubernetesObject):
 class SnapshotSchedule(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "interval": "scalar",
+        "path": "scalar",
+        "start_time": "scalar",
+    }
+
     interval: str
     path: str
     start_time: str
@@ -85,6 +128,13 @@ class SnapshotSchedule(KubernetesObject):
 class CephBlockPoolSpecMirroring(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "mode": "scalar",
+        "peers": ("object", "Peer"),
+        "snapshot_schedules": ("typed_list", "SnapshotSchedule"),
+    }
+
     enabled: bool
     mode: str
     peers: Peer
@@ -97,6 +147,12 @@ class CephBlockPoolSpecMirroring(KubernetesObject):
 class CephBlockPoolSpecQuota(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "max_bytes": "scalar",
+        "max_objects": "scalar",
+        "max_size": "scalar",
+    }
+
     max_bytes: int
     max_objects: int
     max_size: str
@@ -110,6 +166,11 @@ class HybridStorage(KubernetesObject):
 
     _required_ = ["primary_device_class", "secondary_device_class"]
 
+    _field_types_ = {
+        "primary_device_class": "scalar",
+        "secondary_device_class": "scalar",
+    }
+
     primary_device_class: str
     secondary_device_class: str
 
@@ -122,6 +183,15 @@ class Replicated(KubernetesObject):
 
     _required_ = ["size"]
 
+    _field_types_ = {
+        "hybrid_storage": ("object", "HybridStorage"),
+        "replicas_per_failure_domain": "scalar",
+        "require_safe_replica_size": "scalar",
+        "size": "scalar",
+        "sub_failure_domain": "scalar",
+        "target_size_ratio": "scalar",
+    }
+
     hybrid_storage: HybridStorage
     replicas_per_failure_domain: int
     require_safe_replica_size: bool
@@ -151,6 +221,12 @@ class Replicated(KubernetesObject):
 class Mirror(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "interval": "scalar",
+        "timeout": "scalar",
+    }
+
     disabled: bool
     interval: str
     timeout: str
@@ -162,6 +238,10 @@ class Mirror(KubernetesObject):
 class StatusCheck(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "mirror": ("object", "Mirror"),
+    }
+
     mirror: Mirror
 
     def __init__(self, mirror: Mirror = None):
@@ -178,6 +258,21 @@ class CephBlockPoolSpec(KubernetesObject):
         "enableRBDStats": "enable_rbd_stats",
     }
 
+    _field_types_ = {
+        "compression_mode": "scalar",
+        "crush_root": "scalar",
+        "device_class": "scalar",
+        "enable_rbd_stats": "scalar",
+        "erasure_coded": ("object", "ErasureCoded"),
+        "failure_domain": "scalar",
+        "mirroring": ("object", "CephBlockPoolSpecMirroring"),
+        "name": "scalar",
+        "parameters": "raw_dict",
+        "quotas": ("object", "CephBlockPoolSpecQuota"),
+        "replicated": ("object", "Replicated"),
+        "status_check": ("object", "StatusCheck"),
+    }
+
     compression_mode: str
     crush_root: str
     device_class: str
@@ -232,6 +327,11 @@ class CephBlockPool(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephBlockPoolSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephBlockPoolSpec
 
@@ -244,6 +344,10 @@ class CephBlockPoolRadosNamespaceSpec(KubernetesObject):
 
     _required_ = ["block_pool_name"]
 
+    _field_types_ = {
+        "block_pool_name": "scalar",
+    }
+
     block_pool_name: str
 
     def __init__(self, block_pool_name: str = None):
@@ -260,6 +364,11 @@ class CephBlockPoolRadosNamespace(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephBlockPoolRadosNamespaceSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephBlockPoolRadosNamespaceSpec
 
@@ -272,6 +381,11 @@ class FilterItem(KubernetesObject):
 
     _required_ = ["name", "value"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+    }
+
     name: str
     value: str
 
@@ -282,6 +396,12 @@ class FilterItem(KubernetesObject):
 class Filter(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "key_filters": ("typed_list", "FilterItem"),
+        "metadata_filters": ("typed_list", "FilterItem"),
+        "tag_filters": ("typed_list", "FilterItem"),
+    }
+
     key_filters: list[FilterItem]
     metadata_filters: list[FilterItem]
     tag_filters: list[FilterItem]
@@ -297,6 +417,12 @@ class CephBucketNotificationSpec(KubernetesObject):
 
     _required_ = ["topic"]
 
+    _field_types_ = {
+        "events": "raw_list",
+        "filter": ("object", "Filter"),
+        "topic": "scalar",
+    }
+
     events: list[str]
     filter: Filter
     topic: str
@@ -315,6 +441,11 @@ class CephBucketNotification(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephBucketNotificationSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephBucketNotificationSpec
 
@@ -334,6 +465,12 @@ class Http(KubernetesObject):
         "disableVerifySSL": "disable_verify_ssl",
     }
 
+    _field_types_ = {
+        "disable_verify_ssl": "scalar",
+        "send_cloud_events": "scalar",
+        "uri": "scalar",
+    }
+
     disable_verify_ssl: bool
     send_cloud_events: bool
     uri: str
@@ -356,6 +493,13 @@ class Kafka(KubernetesObject):
         "useSSL": "use_ssl",
     }
 
+    _field_types_ = {
+        "ack_level": "scalar",
+        "disable_verify_ssl": "scalar",
+        "uri": "scalar",
+        "use_ssl": "scalar",
+    }
+
     ack_level: str
     disable_verify_ssl: bool
     uri: str
@@ -368,6 +512,12 @@ class Kafka(KubernetesObject):
 class CephBucketTopicSpecEndpoint(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "amqp": ("object", "Amqp"),
+        "http": ("object", "Http"),
+        "kafka": ("object", "Kafka"),
+    }
+
     amqp: Amqp
     http: Http
     kafka: Kafka
@@ -381,6 +531,14 @@ class CephBucketTopicSpec(KubernetesObject):
 
     _required_ = ["endpoint", "object_store_name", "object_store_namespace"]
 
+    _field_types_ = {
+        "endpoint": ("object", "CephBucketTopicSpecEndpoint"),
+        "object_store_name": "scalar",
+        "object_store_namespace": "scalar",
+        "opaque_data": "scalar",
+        "persistent": "scalar",
+    }
+
     endpoint: CephBucketTopicSpecEndpoint
     object_store_name: str
     object_store_namespace: str
@@ -414,6 +572,11 @@ class CephBucketTopic(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephBucketTopicSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephBucketTopicSpec
 
@@ -426,6 +589,11 @@ class CephClientSpec(KubernetesObject):
 
     _required_ = ["caps"]
 
+    _field_types_ = {
+        "caps": "raw_dict",
+        "name": "scalar",
+    }
+
     caps: dict[str, str]
     name: str
 
@@ -443,6 +611,11 @@ class CephClient(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephClientSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephClientSpec
 
@@ -453,6 +626,11 @@ class CephClient(KubernetesApiResource):
 class CephVersion(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "allow_unsupported": "scalar",
+        "image": "scalar",
+    }
+
     allow_unsupported: bool
     image: str
 
@@ -463,6 +641,12 @@ class CephVersion(KubernetesObject):
 class SanitizeDisk(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "data_source": "scalar",
+        "iteration": "scalar",
+        "method": "scalar",
+    }
+
     data_source: str
     iteration: int
     method: str
@@ -474,6 +658,12 @@ class SanitizeDisk(KubernetesObject):
 class CleanupPolicy(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "allow_uninstall_with_volumes": "scalar",
+        "confirmation": "scalar",
+        "sanitize_disks": ("object", "SanitizeDisk"),
+    }
+
     allow_uninstall_with_volumes: bool
     confirmation: str
     sanitize_disks: SanitizeDisk
@@ -487,6 +677,11 @@ class CleanupPolicy(KubernetesObject):
 class CrashCollector(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "days_to_retain": "scalar",
+        "disable": "scalar",
+    }
+
     days_to_retain: int
     disable: bool
 
@@ -497,6 +692,13 @@ class CrashCollector(KubernetesObject):
 class Dashboard(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "port": "scalar",
+        "ssl": "scalar",
+        "url_prefix": "scalar",
+    }
+
     enabled: bool
     port: int
     ssl: bool
@@ -509,6 +711,14 @@ class Dashboard(KubernetesObject):
 class DisruptionManagement(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "machine_disruption_budget_namespace": "scalar",
+        "manage_machine_disruption_budgets": "scalar",
+        "manage_pod_budgets": "scalar",
+        "osd_maintenance_timeout": "scalar",
+        "pg_health_check_timeout": "scalar",
+    }
+
     machine_disruption_budget_namespace: str
     manage_machine_disruption_budgets: bool
     manage_pod_budgets: bool
@@ -535,6 +745,10 @@ class DisruptionManagement(KubernetesObject):
 class External(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enable": "scalar",
+    }
+
     enable: bool
 
     def __init__(self, enable: bool = None):
@@ -544,6 +758,12 @@ class External(KubernetesObject):
 class DaemonHealthMON(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "interval": "scalar",
+        "timeout": "scalar",
+    }
+
     disabled: bool
     interval: str
     timeout: str
@@ -555,6 +775,12 @@ class DaemonHealthMON(KubernetesObject):
 class OSD(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "interval": "scalar",
+        "timeout": "scalar",
+    }
+
     disabled: bool
     interval: str
     timeout: str
@@ -566,6 +792,12 @@ class OSD(KubernetesObject):
 class Status(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "interval": "scalar",
+        "timeout": "scalar",
+    }
+
     disabled: bool
     interval: str
     timeout: str
@@ -577,6 +809,12 @@ class Status(KubernetesObject):
 class DaemonHealth(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "mon": ("object", "DaemonHealthMON"),
+        "osd": ("object", "OSD"),
+        "status": ("object", "Status"),
+    }
+
     mon: DaemonHealthMON
     osd: OSD
     status: Status
@@ -588,6 +826,11 @@ class DaemonHealth(KubernetesObject):
 class Probe(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disabled": "scalar",
+        "probe": ("object", "core.Probe"),
+    }
+
     disabled: bool
     probe: core.Probe
 
@@ -598,6 +841,12 @@ class Probe(KubernetesObject):
 class CephClusterSpecHealthCheck(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "daemon_health": ("object", "DaemonHealth"),
+        "liveness_probe": "raw_dict",
+        "startup_probe": "raw_dict",
+    }
+
     daemon_health: DaemonHealth
     liveness_probe: dict[str, Probe]
     startup_probe: dict[str, Probe]
@@ -609,6 +858,12 @@ class CephClusterSpecHealthCheck(KubernetesObject):
 class LogCollector(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "max_log_size": "union",
+        "periodicity": "scalar",
+    }
+
     enabled: bool
     max_log_size: core.IntOrString
     periodicity: str
@@ -620,6 +875,11 @@ class LogCollector(KubernetesObject):
 class Module(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "name": "scalar",
+    }
+
     enabled: bool
     name: str
 
@@ -630,6 +890,12 @@ class Module(KubernetesObject):
 class MGR(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "allow_multiple_per_node": "scalar",
+        "count": "scalar",
+        "modules": ("typed_list", "Module"),
+    }
+
     allow_multiple_per_node: bool
     count: int
     modules: list[Module]
@@ -641,6 +907,12 @@ class MGR(KubernetesObject):
 class StretchClusterZone(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "arbiter": "scalar",
+        "name": "scalar",
+        "volume_claim_template": ("object", "core.PersistentVolumeClaimTemplate"),
+    }
+
     arbiter: bool
     name: str
     volume_claim_template: core.PersistentVolumeClaimTemplate
@@ -652,6 +924,12 @@ class StretchClusterZone(KubernetesObject):
 class StretchCluster(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "failure_domain_label": "scalar",
+        "sub_failure_domain": "scalar",
+        "zones": ("typed_list", "StretchClusterZone"),
+    }
+
     failure_domain_label: str
     sub_failure_domain: str
     zones: list[StretchClusterZone]
@@ -663,6 +941,13 @@ class StretchCluster(KubernetesObject):
 class CephClusterSpecMON(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "allow_multiple_per_node": "scalar",
+        "count": "scalar",
+        "stretch_cluster": ("object", "StretchCluster"),
+        "volume_claim_template": ("object", "core.PersistentVolumeClaimTemplate"),
+    }
+
     allow_multiple_per_node: bool
     count: int
     stretch_cluster: StretchCluster
@@ -686,6 +971,16 @@ class CephClusterSpecMON(KubernetesObject):
 class TargetRef(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "field_path": "scalar",
+        "kind": "scalar",
+        "name": "scalar",
+        "namespace": "scalar",
+        "resource_version": "scalar",
+        "uid": "scalar",
+    }
+
     api_version: str
     field_path: str
     kind: str
@@ -720,6 +1015,13 @@ class ExternalMgrEndpoint(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "ip": "scalar",
+        "node_name": "scalar",
+        "target_ref": ("object", "TargetRef"),
+    }
+
     hostname: str
     ip: str
     node_name: str
@@ -732,6 +1034,12 @@ class ExternalMgrEndpoint(KubernetesObject):
 class Monitoring(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "external_mgr_endpoints": ("typed_list", "ExternalMgrEndpoint"),
+        "external_mgr_prometheus_port": "scalar",
+    }
+
     enabled: bool
     external_mgr_endpoints: list[ExternalMgrEndpoint]
     external_mgr_prometheus_port: int
@@ -747,6 +1055,10 @@ class Monitoring(KubernetesObject):
 class Compression(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+    }
+
     enabled: bool
 
     def __init__(self, enabled: bool = None):
@@ -756,6 +1068,10 @@ class Compression(KubernetesObject):
 class Encryption(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+    }
+
     enabled: bool
 
     def __init__(self, enabled: bool = None):
@@ -765,6 +1081,11 @@ class Encryption(KubernetesObject):
 class Connection(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "compression": ("object", "Compression"),
+        "encryption": ("object", "Encryption"),
+    }
+
     compression: Compression
     encryption: Encryption
 
@@ -775,6 +1096,15 @@ class Connection(KubernetesObject):
 class Network(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "connections": ("object", "Connection"),
+        "dual_stack": "scalar",
+        "host_network": "scalar",
+        "ip_family": "scalar",
+        "provider": "scalar",
+        "selectors": "raw_dict",
+    }
+
     connections: Connection
     dual_stack: bool
     host_network: bool
@@ -804,6 +1134,14 @@ class Network(KubernetesObject):
 class Placement(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "node_affinity": ("object", "core.NodeAffinity"),
+        "pod_affinity": ("object", "core.PodAffinity"),
+        "pod_anti_affinity": ("object", "core.PodAntiAffinity"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+    }
+
     node_affinity: core.NodeAffinity
     pod_affinity: core.PodAffinity
     pod_anti_affinity: core.PodAntiAffinity
@@ -830,6 +1168,11 @@ class Placement(KubernetesObject):
 class KMS(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "connection_details": "raw_dict",
+        "token_secret_name": "scalar",
+    }
+
     connection_details: dict[str, str]
     token_secret_name: str
 
@@ -840,6 +1183,10 @@ class KMS(KubernetesObject):
 class CephClusterSpecSecurity(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "kms": ("object", "KMS"),
+    }
+
     kms: KMS
 
     def __init__(self, kms: KMS = None):
@@ -849,6 +1196,12 @@ class CephClusterSpecSecurity(KubernetesObject):
 class Device(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config": "raw_dict",
+        "fullpath": "scalar",
+        "name": "scalar",
+    }
+
     config: dict[str, str]
     fullpath: str
     name: str
@@ -860,6 +1213,17 @@ class Device(KubernetesObject):
 class Node(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config": "raw_dict",
+        "device_filter": "scalar",
+        "device_path_filter": "scalar",
+        "devices": ("typed_list", "Device"),
+        "name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "use_all_devices": "scalar",
+        "volume_claim_templates": ("typed_list", "core.PersistentVolumeClaimTemplate"),
+    }
+
     config: dict[str, str]
     device_filter: str
     device_path_filter: str
@@ -897,6 +1261,21 @@ class StorageClassDeviceSet(KubernetesObject):
 
     _required_ = ["count", "name", "volume_claim_templates"]
 
+    _field_types_ = {
+        "config": "raw_dict",
+        "count": "scalar",
+        "encrypted": "scalar",
+        "name": "scalar",
+        "placement": ("object", "Placement"),
+        "portable": "scalar",
+        "prepare_placement": ("object", "Placement"),
+        "resources": ("object", "core.ResourceRequirements"),
+        "scheduler_name": "scalar",
+        "tune_device_class": "scalar",
+        "tune_fast_device_class": "scalar",
+        "volume_claim_templates": ("typed_list", "core.PersistentVolumeClaimTemplate"),
+    }
+
     config: dict[str, str]
     count: int
     encrypted: bool
@@ -951,6 +1330,19 @@ class Storage(KubernetesObject):
         "onlyApplyOSDPlacement": "only_apply_osd_placement",
     }
 
+    _field_types_ = {
+        "config": "raw_dict",
+        "device_filter": "scalar",
+        "device_path_filter": "scalar",
+        "devices": ("typed_list", "Device"),
+        "nodes": ("typed_list", "Node"),
+        "only_apply_osd_placement": "scalar",
+        "storage_class_device_sets": ("typed_list", "StorageClassDeviceSet"),
+        "use_all_devices": "scalar",
+        "use_all_nodes": "scalar",
+        "volume_claim_templates": ("typed_list", "core.PersistentVolumeClaimTemplate"),
+    }
+
     config: dict[str, str]
     device_filter: str
     device_path_filter: str
@@ -1001,6 +1393,33 @@ class CephClusterSpec(KubernetesObject):
         "waitTimeoutForHealthyOSDInMinutes": "wait_timeout_for_healthy_osd_in_minutes",
     }
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "ceph_version": ("object", "CephVersion"),
+        "cleanup_policy": ("object", "CleanupPolicy"),
+        "continue_upgrade_after_checks_even_if_not_healthy": "scalar",
+        "crash_collector": ("object", "CrashCollector"),
+        "dashboard": ("object", "Dashboard"),
+        "data_dir_host_path": "scalar",
+        "disruption_management": ("object", "DisruptionManagement"),
+        "external": ("object", "External"),
+        "health_check": ("object", "CephClusterSpecHealthCheck"),
+        "labels": "raw_dict",
+        "log_collector": ("object", "LogCollector"),
+        "mgr": ("object", "MGR"),
+        "mon": ("object", "CephClusterSpecMON"),
+        "monitoring": ("object", "Monitoring"),
+        "network": ("object", "Network"),
+        "placement": "raw_dict",
+        "priority_class_names": "raw_dict",
+        "remove_os_ds_if_out_and_safe_to_remove": "scalar",
+        "resources": "raw_dict",
+        "security": ("object", "CephClusterSpecSecurity"),
+        "skip_upgrade_checks": "scalar",
+        "storage": ("object", "Storage"),
+        "wait_timeout_for_healthy_osd_in_minutes": "scalar",
+    }
+
     annotations: dict[str, dict[str, str]]
     ceph_version: CephVersion
     cleanup_policy: CleanupPolicy
@@ -1091,6 +1510,11 @@ class CephCluster(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephClusterSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephClusterSpec
 
@@ -1103,6 +1527,18 @@ class MetadataServer(KubernetesObject):
 
     _required_ = ["active_count"]
 
+    _field_types_ = {
+        "active_count": "scalar",
+        "active_standby": "scalar",
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "liveness_probe": ("object", "Probe"),
+        "placement": ("object", "Placement"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "startup_probe": ("object", "Probe"),
+    }
+
     active_count: int
     active_standby: bool
     annotations: dict[str, str]
@@ -1141,6 +1577,11 @@ class MetadataServer(KubernetesObject):
 class SnapshotRetention(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "duration": "scalar",
+        "path": "scalar",
+    }
+
     duration: str
     path: str
 
@@ -1151,6 +1592,13 @@ class SnapshotRetention(KubernetesObject):
 class CephFilesystemSpecMirroring(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "enabled": "scalar",
+        "peers": ("object", "Peer"),
+        "snapshot_retention": ("typed_list", "SnapshotRetention"),
+        "snapshot_schedules": ("typed_list", "SnapshotSchedule"),
+    }
+
     enabled: bool
     peers: Peer
     snapshot_retention: list[SnapshotRetention]
@@ -1171,6 +1619,16 @@ class CephFilesystemSpec(KubernetesObject):
 
     _required_ = ["data_pools", "metadata_pool", "metadata_server"]
 
+    _field_types_ = {
+        "data_pools": ("typed_list", "CephBlockPoolSpec"),
+        "metadata_pool": ("object", "CephBlockPoolSpec"),
+        "metadata_server": ("object", "MetadataServer"),
+        "mirroring": ("object", "CephFilesystemSpecMirroring"),
+        "preserve_filesystem_on_delete": "scalar",
+        "preserve_pools_on_delete": "scalar",
+        "status_check": ("object", "StatusCheck"),
+    }
+
     data_pools: list[CephBlockPoolSpec]
     metadata_pool: CephBlockPoolSpec
     metadata_server: MetadataServer
@@ -1210,6 +1668,11 @@ class CephFilesystem(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephFilesystemSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephFilesystemSpec
 
@@ -1220,6 +1683,14 @@ class CephFilesystem(KubernetesApiResource):
 class CephFilesystemMirrorSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "placement": ("object", "Placement"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
     placement: Placement
@@ -1249,6 +1720,11 @@ class CephFilesystemMirror(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephFilesystemMirrorSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephFilesystemMirrorSpec
 
@@ -1261,6 +1737,10 @@ class CephFilesystemSubVolumeGroupSpec(KubernetesObject):
 
     _required_ = ["filesystem_name"]
 
+    _field_types_ = {
+        "filesystem_name": "scalar",
+    }
+
     filesystem_name: str
 
     def __init__(self, filesystem_name: str = None):
@@ -1277,6 +1757,11 @@ class CephFilesystemSubVolumeGroup(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephFilesystemSubVolumeGroupSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephFilesystemSubVolumeGroupSpec
 
@@ -1287,6 +1772,11 @@ class CephFilesystemSubVolumeGroup(KubernetesApiResource):
 class Rado(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "namespace": "scalar",
+        "pool": "scalar",
+    }
+
     namespace: str
     pool: str
 
@@ -1297,6 +1787,10 @@ class Rado(KubernetesObject):
 class SssdConfigFile(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "volume_source": ("object", "core.Volume"),
+    }
+
     volume_source: core.Volume
 
     def __init__(self, volume_source: core.Volume = None):
@@ -1308,6 +1802,13 @@ class Sidecar(KubernetesObject):
 
     _required_ = ["image"]
 
+    _field_types_ = {
+        "debug_level": "scalar",
+        "image": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "sssd_config_file": ("object", "SssdConfigFile"),
+    }
+
     debug_level: int
     image: str
     resources: core.ResourceRequirements
@@ -1326,6 +1827,10 @@ class Sidecar(KubernetesObject):
 class Sssd(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "sidecar": ("object", "Sidecar"),
+    }
+
     sidecar: Sidecar
 
     def __init__(self, sidecar: Sidecar = None):
@@ -1335,6 +1840,10 @@ class Sssd(KubernetesObject):
 class CephNFSSpecSecurity(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "sssd": ("object", "Sssd"),
+    }
+
     sssd: Sssd
 
     def __init__(self, sssd: Sssd = None):
@@ -1346,6 +1855,16 @@ class Server(KubernetesObject):
 
     _required_ = ["active"]
 
+    _field_types_ = {
+        "active": "scalar",
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "log_level": "scalar",
+        "placement": ("object", "Placement"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     active: int
     annotations: dict[str, str]
     labels: dict[str, str]
@@ -1380,6 +1899,12 @@ class CephNFSSpec(KubernetesObject):
 
     _required_ = ["server"]
 
+    _field_types_ = {
+        "rados": ("object", "Rado"),
+        "security": ("object", "CephNFSSpecSecurity"),
+        "server": ("object", "Server"),
+    }
+
     rados: Rado
     security: CephNFSSpecSecurity
     server: Server
@@ -1398,6 +1923,11 @@ class CephNFS(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephNFSSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephNFSSpec
 
@@ -1408,6 +1938,10 @@ class CephNFS(KubernetesApiResource):
 class Pull(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "endpoint": "scalar",
+    }
+
     endpoint: str
 
     def __init__(self, endpoint: str = None):
@@ -1417,6 +1951,10 @@ class Pull(KubernetesObject):
 class CephObjectRealmSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pull": ("object", "Pull"),
+    }
+
     pull: Pull
 
     def __init__(self, pull: Pull = None):
@@ -1433,6 +1971,11 @@ class CephObjectRealm(KubernetesApiResource):
 
     _required_ = ["metadata"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephObjectRealmSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephObjectRealmSpec
 
@@ -1445,6 +1988,13 @@ class ExternalRgwEndpoint(KubernetesObject):
 
     _required_ = ["ip"]
 
+    _field_types_ = {
+        "hostname": "scalar",
+        "ip": "scalar",
+        "node_name": "scalar",
+        "target_ref": ("object", "TargetRef"),
+    }
+
     hostname: str
     ip: str
     node_name: str
@@ -1457,6 +2007,10 @@ class ExternalRgwEndpoint(KubernetesObject):
 class Service(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+    }
+
     annotations: dict[str, str]
 
     def __init__(self, annotations: dict[str, str] = None):
@@ -1466,6 +2020,22 @@ class Service(KubernetesObject):
 class Gateway(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "ca_bundle_ref": "scalar",
+        "external_rgw_endpoints": ("typed_list", "ExternalRgwEndpoint"),
+        "host_network": "scalar",
+        "instances": "scalar",
+        "labels": "raw_dict",
+        "placement": ("object", "Placement"),
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "secure_port": "scalar",
+        "service": ("object", "Service"),
+        "ssl_certificate_ref": "scalar",
+    }
+
     annotations: dict[str, str]
     ca_bundle_ref: str
     external_rgw_endpoints: list[ExternalRgwEndpoint]
@@ -1516,6 +2086,13 @@ class Gateway(KubernetesObject):
 class CephObjectStoreSpecHealthCheck(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "bucket": ("object", "Bucket"),
+        "liveness_probe": ("object", "Probe"),
+        "readiness_probe": ("object", "Probe"),
+        "startup_probe": ("object", "Probe"),
+    }
+
     bucket: Bucket
     liveness_probe: Probe
     readiness_probe: Probe
@@ -1528,6 +2105,11 @@ class CephObjectStoreSpecHealthCheck(KubernetesObject):
 class S3(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "connection_details": "raw_dict",
+        "token_secret_name": "scalar",
+    }
+
     connection_details: dict[str, str]
     token_secret_name: str
 
@@ -1538,6 +2120,11 @@ class S3(KubernetesObject):
 class CephObjectStoreSpecSecurity(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "kms": ("object", "KMS"),
+        "s3": ("object", "S3"),
+    }
+
     kms: KMS
     s3: S3
 
@@ -1550,6 +2137,10 @@ class CephObjectStoreSpecZone(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+    }
+
     name: str
 
     def __init__(self, name: str = None):
@@ -1559,6 +2150,16 @@ class CephObjectStoreSpecZone(KubernetesObject):
 class CephObjectStoreSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "data_pool": ("object", "CephBlockPoolSpec"),
+        "gateway": ("object", "Gateway"),
+        "health_check": ("object", "CephObjectStoreSpecHealthCheck"),
+        "metadata_pool": ("object", "CephBlockPoolSpec"),
+        "preserve_pools_on_delete": "scalar",
+        "security": ("object", "CephObjectStoreSpecSecurity"),
+        "zone": ("object", "CephObjectStoreSpecZone"),
+    }
+
     data_pool: CephBlockPoolSpec
     gateway: Gateway
     health_check: CephObjectStoreSpecHealthCheck
@@ -1598,6 +2199,11 @@ class CephObjectStore(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephObjectStoreSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephObjectStoreSpec
 
@@ -1608,6 +2214,12 @@ class CephObjectStore(KubernetesApiResource):
 class CephObjectStoreUserSpecQuota(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "max_buckets": "scalar",
+        "max_objects": "scalar",
+        "max_size": "union",
+    }
+
     max_buckets: int
     max_objects: int
     max_size: core.IntOrString
@@ -1619,6 +2231,13 @@ class CephObjectStoreUserSpecQuota(KubernetesObject):
 class CephObjectStoreUserSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "capabilities": ("object", "Capability"),
+        "display_name": "scalar",
+        "quotas": ("object", "CephObjectStoreUserSpecQuota"),
+        "store": "scalar",
+    }
+
     capabilities: Capability
     display_name: str
     quotas: CephObjectStoreUserSpecQuota
@@ -1640,6 +2259,11 @@ class CephObjectStoreUser(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephObjectStoreUserSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephObjectStoreUserSpec
 
@@ -1652,6 +2276,13 @@ class CephObjectZoneSpec(KubernetesObject):
 
     _required_ = ["data_pool", "metadata_pool", "zone_group"]
 
+    _field_types_ = {
+        "custom_endpoints": "raw_list",
+        "data_pool": ("object", "CephBlockPoolSpec"),
+        "metadata_pool": ("object", "CephBlockPoolSpec"),
+        "zone_group": "scalar",
+    }
+
     custom_endpoints: list[str]
     data_pool: CephBlockPoolSpec
     metadata_pool: CephBlockPoolSpec
@@ -1677,6 +2308,11 @@ class CephObjectZone(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephObjectZoneSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephObjectZoneSpec
 
@@ -1689,6 +2325,10 @@ class CephObjectZoneGroupSpec(KubernetesObject):
 
     _required_ = ["realm"]
 
+    _field_types_ = {
+        "realm": "scalar",
+    }
+
     realm: str
 
     def __init__(self, realm: str = None):
@@ -1705,6 +2345,11 @@ class CephObjectZoneGroup(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephObjectZoneGroupSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephObjectZoneGroupSpec
 
@@ -1717,6 +2362,16 @@ class CephRBDMirrorSpec(KubernetesObject):
 
     _required_ = ["count"]
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "count": "scalar",
+        "labels": "raw_dict",
+        "peers": ("object", "Peer"),
+        "placement": ("object", "Placement"),
+        "priority_class_name": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+    }
+
     annotations: dict[str, str]
     count: int
     labels: dict[str, str]
@@ -1756,6 +2411,11 @@ class CephRBDMirror(KubernetesApiResource):
 
     _required_ = ["metadata", "spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "CephRBDMirrorSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: CephRBDMirrorSpec
 
@@ -1766,6 +2426,15 @@ class CephRBDMirror(KubernetesApiResource):
 class ObjectBucketSpecEndpoint(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_config": "raw_dict",
+        "bucket_host": "scalar",
+        "bucket_name": "scalar",
+        "bucket_port": "scalar",
+        "region": "scalar",
+        "sub_region": "scalar",
+    }
+
     additional_config: dict[str, t.Any]
     bucket_host: str
     bucket_name: str
@@ -1795,6 +2464,15 @@ class ObjectBucketSpecEndpoint(KubernetesObject):
 class ObjectBucketSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_state": "raw_dict",
+        "authentication": "raw_dict",
+        "claim_ref": "raw_dict",
+        "endpoint": ("object", "ObjectBucketSpecEndpoint"),
+        "reclaim_policy": "scalar",
+        "storage_class_name": "scalar",
+    }
+
     additional_state: dict[str, t.Any]
     authentication: dict[str, t.Any]
     claim_ref: dict[str, t.Any]
@@ -1829,6 +2507,11 @@ class ObjectBucket(KubernetesApiResource):
     _kind_ = "ObjectBucket"
     _scope_ = "cluster"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ObjectBucketSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ObjectBucketSpec
 
@@ -1839,6 +2522,14 @@ class ObjectBucket(KubernetesApiResource):
 class ObjectBucketClaimSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "additional_config": "raw_dict",
+        "bucket_name": "scalar",
+        "generate_bucket_name": "scalar",
+        "object_bucket_name": "scalar",
+        "storage_class_name": "scalar",
+    }
+
     additional_config: dict[str, t.Any]
     bucket_name: str
     generate_bucket_name: str
@@ -1870,6 +2561,11 @@ class ObjectBucketClaim(KubernetesApiResource):
     _kind_ = "ObjectBucketClaim"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "ObjectBucketClaimSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: ObjectBucketClaimSpec
 
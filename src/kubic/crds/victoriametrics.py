@@ -1,10 +1,23 @@
-from kubic import KubernetesApiResource, KubernetesObject
-from ..api import apps, core, meta
+from __future__ import annotations
+
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, lazy_modules
+
+if t.TYPE_CHECKING:
+    from ..api import apps, core, meta
+
+__getattr__ = lazy_modules(globals(), apps="..api", core="..api", meta="..api")
 
 
 class BasicAuth(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "password": ("object", "core.SecretKeySelector"),
+        "username": ("object", "core.SecretKeySelector"),
+    }
+
     password: core.SecretKeySelector
     username: core.SecretKeySelector
 
@@ -15,6 +28,11 @@ class BasicAuth(KubernetesObject):
 class CA(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -25,6 +43,11 @@ class CA(KubernetesObject):
 class Cert(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map": ("object", "core.ConfigMapKeySelector"),
+        "secret": ("object", "core.SecretKeySelector"),
+    }
+
     config_map: core.ConfigMapKeySelector
     secret: core.SecretKeySelector
 
@@ -35,6 +58,17 @@ class Cert(KubernetesObject):
 class TLSConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ca": ("object", "CA"),
+        "ca_file": "scalar",
+        "cert": ("object", "Cert"),
+        "cert_file": "scalar",
+        "insecure_skip_verify": "scalar",
+        "key_file": "scalar",
+        "key_secret": ("object", "core.SecretKeySelector"),
+        "server_name": "scalar",
+    }
+
     ca: CA
     ca_file: str
     cert: Cert
@@ -72,6 +106,14 @@ class APIServerConfig(KubernetesObject):
 
     _required_ = ["host"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token": "scalar",
+        "bearer_token_file": "scalar",
+        "host": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     basic_auth: BasicAuth
     bearer_token: str
     bearer_token_file: str
@@ -94,6 +136,10 @@ class APIServerConfig(KubernetesObject):
 class ArbitraryFSAccessThroughSM(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "deny": "scalar",
+    }
+
     deny: bool
 
     def __init__(self, deny: bool = None):
@@ -105,6 +151,12 @@ class Datasource(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "tls_config": ("object", "TLSConfig"),
+        "url": "scalar",
+    }
+
     basic_auth: BasicAuth
     tls_config: TLSConfig
     url: str
@@ -116,6 +168,12 @@ class Datasource(KubernetesObject):
 class Metadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "name": "scalar",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
     name: str
@@ -127,6 +185,13 @@ class Metadata(KubernetesObject):
 class EmbeddedPersistentVolumeClaim(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "kind": "scalar",
+        "metadata": ("object", "Metadata"),
+        "spec": ("object", "core.PersistentVolumeClaimSpec"),
+    }
+
     api_version: str
     kind: str
     metadata: Metadata
@@ -139,6 +204,16 @@ class EmbeddedPersistentVolumeClaim(KubernetesObject):
 class RelabelConfig(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "action": "scalar",
+        "modulus": "scalar",
+        "regex": "scalar",
+        "replacement": "scalar",
+        "separator": "scalar",
+        "source_labels": "raw_list",
+        "target_label": "scalar",
+    }
+
     action: str
     modulus: int
     regex: str
@@ -178,6 +253,25 @@ class Endpoint(KubernetesObject):
         "proxyURL": "proxy_url",
     }
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_file": "scalar",
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "interval": "scalar",
+        "metric_relabel_configs": ("typed_list", "RelabelConfig"),
+        "params": "raw_dict",
+        "path": "scalar",
+        "port": "scalar",
+        "proxy_url": "scalar",
+        "relabel_configs": ("typed_list", "RelabelConfig"),
+        "scheme": "scalar",
+        "scrape_timeout": "scalar",
+        "target_port": "union",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     basic_auth: BasicAuth
     bearer_token_file: str
     bearer_token_secret: core.ConfigMapKeySelector
@@ -239,6 +333,11 @@ class FieldRef(KubernetesObject):
 
     _required_ = ["field_path"]
 
+    _field_types_ = {
+        "api_version": "scalar",
+        "field_path": "scalar",
+    }
+
     api_version: str
     field_path: str
 
@@ -251,6 +350,12 @@ class ResourceFieldRef(KubernetesObject):
 
     _required_ = ["resource"]
 
+    _field_types_ = {
+        "container_name": "scalar",
+        "divisor": "union",
+        "resource": "scalar",
+    }
+
     container_name: str
     divisor: core.IntOrString
     resource: str
@@ -262,6 +367,13 @@ class ResourceFieldRef(KubernetesObject):
 class ValueFrom(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "config_map_key_ref": ("object", "core.ConfigMapKeySelector"),
+        "field_ref": ("object", "FieldRef"),
+        "resource_field_ref": ("object", "ResourceFieldRef"),
+        "secret_key_ref": ("object", "core.SecretKeySelector"),
+    }
+
     config_map_key_ref: core.ConfigMapKeySelector
     field_ref: FieldRef
     resource_field_ref: ResourceFieldRef
@@ -284,6 +396,12 @@ class ExtraEnv(KubernetesObject):
 
     _required_ = ["name"]
 
+    _field_types_ = {
+        "name": "scalar",
+        "value": "scalar",
+        "value_from": ("object", "ValueFrom"),
+    }
+
     name: str
     value: str
     value_from: ValueFrom
@@ -299,6 +417,15 @@ class Rule(KubernetesObject):
         "for": "for_",
     }
 
+    _field_types_ = {
+        "alert": "scalar",
+        "annotations": "raw_dict",
+        "expr": "union",
+        "for_": "scalar",
+        "labels": "raw_dict",
+        "record": "scalar",
+    }
+
     alert: str
     annotations: dict[str, str]
     expr: core.IntOrString
@@ -323,6 +450,13 @@ class Group(KubernetesObject):
 
     _required_ = ["name", "rules"]
 
+    _field_types_ = {
+        "concurrency": "scalar",
+        "interval": "scalar",
+        "name": "scalar",
+        "rules": ("typed_list", "Rule"),
+    }
+
     concurrency: int
     interval: str
     name: str
@@ -335,6 +469,11 @@ class Group(KubernetesObject):
 class Host_aliase(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "hostnames": "raw_list",
+        "ip": "scalar",
+    }
+
     hostnames: list[str]
     ip: str
 
@@ -345,6 +484,12 @@ class Host_aliase(KubernetesObject):
 class Image(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "pull_policy": "scalar",
+        "repository": "scalar",
+        "tag": "scalar",
+    }
+
     pull_policy: str
     repository: str
     tag: str
@@ -356,6 +501,11 @@ class Image(KubernetesObject):
 class NamespaceSelector(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "any": "scalar",
+        "match_names": "raw_list",
+    }
+
     any: bool
     match_names: list[str]
 
@@ -366,6 +516,12 @@ class NamespaceSelector(KubernetesObject):
 class Ingress(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "relabeling_configs": ("typed_list", "RelabelConfig"),
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     namespace_selector: NamespaceSelector
     relabeling_configs: list[RelabelConfig]
     selector: meta.LabelSelector
@@ -391,6 +547,13 @@ class InsertPort(KubernetesObject):
         "openTSDBPort": "open_tsdb_port",
     }
 
+    _field_types_ = {
+        "graphite_port": "scalar",
+        "influx_port": "scalar",
+        "open_tsdbhttp_port": "scalar",
+        "open_tsdb_port": "scalar",
+    }
+
     graphite_port: str
     influx_port: str
     open_tsdbhttp_port: str
@@ -407,6 +570,12 @@ class Notifier(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "tls_config": ("object", "TLSConfig"),
+        "url": "scalar",
+    }
+
     basic_auth: BasicAuth
     tls_config: TLSConfig
     url: str
@@ -418,6 +587,11 @@ class Notifier(KubernetesObject):
 class PodDisruptionBudget(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "max_unavailable": "union",
+        "min_available": "union",
+    }
+
     max_unavailable: core.IntOrString
     min_available: core.IntOrString
 
@@ -428,6 +602,12 @@ class PodDisruptionBudget(KubernetesObject):
 class PodMetadata(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "annotations": "raw_dict",
+        "labels": "raw_dict",
+        "name": "scalar",
+    }
+
     annotations: dict[str, str]
     labels: dict[str, str]
     name: str
@@ -441,6 +621,13 @@ class RemoteRead(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "lookback": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+        "url": "scalar",
+    }
+
     basic_auth: BasicAuth
     lookback: str
     tls_config: TLSConfig
@@ -462,6 +649,15 @@ class RemoteWriteSetting(KubernetesObject):
         "showURL": "show_url",
     }
 
+    _field_types_ = {
+        "flush_interval": "scalar",
+        "max_block_size": "scalar",
+        "max_disk_usage_per_url": "scalar",
+        "queues": "scalar",
+        "show_url": "scalar",
+        "tmp_data_path": "scalar",
+    }
+
     flush_interval: str
     max_block_size: int
     max_disk_usage_per_url: int
@@ -491,6 +687,11 @@ class RemoteWriteSetting(KubernetesObject):
 class Resource(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "limits": "raw_dict",
+        "requests": "raw_dict",
+    }
+
     limits: dict[str, core.IntOrString]
     requests: dict[str, core.IntOrString]
 
@@ -501,6 +702,11 @@ class Resource(KubernetesObject):
 class RollingUpdate(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "max_surge": "union",
+        "max_unavailable": "union",
+    }
+
     max_surge: core.IntOrString
     max_unavailable: core.IntOrString
 
@@ -513,6 +719,11 @@ class ServiceSpec(KubernetesObject):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "Metadata"),
+        "spec": ("object", "core.ServiceSpec"),
+    }
+
     metadata: Metadata
     spec: core.ServiceSpec
 
@@ -525,6 +736,12 @@ class StaticConfig(KubernetesObject):
 
     _required_ = ["targets"]
 
+    _field_types_ = {
+        "labels": "raw_dict",
+        "relabeling_configs": ("typed_list", "RelabelConfig"),
+        "targets": "raw_list",
+    }
+
     labels: dict[str, str]
     relabeling_configs: list[RelabelConfig]
     targets: list[str]
@@ -536,6 +753,12 @@ class StaticConfig(KubernetesObject):
 class StorageSpec(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "disable_mount_sub_path": "scalar",
+        "empty_dir": ("object", "core.EmptyDirVolumeSource"),
+        "volume_claim_template": ("object", "EmbeddedPersistentVolumeClaim"),
+    }
+
     disable_mount_sub_path: bool
     empty_dir: core.EmptyDirVolumeSource
     volume_claim_template: EmbeddedPersistentVolumeClaim
@@ -552,6 +775,11 @@ class StorageSpec(KubernetesObject):
 class Target(KubernetesObject):
     __slots__ = ()
 
+    _field_types_ = {
+        "ingress": ("object", "Ingress"),
+        "static_config": ("object", "StaticConfig"),
+    }
+
     ingress: Ingress
     static_config: StaticConfig
 
@@ -571,6 +799,26 @@ class TargetEndpoint(KubernetesObject):
         "proxyURL": "proxy_url",
     }
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_file": "scalar",
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "interval": "scalar",
+        "labels": "raw_dict",
+        "metric_relabel_configs": ("typed_list", "RelabelConfig"),
+        "params": "raw_dict",
+        "path": "scalar",
+        "port": "scalar",
+        "proxy_url": "scalar",
+        "relabel_configs": ("typed_list", "RelabelConfig"),
+        "scheme": "scalar",
+        "scrape_timeout": "scalar",
+        "targets": "raw_list",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     basic_auth: BasicAuth
     bearer_token_file: str
     bearer_token_secret: core.ConfigMapKeySelector
@@ -635,6 +883,17 @@ class VMAgentSpecRemoteWrite(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "inline_url_relabel_config": ("typed_list", "RelabelConfig"),
+        "label": "raw_dict",
+        "send_timeout": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+        "url": "scalar",
+        "url_relabel_config": ("object", "core.ConfigMapKeySelector"),
+    }
+
     basic_auth: BasicAuth
     bearer_token_secret: core.ConfigMapKeySelector
     inline_url_relabel_config: list[RelabelConfig]
@@ -680,6 +939,71 @@ class VMAgentSpec(KubernetesObject):
         "arbitraryFSAccessThroughSMs": "arbitrary_fs_access_through_sms",
     }
 
+    _field_types_ = {
+        "api_server_config": ("object", "APIServerConfig"),
+        "additional_scrape_configs": ("object", "core.SecretKeySelector"),
+        "affinity": ("object", "core.Affinity"),
+        "arbitrary_fs_access_through_sms": ("object", "ArbitraryFSAccessThroughSM"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "enforced_namespace_label": "scalar",
+        "external_labels": "raw_dict",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_network": "scalar",
+        "host_aliases": ("typed_list", "Host_aliase"),
+        "ignore_namespace_selectors": "scalar",
+        "image": ("object", "Image"),
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "inline_relabel_config": ("typed_list", "RelabelConfig"),
+        "inline_scrape_config": "scalar",
+        "insert_ports": ("object", "InsertPort"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "node_scrape_namespace_selector": ("object", "meta.LabelSelector"),
+        "node_scrape_selector": ("object", "meta.LabelSelector"),
+        "override_honor_labels": "scalar",
+        "override_honor_timestamps": "scalar",
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_scrape_namespace_selector": ("object", "meta.LabelSelector"),
+        "pod_scrape_selector": ("object", "meta.LabelSelector"),
+        "pod_security_policy_name": "scalar",
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "probe_namespace_selector": ("object", "meta.LabelSelector"),
+        "probe_selector": ("object", "meta.LabelSelector"),
+        "readiness_probe": ("object", "core.Probe"),
+        "relabel_config": ("object", "core.ConfigMapKeySelector"),
+        "remote_write": ("typed_list", "VMAgentSpecRemoteWrite"),
+        "remote_write_settings": ("object", "RemoteWriteSetting"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "rolling_update": ("object", "apps.RollingUpdateDeployment"),
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "scrape_interval": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_scrape_namespace_selector": ("object", "meta.LabelSelector"),
+        "service_scrape_selector": ("object", "meta.LabelSelector"),
+        "service_spec": ("object", "ServiceSpec"),
+        "shard_count": "scalar",
+        "startup_probe": ("object", "core.Probe"),
+        "static_scrape_namespace_selector": ("object", "meta.LabelSelector"),
+        "static_scrape_selector": ("object", "meta.LabelSelector"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "update_strategy": "scalar",
+        "vm_agent_external_label_name": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     api_server_config: APIServerConfig
     additional_scrape_configs: core.SecretKeySelector
     affinity: core.Affinity
@@ -882,6 +1206,11 @@ class VMAgent(KubernetesApiResource):
     _kind_ = "VMAgent"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMAgentSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMAgentSpec
 
@@ -894,6 +1223,16 @@ class VMAlertSpecRemoteWrite(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "concurrency": "scalar",
+        "flush_interval": "scalar",
+        "max_batch_size": "scalar",
+        "max_queue_size": "scalar",
+        "tls_config": ("object", "TLSConfig"),
+        "url": "scalar",
+    }
+
     basic_auth: BasicAuth
     concurrency: int
     flush_interval: str
@@ -928,6 +1267,54 @@ class VMAlertSpec(KubernetesObject):
 
     _required_ = ["datasource"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "datasource": ("object", "Datasource"),
+        "dns_policy": "scalar",
+        "enforced_namespace_label": "scalar",
+        "evaluation_interval": "scalar",
+        "external_labels": "raw_dict",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "notifier": ("object", "Notifier"),
+        "notifiers": ("typed_list", "Notifier"),
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_security_policy_name": "scalar",
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "remote_read": ("object", "RemoteRead"),
+        "remote_write": ("object", "VMAlertSpecRemoteWrite"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "rolling_update": ("object", "RollingUpdate"),
+        "rule_namespace_selector": ("object", "meta.LabelSelector"),
+        "rule_path": "raw_list",
+        "rule_selector": ("object", "meta.LabelSelector"),
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "update_strategy": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     affinity: core.Affinity
     config_maps: list[str]
     containers: list[core.Container]
@@ -1079,6 +1466,11 @@ class VMAlert(KubernetesApiResource):
     _kind_ = "VMAlert"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMAlertSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMAlertSpec
 
@@ -1096,6 +1488,50 @@ class VMAlertmanagerSpec(KubernetesObject):
         "externalURL": "external_url",
     }
 
+    _field_types_ = {
+        "additional_peers": "raw_list",
+        "affinity": ("object", "core.Affinity"),
+        "cluster_advertise_address": "scalar",
+        "config_maps": "raw_list",
+        "config_raw_yaml": "scalar",
+        "config_secret": "scalar",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "external_url": "scalar",
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "listen_local": "scalar",
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "node_selector": "raw_dict",
+        "paused": "scalar",
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_security_policy_name": "scalar",
+        "port_name": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "retention": "scalar",
+        "route_prefix": "scalar",
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "storage": ("object", "StorageSpec"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     additional_peers: list[str]
     affinity: core.Affinity
     cluster_advertise_address: str
@@ -1237,6 +1673,11 @@ class VMAlertmanager(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMAlertmanagerSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMAlertmanagerSpec
 
@@ -1249,6 +1690,42 @@ class VMInsert(KubernetesObject):
 
     _required_ = ["replica_count"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "init_containers": ("typed_list", "core.Container"),
+        "insert_ports": ("object", "InsertPort"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "name": "scalar",
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "rolling_update": ("object", "RollingUpdate"),
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "update_strategy": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     affinity: core.Affinity
     config_maps: list[str]
     containers: list[core.Container]
@@ -1361,6 +1838,42 @@ class VMSelect(KubernetesObject):
 
     _required_ = ["replica_count"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "cache_mount_path": "scalar",
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "init_containers": ("typed_list", "core.Container"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "name": "scalar",
+        "persistent_volume": ("object", "StorageSpec"),
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "storage": ("object", "StorageSpec"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     affinity: core.Affinity
     cache_mount_path: str
     config_maps: list[str]
@@ -1480,6 +1993,25 @@ class VmBackup(KubernetesObject):
         "acceptEULA": "accept_eula",
     }
 
+    _field_types_ = {
+        "accept_eula": "scalar",
+        "concurrency": "scalar",
+        "credentials_secret": ("object", "core.ConfigMapKeySelector"),
+        "custom_s3_endpoint": "scalar",
+        "destination": "scalar",
+        "disable_daily": "scalar",
+        "disable_hourly": "scalar",
+        "disable_monthly": "scalar",
+        "disable_weekly": "scalar",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "ExtraEnv"),
+        "image": ("object", "Image"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "port": "scalar",
+        "resources": ("object", "Resource"),
+    }
+
     accept_eula: bool
     concurrency: int
     credentials_secret: core.ConfigMapKeySelector
@@ -1550,6 +2082,47 @@ class VMStorage(KubernetesObject):
         "maintenanceSelectNodeIDs": "maintenance_select_node_ids",
     }
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "init_containers": ("typed_list", "core.Container"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "maintenance_insert_node_ids": "raw_list",
+        "maintenance_select_node_ids": "raw_list",
+        "name": "scalar",
+        "pod_disruption_budget": ("object", "PodDisruptionBudget"),
+        "pod_metadata": ("object", "PodMetadata"),
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "storage": ("object", "StorageSpec"),
+        "storage_data_path": "scalar",
+        "termination_grace_period_seconds": "scalar",
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "vm_backup": ("object", "VmBackup"),
+        "vm_insert_port": "scalar",
+        "vm_select_port": "scalar",
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     affinity: core.Affinity
     config_maps: list[str]
     containers: list[core.Container]
@@ -1677,6 +2250,18 @@ class VMClusterSpec(KubernetesObject):
 
     _required_ = ["retention_period"]
 
+    _field_types_ = {
+        "cluster_version": "scalar",
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "pod_security_policy_name": "scalar",
+        "replication_factor": "scalar",
+        "retention_period": "scalar",
+        "service_account_name": "scalar",
+        "vminsert": ("object", "VMInsert"),
+        "vmselect": ("object", "VMSelect"),
+        "vmstorage": ("object", "VMStorage"),
+    }
+
     cluster_version: str
     image_pull_secrets: list[core.LocalObjectReference]
     pod_security_policy_name: str
@@ -1722,6 +2307,11 @@ class VMCluster(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMClusterSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMClusterSpec
 
@@ -1739,6 +2329,28 @@ class VMNodeScrapeSpec(KubernetesObject):
         "proxyURL": "proxy_url",
     }
 
+    _field_types_ = {
+        "basic_auth": ("object", "BasicAuth"),
+        "bearer_token_file": "scalar",
+        "bearer_token_secret": ("object", "core.ConfigMapKeySelector"),
+        "honor_labels": "scalar",
+        "honor_timestamps": "scalar",
+        "interval": "scalar",
+        "job_label": "scalar",
+        "metric_relabel_configs": ("typed_list", "RelabelConfig"),
+        "params": "raw_dict",
+        "path": "scalar",
+        "port": "scalar",
+        "proxy_url": "scalar",
+        "relabel_configs": ("typed_list", "RelabelConfig"),
+        "sample_limit": "scalar",
+        "scheme": "scalar",
+        "scrape_timeout": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "target_labels": "raw_list",
+        "tls_config": ("object", "TLSConfig"),
+    }
+
     basic_auth: BasicAuth
     bearer_token_file: str
     bearer_token_secret: core.ConfigMapKeySelector
@@ -1812,6 +2424,11 @@ class VMNodeScrape(KubernetesApiResource):
     _kind_ = "VMNodeScrape"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMNodeScrapeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMNodeScrapeSpec
 
@@ -1824,6 +2441,15 @@ class VMPodScrapeSpec(KubernetesObject):
 
     _required_ = ["pod_metrics_endpoints", "selector"]
 
+    _field_types_ = {
+        "job_label": "scalar",
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "pod_metrics_endpoints": ("typed_list", "Endpoint"),
+        "pod_target_labels": "raw_list",
+        "sample_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+    }
+
     job_label: str
     namespace_selector: NamespaceSelector
     pod_metrics_endpoints: list[Endpoint]
@@ -1858,6 +2484,11 @@ class VMPodScrape(KubernetesApiResource):
     _kind_ = "VMPodScrape"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMPodScrapeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMPodScrapeSpec
 
@@ -1870,6 +2501,12 @@ class VmProberSpec(KubernetesObject):
 
     _required_ = ["url"]
 
+    _field_types_ = {
+        "path": "scalar",
+        "scheme": "scalar",
+        "url": "scalar",
+    }
+
     path: str
     scheme: str
     url: str
@@ -1883,6 +2520,15 @@ class VMProbeSpec(KubernetesObject):
 
     _required_ = ["vm_prober_spec"]
 
+    _field_types_ = {
+        "interval": "scalar",
+        "job_name": "scalar",
+        "module": "scalar",
+        "scrape_timeout": "scalar",
+        "targets": ("object", "Target"),
+        "vm_prober_spec": ("object", "VmProberSpec"),
+    }
+
     interval: str
     job_name: str
     module: str
@@ -1919,6 +2565,11 @@ class VMProbe(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMProbeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMProbeSpec
 
@@ -1931,6 +2582,10 @@ class VMRuleSpec(KubernetesObject):
 
     _required_ = ["groups"]
 
+    _field_types_ = {
+        "groups": ("typed_list", "Group"),
+    }
+
     groups: list[Group]
 
     def __init__(self, groups: list[Group] = None):
@@ -1947,6 +2602,11 @@ class VMRule(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMRuleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMRuleSpec
 
@@ -1959,6 +2619,17 @@ class VMServiceScrapeSpec(KubernetesObject):
 
     _required_ = ["endpoints", "selector"]
 
+    _field_types_ = {
+        "discovery_role": "scalar",
+        "endpoints": ("typed_list", "Endpoint"),
+        "job_label": "scalar",
+        "namespace_selector": ("object", "NamespaceSelector"),
+        "pod_target_labels": "raw_list",
+        "sample_limit": "scalar",
+        "selector": ("object", "meta.LabelSelector"),
+        "target_labels": "raw_list",
+    }
+
     discovery_role: str
     endpoints: list[Endpoint]
     job_label: str
@@ -2001,6 +2672,11 @@ class VMServiceScrape(KubernetesApiResource):
 
     _required_ = ["spec"]
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMServiceScrapeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMServiceScrapeSpec
 
@@ -2013,6 +2689,46 @@ class VMSingleSpec(KubernetesObject):
 
     _required_ = ["retention_period"]
 
+    _field_types_ = {
+        "affinity": ("object", "core.Affinity"),
+        "config_maps": "raw_list",
+        "containers": ("typed_list", "core.Container"),
+        "dns_policy": "scalar",
+        "extra_args": "raw_dict",
+        "extra_envs": ("typed_list", "core.EnvVar"),
+        "host_aliases": ("typed_list", "core.HostAlias"),
+        "host_network": "scalar",
+        "image": ("object", "Image"),
+        "image_pull_secrets": ("typed_list", "core.LocalObjectReference"),
+        "init_containers": ("typed_list", "core.Container"),
+        "insert_ports": ("object", "InsertPort"),
+        "liveness_probe": ("object", "core.Probe"),
+        "log_format": "scalar",
+        "log_level": "scalar",
+        "pod_metadata": ("object", "PodMetadata"),
+        "pod_security_policy_name": "scalar",
+        "port": "scalar",
+        "priority_class_name": "scalar",
+        "readiness_probe": ("object", "core.Probe"),
+        "remove_pvc_after_delete": "scalar",
+        "replica_count": "scalar",
+        "resources": ("object", "core.ResourceRequirements"),
+        "retention_period": "scalar",
+        "runtime_class_name": "scalar",
+        "scheduler_name": "scalar",
+        "secrets": "raw_list",
+        "security_context": ("object", "core.PodSecurityContext"),
+        "service_account_name": "scalar",
+        "service_spec": ("object", "ServiceSpec"),
+        "startup_probe": ("object", "core.Probe"),
+        "storage": ("object", "core.PersistentVolumeClaimSpec"),
+        "tolerations": ("typed_list", "core.Toleration"),
+        "topology_spread_constraints": ("typed_list", "core.TopologySpreadConstraint"),
+        "vm_backup": ("object", "VmBackup"),
+        "volume_mounts": ("typed_list", "core.VolumeMount"),
+        "volumes": ("typed_list", "core.Volume"),
+    }
+
     affinity: core.Affinity
     config_maps: list[str]
     containers: list[core.Container]
@@ -2140,6 +2856,11 @@ class VMSingle(KubernetesApiResource):
     _kind_ = "VMSingle"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMSingleSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMSingleSpec
 
@@ -2152,6 +2873,12 @@ class VMStaticScrapeSpec(KubernetesObject):
 
     _required_ = ["target_endpoints"]
 
+    _field_types_ = {
+        "job_name": "scalar",
+        "sample_limit": "scalar",
+        "target_endpoints": ("typed_list", "TargetEndpoint"),
+    }
+
     job_name: str
     sample_limit: int
     target_endpoints: list[TargetEndpoint]
@@ -2168,6 +2895,11 @@ class VMStaticScrape(KubernetesApiResource):
     _kind_ = "VMStaticScrape"
     _scope_ = "namespace"
 
+    _field_types_ = {
+        "metadata": ("object", "meta.ObjectMeta"),
+        "spec": ("object", "VMStaticScrapeSpec"),
+    }
+
     metadata: meta.ObjectMeta
     spec: VMStaticScrapeSpec
 
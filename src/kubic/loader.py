@@ -0,0 +1,92 @@
+"""YAML loader building plain values straight from parser events.
+
+It does not compose a node graph first (like yaml.load() does), which is faster, and lets subclasses load
+documents selectively: kubic.reader yields the items of List documents one at a time, and pykapi prunes the
+CRD schemas it does not use. Subclasses drive the parser with get_event()/peek_event()/check_event(), and build
+values with the _load_*() methods.
+"""
+
+import yaml
+from yaml.events import AliasEvent, MappingEndEvent, MappingStartEvent, ScalarEvent, SequenceEndEvent, SequenceStartEvent
+from yaml.nodes import ScalarNode
+
+__all__ = ["EventLoader", "is_plain_mapping"]
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_MAP_TAG = "tag:yaml.org,2002:map"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def is_plain_mapping(event) -> bool:
+    """True for the start of a mapping without explicit tag (or with the default one)."""
+    return type(event) is MappingStartEvent and event.tag in (None, "!", _MAP_TAG)
+
+
+class EventLoader(yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader):
+    def __init__(self, stream):
+        super().__init__(stream)
+        self._anchors = {}
+
+    def _load_value(self):
+        event = self.get_event()
+        cls = type(event)
+        if cls is ScalarEvent:
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self.resolve(ScalarNode, event.value, event.implicit)
+            if tag == _STR_TAG:
+                value = event.value
+            else:
+                constructor = self.yaml_constructors.get(tag) or self.yaml_constructors[None]
+                value = constructor(self, ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style))
+        elif cls is MappingStartEvent:
+            value = self._load_mapping()
+        elif cls is SequenceStartEvent:
+            value = []
+            while not self.check_event(SequenceEndEvent):
+                value.append(self._load_value())
+            self.get_event()
+        elif cls is AliasEvent:
+            if event.anchor not in self._anchors:
+                raise yaml.composer.ComposerError(None, None, f"found undefined alias {event.anchor}", event.start_mark)
+            return self._anchors[event.anchor]
+        else:
+            raise yaml.constructor.ConstructorError(None, None, f"unexpected event {event}", event.start_mark)
+
+        if event.anchor is not None:
+            self._anchors[event.anchor] = value
+        return value
+
+    def _load_mapping(self) -> dict:
+        value = {}
+        merged = None
+        while not self.check_event(MappingEndEvent):
+            if self._check_merge_key():
+                self.get_event()
+                merged = self._load_merge(merged)
+            else:
+                key = self._load_value()
+                value[key] = self._load_value()
+        self.get_event()
+        # explicit keys take precedence over merged ones
+        return {**merged, **value} if merged else value
+
+    def _check_merge_key(self) -> bool:
+        event = self.peek_event()
+        return (
+            type(event) is ScalarEvent
+            and event.value == "<<"
+            and event.tag is None
+            and self.resolve(ScalarNode, event.value, event.implicit) == _MERGE_TAG
+        )
+
+    def _load_merge(self, merged: dict | None) -> dict:
+        mark = self.peek_event().start_mark
+        value = self._load_value()
+        mappings = value if isinstance(value, list) else [value]
+        merged = merged or {}
+        for mapping in reversed(mappings):
+            if not isinstance(mapping, dict):
+                raise yaml.constructor.ConstructorError(None, None, "expected a mapping for merging", mark)
+            merged.update(mapping)
+        return merged
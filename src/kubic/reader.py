@@ -1,11 +1,16 @@
 import importlib.util
 import inspect
+import os
 import pkgutil
 import typing as t
+from collections.abc import Iterator
 from importlib.machinery import ModuleSpec
 from types import ModuleType
 
+from yaml.events import MappingEndEvent, MappingStartEvent, SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+
 from . import KubernetesApiResource, KubernetesObject, _TypedList
+from .loader import EventLoader, is_plain_mapping
 
 R = t.TypeVar("R", bound=KubernetesApiResource)
 
@@ -20,7 +25,13 @@ class _ObjID(t.NamedTuple):
     kind: str
 
 
-_rsrc_index: dict[_ObjID, t.Type] = {}
+# Resource registered through a package index, and not imported yet.
+class _IndexEntry(t.NamedTuple):
+    module: str
+    name: str
+
+
+_rsrc_index: dict[_ObjID, t.Type | _IndexEntry] = {}
 
 
 # Must be called before trying to use the reader API.
@@ -71,7 +82,7 @@ def _register_any(object_meta):
             self._kind_ = kind
             super().__init__(name, namespace)
             if items and isinstance(items[0], KubernetesObject):
-                self.items_ = _TypedList(type(items[0]), items)
+                self.items_ = _TypedList(type(items[0]), True, items)
             else:
                 self.items_ = list(items)
 
@@ -90,11 +101,30 @@ def register_module(module: ModuleType):
             _register_any(cls)
 
 
+def _import_index(spec: ModuleSpec) -> ModuleType | None:
+    name = f"{spec.name}._index"
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        if e.name != name:
+            raise
+        return None
+
+
 # Call with all modules containing CRD objects to register them.
+# If the package has an index generated by pykapi, modules are only imported when one of their resources is resolved.
 def register_modules(spec: ModuleSpec):
-    for pkg in pkgutil.iter_modules(spec.submodule_search_locations, prefix=spec.name + "."):
-        mod = importlib.import_module(pkg.name)
-        register_module(mod)
+    index = _import_index(spec)
+    if index is None:
+        for pkg in pkgutil.iter_modules(spec.submodule_search_locations, prefix=spec.name + "."):
+            mod = importlib.import_module(pkg.name)
+            register_module(mod)
+        return
+
+    if index.OBJECT_META:
+        register_module(importlib.import_module(f"{spec.name}.{index.OBJECT_META}"))
+    for (group, kind), (_, module, name) in index.RESOURCES.items():
+        _rsrc_index[_ObjID(group, kind)] = _IndexEntry(f"{spec.name}.{module}", name)
 
 
 KubernetesApiResourceTy = t.TypeVar("KubernetesApiResourceTy", bound=KubernetesApiResource)
@@ -105,10 +135,22 @@ def resolve_api_resource(api_version: str, kind: str) -> t.Type[R] | None:
     # special case for 'v1' -> means 'core/v1' and core is empty group
     if not sep:
         group = ""
-    return _rsrc_index.get(_ObjID(group, kind.lower()))
+    oid = _ObjID(group, kind.lower())
+    rsrc = _rsrc_index.get(oid)
+    if isinstance(rsrc, _IndexEntry):
+        rsrc = getattr(importlib.import_module(rsrc.module), rsrc.name)
+        _rsrc_index[oid] = rsrc
+    return rsrc
+
+
+def _is_list_kind(kind) -> bool:
+    # `List`, or a typed list returned by the API server (ConfigMapList, …)
+    return isinstance(kind, str) and kind.endswith("List")
 
 
-def create_api_resource(obj: dict, strict: bool = True, resolve: bool = True) -> KubernetesApiResourceTy:
+# In lazy mode, nested objects are kept as raw dicts and lists, and converted into their typed class on first access.
+# Values are not validated (strict is ignored), and subtrees that are never accessed are dumped unchanged.
+def create_api_resource(obj: dict, strict: bool = True, resolve: bool = True, lazy: bool = False) -> KubernetesApiResourceTy:
     if isinstance(obj, KubernetesApiResource):
         return obj
 
@@ -120,18 +162,116 @@ def create_api_resource(obj: dict, strict: bool = True, resolve: bool = True) ->
     rsrc = resolve_api_resource(api_version, kind) if resolve else None
     # in case of version discrepancy, fallback to AnyApiResource
     if not rsrc:
-        # assuming that object that contains items instead of spec is a ResourceList (ConfigMapList, …)
+        # a List, or a typed list (ConfigMapList, …)
         items = obj.get("items", None)
-        if items:
-            return AnyResourceList(api_version, kind, "", items=[create_api_resource(item) for item in items])
+        if items and _is_list_kind(kind):
+            return AnyResourceList(api_version, kind, "", items=[create_api_resource(item, strict, resolve, lazy) for item in items])
         return AnyApiResource(api_version, kind, "").update(obj)
     try:
         if rsrc.api_version != api_version:
             obj = dict(obj)
             obj["apiVersion"] = rsrc.api_version
+        if lazy:
+            return rsrc("")._load_(obj)
         return rsrc("").update(obj, strict=strict)
     except AttributeError:
         # If version mismatch, maybe we are trying to use an old field -> default to AnyApiResource
         if rsrc.api_version != api_version:
             return AnyApiResource(api_version, kind, "").update(obj)
         raise
+
+
+# ================================================
+#              Manifest Streaming
+# ================================================
+
+
+# Values are built straight from parser events, so the items of a List document can be yielded one at a time.
+class _ManifestLoader(EventLoader):
+    def iter_documents(self) -> Iterator[dict]:
+        """Yield each document of the stream, replacing List documents by their items."""
+        self.get_event()  # StreamStartEvent
+        while not self.check_event(StreamEndEvent):
+            self.get_event()  # DocumentStartEvent
+            event = self.peek_event()
+            if is_plain_mapping(event):
+                self.get_event()
+                yield from self._iter_root_mapping(event)
+            else:
+                value = self._load_value()
+                if value is not None:
+                    yield value
+            self.get_event()  # DocumentEndEvent
+            self._anchors = {}
+
+    def _iter_root_mapping(self, event: MappingStartEvent) -> Iterator[dict]:
+        header = {}
+        # items loaded before the document kind is known (`kubectl get -o yaml` sorts keys)
+        items = None
+        expanded = False
+        while not self.check_event(MappingEndEvent):
+            if self._check_merge_key():
+                self.get_event()
+                header = {**self._load_merge(None), **header}
+                continue
+            key = self._load_value()
+            if key == "items" and self.check_event(SequenceStartEvent) and "kind" not in header:
+                items = self._load_value()
+            elif key == "items" and self.check_event(SequenceStartEvent) and _is_list_kind(header["kind"]):
+                expanded = True
+                self.get_event()
+                while not self.check_event(SequenceEndEvent):
+                    yield self._list_item(header, self._load_value())
+                self.get_event()
+            else:
+                header[key] = self._load_value()
+        self.get_event()
+        if items is not None:
+            if _is_list_kind(header.get("kind")):
+                expanded = True
+                for item in items:
+                    yield self._list_item(header, item)
+            else:
+                header["items"] = items
+        if event.anchor is not None:
+            self._anchors[event.anchor] = header
+        if not expanded:
+            yield header
+
+    @staticmethod
+    def _list_item(header: dict, item):
+        # Typed lists omit apiVersion and kind in items. `kubectl get -o yaml` fills them.
+        list_kind: str = header["kind"]
+        if isinstance(item, dict) and list_kind != "List":
+            item.setdefault("apiVersion", header.get("apiVersion"))
+            item.setdefault("kind", list_kind[:-4])
+        return item
+
+
+def _resource_documents(stream) -> Iterator[dict]:
+    loader = _ManifestLoader(stream)
+    try:
+        yield from loader.iter_documents()
+    finally:
+        loader.dispose()
+
+
+# Stream typed resources from a YAML (or JSON) manifest. The documents of a `List` (and of typed lists like ConfigMapList)
+# are replaced by their items. When `kind` comes before `items`, they are parsed and yielded one at a time, so memory
+# does not grow with the list size. Otherwise, items are loaded until the document kind is known.
+# `strict` and `lazy` are passed to create_api_resource(). If `skip_unknown` is set, documents whose kind is not
+# registered are skipped instead of being loaded as AnyApiResource.
+def iter_resources(
+    source: str | os.PathLike | t.IO, strict: bool = True, skip_unknown: bool = False, lazy: bool = False
+) -> Iterator[KubernetesApiResourceTy]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from iter_resources(stream, strict, skip_unknown, lazy)
+        return
+
+    for obj in _resource_documents(source):
+        if not isinstance(obj, dict):
+            raise ValueError(f"K8S resource must be a mapping, got {type(obj).__name__}")
+        if skip_unknown and not resolve_api_resource(obj.get("apiVersion") or "", obj.get("kind") or ""):
+            continue
+        yield create_api_resource(obj, strict=strict, lazy=lazy)
@@ -0,0 +1,116 @@
+import typing as t
+from collections.abc import Iterable
+
+import yaml
+
+from . import KubernetesObject, _json_encoder, _to_plain
+
+# Use the libyaml emitter when PyYAML is built with it (kubic registers its representers on both dumpers).
+_Dumper = yaml.CSafeDumper if yaml.__with_libyaml__ else yaml.SafeDumper
+
+
+class _ChunkedWriter:
+    """Accumulate small writes and forward them to the output stream in chunks of about `size` characters."""
+
+    __slots__ = ("fp", "size", "chunks", "pending")
+
+    def __init__(self, fp: t.TextIO, size: int):
+        self.fp = fp
+        self.size = size
+        self.chunks: list[str] = []
+        self.pending = 0
+
+    def write(self, data: str):
+        self.chunks.append(data)
+        self.pending += len(data)
+        if self.pending >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.chunks:
+            self.fp.write("".join(self.chunks))
+            self.chunks.clear()
+            self.pending = 0
+
+
+class ManifestWriter:
+    """Write kubic objects to a multi-document manifest as they are produced.
+
+    Documents are separated by `---` and are never collected, so memory does not grow with the number of objects.
+    The YAML output is identical to `yaml.dump_all(objs, Dumper=yaml.CSafeDumper, sort_keys=sort_keys)`.
+    In JSON format, each document is written on a single line, or indented if `compact` is False.
+
+    >>> with ManifestWriter("manifest.yaml") as writer:
+    ...     writer.write_all(generate_resources())
+    """
+
+    def __init__(
+        self,
+        fp: str | t.TextIO,
+        format: t.Literal["yaml", "json"] = "yaml",
+        *,
+        sort_keys: bool = False,
+        compact: bool = True,
+        buffer_size: int = 64 * 1024,
+    ):
+        if format not in ("yaml", "json"):
+            raise ValueError(f"unsupported manifest format: {format}")
+
+        self._owned = isinstance(fp, str)
+        self._fp: t.TextIO = open(fp, "w", encoding="utf-8") if self._owned else fp
+        self._buffer = _ChunkedWriter(self._fp, buffer_size)
+        self._count = 0
+        self._closed = False
+        if format == "yaml":
+            # A single dumper instance is reused for all documents, like dump_all() does.
+            self._dumper = _Dumper(self._buffer, sort_keys=sort_keys)
+            self._dumper.open()
+            self._encoder = None
+        else:
+            self._dumper = None
+            self._encoder = _json_encoder(compact, sort_keys)
+
+    @property
+    def count(self) -> int:
+        """Number of documents written so far."""
+        return self._count
+
+    def write(self, obj: KubernetesObject):
+        if self._closed:
+            raise ValueError("write to a closed ManifestWriter")
+
+        if self._dumper is not None:
+            self._dumper.represent(obj)
+        else:
+            if self._count:
+                self._buffer.write("---\n")
+            self._buffer.write(self._encoder.encode(_to_plain(obj)))
+            self._buffer.write("\n")
+        self._count += 1
+
+    def write_all(self, objs: Iterable[KubernetesObject]):
+        for obj in objs:
+            self.write(obj)
+
+    def flush(self):
+        self._buffer.flush()
+        self._fp.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._dumper is not None:
+                self._dumper.close()
+                self._dumper.dispose()
+            self.flush()
+        finally:
+            if self._owned:
+                self._fp.close()
+
+    def __enter__(self) -> "ManifestWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
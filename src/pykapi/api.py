@@ -5,6 +5,7 @@ from collections.abc import Iterable
 
 import yaml
 
+from pykapi import stats
 from pykapi.k8s import QualifiedName, CLUSTER_OBJECTS, module_for_group
 from pykapi.parser import (
     Parser,
@@ -64,7 +65,7 @@ class ApiParser(Parser):
         self._groups: dict[str, ApiGroup] = {}
 
         if isinstance(schema, (str, os.PathLike)):
-            with open(schema) as f:
+            with stats.phase("parse", str(schema)), open(schema) as f:
                 schema = yaml.load(f, yaml.CSafeLoader)
 
         if "definitions" in schema:
@@ -108,7 +109,7 @@ class ApiParser(Parser):
     def annotations_for_type(self, obj_type: ObjectType) -> dict | None:
         return self.annotations.get(f"{obj_type.group}.{obj_type.version}.{obj_type.name}")
 
-    def import_types(self, names: Iterable[str]) -> list[ApiGroup]:
+    def import_types(self, names: Iterable[str], finalize: bool = True) -> list[ApiGroup]:
         # register builtin types
         for t in (IntOrStringType, QuantityType, Base64Type, TimeType):
             self.group_for_type(t).add(t)
@@ -134,12 +135,14 @@ class ApiParser(Parser):
                 raise ValueError(f"unknown type '{name}' requested")
             self.import_ref(ref)
 
-        for pending, schema in self.pendings:
-            self.import_resource(pending, schema)
+        with stats.phase("import"):
+            for pending, schema in self.pendings:
+                self.import_resource(pending, schema)
 
-        # finalize groups
-        for group in self._groups.values():
-            group.finalize()
+        # finalize groups (unless deferred to worker processes)
+        if finalize:
+            for group in self._groups.values():
+                group.finalize()
 
         return list(self._groups.values())
 
@@ -213,7 +216,7 @@ class ApiParser(Parser):
         return alias
 
 
-def import_api_types(schema: str, annotations: dict, *names) -> list[ApiGroup]:
+def import_api_types(schema: str | dict, annotations: dict, *names, finalize: bool = True) -> list[ApiGroup]:
     if annotations is None:
         # Default API Annotations
         annotations = {
@@ -230,4 +233,4 @@ def import_api_types(schema: str, annotations: dict, *names) -> list[ApiGroup]:
         }
 
     parser = ApiParser(schema, annotations)
-    return parser.import_types(names)
+    return parser.import_types(names, finalize)
@@ -0,0 +1,89 @@
+"""Cache of parsed YAML schemas (swagger documents and CRD bundles).
+
+Parsing multi-MB YAML files is the most expensive step of a generation, so the parsed documents are
+pickled in a cache directory. Entries are keyed by source path and parse function, and validated against
+the source size and mtime, or its content digest when only the mtime changed.
+
+Entries are written to a temporary file and renamed, so concurrent generators can share the same cache.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+import typing as t
+
+import yaml
+
+from . import stats
+
+logger = logging.getLogger("cache")
+
+# bump when the cached structure changes
+CACHE_VERSION = 2
+
+
+def load_yaml(stream: t.BinaryIO) -> t.Any:
+    return yaml.load(stream, yaml.CSafeLoader)
+
+
+def default_cache_dir() -> pathlib.Path:
+    return pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home().joinpath(".cache"), "pykapi")
+
+
+class SchemaCache:
+    def __init__(self, directory: pathlib.Path):
+        self.directory = directory
+
+    # parse must be a module level function, as its name is part of the entry key.
+    def load(self, path: str | os.PathLike, parse: t.Callable[[t.BinaryIO], t.Any] = load_yaml) -> t.Any:
+        path = pathlib.Path(path)
+        stat = path.stat()
+        entry = self._entry(path, parse)
+        try:
+            with entry.open("rb") as f:
+                version, size, mtime, digest = pickle.load(f)
+                if version == CACHE_VERSION and size == stat.st_size:
+                    if mtime == stat.st_mtime_ns or digest == _file_digest(path):
+                        return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # corrupted or incompatible entry -> parse again
+            logger.debug("ignoring cache entry %s: %s", entry, e)
+
+        with path.open("rb") as f:
+            data = f.read()
+        with stats.phase("parse", str(path)):
+            documents = parse(io.BytesIO(data))
+        # stored before returning, as callers are free to modify the documents.
+        self._store(entry, (CACHE_VERSION, stat.st_size, stat.st_mtime_ns, hashlib.sha256(data).hexdigest()), documents)
+        return documents
+
+    def _entry(self, path: pathlib.Path, parse: t.Callable) -> pathlib.Path:
+        key = hashlib.sha256(f"{parse.__module__}.{parse.__qualname__}:{path.resolve()}".encode()).hexdigest()
+        return self.directory.joinpath(f"{key}.pickle")
+
+    def _store(self, entry: pathlib.Path, header: tuple, documents):
+        tmp = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=entry.stem, suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(documents, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+            tmp = None
+        except OSError as e:
+            logger.warning("failed to write schema cache entry %s: %s", entry, e)
+        finally:
+            if tmp:
+                os.unlink(tmp)
+
+
+def _file_digest(path: pathlib.Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -1,25 +1,36 @@
 import argparse
+import concurrent.futures
+import functools
 import logging
 import os
 import pathlib
 import re
 import sys
 import tempfile
+import threading
 import typing as t
+from collections.abc import Iterator
 from os import fdopen
 from tempfile import mktemp
 from urllib.request import urlretrieve
 
 import yaml
-from kubernetes import client, config
 from yaml import CSafeLoader
+from yaml.events import MappingEndEvent, MappingStartEvent, SequenceEndEvent, SequenceStartEvent, StreamEndEvent
 
+from kubic.loader import EventLoader, is_plain_mapping
+
+from . import stats
 from .annotations import AnnotationProvider
 from .api import import_api_types
-from .crd import import_crds
+from .cache import SchemaCache, default_cache_dir
+from .crd import group_crds, import_crds
+from .index import GroupIndex, merge_index
+from .jobs import render_api_groups, render_crd_group, render_group, write_groups
 from .k8s import QualifiedName
 from .parser import ApiGroup
-from .printer import TypePrinter
+from .printer import PROFILES, TypePrinter
+from .state import GenerationState, inputs_digest, package_sources
 
 logger = logging.getLogger("cli")
 
@@ -42,31 +53,61 @@ def import_k8s_api(args):
     try:
         if not schema:
             fd, tmp = tempfile.mkstemp(text=True)
-            with fdopen(fd, "w") as f:
+            with stats.phase("download", args.version), fdopen(fd, "w") as f:
                 download_schema(args.version, f)
             schema = tmp
 
+        state = None
+        if args.output != "-":
+            state = GenerationState(args.output)
+            inputs = inputs_digest([pathlib.Path(schema)], args.annotations, docstrings=args.docstrings, profile=args.profile)
+            if not args.force and state.is_current("api", inputs):
+                logger.info("%s is up to date", args.output)
+                return
+
         annotations = None
         if args.annotations:
             with args.annotations.open("rb") as f:
                 annotations = yaml.load(f, CSafeLoader)
 
-        groups = import_api_types(schema, annotations)
+        # downloaded schemas are temporary files, that are not worth caching.
+        if args.schema_cache and not tmp:
+            schema = SchemaCache(args.schema_cache).load(schema)
+
+        if args.jobs > 1:
+            # groups are finalized by the workers
+            groups = import_api_types(schema, annotations, finalize=False)
+            printer = TypePrinter(api_module=".", docstrings=args.docstrings, annotations=None, profile=args.profile)
+            indexes = write_groups(render_api_groups(printer, groups, args.jobs), args.output)
+        else:
+            groups = import_api_types(schema, annotations)
+            indexes = print_groups(groups, args.output, api_module=".", docstrings=args.docstrings, annotations=None, profile=args.profile)
 
-        print_groups(groups, args.output, api_module=".", docstrings=args.docstrings, annotations=None)
+        if state:
+            state.update("api", inputs, output_files(indexes, args.profile))
+            state.save()
     finally:
         if tmp:
             os.remove(tmp)
 
 
-def print_groups(groups: list[ApiGroup], output: str, api_module: str, docstrings: bool, annotations: AnnotationProvider | None):
-    printer = TypePrinter(api_module=api_module, docstrings=docstrings, annotations=annotations)
-    for group in groups:
-        filename = output
-        if filename != "-":
-            module = group.module
-            filename = os.path.join(filename, f"{module}.py")
-        printer.print_group(group, filename)
+def print_groups(
+    groups: list[ApiGroup],
+    output: str,
+    api_module: str,
+    docstrings: bool,
+    annotations: AnnotationProvider | None,
+    profile: str = "full",
+    index: bool = True,
+) -> list[GroupIndex]:
+    printer = TypePrinter(api_module=api_module, docstrings=docstrings, annotations=annotations, profile=profile)
+    # modules are rendered one at a time, and only written if they changed
+    return write_groups((render_group(printer, group) for group in groups), output, index)
+
+
+def output_files(groups: list[GroupIndex], profile: str) -> list[str]:
+    suffixes = (".py", ".pyi") if profile == "slim" else (".py",)
+    return [group.module + suffix for group in groups for suffix in suffixes]
 
 
 class CRD(t.NamedTuple):
@@ -82,6 +123,17 @@ def parse_version(vers: str) -> tuple[int, str, int]:
     return m[1], m[2] or "~", m[3] or 99
 
 
+def latest_version(versions: list[dict]) -> dict:
+    latest = None
+    version = None
+    for v in versions:
+        ver = parse_version(v["name"])
+        if not version or version < ver:
+            version = ver
+            latest = v
+    return latest
+
+
 def create_crd(schema: dict) -> CRD:
     if schema.get("kind") != "CustomResourceDefinition":
         raise ValueError("Not a CustomResourceDefinition")
@@ -92,16 +144,13 @@ def create_crd(schema: dict) -> CRD:
     # default to using the storage version, ignoring other versions
     vers: dict[str, t.Any] = {}
     if "versions" in spec:
-        # find best version
+        # find best version (must match CRDLoader)
+        vers = latest_version(spec["versions"])
+        version = parse_version(vers["name"])
         storage = None
-        version = None
         for v in spec["versions"]:
-            ver = parse_version(v["name"])
             if v["storage"]:
-                storage = ver
-            if not version or version < ver:
-                version = ver
-                vers = v
+                storage = parse_version(v["name"])
         if storage and storage != version:
             logger.warning(f"[{group}.{kind}] latest version ({version}) is not defined as the storage version ({storage}).")
     else:
@@ -119,22 +168,163 @@ def create_crd(schema: dict) -> CRD:
     return CRD(QualifiedName(kind, group, vers["name"]), openapi)
 
 
-def read_crds(paths: list[pathlib.Path], crds: list):
+class _DeferredValue(t.NamedTuple):
+    events: list
+
+
+class _EventReplay:
+    def __init__(self, events: list):
+        self.events = events
+        self.pos = 0
+
+    def get_event(self):
+        event = self.events[self.pos]
+        self.pos += 1
+        return event
+
+    def peek_event(self):
+        return self.events[self.pos]
+
+    def check_event(self, *choices) -> bool:
+        if self.pos >= len(self.events):
+            return False
+        return not choices or isinstance(self.events[self.pos], choices)
+
+
+class CRDLoader(EventLoader):
+    """Load the documents of a CRD bundle one at a time, pruning the schemas of the versions create_crd() ignores.
+
+    The parser events of `spec.versions[*].schema` are recorded instead of being loaded, and once all versions
+    are known, only the schema of the latest one is built. Documents are not expanded like iter_documents() does.
+    """
+
+    def load_documents(self) -> Iterator:
+        self.get_event()  # StreamStartEvent
+        while not self.check_event(StreamEndEvent):
+            self.get_event()  # DocumentStartEvent
+            document = self._load_node(lambda: self._load_keys({"spec": self._load_spec}))
+            if document is not None:
+                yield document
+            self.get_event()  # DocumentEndEvent
+            self._anchors = {}
+
+    def _load_node(self, load_mapping: t.Callable[[], dict]) -> t.Any:
+        # anything but a plain mapping is loaded as is
+        event = self.peek_event()
+        if not is_plain_mapping(event):
+            return self._load_value()
+        self.get_event()
+        value = load_mapping()
+        if event.anchor is not None:
+            self._anchors[event.anchor] = value
+        return value
+
+    def _load_keys(self, loaders: dict[str, t.Callable[[], t.Any]]) -> dict:
+        # like _load_mapping(), using custom loaders for some keys
+        value = {}
+        merged = None
+        while not self.check_event(MappingEndEvent):
+            if self._check_merge_key():
+                self.get_event()
+                merged = self._load_merge(merged)
+            else:
+                key = self._load_value()
+                loader = loaders.get(key) if isinstance(key, str) else None
+                value[key] = loader() if loader else self._load_value()
+        self.get_event()
+        return {**merged, **value} if merged else value
+
+    def _load_spec(self) -> t.Any:
+        return self._load_node(lambda: self._load_keys({"versions": self._load_versions}))
+
+    def _load_versions(self) -> t.Any:
+        event = self.peek_event()
+        if type(event) is not SequenceStartEvent or event.anchor is not None:
+            return self._load_value()
+        self.get_event()
+
+        versions = []
+        while not self.check_event(SequenceEndEvent):
+            versions.append(self._load_node(lambda: self._load_keys({"schema": self._defer_value})))
+        self.get_event()
+
+        deferred = [v for v in versions if isinstance(v, dict) and isinstance(v.get("schema"), _DeferredValue)]
+        try:
+            selected = latest_version(versions)
+        except (KeyError, TypeError):
+            # not a valid CRD, let create_crd() report it
+            selected = None
+        for v in deferred:
+            if selected is None or v is selected:
+                v["schema"] = self._replay(v["schema"].events)
+            else:
+                del v["schema"]
+        return versions
+
+    def _defer_value(self) -> t.Any:
+        events = []
+        depth = 0
+        anchored = False
+        while True:
+            event = self.get_event()
+            events.append(event)
+            if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+                depth -= 1
+            anchored = anchored or getattr(event, "anchor", None) is not None
+            if depth == 0:
+                break
+        # anchors and aliases must be resolved in document order
+        if anchored:
+            return self._replay(events)
+        return _DeferredValue(events)
+
+    def _replay(self, events: list) -> t.Any:
+        replay = _EventReplay(events)
+        self.get_event, self.peek_event, self.check_event = replay.get_event, replay.peek_event, replay.check_event
+        try:
+            return self._load_value()
+        finally:
+            del self.get_event, self.peek_event, self.check_event
+
+
+def load_crd_documents(stream: t.BinaryIO) -> Iterator:
+    loader = CRDLoader(stream)
+    try:
+        yield from loader.load_documents()
+    finally:
+        loader.dispose()
+
+
+def load_crd_bundle(stream: t.BinaryIO) -> list:
+    return list(load_crd_documents(stream))
+
+
+def _load_documents(path: pathlib.Path, cache: SchemaCache | None) -> Iterator:
+    if cache:
+        # cached bundles are pruned, so they only hold what create_crd() uses
+        yield from cache.load(path, load_crd_bundle)
+        return
+    with path.open("rb") as f:
+        yield from load_crd_documents(f)
+
+
+def read_crds(paths: list[pathlib.Path], crds: list, cache: SchemaCache | None = None):
     for path in paths:
         if path.is_dir():
             for entry in path.iterdir():
                 if entry.name.startswith("."):
                     continue
-
-                with entry.open("rb") as f:
-                    for schema in yaml.load_all(f, yaml.CSafeLoader):
+                with stats.phase("read", str(entry)):
+                    for schema in _load_documents(entry, cache):
                         try:
                             crds.append(create_crd(schema))
                         except ValueError:
                             logger.warning("skipping non CRD file: %s", entry.name)
         else:
-            with path.open("rb") as f:
-                for schema in yaml.load_all(f, yaml.CSafeLoader):
+            with stats.phase("read", str(path)):
+                for schema in _load_documents(path, cache):
                     try:
                         crds.append(create_crd(schema))
                     except ValueError:
@@ -149,78 +339,397 @@ def _sanitize_crd(crd: dict) -> dict:
     return crd
 
 
-def import_custom_resources(args):
-    files = []
-    tmpfiles = []
-    v1: client.ApiextensionsV1Api | None = None
-    api_groups: dict[str, list[str]] = {}
-    for crd in args.crds:
-        filename, ext = os.path.splitext(crd)
-        if ext.lower() in (".yml", ".yaml", ".json") or os.path.isdir(crd):
-            files.append(pathlib.Path(crd))
-            continue
-
-        if args.cache_dir:
-            cached: pathlib.Path = args.cache_dir.joinpath(crd + ".yaml")
-            if cached.exists():
-                files.append(cached)
-                continue
-        else:
-            cached: pathlib.Path = pathlib.Path(mktemp(f"-{crd}.yaml"))
-            tmpfiles.append(cached)
+def is_crd_file(crd: str) -> bool:
+    _, ext = os.path.splitext(crd)
+    return ext.lower() in (".yml", ".yaml", ".json") or os.path.isdir(crd)
 
-        if v1 is None:
-            config.load_kube_config()
-            v1 = client.ApiextensionsV1Api()
 
-        # Try to interpret it as a CRD first
+# maximum number of concurrent requests to the API server
+FETCH_WORKERS = 8
+
+
+class ClusterApi:
+    """API server calls used by ClusterFetcher, using the current kube config.
+
+    All calls share a single ApiClient, whose connection pool is sized for FETCH_WORKERS concurrent requests.
+    """
+
+    def __init__(self, workers: int = FETCH_WORKERS):
+        from kubernetes import client, config
+
+        config.load_kube_config()
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = max(configuration.connection_pool_maxsize or 0, workers)
+        self.client = client.ApiClient(configuration)
+
+    def read_crd(self, name: str) -> dict | None:
+        from kubernetes import client
+
         try:
-            response = v1.read_custom_resource_definition(crd)
-            schemas = [_sanitize_crd(v1.api_client.sanitize_for_serialization(response))]
+            response = client.ApiextensionsV1Api(self.client).read_custom_resource_definition(name)
         except client.exceptions.ApiException as e:
             if e.status != 404:
                 raise e
+            return None
+        return self.client.sanitize_for_serialization(response)
+
+    def api_groups(self) -> dict[str, list[str]]:
+        from kubernetes import client
+
+        groups = {}
+        for api in client.ApisApi(self.client).get_api_versions().groups:
+            group, _, _ = api.preferred_version.group_version.rpartition("/")
+            groups[group] = sorted(version.version for version in api.versions)
+        return groups
+
+    def api_resources(self, group: str, version: str) -> list[str]:
+        from kubernetes import client
+
+        response = client.CustomObjectsApi(self.client).get_api_resources(group=group, version=version)
+        return [rsrc.name for rsrc in response.resources]
+
+
+class ClusterFetcher:
+    """Fetch CRDs and API groups from the cluster of the current kube config.
+
+    The API client is created on first fetch only, and shared by all targets. Requests are sent from a pool
+    of `workers` threads, but results are always returned in the same order.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path | None, api_factory: t.Callable[[], ClusterApi] | None = None, workers: int = FETCH_WORKERS):
+        self.cache_dir = cache_dir
+        self.tmpfiles: list[pathlib.Path] = []
+        self.resolved: dict[str, pathlib.Path] = {}
+        self.api_factory = api_factory
+        self.workers = workers
+        self._api: ClusterApi | None = None
+        self._api_groups: dict[str, list[str]] | None = None
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def api(self) -> ClusterApi:
+        with self._lock:
+            if self._api is None:
+                self._api = (self.api_factory or ClusterApi)()
+            return self._api
+
+    @property
+    def pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(self.workers, thread_name_prefix="fetch")
+            return self._pool
+
+    def api_groups(self) -> dict[str, list[str]]:
+        # only fetched once, even if requested by concurrent resolve()
+        with self._lock:
+            if self._api_groups is None:
+                self._api_groups = self.api.api_groups()
+            return self._api_groups
+
+    def prefetch(self, crds: list[str]):
+        """Resolve all crds concurrently, so the following resolve() calls return immediately."""
+        pending = list(dict.fromkeys(crd for crd in crds if crd not in self.resolved))
+        if len(pending) < 2:
+            return
+        # resolve() waits on tasks of self.pool, so it must not run in it.
+        with concurrent.futures.ThreadPoolExecutor(min(len(pending), self.workers), thread_name_prefix="resolve") as resolver:
+            for crd, path in zip(pending, resolver.map(self.resolve, pending)):
+                self.resolved[crd] = path
+
+    def resolve(self, crd: str) -> pathlib.Path:
+        resolved = self.resolved.get(crd)
+        if resolved:
+            return resolved
+
+        if self.cache_dir:
+            cached: pathlib.Path = self.cache_dir.joinpath(crd + ".yaml")
+            if cached.exists():
+                return cached
+        else:
+            cached: pathlib.Path = pathlib.Path(mktemp(f"-{crd}.yaml"))
+            with self._lock:
+                self.tmpfiles.append(cached)
 
-            if not api_groups:
-                for api in client.ApisApi().get_api_versions().groups:
-                    group, _, _ = api.preferred_version.group_version.rpartition("/")
-                    api_groups[group] = sorted(version.version for version in api.versions)
-            v = api_groups.get(crd)
-            if not v:
-                raise ValueError(f"'{crd}' is neither a CRD nor an API Group.")
-
-            # Iterate over all version, as a group can have resources in multiple versions
-            schemas = []
-            fetched = set()
-            for version in v:
-                response = client.CustomObjectsApi().get_api_resources(group=crd, version=version)
-                for rsrc in response.resources:
-                    # - Skip already fetched (in case a CRD is declared in more than one version)
-                    # - Names containing slash are usually status resource (ciliumnode/status…)
-                    if "/" in rsrc.name or rsrc.name in fetched:
-                        continue
-                    fetched.add(rsrc.name)
-                    crd_schema = v1.read_custom_resource_definition(f"{rsrc.name}.{crd}")
-                    schemas.append(_sanitize_crd(v1.api_client.sanitize_for_serialization(crd_schema)))
-            # Reponse order is not deterministic but we need a stable order to always get the same output
-            schemas.sort(key=lambda r: r["metadata"]["name"])
-
+        schemas = self.fetch(crd)
         with cached.open("w") as f:
             yaml.dump_all(schemas, f, yaml.CSafeDumper, indent=2)
+        return cached
+
+    def fetch(self, crd: str) -> list[dict]:
+        # Try to interpret it as a CRD first
+        schema = self.api.read_crd(crd)
+        if schema is not None:
+            return [_sanitize_crd(schema)]
+
+        v = self.api_groups().get(crd)
+        if not v:
+            raise ValueError(f"'{crd}' is neither a CRD nor an API Group.")
+
+        # Iterate over all version, as a group can have resources in multiple versions
+        names = []
+        for resources in self.pool.map(functools.partial(self.api.api_resources, crd), v):
+            for name in resources:
+                # - Skip already fetched (in case a CRD is declared in more than one version)
+                # - Names containing slash are usually status resource (ciliumnode/status…)
+                if "/" in name or name in names:
+                    continue
+                names.append(name)
+        schemas = []
+        for schema in self.pool.map(self.api.read_crd, [f"{name}.{crd}" for name in names]):
+            # deleted since listed
+            if schema is not None:
+                schemas.append(_sanitize_crd(schema))
+        # Reponse order is not deterministic but we need a stable order to always get the same output
+        schemas.sort(key=lambda r: r["metadata"]["name"])
+        return schemas
+
+    def is_temporary(self, path: pathlib.Path) -> bool:
+        return path in self.tmpfiles
+
+    def cleanup(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for tmp in self.tmpfiles:
+            tmp.unlink(missing_ok=True)
+        self.tmpfiles.clear()
+        self.resolved.clear()
+
+
+def _resolve(fetcher: ClusterFetcher, crd: str) -> pathlib.Path:
+    if crd in fetcher.resolved:
+        return fetcher.resolved[crd]
+    with stats.phase("download", crd):
+        return fetcher.resolve(crd)
+
+
+class CRDTarget(t.NamedTuple):
+    crds: list[str]
+    output: str
+    api_module: str
+    annotations: pathlib.Path | None
+    docstrings: bool
+    profile: str
+    # importable package of api_module, whose types replace anonymous types with the same structure (see shared.py)
+    shared_types: str | None
+
+
+TARGET_KEYS = frozenset(CRDTarget._fields)
+
+
+def read_manifest(path: pathlib.Path, args) -> list[CRDTarget]:
+    """Load a batch manifest.
+
+    Top level keys are defaults for all targets, and fallback to the command line arguments.
+    Relative paths of the manifest are resolved from its directory, those of the command line from the current directory.
+
+        api_module: "..api"
+        output: src/kubic/crds
+        targets:
+          - crds: [schemas/crds/cilium.yaml]
+          - crds: [postgresql.cnpg.io]
+            annotations: annotations
+    """
+    with path.open("rb") as f:
+        manifest = yaml.load(f, CSafeLoader) or {}
+
+    base = path.parent
+    defaults = {key: getattr(args, key) for key in TARGET_KEYS if key != "crds"}
+    defaults.update(_manifest_paths({key: value for key, value in manifest.items() if key in defaults}, base))
+    targets = []
+    for idx, target in enumerate(manifest.get("targets") or []):
+        unknown = target.keys() - TARGET_KEYS
+        if unknown:
+            raise ValueError(f"{path}: target #{idx}: unknown keys {', '.join(sorted(unknown))}")
+        if not target.get("crds"):
+            raise ValueError(f"{path}: target #{idx}: no crds")
+        if not (target.get("api_module") or defaults["api_module"]):
+            raise ValueError(f"{path}: target #{idx}: api_module is required")
+
+        values = {**defaults, **_manifest_paths(target, base)}
+        if values["profile"] not in PROFILES:
+            raise ValueError(f"{path}: target #{idx}: invalid profile {values['profile']!r}")
+        # cluster CRDs and API groups are names, not paths
+        values["crds"] = [str(base / crd) if is_crd_file(str(base / crd)) else crd for crd in values["crds"]]
+        targets.append(CRDTarget(**values))
+    return targets
+
+
+# paths of the manifest are relative to its directory (those of the command line, to the current directory)
+def _manifest_paths(values: dict, base: pathlib.Path) -> dict:
+    values = dict(values)
+    if values.get("output") and values["output"] != "-":
+        values["output"] = str(base / values["output"])
+    if values.get("annotations"):
+        values["annotations"] = base / values["annotations"]
+    return values
+
+
+def read_crd_file(path: pathlib.Path, cache: SchemaCache | None) -> list[CRD]:
+    crds = []
+    read_crds([path], crds, cache)
+    return crds
 
-        files.append(cached)
 
+def _annotation_provider(providers: dict[pathlib.Path | None, AnnotationProvider], path: pathlib.Path | None) -> AnnotationProvider:
+    # annotation files are loaded once for all targets sharing the same annotations directory
+    annotations = providers.get(path)
+    if annotations is None:
+        annotations = providers[path] = AnnotationProvider(path)
+    return annotations
+
+
+def generate_crds(
+    target: CRDTarget, files: list[pathlib.Path], cache: SchemaCache | None, providers: dict[pathlib.Path | None, AnnotationProvider]
+) -> list[GroupIndex]:
     crds = []
+    read_crds(files, crds, cache)
+    annotations = _annotation_provider(providers, target.annotations)
+    groups = import_crds(crds, annotations, target.shared_types)
+
+    return print_groups(
+        groups,
+        target.output,
+        api_module=target.api_module,
+        docstrings=target.docstrings,
+        annotations=annotations,
+        profile=target.profile,
+        index=False,
+    )
+
+
+def generate_crds_parallel(
+    targets: list[tuple[CRDTarget, list[pathlib.Path], SchemaCache | None]],
+    providers: dict[pathlib.Path | None, AnnotationProvider],
+    jobs: int,
+    verbose: bool,
+) -> list[list[GroupIndex]]:
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+        # parsing the schema files is the most expensive step, so they are loaded by the workers too.
+        caches: dict[pathlib.Path, SchemaCache | None] = {}
+        for _, files, cache in targets:
+            for path in files:
+                caches.setdefault(path, cache)
+        loaded = dict(zip(caches, pool.map(read_crd_file, caches.keys(), caches.values())))
+
+        pendings = []
+        for target, files, _ in targets:
+            crds = [crd for path in files for crd in loaded[path]]
+            annotations = _annotation_provider(providers, target.annotations)
+            printer = TypePrinter(
+                api_module=target.api_module, docstrings=target.docstrings, annotations=annotations, profile=target.profile
+            )
+            sources = group_crds(crds, annotations, target.shared_types)
+            pendings.append([pool.submit(render_crd_group, printer, source) for source in sources])
+
+        # write in targets order, as a serial run would
+        for (target, _, _), futures in zip(targets, pendings):
+            if verbose:
+                logger.info("processing %s", ", ".join(target.crds))
+            results.append(write_groups((future.result() for future in futures), target.output, index=False))
+    return results
+
+
+def target_key(target: CRDTarget) -> str:
+    # paths are relative to the output directory, so the state does not depend on the checkout location
+    return " ".join(os.path.relpath(crd, target.output) if is_crd_file(crd) else crd for crd in target.crds)
+
+
+def import_custom_resources(args):
+    if args.manifest:
+        targets = read_manifest(args.manifest, args)
+    else:
+        targets = [CRDTarget(args.crds, args.output, args.api_module, args.annotations, args.docstrings, args.profile, args.shared_types)]
+
+    fetcher = ClusterFetcher(args.cache_dir)
+    cache = SchemaCache(args.schema_cache) if args.schema_cache else None
+    providers: dict[pathlib.Path | None, AnnotationProvider] = {}
+    states: dict[str, GenerationState] = {}
+    pendings: list[tuple[CRDTarget, list[pathlib.Path], SchemaCache | None, str | None]] = []
+    verbose = len(targets) > 1
     try:
-        read_crds(files, crds)
-        annotations = AnnotationProvider(args.annotations)
-        groups = import_crds(crds, annotations)
+        # fetch all CRDs and API groups of the cluster at once
+        cluster_crds = [crd for target in targets for crd in target.crds if not is_crd_file(crd)]
+        if cluster_crds:
+            with stats.phase("download"):
+                fetcher.prefetch(cluster_crds)
+        for target in targets:
+            files = [pathlib.Path(crd) if is_crd_file(crd) else _resolve(fetcher, crd) for crd in target.crds]
+            inputs = None
+            if target.output != "-":
+                state = states.get(target.output)
+                if state is None:
+                    state = states[target.output] = GenerationState(target.output)
+                options = {
+                    "api_module": target.api_module,
+                    "docstrings": target.docstrings,
+                    "profile": target.profile,
+                    "shared_types": target.shared_types,
+                }
+                # generated modules depend on the shared types package too
+                sources = package_sources(target.shared_types) if target.shared_types else []
+                inputs = inputs_digest(files + sources, target.annotations, **options)
+                if not args.force and state.is_current(target_key(target), inputs):
+                    if verbose:
+                        logger.info("skipping %s: up to date", ", ".join(target.crds))
+                    continue
+            # CRDs fetched without --cache_dir are read from temporary files, that are not worth caching.
+            target_cache = None if any(fetcher.is_temporary(path) for path in files) else cache
+            pendings.append((target, files, target_cache, inputs))
 
-        print_groups(groups, args.output, api_module=args.api_module, docstrings=args.docstrings, annotations=annotations)
+        if args.jobs > 1 and pendings:
+            results = generate_crds_parallel([pending[:3] for pending in pendings], providers, args.jobs, verbose)
+        else:
+            results = []
+            for target, files, target_cache, _ in pendings:
+                if verbose:
+                    logger.info("processing %s", ", ".join(target.crds))
+                results.append(generate_crds(target, files, target_cache, providers))
     finally:
         # cleanup temp files
-        for tmp in tmpfiles:
-            tmp.unlink(missing_ok=True)
+        fetcher.cleanup()
+
+    outputs: dict[str, list[GroupIndex]] = {}
+    for (target, _, _, inputs), groups in zip(pendings, results):
+        if target.output != "-":
+            outputs.setdefault(target.output, []).extend(groups)
+            states[target.output].update(target_key(target), inputs, output_files(groups, target.profile))
+    for output, groups in outputs.items():
+        with stats.phase("index", output):
+            merge_index(output, groups)
+    for state in states.values():
+        state.save()
+
+
+def add_schema_cache_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--schema_cache", type=pathlib.Path, default=default_cache_dir(), help="parsed schemas cache directory")
+    parser.add_argument("--no_schema_cache", action="store_const", const=None, dest="schema_cache", help="always parse schemas")
+
+
+def add_stats_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--stats", action="store_true", help="report time spent in each phase, and the number of generated types (implies --force)"
+    )
+    parser.add_argument("--stats_memory", action="store_true", help="report peak memory of each phase too (slower)")
+    parser.add_argument("--stats_json", type=str, help="write the statistics to a JSON file")
+
+
+def run_with_stats(args, action: t.Callable):
+    if not (args.stats or args.stats_memory or args.stats_json):
+        action(args)
+        return
+    if args.jobs > 1:
+        # phases run in worker processes would not be recorded
+        logger.warning("--jobs is ignored when collecting statistics")
+        args.jobs = 1
+    # up-to-date targets are skipped, and would leave nothing to report
+    args.force = True
+    with stats.collect(memory=args.stats_memory) as collected:
+        action(args)
+    stats.write_report(collected, args.stats_json)
 
 
 def main():
@@ -236,15 +745,35 @@ def main():
     group = api.add_mutually_exclusive_group(required=True)
     group.add_argument("--version", type=str, help="Kubernetes release version (like 1.23)")
     group.add_argument("-s", "--schema", type=pathlib.Path)
-    api.add_argument("--annotations", type=str)
+    api.add_argument("--annotations", type=pathlib.Path)
     api.add_argument("--docstrings", action="store_true", help="generate docstrings")
+    api.add_argument(
+        "--profile", choices=PROFILES, default="full", help="slim: runtime modules without annotations and docstrings, plus .pyi stubs"
+    )
+    api.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes")
+    api.add_argument("--force", action="store_true", help="regenerate even if inputs did not change")
+    add_schema_cache_arguments(api)
+    add_stats_arguments(api)
     api.add_argument("-o", "--output", type=str, default="-")
 
     crd = subparsers.add_parser("crd")
-    crd.add_argument("--api_module", type=str, required=True)
+    crd.add_argument("--api_module", type=str, help="required, unless defined by the manifest")
     crd.add_argument("--annotations", type=pathlib.Path, help="annotations directory")
     crd.add_argument("--docstrings", action="store_true", help="generate docstrings")
+    crd.add_argument(
+        "--profile", choices=PROFILES, default="full", help="slim: runtime modules without annotations and docstrings, plus .pyi stubs"
+    )
+    crd.add_argument(
+        "--shared_types",
+        type=str,
+        help="importable package of --api_module (like kubic.api): anonymous types with the same structure as one of its types use it",
+    )
     crd.add_argument("--cache_dir", type=pathlib.Path)
+    crd.add_argument("--manifest", type=pathlib.Path, help="YAML list of targets to generate in a single run")
+    crd.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes")
+    crd.add_argument("--force", action="store_true", help="regenerate even if inputs did not change")
+    add_schema_cache_arguments(crd)
+    add_stats_arguments(crd)
     crd.add_argument("crds", nargs="*", type=str)
     crd.add_argument("-o", "--output", type=str, default="-")
 
@@ -254,8 +783,12 @@ def main():
 
     args = parser.parse_args()
     if args.action == "api":
-        import_k8s_api(args)
+        run_with_stats(args, import_k8s_api)
     elif args.action == "schema":
         download_schema(args.version, args.output)
     else:
-        import_custom_resources(args)
+        if not args.manifest and not args.api_module:
+            crd.error("the following arguments are required: --api_module")
+        if args.manifest and args.crds:
+            crd.error("crds can't be used with --manifest")
+        run_with_stats(args, import_custom_resources)
@@ -4,9 +4,11 @@ from collections.abc import Callable
 
 from pykapi.k8s import module_for_group
 
+from . import stats
 from .annotations import AnnotationProvider
 from .k8s import QualifiedName
 from .parser import ApiGroup, Parser
+from .shared import match_api_types
 from .types import AnonymousType, ApiResourceType, ApiType, ApiTypeRef, ObjectType, Type
 
 
@@ -26,11 +28,13 @@ class CRDGroup(ApiGroup):
 
 
 class CRDParser(Parser):
-    def __init__(self, group: str, version: str, module: str, annotations: dict):
+    def __init__(self, group: str, version: str, module: str, annotations: dict, shared_types: str | None = None):
         super().__init__()
         self.group = CRDGroup(group, version, module)
         # patching root schema
         self.annotations = annotations
+        # package (like kubic.api) whose types replace anonymous types with the same structure
+        self.shared_types = shared_types
 
     def group_for_type(self, fqn: QualifiedName) -> ApiGroup:
         return self.group
@@ -58,9 +62,17 @@ class CRDParser(Parser):
                 schema,
             )
 
-        for obj_type, schema in self.pendings:
-            self.import_resource(obj_type, schema)
+        with stats.phase("import", self.group.name):
+            for obj_type, schema in self.pendings:
+                self.import_resource(obj_type, schema)
+        shared = {}
+        if self.shared_types:
+            # use the api types instead of anonymous copies
+            with stats.phase("shared", self.group.name):
+                shared = match_api_types(self.group.anonymous_types, self.shared_types)
+                self.group.replace_anonymous(shared)
         self.group.finalize()
+        stats.count(self.group.name, shared=len(shared))
         return self.group
 
     def import_resource(self, obj_type: ObjectType, schema: dict):
@@ -328,7 +340,21 @@ def infer_k8s_type(prop_name: str, schema: dict) -> ApiTypeRef | None:
     return None
 
 
-def import_crds(crds: list[tuple[QualifiedName, dict]], annotations: AnnotationProvider) -> list[ApiGroup]:
+class CRDGroupSource(t.NamedTuple):
+    group: str
+    module: str
+    patches: dict
+    crds: list[tuple[QualifiedName, dict]]
+    shared_types: str | None = None
+
+    def process(self) -> ApiGroup:
+        parser = CRDParser(self.group, version="", module=self.module, annotations=self.patches, shared_types=self.shared_types)
+        return parser.process(*self.crds)
+
+
+def group_crds(
+    crds: list[tuple[QualifiedName, dict]], annotations: AnnotationProvider, shared_types: str | None = None
+) -> list[CRDGroupSource]:
     # in case there is CRDs from many groups/versions.
     # FIXME: disable group by version as some CRDs have etherogenous version (cilium)
     modules = {}
@@ -348,9 +374,8 @@ def import_crds(crds: list[tuple[QualifiedName, dict]], annotations: AnnotationP
             patches_by_group[group].update(patches)
         # crds_by_groups[(group, fqn.version)].append((fqn, schema))
 
-    groups = []
-    for group, crds in crds_by_groups.items():
-        parser = CRDParser(group, version="", module=modules[group], annotations=patches_by_group[group])
-        groups.append(parser.process(*crds))
+    return [CRDGroupSource(group, modules[group], patches_by_group[group], crds, shared_types) for group, crds in crds_by_groups.items()]
+
 
-    return groups
+def import_crds(crds: list[tuple[QualifiedName, dict]], annotations: AnnotationProvider, shared_types: str | None = None) -> list[ApiGroup]:
+    return [source.process() for source in group_crds(crds, annotations, shared_types)]
@@ -0,0 +1,93 @@
+import ast
+import os
+import typing as t
+
+from .parser import ApiGroup
+from .state import write_if_changed
+from .types import ApiResourceType, ObjectType
+
+INDEX_MODULE = "_index"
+# line length of the project ruff configuration
+LINE_LENGTH = 140
+
+HEADER = """# Generated by pykapi, do not edit.
+# Used by kubic.reader to import the module defining a resource only when this resource is first resolved.
+"""
+
+
+class ResourceIndex(t.NamedTuple):
+    # (api group, lowercase kind) -> (api version, module, class name)
+    resources: dict[tuple[str, str], tuple[str, str, str]]
+    # module defining meta/v1 ObjectMeta, if any
+    object_meta: str | None
+
+
+def read_index(path: str) -> ResourceIndex:
+    if not os.path.exists(path):
+        return ResourceIndex({}, None)
+
+    with open(path, "r") as f:
+        tree = ast.parse(f.read(), path)
+    values = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            values[stmt.targets[0].id] = ast.literal_eval(stmt.value)
+    return ResourceIndex(values.get("RESOURCES", {}), values.get("OBJECT_META"))
+
+
+def _quote(value: str | None) -> str:
+    return "None" if value is None else f'"{value}"'
+
+
+def _tuple(values: tuple) -> str:
+    return "(" + ", ".join(_quote(value) for value in values) + ")"
+
+
+def write_index(path: str, index: ResourceIndex):
+    lines = [HEADER, f"\nOBJECT_META = {_quote(index.object_meta)}\n", "\nRESOURCES = {\n"]
+    for key in sorted(index.resources):
+        line = f"    {_tuple(key)}: {_tuple(index.resources[key])},\n"
+        if len(line) > LINE_LENGTH + 1:
+            # like ruff format: one value element per line
+            values = "".join(f"        {_quote(value)},\n" for value in index.resources[key])
+            line = f"    {_tuple(key)}: (\n{values}    ),\n"
+        lines.append(line)
+    lines.append("}\n")
+    write_if_changed(path, "".join(lines))
+
+
+class GroupIndex(t.NamedTuple):
+    module: str
+    # resources defined by the group, in class name order
+    resources: list[tuple[tuple[str, str], tuple[str, str, str]]]
+    # the group defines meta/v1 ObjectMeta
+    object_meta: bool
+
+
+def group_index(group: ApiGroup) -> GroupIndex:
+    resources = []
+    object_meta = False
+    for ty in sorted(group.types, key=lambda ty: ty.name):
+        if isinstance(ty, ApiResourceType):
+            resources.append(((ty.api_group, ty.kind.lower()), (ty.api_version, group.module, ty.name)))
+        elif isinstance(ty, ObjectType) and ty.name == "ObjectMeta" and ty.api_version == "meta/v1":
+            object_meta = True
+    return GroupIndex(group.module, resources, object_meta)
+
+
+# pykapi is usually run once per CRD file on the same output directory,
+# so entries of modules that are not part of this run are preserved.
+def merge_index(output: str, groups: list[GroupIndex]):
+    path = os.path.join(output, f"{INDEX_MODULE}.py")
+    index = read_index(path)
+    modules = {group.module for group in groups}
+
+    resources = {key: entry for key, entry in index.resources.items() if entry[1] not in modules}
+    object_meta = index.object_meta if index.object_meta not in modules else None
+    # like register_modules(), the last module (and class) in name order wins
+    for group in sorted(groups, key=lambda g: g.module):
+        resources.update(group.resources)
+        if group.object_meta:
+            object_meta = group.module
+
+    write_index(path, ResourceIndex(resources, object_meta))
@@ -0,0 +1,73 @@
+"""Process pool used by `pykapi --jobs N`.
+
+Workers parse, finalize and render groups, and return the generated sources. The main process
+writes them (and the index) in submission order, so the output is the same as a serial run.
+"""
+
+import concurrent.futures
+import functools
+import os
+import sys
+import typing as t
+from collections.abc import Iterable
+
+from . import stats
+from .crd import CRDGroupSource
+from .index import GroupIndex, group_index, merge_index
+from .parser import ApiGroup
+from .printer import TypePrinter
+from .state import write_if_changed
+
+
+class RenderedGroup(t.NamedTuple):
+    index: GroupIndex
+    # (file suffix, source)
+    sources: list[tuple[str, str]]
+
+
+def render_group(printer: TypePrinter, group: ApiGroup) -> RenderedGroup:
+    with stats.phase("print", group.name):
+        return RenderedGroup(group_index(group), printer.render_group(group))
+
+
+def write_groups(rendered: Iterable[RenderedGroup], output: str, index: bool = True) -> list[GroupIndex]:
+    indexes = []
+    for group in rendered:
+        with stats.phase("write", group.index.module):
+            for suffix, source in group.sources:
+                if output == "-":
+                    # only the module is printed on stdout, not its stub
+                    if suffix == ".py":
+                        sys.stdout.write(source)
+                else:
+                    write_if_changed(os.path.join(output, group.index.module + suffix), source)
+        indexes.append(group.index)
+    if index and output != "-":
+        with stats.phase("index", output):
+            merge_index(output, indexes)
+    return indexes
+
+
+def render_crd_group(printer: TypePrinter, source: CRDGroupSource) -> RenderedGroup:
+    return render_group(printer, source.process())
+
+
+# API groups reference each other, so the whole parsed API is sent once to each worker,
+# and tasks only carry the index of the group to finalize and render.
+_api_groups: list[ApiGroup] = []
+
+
+def _init_api_groups(groups: list[ApiGroup]):
+    global _api_groups
+    _api_groups = groups
+
+
+def _render_api_group(printer: TypePrinter, idx: int) -> RenderedGroup:
+    group = _api_groups[idx]
+    group.finalize()
+    return render_group(printer, group)
+
+
+def render_api_groups(printer: TypePrinter, groups: list[ApiGroup], jobs: int) -> list[RenderedGroup]:
+    with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_api_groups, initargs=(groups,)) as pool:
+        return list(pool.map(functools.partial(_render_api_group, printer), range(len(groups))))
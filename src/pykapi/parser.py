@@ -2,6 +2,7 @@ import sys
 from collections import defaultdict
 from collections.abc import Iterable
 
+from . import stats
 from .k8s import QualifiedName, module_for_group, type_name_from_property_name
 from .types import (
     TypeAlias,
@@ -14,6 +15,7 @@ from .types import (
     ApiType,
     ApiTypeRef,
     NamedProperty,
+    StructuralKeys,
 )
 
 TimeType = TypeAlias(QualifiedName("Time", "meta", "v1"), "str", description="ISO date-time")
@@ -49,6 +51,8 @@ class ApiGroup:
 
         self._types: dict[str, ApiType] = {}
         self._anonymous: dict[str, list[AnonymousType]] = defaultdict(list)
+        # anonymous types renamed to avoid name conflicts
+        self.renames = 0
 
         # imports
         self.use_typing: bool = False
@@ -98,6 +102,7 @@ class ApiGroup:
         return self._refs
 
     def _rename(self, item: AnonymousType):
+        self.renames += 1
         item.fqn = QualifiedName(item.fullname, item.group, item.version)
         # ensure uniqueness
         idx = 1
@@ -109,19 +114,47 @@ class ApiGroup:
         assert item.name not in self._types, item.name
         self._types[item.name] = item
 
+    @property
+    def anonymous_types(self) -> Iterable[AnonymousType]:
+        return (ty for items in self._anonymous.values() for ty in items)
+
+    def replace_anonymous(self, replacements: dict[int, ApiType]):
+        """Replace anonymous types (by id) with other types, and remove their nested types from the group."""
+
+        def substitute(value, ty: AnonymousType, replacement: ApiType):
+            if value is ty:
+                return replacement
+            if isinstance(value, GenericType):
+                return GenericType(value.base_type, tuple(substitute(param, ty, replacement) for param in value.parameters))
+            return value
+
+        anonymous = defaultdict(list)
+        for name, items in self._anonymous.items():
+            for item in items:
+                # outermost replaced type containing this item
+                replaced = None
+                parent = item
+                while isinstance(parent, AnonymousType):
+                    if id(parent) in replacements:
+                        replaced = parent
+                    parent = parent.parent
+                if replaced is None:
+                    anonymous[name].append(item)
+                elif replaced is item:
+                    replacement = replacements[id(item)]
+                    item.parent.properties = [
+                        prop._replace(type=substitute(prop.type, item, replacement)) for prop in item.parent.properties
+                    ]
+        self._anonymous = anonymous
+
     # list of items with the same name
     def rename_duplicated(self, items: list[AnonymousType]):
-        types: list[list[AnonymousType]] = []
-
-        # Count effective number of ≠ types
+        # Count effective number of ≠ types, grouping items by matching type
+        keys = StructuralKeys()
+        matching: dict[int, list[AnonymousType]] = {}
         for duplicated in items:
-            # Try to group items by matching type
-            for atypes in types:
-                if atypes[0] == duplicated:
-                    atypes.append(duplicated)
-                    break
-            else:
-                types.append([duplicated])
+            matching.setdefault(keys.key(duplicated), []).append(duplicated)
+        types = list(matching.values())
 
         # This is a effectively a single type use at different places
         if len(types) == 1:
@@ -149,6 +182,7 @@ class ApiGroup:
                     base = typs[0]
                     # For the type with most matching types -> use the original name
                     if counter > 1 or base.name in self._types:
+                        self.renames += 1
                         name = f"{base.name}{counter}"
                         for ty in typs:
                             ty.fqn = QualifiedName(name, base.group, base.version)
@@ -161,33 +195,41 @@ class ApiGroup:
                         ty.fqn = typs[0].fqn
 
     def finalize(self):
-        for name, items in self._anonymous.items():
-            if len(items) == 1:
-                item = items[0]
-                if item.name in self._types:
-                    # a base type with this name already exists
-                    self._rename(item)
-                else:
-                    self._types[item.name] = item
-                continue
-
-            self.rename_duplicated(items)
-
-        # Sort types by dependency
-        types = []
-        dones = set()
-        for ty in sorted(self._types.values(), key=lambda k: k.name):
-            if ty.name in dones:
-                continue
-            dones.add(ty.name)
+        with stats.phase("finalize", self.name):
+            anonymous = sum(len(items) for items in self._anonymous.values())
+            with stats.phase("rename", self.name):
+                for name, items in self._anonymous.items():
+                    if len(items) == 1:
+                        item = items[0]
+                        if item.name in self._types:
+                            # a base type with this name already exists
+                            self._rename(item)
+                        else:
+                            self._types[item.name] = item
+                        continue
+
+                    self.rename_duplicated(items)
+
+            # Sort types by dependency
+            types = []
+            dones = set()
+            for ty in sorted(self._types.values(), key=lambda k: k.name):
+                if ty.name in dones:
+                    continue
+                dones.add(ty.name)
 
-            self.add_imports_for_type(ty)
-            # insert all dependencies
-            dependencies = self._fetch_dependencies(ty, dones)
-            dependencies.extend(types)
-            types = dependencies
+                self.add_imports_for_type(ty)
+                # append all dependencies, then the type
+                self._sort_dependencies(ty, dones, types)
 
-        self.types = list(reversed(types))
+            self.types = types
+        stats.count(
+            self.name,
+            types=len(types),
+            anonymous=anonymous,
+            renames=self.renames,
+            aliases=sum(isinstance(ty, TypeAlias) for ty in types),
+        )
 
     def add_imports_for_type(self, ty):
         if isinstance(ty, ApiType):
@@ -210,9 +252,7 @@ class ApiGroup:
             else:
                 into.append(param)
 
-    def _fetch_dependencies(self, ty: ApiType, dones: set) -> list[ApiType]:
-        dependencies = []
-
+    def _fetch_dependencies(self, ty: ApiType) -> tuple[ApiType, list[ApiType]]:
         # resolve internal reference
         if isinstance(ty, ApiTypeRef):
             # _fetch_dependencies assumes ty is a type internal to the group
@@ -224,6 +264,7 @@ class ApiGroup:
             assert isinstance(ty, TypeAlias), f"depends on type: {type(ty)}"
             properties = [ty.type]
 
+        dependencies = []
         for prop_type in properties:
             if isinstance(prop_type, GenericType):
                 self._fetch_generic_params(prop_type, dependencies)
@@ -235,24 +276,27 @@ class ApiGroup:
         for dependency in dependencies:
             self.add_imports_for_type(dependency)
 
-            if not isinstance(dependency, ApiType):
-                continue
-
             # if type is not part of the group -> skip it (external type like IntOrString)
-            if dependency not in self:
-                continue
-
-            if dependency.name in dones:
-                continue
-            dones.add(dependency.name)
-
-            subtypes = self._fetch_dependencies(dependency, dones)
-            # prepend subtypes to types
-            subtypes.extend(types)
-            types = subtypes
-
-        types.insert(0, ty)
-        return types
+            if isinstance(dependency, ApiType) and dependency in self:
+                types.append(dependency)
+        return ty, types
+
+    def _sort_dependencies(self, root: ApiType, dones: set, into: list[ApiType]):
+        # Iterative depth-first traversal: each type is appended after its dependencies,
+        # which are visited in declaration order.
+        ty, dependencies = self._fetch_dependencies(root)
+        stack = [(ty, iter(dependencies))]
+        while stack:
+            ty, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency.name not in dones:
+                    dones.add(dependency.name)
+                    dependency, subtypes = self._fetch_dependencies(dependency)
+                    stack.append((dependency, iter(subtypes)))
+                    break
+            else:
+                stack.pop()
+                into.append(ty)
 
 
 class Parser:
@@ -1,7 +1,7 @@
-import pathlib
-import sys
+import io
 import typing as t
 from collections import defaultdict
+from collections.abc import Iterable
 
 from kubic import (
     camel_to_snake as naive_camel_to_snake,
@@ -18,34 +18,53 @@ from .parser import ApiGroup
 from .types import (
     AnonymousType,
     ApiResourceType,
+    ApiType,
+    ApiTypeRef,
+    GenericType,
     ObjectType,
     ResourceType,
     TypeAlias,
 )
 
 
+PROFILES = ("full", "slim")
+
+
 class TypePrinter:
-    def __init__(self, api_module: str, docstrings: bool, annotations: AnnotationProvider | None):
+    # profiles:
+    # - full: modules with annotations, constructors and docstrings (if enabled).
+    # - slim: modules with only what kubic needs at runtime, and a .pyi stub with annotations, constructors and docstrings.
+    def __init__(self, api_module: str, docstrings: bool, annotations: AnnotationProvider | None, profile: str = "full"):
+        assert profile in PROFILES, profile
         self.api_module = api_module
         self.docstrings = docstrings
         self.annotations = annotations
+        self.profile = profile
 
-    def print_group(self, group: ApiGroup, output: str):
-        if output == "-":
-            stream = sys.stdout
-        else:
-            stream = open(output, "w")
+    @property
+    def slim(self) -> bool:
+        return self.profile == "slim"
+
+    # (file suffix, source) of the modules generated for a group, used to generate groups in worker processes.
+    def render_group(self, group: ApiGroup) -> list[tuple[str, str]]:
+        sources = []
+        for stub in (False, True) if self.slim else (False,):
+            buffer = io.StringIO()
+            self.write_module(group, buffer, stub)
+            sources.append((".pyi" if stub else ".py", buffer.getvalue()))
+        return sources
 
-        try:
+    def write_module(self, group: ApiGroup, stream: t.TextIO, stub: bool):
+        if stub:
+            self.print_stub_imports(group, stream)
+        else:
             self.print_imports(group, stream)
-            stream.write("\n\n")
+        stream.write("\n\n")
 
-            self.print_types(group, stream)
-        finally:
-            if stream is not sys.stdout:
-                stream.close()
+        self.print_types(group, stream, stub)
 
-    def print_imports(self, group: ApiGroup, stream: t.TextIO):
+    # stubs are never executed, so they can import all referenced modules.
+    def print_stub_imports(self, group: ApiGroup, stream: t.TextIO):
         if group.use_typing:
             stream.write("import typing as t")
             stream.write("\n\n")
@@ -55,15 +74,73 @@ class TypePrinter:
             stream.write(", ".join(sorted(group.base_types)))
             stream.write("\n")
 
-        if group.refs:
-            roots = defaultdict(list)
-            for g in group.refs:
-                root, module = self.module_for_group(g)
-                roots[root].append(module)
-            for root, modules in roots.items():
+        for root, modules in self.group_modules(sorted(group.refs)).items():
+            stream.write(f"from {root} import ")
+            stream.write(", ".join(sorted(modules)))
+            stream.write("\n")
+
+    def print_imports(self, group: ApiGroup, stream: t.TextIO):
+        # annotations are not evaluated at import time, so referenced modules can be imported lazily.
+        # slim modules have no annotations, and only need referenced modules to resolve _field_types_.
+        if not self.slim:
+            stream.write("from __future__ import annotations\n\n")
+
+        # type aliases are evaluated at import time, so modules they reference must be imported eagerly.
+        eager = self.alias_refs(group)
+        lazy = sorted(g for g in group.refs if g not in eager)
+
+        if group.use_typing or (lazy and not self.slim):
+            stream.write("import typing as t")
+            stream.write("\n\n")
+
+        base_types = set(group.base_types)
+        if lazy:
+            base_types.add("lazy_modules")
+        if base_types:
+            stream.write("from kubic import ")
+            stream.write(", ".join(sorted(base_types)))
+            stream.write("\n")
+
+        if eager:
+            for root, modules in self.group_modules(eager).items():
                 stream.write(f"from {root} import ")
                 stream.write(", ".join(sorted(modules)))
-                stream.write("\n\n")
+                stream.write("\n")
+
+        if lazy:
+            roots = self.group_modules(lazy)
+            if not self.slim:
+                stream.write("\nif t.TYPE_CHECKING:\n")
+                for root, modules in roots.items():
+                    stream.write(f"    from {root} import ")
+                    stream.write(", ".join(sorted(modules)))
+                    stream.write("\n")
+            stream.write("\n__getattr__ = lazy_modules(globals(), ")
+            stream.write(", ".join(f'{module}="{root}"' for root, modules in roots.items() for module in sorted(modules)))
+            stream.write(")\n")
+
+    def group_modules(self, groups: Iterable[str]) -> dict[str, list[str]]:
+        roots = defaultdict(list)
+        for g in groups:
+            root, module = self.module_for_group(g)
+            roots[root].append(module)
+        return roots
+
+    @staticmethod
+    def alias_refs(group: ApiGroup) -> set[str]:
+        refs = set()
+
+        def collect(ty):
+            if isinstance(ty, GenericType):
+                for param in ty.parameters:
+                    collect(param)
+            elif isinstance(ty, ApiType) and ty not in group and ty.group:
+                refs.add(ty.group)
+
+        for ty in group.types:
+            if isinstance(ty, TypeAlias):
+                collect(ty.type)
+        return refs
 
     def module_for_group(self, group: str):
         if '.' in group:
@@ -72,21 +149,56 @@ class TypePrinter:
                 return ".", a.get("module", group.partition('.')[0])
         return self.api_module, module_for_group(group)
 
-    def print_types(self, group: ApiGroup, stream: t.TextIO):
+    def print_types(self, group: ApiGroup, stream: t.TextIO, stub: bool = False):
         for ty in group.types:
             if isinstance(ty, TypeAlias):
-                self.print_type_alias(group, ty, stream)
+                self.print_type_alias(group, ty, stream, stub)
+            elif stub:
+                assert isinstance(ty, ObjectType)
+                self.print_stub_type(group, ty, stream)
             else:
                 assert isinstance(ty, ObjectType)
                 self.print_type(group, ty, stream)
             stream.write("\n")
 
-    def print_type_alias(self, group: ApiGroup, ty: TypeAlias, stream: t.TextIO):
+    # Field descriptor loaded by kubic instead of evaluating annotations. Must match kubic._resolve_field().
+    @staticmethod
+    def field_type(group: ApiGroup, ty) -> str:
+        while isinstance(ty, TypeAlias):
+            ty = ty.type
+
+        # references to builtin kubernetes types (ApiTypeRef) always point to object types
+        if isinstance(ty, (ObjectType, ApiTypeRef)):
+            return f'("object", "{group.qualified_name(ty)}")'
+
+        if isinstance(ty, GenericType):
+            if ty.base_type == "list":
+                item = ty.parameters[0]
+                while isinstance(item, TypeAlias):
+                    item = item.type
+                if isinstance(item, (ObjectType, ApiTypeRef)):
+                    return f'("typed_list", "{group.qualified_name(item)}")'
+                return '"raw_list"'
+            if ty.base_type == "dict":
+                return '"raw_dict"'
+            return '"scalar"'
+
+        assert isinstance(ty, str), ty
+        if " | " in ty or ty.startswith("t.Union["):
+            return '"union"'
+        if ty.startswith("list["):
+            return '"raw_list"'
+        if ty.startswith("dict["):
+            return '"raw_dict"'
+        return '"scalar"'
+
+    def print_type_alias(self, group: ApiGroup, ty: TypeAlias, stream: t.TextIO, stub: bool = False):
         stream.write(ty.name)
         stream.write(": t.TypeAlias = ")
         stream.write(group.qualified_name(ty.type))
         stream.write("\n")
-        self.print_docstring(ty.description, stream)
+        if stub or not self.slim:
+            self.print_docstring(ty.description, stream)
         stream.write("\n")
 
     def print_docstring(self, description: str, stream: t.TextIO, indent=""):
@@ -115,7 +227,7 @@ class TypePrinter:
         stream.write(f"({ty.kubic_type})")
         stream.write(":\n")
 
-        if isinstance(ty, ResourceType):
+        if isinstance(ty, ResourceType) and not self.slim:
             self.print_docstring(ty.description, stream, "    ")
 
         stream.write("    __slots__ = ()\n")
@@ -157,27 +269,72 @@ class TypePrinter:
                 stream.write(f'        "{camel}": "{snake}",\n')
             stream.write("    }\n")
 
+        if ty.properties:
+            stream.write("\n    _field_types_ = {\n")
+            for prop in ty.properties:
+                stream.write(f'        "{prop.snake_name}": {self.field_type(group, prop.type)},\n')
+            stream.write("    }\n")
+
+        # slim modules rely on _field_types_ and KubernetesObject constructors (keyword arguments only).
+        if self.slim:
+            stream.write("\n")
+            return
+
+        properties = self.typed_properties(group, ty)
         stream.write("\n")
-        for prop in ty.properties:
-            stream.write("    ")
-            stream.write(prop.snake_name)
-            stream.write(": ")
-            stream.write(group.qualified_name(prop.type, ty))
+        self.print_annotations(group, ty, stream, properties)
+        stream.write("\n")
+        self.print_constructor(group, ty, stream, properties=properties)
+        stream.write("\n")
+
+    def print_stub_type(self, group: ApiGroup, ty: ObjectType, stream: t.TextIO):
+        stream.write("class ")
+        stream.write(ty.name)
+        stream.write(f"({ty.kubic_type})")
+        stream.write(":\n")
+
+        if isinstance(ty, ResourceType):
+            self.print_docstring(ty.description, stream, "    ")
+
+        properties = self.typed_properties(group, ty)
+        self.print_annotations(group, ty, stream, properties)
+        if ty.properties:
             stream.write("\n")
+        self.print_constructor(group, ty, stream, stub=True, properties=properties)
+        stream.write("\n")
+
+    # (snake name, annotation) of each property, shared by the annotations and the constructor of a type.
+    @staticmethod
+    def typed_properties(group: ApiGroup, ty: ObjectType) -> list[tuple[str, str]]:
+        return [(prop.snake_name, group.qualified_name(prop.type, ty)) for prop in ty.properties]
+
+    def print_annotations(self, group: ApiGroup, ty: ObjectType, stream: t.TextIO, properties: list[tuple[str, str]] | None = None):
+        if properties is None:
+            properties = self.typed_properties(group, ty)
+        for prop, (snake_name, annotation) in zip(ty.properties, properties):
+            stream.write(f"    {snake_name}: {annotation}\n")
             # docstring
             self.print_docstring(prop.description, stream, "    ")
 
-        stream.write("\n    def __init__(self")
+    def print_constructor(
+        self, group: ApiGroup, ty: ObjectType, stream: t.TextIO, stub: bool = False, properties: list[tuple[str, str]] | None = None
+    ):
+        if properties is None:
+            properties = self.typed_properties(group, ty)
+        stream.write("    def __init__(self")
         if isinstance(ty, ApiResourceType):
             stream.write(", name: str")
             if ty.scoped:
                 stream.write(", namespace: str = None")
-        for prop in ty.properties:
-            stream.write(", ")
-            stream.write(prop.snake_name)
-            stream.write(": ")
-            stream.write(group.qualified_name(prop.type, ty))
-            stream.write(" = None")
+        # stubs describe slim modules, that inherit the keyword only constructors of kubic base classes.
+        if stub and properties:
+            stream.write(", *")
+        for snake_name, annotation in properties:
+            stream.write(f", {snake_name}: {annotation} = None")
+        if stub:
+            stream.write(") -> None: ...\n")
+            return
+
         stream.write("):\n")
         stream.write("        super().__init__(")
         if isinstance(ty, ApiResourceType):
@@ -186,13 +343,7 @@ class TypePrinter:
                 stream.write(", namespace")
             else:
                 stream.write(', ""')
-            if ty.properties:
-                stream.write(", ")
-        for idx, prop in enumerate(ty.properties):
-            if idx != 0:
+            if properties:
                 stream.write(", ")
-            stream.write(prop.snake_name)
-            stream.write("=")
-            stream.write(prop.snake_name)
-
-        stream.write(")\n\n")
+        stream.write(", ".join(f"{snake_name}={snake_name}" for snake_name, _ in properties))
+        stream.write(")\n")
@@ -0,0 +1,173 @@
+"""Structural matching of CRD anonymous types with the kubernetes types of an API package (like kubic.api).
+
+CRDs commonly embed copies of core types (node affinity, probe handlers, volume sources…). When an anonymous
+type has exactly the same fields as a type of the API package (names, required flags and types, recursively),
+generated modules reference the API type instead of defining their own copy.
+
+Matching is enabled with `pykapi crd --shared_types PACKAGE`, where PACKAGE is the importable name of the package
+`--api_module` refers to. Its sources are part of the target inputs, so targets are regenerated when it changes.
+
+Rules:
+- types with less than MIN_PROPERTIES fields are never matched.
+- structures shared by many API types (like ConfigMapKeySelector and SecretKeySelector) are never matched.
+- types with at most SCALAR_PAIR_PROPERTIES fields, all of them strings (name/value pairs…), are too common to
+  be identified by structure only. The words of their name must also appear, in order and contiguously, in
+  the name of the API type: hostPath matches HostPathVolumeSource, and options matches PodDNSConfigOption, but
+  providerSpecific does not.
+"""
+
+import functools
+import importlib
+import pkgutil
+import re
+import types
+import typing as t
+
+from kubic import KubernetesApiResource, KubernetesObject, get_type_hints, snake_to_camel
+
+from .k8s import QualifiedName
+from .types import AnonymousType, ApiTypeRef, GenericType, ObjectType, Type, TypeAlias
+
+# Anonymous types with fewer fields match too many unrelated types.
+MIN_PROPERTIES = 2
+# Anonymous types with up to this number of string fields must match by name too.
+SCALAR_PAIR_PROPERTIES = 2
+
+
+class ApiTypeIndex:
+    """Object types of an API package, indexed by structure."""
+
+    def __init__(self, package: types.ModuleType):
+        self._classes: dict[tuple[str, str], type[KubernetesObject]] = {}
+        for info in pkgutil.iter_modules(package.__path__):
+            if info.name.startswith("_"):
+                continue
+            module = importlib.import_module(f"{package.__name__}.{info.name}")
+            for cls in vars(module).values():
+                # resources are not embedded in other objects
+                if (
+                    isinstance(cls, type)
+                    and issubclass(cls, KubernetesObject)
+                    and not issubclass(cls, KubernetesApiResource)
+                    and cls.__module__ == module.__name__
+                ):
+                    self._classes[self.qualified_name(cls)[:2]] = cls
+
+        self._keys: dict[type[KubernetesObject], t.Hashable] = {}
+        # structure -> type, or None if many types have the same structure (like ConfigMapKeySelector and SecretKeySelector)
+        self._types: dict[t.Hashable, QualifiedName | None] = {}
+        for cls in self._classes.values():
+            key = self.class_key(cls)
+            if len(key) >= MIN_PROPERTIES:
+                self._types[key] = None if key in self._types else self.qualified_name(cls)
+
+    @staticmethod
+    def qualified_name(ty: type[KubernetesObject]) -> QualifiedName:
+        group, _, version = ty._api_version_.rpartition("/")
+        return QualifiedName(ty.__name__, group or "core", version)
+
+    def get(self, key: t.Hashable) -> QualifiedName | None:
+        return self._types.get(key)
+
+    def class_for(self, ty: ApiTypeRef) -> type[KubernetesObject] | None:
+        return self._classes.get((ty.name, ty.group))
+
+    def class_key(self, cls: type[KubernetesObject]) -> t.Hashable:
+        key = self._keys.get(cls)
+        if key is None:
+            # recursive types (JSONSchemaProps) are only equal to themselves
+            self._keys[cls] = ("recursive", cls)
+            required = getattr(cls, "_required_", ())
+            key = self._keys[cls] = frozenset(
+                (cls._field_names_.get(name) or snake_to_camel(name), name in required, self._hint_key(hint))
+                for name, hint in get_type_hints(cls).items()
+            )
+        return key
+
+    def _hint_key(self, hint) -> t.Hashable:
+        if isinstance(hint, type) and issubclass(hint, KubernetesObject):
+            return "object", self.class_key(hint)
+        origin = getattr(hint, "__origin__", None)
+        if origin is list or origin is dict:
+            return origin.__name__, tuple(self._hint_key(arg) for arg in hint.__args__)
+        if isinstance(hint, types.UnionType) or origin is t.Union:
+            return "union", frozenset(self._hint_key(arg) for arg in hint.__args__)
+        if hint is t.Any:
+            return "scalar", "t.Any"
+        if isinstance(hint, type):
+            return "scalar", hint.__name__
+        # unresolved forward reference
+        return "unknown", str(hint)
+
+
+@functools.cache
+def api_type_index(package: str) -> ApiTypeIndex:
+    return ApiTypeIndex(importlib.import_module(package))
+
+
+def name_words(name: str) -> list[str]:
+    # HTTPHeader -> ["http", "header"]
+    return [word.lower() for word in re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+", name)]
+
+
+def is_name_part(name: str, type_name: str) -> bool:
+    """True if the words of name appear contiguously in type_name."""
+    words, type_words = name_words(name), name_words(type_name)
+    return any(type_words[idx : idx + len(words)] == words for idx in range(len(type_words) - len(words) + 1))
+
+
+class ApiTypeMatcher:
+    """Find the API type with the same structure as a parsed type.
+
+    Keys are computed once per type, so types must not be modified while matching.
+    """
+
+    def __init__(self, index: ApiTypeIndex):
+        self.index = index
+        # id(ObjectType) -> key
+        self._keys: dict[int, t.Hashable] = {}
+
+    def match(self, ty: ObjectType) -> ApiTypeRef | None:
+        if len(ty.properties) < MIN_PROPERTIES:
+            return None
+        fqn = self.index.get(self._object_key(ty))
+        if not fqn:
+            return None
+        # pairs of strings (like name/value) are too common to be matched by structure only
+        if len(ty.properties) <= SCALAR_PAIR_PROPERTIES and all(prop.type == "str" for prop in ty.properties):
+            if not is_name_part(ty.name, fqn.name):
+                return None
+        return ApiTypeRef(fqn)
+
+    def _object_key(self, ty: ObjectType) -> t.Hashable:
+        key = self._keys.get(id(ty))
+        if key is None:
+            self._keys[id(ty)] = ("recursive", id(ty))
+            key = self._keys[id(ty)] = frozenset((prop.name, prop.required, self._type_key(prop.type)) for prop in ty.properties)
+        return key
+
+    def _type_key(self, ty: Type) -> t.Hashable:
+        while isinstance(ty, TypeAlias):
+            ty = ty.type
+        if isinstance(ty, ObjectType):
+            return "object", self._object_key(ty)
+        if isinstance(ty, ApiTypeRef):
+            cls = self.index.class_for(ty)
+            return ("object", self.index.class_key(cls)) if cls else ("unknown", ty.fqn)
+        if isinstance(ty, GenericType):
+            return ty.base_type, tuple(self._type_key(param) for param in ty.parameters)
+        assert isinstance(ty, str), ty
+        if " | " in ty:
+            return "union", frozenset(("scalar", member) for member in ty.split(" | "))
+        return "scalar", ty
+
+
+def match_api_types(anonymous: t.Iterable[AnonymousType], package: str) -> dict[int, ApiTypeRef]:
+    """id(type) -> API type, for all types with the same structure as a type of the package."""
+    matcher = ApiTypeMatcher(api_type_index(package))
+    matches = {}
+    for ty in anonymous:
+        ref = matcher.match(ty)
+        if ref:
+            matches[id(ty)] = ref
+    return matches
@@ -0,0 +1,114 @@
+"""Generation manifest used to skip targets whose inputs did not change since the last run.
+
+Each output directory has a `.pykapi.json` file recording, for every target generated into it, a digest of
+its inputs (schema files, annotations, options and generator sources) and the files it wrote.
+Outputs are not hashed, as they may be reformatted after generation (see crds.fish).
+"""
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import pathlib
+import tempfile
+
+STATE_FILE = ".pykapi.json"
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Write content to path, unless the file already contains it (so its mtime is preserved).
+
+    The content is written to a temporary file that replaces path, so readers never see a partial file.
+    """
+    data = content.encode()
+    mode = 0o666 & ~_UMASK
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+            # keep the permissions of the replaced file
+            mode = os.stat(f.fileno()).st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+
+    fd, tmp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates private files
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+# The umask can only be read by changing it, so it is read once, when no worker thread can create files yet.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _update_tree(digest, path: pathlib.Path):
+    # directories are hashed like read_crds() and AnnotationProvider read them: all non hidden entries
+    if path.is_dir():
+        for entry in sorted(path.iterdir()):
+            if not entry.name.startswith("."):
+                digest.update(entry.name.encode())
+                _update_tree(digest, entry)
+    else:
+        with path.open("rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+
+
+@functools.cache
+def generator_version() -> str:
+    """Digest of the pykapi sources, so any change to the generator invalidates previous outputs."""
+    digest = hashlib.sha256()
+    for path in sorted(pathlib.Path(__file__).parent.glob("*.py")):
+        _update_tree(digest, path)
+    return digest.hexdigest()
+
+
+def package_sources(name: str) -> list[pathlib.Path]:
+    """Python sources of an importable package, found without importing it."""
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.submodule_search_locations:
+        raise ValueError(f"{name} is not a package")
+    return sorted(path for location in spec.submodule_search_locations for path in pathlib.Path(location).glob("*.py"))
+
+
+def inputs_digest(paths: list[pathlib.Path], annotations: pathlib.Path | None, **options) -> str:
+    digest = hashlib.sha256(generator_version().encode())
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    for path in paths:
+        _update_tree(digest, path)
+    digest.update(b"\0annotations")
+    if annotations and annotations.exists():
+        _update_tree(digest, annotations)
+    return digest.hexdigest()
+
+
+class GenerationState:
+    def __init__(self, output: str):
+        self.output = output
+        self.path = os.path.join(output, STATE_FILE)
+        try:
+            with open(self.path, "r") as f:
+                self.targets: dict[str, dict] = json.load(f).get("targets", {})
+        except FileNotFoundError:
+            self.targets = {}
+
+    def is_current(self, key: str, inputs: str) -> bool:
+        """True if the target was generated from the same inputs, and its outputs still exist."""
+        entry = self.targets.get(key)
+        if not entry or entry["inputs"] != inputs:
+            return False
+        return all(os.path.exists(os.path.join(self.output, name)) for name in entry["outputs"])
+
+    def update(self, key: str, inputs: str, outputs: list[str]):
+        self.targets[key] = {"inputs": inputs, "outputs": sorted(outputs)}
+
+    def save(self):
+        write_if_changed(self.path, json.dumps({"targets": self.targets}, indent=2, sort_keys=True) + "\n")
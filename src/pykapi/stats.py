@@ -0,0 +1,157 @@
+"""Phase timings, memory usage and type counts of a generation, reported by `pykapi --stats`.
+
+Phases are recorded by subject (input file, CRD or API group), and aggregated when a phase runs many
+times for the same subject. Phases may be nested (parse runs inside read, rename inside finalize), and
+the time of nested phases is included in their parent.
+
+Statistics are only collected in the scope of collect(). Outside of it, phase() and count() do nothing.
+"""
+
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+import typing as t
+from collections.abc import Iterator
+
+
+class PhaseStats:
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        # bytes allocated over the memory traced when the phase started (only when tracing memory)
+        self.peak_memory: int | None = None
+
+
+class _Frame:
+    def __init__(self, start_memory: int):
+        self.start_memory = start_memory
+        self.peak = start_memory
+
+
+class GenerationStats:
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        # (phase, subject) -> stats, in first run order
+        self.phases: dict[tuple[str, str | None], PhaseStats] = {}
+        # subject -> counter -> value
+        self.counts: dict[str, dict[str, int]] = {}
+        self.time = 0.0
+        self._frames: list[_Frame] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str, subject: str | None = None) -> Iterator[None]:
+        stats = self.phases.get((name, subject))
+        if stats is None:
+            stats = self.phases[(name, subject)] = PhaseStats()
+        frame = self._enter() if self.memory else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.time += time.perf_counter() - start
+            stats.calls += 1
+            if frame:
+                peak = self._exit(frame) - frame.start_memory
+                stats.peak_memory = max(stats.peak_memory or 0, peak)
+
+    # tracemalloc has a single peak, that is reset for each phase. The peak of the enclosing phase is saved before.
+    def _enter(self) -> _Frame:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            self._frames[-1].peak = max(self._frames[-1].peak, peak)
+        tracemalloc.reset_peak()
+        frame = _Frame(current)
+        self._frames.append(frame)
+        return frame
+
+    def _exit(self, frame: _Frame) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        frame.peak = max(frame.peak, peak)
+        self._frames.pop()
+        if self._frames:
+            self._frames[-1].peak = max(self._frames[-1].peak, frame.peak)
+        tracemalloc.reset_peak()
+        return frame.peak
+
+    def count(self, subject: str, **counts: int):
+        counters = self.counts.setdefault(subject, {})
+        for key, value in counts.items():
+            counters[key] = counters.get(key, 0) + value
+
+    def to_json(self) -> dict:
+        return {
+            "time": self.time,
+            "max_rss": _max_rss(),
+            "phases": [
+                {"phase": name, "subject": subject, "calls": stats.calls, "time": stats.time, "peak_memory": stats.peak_memory}
+                for (name, subject), stats in self.phases.items()
+            ],
+            "counts": self.counts,
+        }
+
+    def report(self, stream: t.TextIO):
+        width = max((len(subject or "") for _, subject in self.phases), default=0)
+        stream.write(f"{'phase':<10} {'subject':<{width}} {'calls':>6} {'time (ms)':>10}")
+        stream.write(f" {'peak (MiB)':>10}\n" if self.memory else "\n")
+        for (name, subject), stats in self.phases.items():
+            stream.write(f"{name:<10} {subject or '':<{width}} {stats.calls:>6} {stats.time * 1e3:>10.1f}")
+            stream.write(f" {stats.peak_memory / 2**20:>10.2f}\n" if self.memory else "\n")
+
+        if self.counts:
+            keys = list(dict.fromkeys(key for counters in self.counts.values() for key in counters))
+            width = max(len(subject) for subject in self.counts)
+            stream.write(f"\n{'group':<{width}} " + " ".join(f"{key:>9}" for key in keys) + "\n")
+            for subject, counters in self.counts.items():
+                stream.write(f"{subject:<{width}} " + " ".join(f"{counters.get(key, 0):>9}" for key in keys) + "\n")
+        stream.write(f"\ntotal: {self.time * 1e3:.1f} ms\n")
+
+
+def _max_rss() -> int | None:
+    """Peak resident memory of the process, in kilobytes on Linux and bytes on macOS (None where unavailable, like Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+_current: GenerationStats | None = None
+
+
+@contextlib.contextmanager
+def collect(memory: bool = False) -> Iterator[GenerationStats]:
+    """Collect the statistics of all phases run in this scope (memory tracing slows the generation down)."""
+    global _current
+    assert _current is None, "statistics are already collected"
+    stats = _current = GenerationStats(memory)
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.time = time.perf_counter() - start
+        if memory:
+            tracemalloc.stop()
+        _current = None
+
+
+def phase(name: str, subject: str | None = None) -> t.ContextManager:
+    if _current is None:
+        return contextlib.nullcontext()
+    return _current.phase(name, subject)
+
+
+def count(subject: str, **counts: int):
+    if _current is not None:
+        _current.count(subject, **counts)
+
+
+def write_report(stats: GenerationStats, json_path: str | None = None):
+    stats.report(sys.stderr)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(stats.to_json(), f, indent=2)
+            f.write("\n")
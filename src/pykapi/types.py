@@ -118,7 +118,7 @@ class ObjectType(ApiType):
         self.properties: list[Property] = []
 
     def __eq__(self, other):
-        return self.name == other.name and self.properties == other.properties
+        return isinstance(other, ObjectType) and self.name == other.name and self.properties == other.properties
 
     @property
     def kubic_type(self):
@@ -189,3 +189,54 @@ class AnonymousType(ObjectType):
 
 
 Type: t.TypeAlias = str | ApiType | GenericType
+
+
+class StructuralKeys:
+    """Hash-consed structural identity of types: values that compare equal get the same key (a small int).
+
+    Like ObjectType.__eq__, keys ignore descriptions but include the names of the referenced types,
+    so they must not be reused once a type is renamed.
+    """
+
+    def __init__(self):
+        self._keys: dict[t.Hashable, int] = {}
+        # id(ApiType) -> key
+        self._types: dict[int, int] = {}
+        self._pendings: set[int] = set()
+
+    def key(self, value: Type) -> int:
+        if isinstance(value, ApiType):
+            return self._type_key(value)
+        if isinstance(value, GenericType):
+            return self._intern((GenericType, value.base_type, tuple(self.key(param) for param in value.parameters)))
+        return self._intern((type(value), value))
+
+    def _intern(self, structure: tuple) -> int:
+        return self._keys.setdefault(structure, len(self._keys))
+
+    def _type_key(self, ty: ApiType) -> int:
+        key = self._types.get(id(ty))
+        if key is not None:
+            return key
+
+        if isinstance(ty, ObjectType):
+            if id(ty) in self._pendings:
+                # recursive type, only equal to itself
+                return self._intern((ObjectType, id(ty)))
+            self._pendings.add(id(ty))
+            try:
+                properties = tuple(
+                    (prop.name, prop.snake_name if isinstance(prop, NamedProperty) else None, self.key(prop.type), prop.required)
+                    for prop in ty.properties
+                )
+            finally:
+                self._pendings.discard(id(ty))
+            # AnonymousType only equals AnonymousType
+            structure = (AnonymousType if isinstance(ty, AnonymousType) else ObjectType, ty.name, properties)
+        elif isinstance(ty, TypeAlias):
+            structure = (TypeAlias, ty.name, self.key(ty.type))
+        else:
+            structure = (ApiType, ty.name)
+
+        key = self._types[id(ty)] = self._intern(structure)
+        return key
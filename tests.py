@@ -1,16 +1,34 @@
+import argparse
+import copy
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import pkgutil
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
 import typing as t
 import unittest
+import unittest.mock
 from collections.abc import MutableSequence
 
 import yaml
 
 import kubic.api
 import kubic.crds
-from kubic import KubernetesApiResource, KubernetesObject
+from kubic import KubernetesApiResource, KubernetesObject, dump_json, dumps_json, read_only
 from kubic.api import apps
-from kubic.api.apps import Deployment, DeploymentStrategy
+from kubic.api.apps import Deployment, DeploymentSpec, DeploymentStrategy
 from kubic.api.meta import LabelSelectorRequirement, ObjectMeta
-from kubic.reader import create_api_resource, register_modules
+from kubic.reader import create_api_resource, iter_resources, register_module, register_modules, resolve_api_resource
+from kubic.writer import ManifestWriter
 
 
 class LeaveType(KubernetesObject):
@@ -56,7 +74,49 @@ class CustomResource(KubernetesApiResource):
     _scope_ = "namespace"
 
 
+# not a list, even if it has an items field
+class Widget(KubernetesApiResource):
+    __slots__ = ()
+
+    _api_version_ = "example.com/v1"
+    _api_group_ = "example.com"
+    _kind_ = "Widget"
+    _scope_ = "namespace"
+
+    metadata: ObjectMeta
+    items_: t.List[LeaveType]
+
+    _revfield_names_ = {"items": "items_"}
+
+
 class ResourceTest(unittest.TestCase):
+    def test_lazy_modules(self):
+        # referenced modules are only imported when a field table needs them
+        code = """
+import sys
+from kubic.api import apps
+assert "kubic.api.core" not in sys.modules
+assert "core" not in vars(apps)
+deployment = apps.Deployment(name="app")
+deployment.spec.template.spec.containers += {"name": "app"}
+assert type(deployment.spec.template.spec.containers[0]).__module__ == "kubic.api.core"
+assert "core" in vars(apps)
+"""
+        subprocess.run([sys.executable, "-c", code], check=True, env={"PYTHONPATH": os.path.dirname(os.path.dirname(kubic.__file__))})
+
+    def test_type_hints(self):
+        # annotations reference modules that are not imported yet
+        code = """
+import sys
+import kubic
+from kubic.api import apps
+assert "kubic.api.meta" not in sys.modules
+hints = kubic.get_type_hints(apps.DeploymentSpec)
+assert len(hints) == 8, hints
+assert hints["selector"].__module__ == "kubic.api.meta", hints
+"""
+        subprocess.run([sys.executable, "-c", code], check=True, env={"PYTHONPATH": os.path.dirname(os.path.dirname(kubic.__file__))})
+
     def test_dir(self):
         obj = SpecialProperty()
 
@@ -73,6 +133,58 @@ class ResourceTest(unittest.TestCase):
             # make sure base class are properly defined to avoid creation of __dict__ (using __slots__)
             _ = obj.__dict__
 
+    def test_fields(self):
+        fields = SubType._fields_()
+        self.assertEqual(["value", "leave", "leaves"], list(fields))
+        self.assertIs(fields["leave"].type, LeaveType)
+        self.assertIs(fields["leaves"].type, LeaveType)
+        self.assertEqual("leaves", fields["leaves"].camel_name)
+        # field tables are immutable
+        with self.assertRaises(TypeError):
+            fields["other"] = fields["value"]
+
+        class InheritedProperty(SpecialProperty):
+            __slots__ = ()
+
+            other: str
+
+        # field names mapping are inherited
+        obj = InheritedProperty()
+        obj.update({"loadURLs": "urls", "other": "value"})
+        self.assertEqual(obj.load_urls, "urls")
+        self.assertEqual(obj.other, "value")
+
+        class Empty(KubernetesObject):
+            __slots__ = ()
+
+        # empty tables are only built once
+        self.assertIs(Empty._fields_(), Empty._fields_())
+
+    def test_field_types(self):
+        # generated field types must describe the same fields as the annotations
+        for package in (kubic.api, kubic.crds):
+            for info in pkgutil.iter_modules(package.__spec__.submodule_search_locations, prefix=package.__name__ + "."):
+                module = importlib.import_module(info.name)
+                for cls in list(vars(module).values()):
+                    if not (isinstance(cls, type) and cls.__module__ == info.name and "_field_types_" in cls.__dict__):
+                        continue
+                    fields = cls._fields_()
+                    hints = kubic.get_type_hints(cls)
+                    self.assertEqual(list(hints), list(fields), cls)
+                    for name, hint in hints.items():
+                        expected = kubic._resolve_field(name, fields[name].camel_name, hint)
+                        self.assertIs(expected.kind, fields[name].kind, f"{cls.__name__}.{name}")
+                        if expected.kind in (kubic._FieldKind.OBJECT, kubic._FieldKind.TYPED_LIST):
+                            self.assertIs(expected.type, fields[name].type, f"{cls.__name__}.{name}")
+
+        # subclasses declaring new fields add them to the parent field types
+        class CustomDeployment(Deployment):
+            __slots__ = ()
+
+            extra: str
+
+        self.assertEqual(["metadata", "spec", "extra"], list(CustomDeployment._fields_()))
+
     def test_get(self):
         obj = BaseType()
 
@@ -133,6 +245,21 @@ class ResourceTest(unittest.TestCase):
         self.assertEqual(obj.spec.leaves[0].value, 42)
         self.assertEqual(obj, obj.update({}))
 
+    def test_update_merge(self):
+        obj = BaseType.from_dict({"spec": {"value": "hello", "leaves": [{"value": 1}]}})
+        # nested objects are merged, lists and values are replaced
+        obj.update({"spec": {"leave": {"value": "world"}, "leaves": [{"value": 2}]}})
+        self.assertEqual(obj.spec.value, "hello")
+        self.assertEqual(obj.spec.leave.value, "world")
+        self.assertEqual([2], [leave.value for leave in obj.spec.leaves])
+
+        obj.update({"spec": {"value": None}})
+        self.assertNotIn("value", obj.spec)
+
+        dep = Deployment.from_dict({"metadata": {"name": "myapp"}, "spec": {"replicas": 2}})
+        self.assertEqual("myapp", dep.name)
+        self.assertEqual(2, dep.spec.replicas)
+
     def test_update_camel(self):
         sp = SpecialProperty()
         # merge supports using camelCase key name (and keyword without trailing '_')
@@ -152,6 +279,37 @@ class ResourceTest(unittest.TestCase):
         for leave in obj.spec.leaves:
             self.assertIsInstance(leave, LeaveType)
 
+        # custom constructors are run, generated ones are not needed
+        class Defaults(KubernetesObject):
+            __slots__ = ()
+
+            a: str
+            b: str
+
+            def __init__(self, a: str = None, b: str = "default"):
+                super().__init__(a=a, b=b)
+
+        self.assertEqual({"a": "x", "b": "default"}, Defaults.from_dict({"a": "x"}))
+        self.assertFalse(Defaults._plain_init)
+        self.assertTrue(DeploymentSpec._plain_init)
+
+    def test_read_only_mode(self):
+        dep = Deployment("myobj", namespace="default")
+        with read_only():
+            self.assertEqual(0, len(dep.spec.template.spec.containers))
+            self.assertNotIn("app", dep.spec.template.metadata.labels)
+            self.assertIsNone(dep.spec.replicas)
+            # missing values are not created
+            self.assertNotIn("spec", dep)
+            # and shared values can't be modified
+            with self.assertRaises(AttributeError):
+                dep.spec.replicas = 1
+            with self.assertRaises(AttributeError):
+                dep.spec.selector.update({"matchLabels": {"app": "myobj"}})
+
+        self.assertNotIn("replicas", dep.spec)
+        self.assertIn("spec", dep)
+
     # accessing and setting unknown attributes must raise
     def test_validation(self):
         base = BaseType()
@@ -240,6 +398,36 @@ class LoaderTest(unittest.TestCase):
         data = yaml.load(value, yaml.CSafeLoader)
         self.assertEqual(data["spec"]["extra"], "bar")
 
+    def test_create_lazy(self):
+        spec = {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": "myobject", "managedFields": [{"manager": "kubectl"}]},
+            "spec": {"replicas": 2, "template": {"spec": {"containers": [{"name": "app", "extra": "bar"}]}}},
+            "status": {},
+        }
+        rsrc = create_api_resource(spec, lazy=True)
+        self.assertIsInstance(rsrc, Deployment)
+        self.assertEqual("myobject", rsrc.metadata.name)
+        # nested values are converted on first access only
+        self.assertIs(dict, type(rsrc["spec"]))
+        self.assertEqual(2, rsrc.spec.replicas)
+        self.assertIsInstance(rsrc.spec, DeploymentSpec)
+        self.assertIs(dict, type(rsrc.spec["template"]))
+        self.assertEqual("app", rsrc.spec.template.spec.containers[0].name)
+
+        # reading in read-only mode does not store converted values
+        rsrc = create_api_resource(spec, lazy=True)
+        with read_only():
+            self.assertEqual(2, rsrc.spec.replicas)
+        self.assertIs(dict, type(rsrc["spec"]))
+
+        # raw values are dumped unchanged
+        data = yaml.load(yaml.dump(rsrc, Dumper=yaml.CSafeDumper), yaml.CSafeLoader)
+        self.assertEqual(spec["spec"], data["spec"])
+        self.assertNotIn("managedFields", data["metadata"])
+        self.assertNotIn("status", data)
+
     def test_create_generic(self):
         spec = {"apiVersion": "apps/v1", "kind": "Deployment", "spec": {"extra": "bar"}, "metadata": {"name": "myobject"}, "status": {}}
         self.assertRaises(AttributeError, create_api_resource, [spec])
@@ -252,6 +440,64 @@ class LoaderTest(unittest.TestCase):
         self.assertEqual("com.xenonium/v1", CustomResource.api_version)
         self.assertTrue(CustomResource.namespaced)
 
+    def test_index(self):
+        # generated indexes must match the generated modules
+        for package in ("kubic.api", "kubic.crds"):
+            index = importlib.import_module(f"{package}._index")
+            for (group, kind), (version, module, name) in index.RESOURCES.items():
+                cls = getattr(importlib.import_module(f"{package}.{module}"), name)
+                self.assertEqual((group, kind, version), (cls._api_group_, cls._kind_.lower(), cls._api_version_))
+                self.assertIs(cls, resolve_api_resource(version, kind))
+
+    def test_iter_resources(self):
+        manifest = """
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: app}
+---
+apiVersion: v1
+items:
+- apiVersion: v1
+  kind: Service
+  metadata: {name: svc}
+- apiVersion: example.com/v1
+  kind: Unknown
+  metadata: {name: other}
+kind: List
+---
+apiVersion: v1
+kind: ConfigMapList
+items:
+- metadata: {name: config}
+  data: {key: value}
+"""
+        rsrcs = list(iter_resources(io.StringIO(manifest)))
+        self.assertEqual(["Deployment", "Service", "Unknown", "ConfigMap"], [rsrc.kind for rsrc in rsrcs])
+        self.assertEqual(["app", "svc", "other", "config"], [rsrc.metadata.name for rsrc in rsrcs])
+        self.assertIsInstance(rsrcs[0], Deployment)
+        self.assertEqual("value", rsrcs[3].data["key"])
+
+        rsrcs = list(iter_resources(io.StringIO(manifest), skip_unknown=True))
+        self.assertEqual(["Deployment", "Service", "ConfigMap"], [rsrc.kind for rsrc in rsrcs])
+
+        relaxed = "apiVersion: apps/v1\nkind: Deployment\nmetadata: {name: app}\nspec: {extra: 1}\n"
+        self.assertRaises(AttributeError, list, iter_resources(io.StringIO(relaxed)))
+        self.assertEqual(1, list(iter_resources(io.StringIO(relaxed), strict=False))[0].spec["extra"])
+
+        # only lists are expanded, other resources may have an items field
+        widget = "apiVersion: example.com/v1\nkind: Widget\nmetadata: {name: w}\nitems: [{value: 1}, {value: 2}]\n"
+        sorted_widget = "apiVersion: example.com/v1\nitems: [{value: 1}, {value: 2}]\nkind: Widget\nmetadata: {name: w}\n"
+        register_module(types.SimpleNamespace(Widget=Widget))
+        for source in (widget, sorted_widget):
+            rsrcs = list(iter_resources(io.StringIO(source)))
+            self.assertEqual(["w"], [rsrc.metadata.name for rsrc in rsrcs])
+            self.assertEqual([1, 2], [leave.value for leave in rsrcs[0].items_])
+
+        # anchors and merge keys are supported
+        merged = "apiVersion: v1\nkind: ConfigMap\nmetadata: {name: a, labels: &l {x: '1'}, annotations: {<<: *l, y: '2'}}\n"
+        rsrc = next(iter_resources(io.StringIO(merged)))
+        self.assertEqual({"x": "1", "y": "2"}, rsrc.metadata.annotations)
+
 
 class WriterTest(unittest.TestCase):
     def test_writer(self):
@@ -299,3 +545,611 @@ class WriterTest(unittest.TestCase):
         self.assertIn("finalizers", data["metadata"])
         self.assertNotIn("ports", data["spec"]["template"]["spec"]["containers"][0])
         self.assertIn("envFrom", data["spec"]["template"]["spec"]["containers"][0])
+
+    def test_writer_implicit(self):
+        obj = BaseType()
+        _ = obj.spec.leave
+        _ = obj.spec.leaves
+        self.assertEqual({}, yaml.load(yaml.dump(obj, Dumper=yaml.CSafeDumper), yaml.CSafeLoader))
+
+        # writing into an implicitly created object must make its ancestors visible
+        obj.spec.leave.value = "value"
+        data = yaml.load(yaml.dump(obj, Dumper=yaml.CSafeDumper), yaml.CSafeLoader)
+        self.assertEqual({"spec": {"leave": {"value": "value"}}}, data)
+
+        # ditto when adding items to an implicitly created list
+        obj = BaseType()
+        obj.spec.leaves.append({"value": 1})
+        data = yaml.load(yaml.dump(obj, Dumper=yaml.CSafeDumper), yaml.CSafeLoader)
+        self.assertEqual({"spec": {"leaves": [{"value": 1}]}}, data)
+
+    def test_to_dict(self):
+        rsrc = apps.Deployment(name="myapp", namespace="default")
+        rsrc.metadata.labels["foo"] = "bar"
+        _ = rsrc.metadata.annotations
+        rsrc.spec.template.spec.containers += {"name": "app", "args": ["--verbose"]}
+        _ = rsrc.spec.template.spec.containers[0].ports
+        _ = rsrc.spec.selector.match_labels
+
+        data = rsrc.to_dict()
+        # same pruning rules as the YAML representer
+        self.assertEqual(yaml.load(yaml.dump(rsrc, Dumper=yaml.CSafeDumper), yaml.CSafeLoader), data)
+        self.assertIs(dict, type(data["spec"]["template"]["spec"]["containers"][0]))
+
+        # the result does not share state with the source object
+        data["metadata"]["labels"]["foo"] = "baz"
+        data["spec"]["template"]["spec"]["containers"][0]["args"].append("--debug")
+        self.assertEqual("bar", rsrc.metadata.labels["foo"])
+        self.assertEqual(["--verbose"], rsrc.spec.template.spec.containers[0].args)
+
+    def test_json(self):
+        rsrc = apps.Deployment(name="myapp", namespace="default")
+        rsrc.metadata.labels["foo"] = "bar"
+        _ = rsrc.metadata.annotations
+        rsrc.spec.replicas = 2
+
+        self.assertEqual(rsrc.to_dict(), json.loads(dumps_json(rsrc)))
+        self.assertNotIn(" ", dumps_json(rsrc))
+        self.assertEqual(json.loads(dumps_json(rsrc)), json.loads(dumps_json(rsrc, compact=False)))
+        self.assertEqual(
+            '{"apiVersion":"apps/v1","kind":"Deployment","metadata":{"labels":{"foo":"bar"},', dumps_json(rsrc, sort_keys=True)[:79]
+        )
+
+        for compact in (True, False):
+            fp = io.StringIO()
+            dump_json((apps.Deployment(name=f"app-{idx}") for idx in range(3)), fp, compact=compact)
+            data = json.loads(fp.getvalue())
+            self.assertEqual("List", data["kind"])
+            self.assertEqual(["app-0", "app-1", "app-2"], [item["metadata"]["name"] for item in data["items"]])
+
+    def test_manifest_writer(self):
+        objs = [apps.Deployment(name=f"app-{idx}") for idx in range(3)]
+        objs[1].spec.replicas = 2
+        _ = objs[2].metadata.labels
+
+        fp = io.StringIO()
+        with ManifestWriter(fp, buffer_size=16) as writer:
+            writer.write(objs[0])
+            writer.write_all(obj for obj in objs[1:])
+        self.assertEqual(3, writer.count)
+        self.assertEqual(yaml.dump_all(objs, Dumper=yaml.CSafeDumper, sort_keys=False), fp.getvalue())
+
+        fp = io.StringIO()
+        with ManifestWriter(fp, "json") as writer:
+            writer.write_all(objs)
+        self.assertEqual(2, fp.getvalue().count("---\n"))
+        self.assertEqual([obj.to_dict() for obj in objs], list(yaml.load_all(fp.getvalue(), yaml.CSafeLoader)))
+
+        with self.assertRaises(ValueError):
+            writer.write(objs[0])
+
+
+def _object(**properties):
+    return {"type": "object", "properties": properties}
+
+
+def _resource(group: str, kind: str, **properties):
+    return {
+        "type": "object",
+        "x-kubernetes-group-version-kind": [{"group": group, "kind": kind, "version": "v1"}],
+        "properties": {
+            "apiVersion": {"type": "string"},
+            "kind": {"type": "string"},
+            "metadata": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"},
+            **properties,
+        },
+    }
+
+
+API_SCHEMA = {
+    "definitions": {
+        "io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta": _object(
+            name={"type": "string"}, labels={"type": "object", "additionalProperties": {"type": "string"}}
+        ),
+        "io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelector": _object(
+            matchLabels={"type": "object", "additionalProperties": {"type": "string"}}
+        ),
+        "io.k8s.api.core.v1.Container": _object(
+            name={"type": "string"}, ports={"type": "array", "items": _object(containerPort={"type": "integer"})}
+        ),
+        "io.k8s.api.core.v1.PodSpec": _object(
+            containers={"type": "array", "items": {"$ref": "#/definitions/io.k8s.api.core.v1.Container"}}
+        ),
+        "io.k8s.api.core.v1.Pod": _resource("", "Pod", spec={"$ref": "#/definitions/io.k8s.api.core.v1.PodSpec"}),
+        "io.k8s.api.apps.v1.Deployment": _resource(
+            "apps",
+            "Deployment",
+            spec=_object(
+                selector={"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.LabelSelector"},
+                template=_object(spec={"$ref": "#/definitions/io.k8s.api.core.v1.PodSpec"}),
+                strategy=_object(type={"type": "string"}),
+            ),
+        ),
+        "io.k8s.api.apps.v1.StatefulSet": _resource("apps", "StatefulSet", spec=_object(strategy=_object(partition={"type": "integer"}))),
+    }
+}
+
+
+SCHEMAS = pathlib.Path(__file__).parent / "schemas" / "crds"
+
+
+class FakeApiServer:
+    """In-memory stand-in for the API server calls of ClusterFetcher (see pykapi.cli.ClusterApi).
+
+    Requests are answered after a random delay, and in random order, like a real API server.
+    """
+
+    def __init__(self, *paths: pathlib.Path):
+        self.crds = {}
+        for path in paths:
+            for doc in yaml.load_all(path.read_bytes(), yaml.CSafeLoader):
+                if doc:
+                    doc["status"] = {"acceptedNames": doc["spec"]["names"]}
+                    self.crds[doc["metadata"]["name"]] = doc
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def request(self):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(random.uniform(0.001, 0.01))
+        with self.lock:
+            self.active -= 1
+
+    def read_crd(self, name: str) -> dict | None:
+        self.request()
+        crd = self.crds.get(name)
+        return copy.deepcopy(crd) if crd else None
+
+    def api_groups(self) -> dict[str, list[str]]:
+        self.request()
+        groups = {}
+        for crd in self.crds.values():
+            groups.setdefault(crd["spec"]["group"], set()).update(v["name"] for v in crd["spec"]["versions"])
+        return {group: sorted(versions) for group, versions in groups.items()}
+
+    def api_resources(self, group: str, version: str) -> list[str]:
+        self.request()
+        resources = []
+        for crd in self.crds.values():
+            if crd["spec"]["group"] == group and any(v["name"] == version for v in crd["spec"]["versions"]):
+                plural = crd["spec"]["names"]["plural"]
+                resources += [plural, f"{plural}/status"]
+        random.shuffle(resources)
+        return resources
+
+
+class GeneratorTest(unittest.TestCase):
+    @staticmethod
+    def read_output(path: pathlib.Path) -> dict[str, bytes]:
+        return {entry.name: entry.read_bytes() for entry in sorted(path.iterdir())}
+
+    @staticmethod
+    def crd_args(**kwargs) -> argparse.Namespace:
+        defaults = dict(
+            manifest=None,
+            crds=[],
+            output="-",
+            api_module="..api",
+            annotations=None,
+            docstrings=False,
+            profile="full",
+            shared_types=None,
+            cache_dir=None,
+        )
+        return argparse.Namespace(**{**defaults, "jobs": 1, "force": False, "schema_cache": None, **kwargs})
+
+    def test_jobs_api(self):
+        from pykapi.cli import import_k8s_api
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            schema = root / "swagger.yaml"
+            schema.write_text(yaml.safe_dump(API_SCHEMA))
+
+            outputs = []
+            for jobs in (1, 2):
+                output = root / f"jobs-{jobs}"
+                output.mkdir()
+                args = argparse.Namespace(
+                    schema=schema,
+                    version=None,
+                    annotations=None,
+                    docstrings=True,
+                    profile="full",
+                    output=str(output),
+                    jobs=jobs,
+                    force=False,
+                    schema_cache=root / "cache",
+                )
+                import_k8s_api(args)
+                outputs.append(self.read_output(output))
+
+        self.assertEqual([".pykapi.json", "_index.py", "apps.py", "core.py", "meta.py"], list(outputs[0]))
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_jobs_crds(self):
+        from pykapi.cli import import_custom_resources
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            manifest = root / "crds.yaml"
+            targets = [
+                {"crds": [str(SCHEMAS / "cert-manager.yaml")]},
+                {"crds": [str(SCHEMAS / "external-dns.yaml"), str(SCHEMAS / "sealedsecrets.bitnami.com.yaml")], "docstrings": True},
+            ]
+            manifest.write_text(yaml.safe_dump({"targets": targets}))
+
+            outputs = []
+            for jobs in (1, 2):
+                output = root / f"jobs-{jobs}"
+                output.mkdir()
+                import_custom_resources(self.crd_args(manifest=manifest, output=str(output), profile="slim", jobs=jobs))
+                outputs.append(self.read_output(output))
+
+        self.assertIn("cert_manager.pyi", outputs[0])
+        self.assertIn("bitnami.py", outputs[0])
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_read_manifest(self):
+        from pykapi.cli import read_manifest
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = pathlib.Path(tmp) / "config" / "crds.yaml"
+            manifest.parent.mkdir()
+            targets = [{"crds": ["cilium.io"]}, {"crds": ["cert-manager.io"], "output": "certs", "annotations": "annotations"}]
+            manifest.write_text(yaml.safe_dump({"targets": targets}))
+
+            # paths of the command line are relative to the current directory
+            args = self.crd_args(output="out", annotations=pathlib.Path("annotations"))
+            cli, local = read_manifest(manifest, args)
+            self.assertEqual(("out", pathlib.Path("annotations")), (cli.output, cli.annotations))
+            self.assertEqual((str(manifest.parent / "certs"), manifest.parent / "annotations"), (local.output, local.annotations))
+
+            # and the manifest defaults to its directory
+            manifest.write_text(yaml.safe_dump({"output": "crds", "targets": targets[:1]}))
+            self.assertEqual([str(manifest.parent / "crds")], [target.output for target in read_manifest(manifest, args)])
+
+    def test_slim_subclass(self):
+        from pykapi.cli import import_custom_resources
+
+        with tempfile.TemporaryDirectory() as tmp:
+            crds = [str(SCHEMAS / "sealedsecrets.bitnami.com.yaml")]
+            import_custom_resources(self.crd_args(crds=crds, output=tmp, api_module="kubic.api", profile="slim"))
+            spec = importlib.util.spec_from_file_location("slim_bitnami", os.path.join(tmp, "bitnami.py"))
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            try:
+                spec.loader.exec_module(module)
+
+                # slim classes have no annotations, so inherited fields come from their field types
+                class Plain(module.Template):
+                    __slots__ = ()
+
+                class MyTemplate(module.Template):
+                    __slots__ = ()
+
+                    extra: str
+
+                self.assertEqual(["data", "metadata", "type"], list(Plain._fields_()))
+                self.assertEqual(["data", "metadata", "type", "extra"], list(MyTemplate._fields_()))
+                template = MyTemplate(type="x", extra="y")
+                template.metadata.name = "secret"
+                self.assertEqual({"type": "x", "extra": "y", "metadata": {"name": "secret"}}, template)
+                self.assertIs(Deployment._fields_()["metadata"].type, MyTemplate._fields_()["metadata"].type)
+            finally:
+                del sys.modules[spec.name]
+
+    def test_incremental(self):
+        from pykapi.cli import import_custom_resources
+
+        with tempfile.TemporaryDirectory() as tmp:
+            schema = pathlib.Path(tmp, "external-dns.yaml")
+            schema.write_bytes((SCHEMAS / "external-dns.yaml").read_bytes())
+            output = pathlib.Path(tmp, "output")
+            output.mkdir()
+            args = self.crd_args(crds=[str(schema), str(SCHEMAS / "sealedsecrets.bitnami.com.yaml")], output=str(output))
+
+            import_custom_resources(args)
+            generated = self.read_output(output)
+            mtimes = {entry.name: entry.stat().st_mtime_ns for entry in output.iterdir()}
+
+            # unchanged inputs -> nothing is written
+            os.utime(schema)
+            import_custom_resources(args)
+            self.assertEqual(mtimes, {entry.name: entry.stat().st_mtime_ns for entry in output.iterdir()})
+
+            # missing output -> regenerated
+            output.joinpath("bitnami.py").unlink()
+            import_custom_resources(args)
+            self.assertEqual(generated, self.read_output(output))
+
+            # changed input -> regenerated
+            schema.write_text(schema.read_text().replace("DNSEndpoint", "DNSRecord"))
+            import_custom_resources(args)
+            self.assertIn(b"class DNSRecord(", output.joinpath("externaldns.py").read_bytes())
+
+    def test_schema_cache(self):
+        from pykapi.cache import SchemaCache
+        from pykapi.cli import load_crd_bundle
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SchemaCache(pathlib.Path(tmp, "cache"))
+            schema = pathlib.Path(tmp, "external-dns.yaml")
+            schema.write_bytes((SCHEMAS / "external-dns.yaml").read_bytes())
+
+            documents = cache.load(schema, load_crd_bundle)
+            self.assertEqual(list(yaml.load_all(schema.read_text(), yaml.CSafeLoader)), documents)
+            documents[0]["kind"] = "modified"
+
+            # warm loads don't parse yaml, even if only the mtime changed
+            os.utime(schema, ns=(0, 0))
+            with unittest.mock.patch("pykapi.cli.CRDLoader", side_effect=AssertionError("parsed")):
+                self.assertEqual("CustomResourceDefinition", cache.load(schema, load_crd_bundle)[0]["kind"])
+                self.assertEqual("CustomResourceDefinition", cache.load(schema, load_crd_bundle)[0]["kind"])
+
+            schema.write_text(schema.read_text().replace("DNSEndpoint", "DNSRecord"))
+            self.assertEqual("DNSRecord", cache.load(schema, load_crd_bundle)[0]["spec"]["names"]["kind"])
+            self.assertEqual(1, len(list(cache.directory.iterdir())))
+
+    def test_crd_versions_pruning(self):
+        from pykapi.cli import create_crd, load_crd_documents
+
+        def version(name: str, storage: bool) -> dict:
+            return {
+                "name": name,
+                "served": True,
+                "storage": storage,
+                "schema": {"openAPIV3Schema": {"type": "object", "description": name}},
+            }
+
+        crd = {
+            "apiVersion": "apiextensions.k8s.io/v1",
+            "kind": "CustomResourceDefinition",
+            "metadata": {"name": "widgets.example.com"},
+            "spec": {
+                "group": "example.com",
+                "names": {"kind": "Widget", "plural": "widgets"},
+                "scope": "Namespaced",
+                "versions": [version("v1alpha1", False), version("v1", True), version("v1beta2", False)],
+            },
+        }
+        other = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "config"}, "data": {"key": "value"}}
+        data = yaml.safe_dump_all([crd, other]).encode()
+
+        documents = list(load_crd_documents(io.BytesIO(data)))
+        self.assertEqual(other, documents[1])
+        versions = documents[0]["spec"]["versions"]
+        self.assertEqual(["v1alpha1", "v1", "v1beta2"], [v["name"] for v in versions])
+        # only the schema of the selected version is loaded
+        self.assertEqual([False, True, False], ["schema" in v for v in versions])
+        self.assertEqual(create_crd(yaml.safe_load(yaml.safe_dump(crd))), create_crd(documents[0]))
+
+        # anchors are resolved in document order
+        data = b"""
+kind: CustomResourceDefinition
+spec:
+  group: example.com
+  names: {kind: Widget}
+  versions:
+  - name: v1alpha1
+    storage: false
+    schema: &schema {openAPIV3Schema: {type: object}}
+  - name: v1
+    storage: true
+    schema: *schema
+"""
+        document = next(load_crd_documents(io.BytesIO(data)))
+        self.assertEqual({"openAPIV3Schema": {"type": "object"}}, document["spec"]["versions"][1]["schema"])
+
+    def test_finalize_order(self):
+        from pykapi.k8s import QualifiedName
+        from pykapi.parser import ApiGroup
+        from pykapi.types import GenericType, ObjectType, Property
+
+        # deeper than the recursion limit
+        count = sys.getrecursionlimit() * 2
+        group = ApiGroup("example.com", "v1", "example")
+        types = [ObjectType(QualifiedName(f"Type{idx:05}", group.name, group.version)) for idx in range(count)]
+        for idx, ty in enumerate(types):
+            group.add(ty)
+            if idx + 1 < count:
+                ty.properties.append(Property("next", types[idx + 1], False, None))
+            if idx + 2 < count:
+                ty.properties.append(Property("items", GenericType("list", [types[idx + 2]]), False, None))
+        group.finalize()
+        # dependencies first
+        self.assertEqual(list(reversed(types)), group.types)
+
+    def test_structural_keys(self):
+        from pykapi.k8s import QualifiedName
+        from pykapi.types import AnonymousType, GenericType, ObjectType, Property, StructuralKeys
+
+        parent = ObjectType(QualifiedName("Parent", "example.com", "v1"))
+
+        def anonymous(name: str, *properties: Property) -> AnonymousType:
+            ty = AnonymousType(QualifiedName(name, parent.group, parent.version), parent, "spec")
+            ty.properties.extend(properties)
+            return ty
+
+        def nested(name: str, description: str | None = None) -> GenericType:
+            return GenericType("list", (anonymous(name, Property("value", "str", True, description)),))
+
+        items = [
+            anonymous("Item", Property("a", nested("Sub"), False, "description")),
+            anonymous("Item", Property("a", nested("Sub", "other description"), False, None)),
+            anonymous("Item", Property("a", nested("Sub1"), False, None)),
+            anonymous("Item", Property("a", nested("Sub"), True, None)),
+            anonymous("Other", Property("a", nested("Sub"), False, None)),
+        ]
+        object_type = ObjectType(items[0].fqn)
+        object_type.properties.extend(items[0].properties)
+        items.append(object_type)
+
+        keys = StructuralKeys()
+        for a in items:
+            for b in items:
+                self.assertEqual(a == b, keys.key(a) == keys.key(b), (a, b))
+        self.assertEqual(keys.key(items[0]), keys.key(items[1]))
+
+    def test_shared_api_types(self):
+        from pykapi.annotations import AnnotationProvider
+        from pykapi.cli import create_crd
+        from pykapi.crd import import_crds
+        from pykapi.shared import is_name_part
+        from pykapi.state import package_sources
+
+        string = {"type": "string"}
+        crd = {
+            "kind": "CustomResourceDefinition",
+            "spec": {
+                "group": "example.com",
+                "names": {"kind": "Widget"},
+                "scope": "Namespaced",
+                "versions": [{"name": "v1", "storage": True, "schema": {"openAPIV3Schema": {"type": "object", "properties": {
+                    "spec": {"type": "object", "properties": {
+                        # same as networking.IPBlock
+                        "blocks": {"type": "array", "items": {"type": "object", "required": ["cidr"], "properties": {
+                            "cidr": string,
+                            "except": {"type": "array", "items": string},
+                        }}},
+                        # same structure as core.PodDNSConfigOption, but unrelated
+                        "parameters": {"type": "array", "items": {"type": "object", "properties": {"name": string, "value": string}}},
+                        # not required like in IPBlock
+                        "range": {"type": "object", "properties": {"cidr": string, "except": {"type": "array", "items": string}}},
+                    }},
+                }}}}],
+            },
+        }  # fmt: skip
+
+        # only enabled explicitly
+        group = import_crds([create_crd(copy.deepcopy(crd))], AnnotationProvider(None))[0]
+        self.assertIn("Block", [ty.name for ty in group.types])
+
+        group = import_crds([create_crd(crd)], AnnotationProvider(None), shared_types="kubic.api")[0]
+        self.assertEqual(["Parameter", "Range", "WidgetSpec", "Widget"], [ty.name for ty in group.types])
+        spec = group.types[2]
+        self.assertEqual("list[networking.IPBlock]", group.qualified_name(spec.properties[0].type))
+        self.assertIn("networking.k8s.io", group.refs)
+
+        # string pairs must match by name too
+        self.assertTrue(is_name_part("HostPath", "HostPathVolumeSource"))
+        self.assertTrue(is_name_part("Option", "PodDNSConfigOption"))
+        self.assertTrue(is_name_part("HttpHeader", "HTTPHeader"))
+        self.assertFalse(is_name_part("Parameter", "PodDNSConfigOption"))
+        self.assertFalse(is_name_part("Port", "Report"))
+
+        # the shared types package is part of the target inputs
+        self.assertIn(pathlib.Path(kubic.api.__file__).with_name("core.py"), package_sources("kubic.api"))
+
+    def test_write_if_changed(self):
+        from pykapi.state import write_if_changed
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "module.py")
+            self.assertTrue(write_if_changed(path, "a = 1\n"))
+            os.utime(path, ns=(0, 0))
+            self.assertFalse(write_if_changed(path, "a = 1\n"))
+            self.assertEqual(0, os.stat(path).st_mtime_ns)
+
+            self.assertTrue(write_if_changed(path, "a = 2\n"))
+            with open(path) as f:
+                self.assertEqual("a = 2\n", f.read())
+            # replaced, without leaving temporary files
+            self.assertEqual(["module.py"], os.listdir(tmp))
+            self.assertTrue(os.stat(path).st_mode & 0o044)
+
+            # the permissions of an existing file are kept
+            os.chmod(path, 0o640)
+            self.assertTrue(write_if_changed(path, "a = 3\n"))
+            self.assertEqual(0o640, os.stat(path).st_mode & 0o777)
+
+    def test_cluster_fetcher(self):
+        from pykapi.cli import ClusterFetcher
+
+        server = FakeApiServer(SCHEMAS / "cilium.yaml", SCHEMAS / "external-dns.yaml")
+        expected = sorted(name for name in server.crds if name.endswith(".cilium.io"))
+        contents = []
+        for _ in range(2):
+            fetcher = ClusterFetcher(None, api_factory=lambda: server, workers=4)
+            try:
+                fetcher.prefetch(["cilium.io", "dnsendpoints.externaldns.k8s.io", "cilium.io"])
+                self.assertLessEqual(server.max_active, 4)
+                self.assertGreater(server.max_active, 1)
+
+                documents = list(yaml.load_all(fetcher.resolve("cilium.io").read_text(), yaml.CSafeLoader))
+                self.assertEqual(expected, [doc["metadata"]["name"] for doc in documents])
+                self.assertTrue(all("status" not in doc for doc in documents))
+                contents.append(fetcher.resolve("cilium.io").read_bytes())
+
+                documents = list(yaml.load_all(fetcher.resolve("dnsendpoints.externaldns.k8s.io").read_text(), yaml.CSafeLoader))
+                self.assertEqual(["dnsendpoints.externaldns.k8s.io"], [doc["metadata"]["name"] for doc in documents])
+
+                with self.assertRaises(ValueError):
+                    fetcher.resolve("unknown.example.com")
+            finally:
+                fetcher.cleanup()
+            self.assertEqual([], list(fetcher.tmpfiles))
+        # deterministic output, whatever the responses order
+        self.assertEqual(contents[0], contents[1])
+
+    def test_cluster_crds(self):
+        from pykapi.cli import import_custom_resources
+
+        server = FakeApiServer(SCHEMAS / "cilium.yaml")
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = []
+            for crds in (["cilium.io"], [str(SCHEMAS / "cilium.yaml")]):
+                output = pathlib.Path(tmp, str(len(outputs)))
+                output.mkdir()
+                with unittest.mock.patch("pykapi.cli.ClusterApi", return_value=server):
+                    import_custom_resources(self.crd_args(crds=crds, output=str(output)))
+                outputs.append(output.joinpath("cilium.py").read_bytes())
+            self.assertEqual(outputs[0], outputs[1])
+
+    def test_generation_stats(self):
+        from pykapi import stats
+        from pykapi.cli import import_custom_resources
+
+        with tempfile.TemporaryDirectory() as tmp:
+            schema = str(SCHEMAS / "external-dns.yaml")
+            with stats.collect(memory=True) as collected:
+                import_custom_resources(self.crd_args(crds=[schema], output=tmp, shared_types="kubic.api"))
+                with stats.phase("outer"):
+                    with stats.phase("inner"):
+                        data = bytearray(4 * 2**20)
+                    del data
+
+        phases = collected.phases
+        self.assertEqual(1, phases[("read", schema)].calls)
+        for name in ("import", "shared", "finalize", "rename", "print"):
+            self.assertIn((name, "externaldns.k8s.io"), phases)
+        self.assertIn(("write", "externaldns"), phases)
+        self.assertEqual({"shared": 0, "types": 4, "anonymous": 3, "renames": 0, "aliases": 0}, collected.counts["externaldns.k8s.io"])
+        # nested peaks are included in the enclosing phase
+        self.assertGreaterEqual(phases[("inner", None)].peak_memory, 4 * 2**20)
+        self.assertGreaterEqual(phases[("outer", None)].peak_memory, 4 * 2**20)
+
+        report = json.loads(json.dumps(collected.to_json()))
+        self.assertEqual(len(phases), len(report["phases"]))
+        # not collected outside of collect()
+        with stats.phase("ignored"):
+            pass
+        self.assertNotIn(("ignored", None), collected.phases)
+
+    def test_stats_force(self):
+        from pykapi.cli import import_custom_resources, run_with_stats
+
+        with tempfile.TemporaryDirectory() as tmp:
+            schema = str(SCHEMAS / "external-dns.yaml")
+            import_custom_resources(self.crd_args(crds=[schema], output=tmp))
+            # the target is up to date, but is regenerated to report its statistics
+            json_path = os.path.join(tmp, "stats.json")
+            args = self.crd_args(crds=[schema], output=tmp, stats=True, stats_memory=False, stats_json=json_path)
+            with contextlib.redirect_stderr(io.StringIO()):
+                run_with_stats(args, import_custom_resources)
+            with open(json_path) as f:
+                report = json.load(f)
+            self.assertIn("import", {phase["phase"] for phase in report["phases"]})